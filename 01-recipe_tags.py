@@ -1,30 +1,57 @@
-import ast
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 import yaml
 
+from file_utils import file_version
+from tag_index import load_tag_index
+from tag_suggestions import load_tag_cooccurrence, suggest_categories
+
 RECIPE_FILE = Path("food-com-recipes/RAW_recipes.csv")
+TAG_INDEX_FILE = Path("food-com-recipes/tag_index.npz")
 TAGS_FILE = Path("food-com-recipes/all_tags.yaml")
+TAG_COOCCURRENCE_FILE = Path("food-com-recipes/tag_cooccurrence.npz")
 
-# wide display
-st.set_page_config(layout="wide")
 
-prog_bar = st.progress(20, "Loading Recipe Data...")
-recipes = pd.read_csv(RECIPE_FILE)
+@st.cache_data
+def load_tag_counts(recipe_file_version: tuple[int, int]) -> pd.DataFrame:
+    """Load the unique tags and their counts, cached until the recipes change."""
+    index = load_tag_index(RECIPE_FILE, TAG_INDEX_FILE)
+    return pd.DataFrame({"tags": index["tags"], "count": index["counts"]})
 
-prog_bar.progress(40, "Extracting Tags...")
-# Put all tags into a set after converting from string to list
-tags = {
-    tag for tag_list in recipes["tags"] for tag in ast.literal_eval(tag_list) if tag
-}
 
-prog_bar.progress(50, "Creating DataFrame...")
-data = pd.DataFrame(tags, columns=["tags"])
+@st.cache_data
+def load_suggestions(
+    recipe_file_version: tuple[int, int], tags_file_version: tuple[int, int]
+) -> pd.DataFrame:
+    """Suggest categories for the uncategorized tags, cached until the recipes
+    or the saved categories change."""
+    with TAGS_FILE.open("r") as f:
+        categories = {
+            name: set(tags or []) for name, tags in (yaml.safe_load(f) or {}).items()
+        }
+    index = load_tag_cooccurrence(RECIPE_FILE, TAG_INDEX_FILE, TAG_COOCCURRENCE_FILE)
+    suggestions = suggest_categories(index["tags"], index["cooccurrence"], categories)
+    return suggestions.to_pandas()
+
+
+# wide display
+st.set_page_config(layout="wide")
+
+prog_bar = st.progress(20, "Loading Tag Index...")
+# Unique tags and counts, reloaded only when the recipe file changes. Streamlit
+# reruns the script on every edit, so the file's mtime and size are the cache
+# key and the tag index only hashes the contents when they change.
+data = load_tag_counts(file_version(RECIPE_FILE)).copy()
 
 columns = {
     "tags": st.column_config.TextColumn(required=True, validate="^[a-z-]+$"),
+    "count": st.column_config.NumberColumn(disabled=True),
+    "suggested": st.column_config.TextColumn(disabled=True),
+    "accept": st.column_config.CheckboxColumn(
+        help="Save the tag in its first suggested category"
+    ),
     "season": st.column_config.CheckboxColumn(),
     "event": st.column_config.CheckboxColumn(),
     "time": st.column_config.CheckboxColumn(),
@@ -37,39 +64,39 @@ columns = {
     "key_ingredient": st.column_config.CheckboxColumn(),
     "dish": st.column_config.CheckboxColumn(),
 }
+category_columns = [
+    col for col in columns if col not in ["tags", "count", "suggested", "accept"]
+]
 
 # Load tags.yaml if it exists
 prog_bar.progress(60, "Loading Tag Categories File...")
 with TAGS_FILE.open("r") as f:
     saved_tags: dict = yaml.safe_load(f)
 
-prog_bar.progress(70, "Adding New Columns...")
-# Add new columns with all unsaved values set to False
-for col in columns:
-    if col != "tags":
-        data[col] = 0
+prog_bar.progress(70, "Appending Missing Tags...")
+# Add saved tags that no recipe uses to the end of the dataframe
+saved_tags = {col: set(saved_tags.get(col) or []) for col in category_columns}
+missing_tags = set().union(*saved_tags.values()).difference(data["tags"])
+data = pd.concat(
+    [data, pd.DataFrame({"tags": sorted(missing_tags)})], ignore_index=True
+)
 
 prog_bar.progress(80, "Assigning Saved Tags...")
-# Set saved values to True
-for row in data.index:
-    for col in columns:
-        if col != "tags":
-            if col in saved_tags and data["tags"][row] in saved_tags[col]:
-                saved_tags[col].remove(data["tags"][row])
-                data[col][row] = 1
-
-prog_bar.progress(90, "Appending Missing Tags...")
-# Add remaining saved values to the end of the dataframe
-remaining_saved_tags = [itm for lst in saved_tags.values() for itm in lst]
-new_data = []
-for tag in remaining_saved_tags:
-    row = {"tags": tag}
-    for col in columns:
-        if col != "tags":
-            row[col] = 1 if tag in saved_tags[col] else 0
-    new_data.append(row)
-
-data = pd.concat([data, pd.DataFrame(new_data)], ignore_index=True)
+# Set saved values to True, all unsaved values to False
+for col in category_columns:
+    data[col] = data["tags"].isin(saved_tags[col]).astype(int)
+
+prog_bar.progress(90, "Suggesting Categories...")
+# Show the likely categories of uncategorized tags, they are only saved for
+# the tags whose suggestion is accepted
+suggestions = load_suggestions(file_version(RECIPE_FILE), file_version(TAGS_FILE))
+suggestions["label"] = suggestions["category"] + suggestions["score"].map(
+    " {:.0%}".format
+)
+data["suggested"] = data["tags"].map(suggestions.groupby("tag")["label"].agg(", ".join))
+data["accept"] = 0
+best = suggestions.drop_duplicates("tag").set_index("tag")["category"]
+best_category = best[best.isin(category_columns)]
 
 prog_bar.progress(100, "Done!")
 edited = st.data_editor(
@@ -82,16 +109,15 @@ edited = st.data_editor(
 )
 
 if st.button("Save", type="primary"):
-    # Replace True with tag name
-    for col in columns:
-        if col != "tags":
-            for tag_index in edited[edited[col] == 1].index:
-                edited[col][tag_index] = edited["tags"][tag_index]
-
-    # Create dict without 'tags' column, ignore NaN values
-    edited = edited.drop("tags", axis=1)
-    data_dict = edited.to_dict("list")
-    data_dict = {k: list({x for x in v if x != 0}) for k, v in data_dict.items()}
+    # Collect the checked tags and accepted suggestions of each category,
+    # ignore NaN values
+    accepted = edited["tags"].map(best_category).where(edited["accept"] == 1)
+    data_dict = {
+        col: sorted(
+            set(edited.loc[(edited[col] == 1) | (accepted == col), "tags"].dropna())
+        )
+        for col in category_columns
+    }
 
     with TAGS_FILE.open("w") as f:
         yaml.safe_dump(data_dict, f)
@@ -1,16 +1,22 @@
 from pathlib import Path
-from docx import Document
 import yaml
 import re
 
+from file_utils import file_hash
+
 TAGS_IN_FILE = Path("data/all_tags.yaml")
 TAGS_OUT_FILE = Path("data/tags.yaml")
 REPLACEMENTS_FILE = Path("data/replacements.yaml")
+STRIKETHROUGH_DOC = Path("data/Tags Categorization.docx")
+STRIKETHROUGH_CACHE = Path("data/strikethrough_tags.yaml")
 
 remove_leading_spaces_and_hyphens = re.compile(r"^\s*-\s*")
 
 
 def extract_strikethrough_text(doc_path):
+    # Only needed when the cached tags are stale
+    from docx import Document
+
     doc = Document(doc_path)
     strikethrough_text = []
 
@@ -24,27 +30,50 @@ def extract_strikethrough_text(doc_path):
     return strikethrough_text
 
 
-strikethrough_tags = extract_strikethrough_text("data/Tags Categorization.docx")
+def load_strikethrough_tags(doc_path: Path, cache_path: Path) -> set[str]:
+    """Get the strikethrough tags, only re-parsing the document if it changed."""
+    doc_hash = file_hash(doc_path)
+    if cache_path.exists():
+        cache = yaml.safe_load(cache_path.open("r"))
+        if cache["source_hash"] == doc_hash:
+            return set(cache["tags"])
+
+    tags = set(extract_strikethrough_text(doc_path))
+    yaml.safe_dump(
+        {"source_hash": doc_hash, "tags": sorted(tags)}, cache_path.open("w")
+    )
+    return tags
+
+
+def clean_tags(
+    data: dict[str, list[str]],
+    strikethrough_tags: set[str],
+    replacement_map: dict[str, str],
+) -> dict[str, list[str]]:
+    """Remove strikethrough tags, replace tags and remove duplicates in one pass."""
+    return {
+        cat: sorted(
+            {
+                replacement_map.get(tag, tag)
+                for tag in lst
+                if tag not in strikethrough_tags
+            }
+        )
+        for cat, lst in data.items()
+    }
 
-# Load the YAML file
-data = yaml.safe_load(TAGS_IN_FILE.open("r"))
 
-# Remove strikethrough tags
-cleaned_data = {
-    cat: [tag for tag in lst if tag not in strikethrough_tags]
-    for cat, lst in data.items()
-}
+if __name__ == "__main__":
+    strikethrough_tags = load_strikethrough_tags(STRIKETHROUGH_DOC, STRIKETHROUGH_CACHE)
 
-replacements = yaml.safe_load(REPLACEMENTS_FILE.open("r"))
+    # Load the YAML file
+    data = yaml.safe_load(TAGS_IN_FILE.open("r"))
 
-# Replace tags
-for replace, find_list in replacements.items():
-    for find in find_list:
-        for category, lst in cleaned_data.items():
-            cleaned_data[category] = [replace if tag == find else tag for tag in lst]
+    # Invert the replacements into a single tag -> replacement lookup
+    replacements = yaml.safe_load(REPLACEMENTS_FILE.open("r"))
+    replacement_map = {item: cat for cat, lst in replacements.items() for item in lst}
 
-# Remove duplicates
-filtered_data = {k: sorted(set(v)) for k, v in cleaned_data.items()}
+    filtered_data = clean_tags(data, strikethrough_tags, replacement_map)
 
-# Write the cleaned data back to the YAML file
-yaml.dump(filtered_data, TAGS_OUT_FILE.open("w"))
+    # Write the cleaned data back to the YAML file
+    yaml.dump(filtered_data, TAGS_OUT_FILE.open("w"))
@@ -1,15 +1,29 @@
 import ast
+import os
 from pathlib import Path
 
 import polars as pl
 import yaml
 
+from recipe_dedup import DEDUP_THRESHOLD, deduplicate_recipes
+from schemas import INGREDIENT_PRICELIST, RAW_RECIPES, read_dataset
+from sharding import current_shard, filter_shard, shard_path
+from tag_categories import category_enums, decode_categories
+
 # File paths
 RAW_RECIPES_FILES = Path("food-com-recipes/RAW_recipes.csv")
-CLEANED_RECIPES_CSV = Path("data/recipes-1.csv")
+CLEANED_RECIPES_CSV = shard_path(Path("data/recipes-1.csv"))
 
 TAGS_FILE = Path("data/tags.yaml")
 TAG_REPLACEMENTS_FILE = Path("data/replacements.yaml")
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+
+# Sampling limits, a sample size of 0 keeps every cleaned recipe
+SAMPLE_SIZE = int(os.environ.get("RECIPE_SAMPLE_SIZE", 200))
+SAMPLE_PER_CUISINE = int(os.environ.get("RECIPE_SAMPLE_PER_CUISINE", 50))
+# Only recipes with at least this share of ingredients on the pricelist are
+# sampled (and so scraped in stage 04). A coverage of 0 samples every recipe.
+MIN_PRICE_COVERAGE = float(os.environ.get("RECIPE_MIN_PRICE_COVERAGE", 0.8))
 
 # ==============================================================================
 
@@ -54,6 +68,8 @@ def process_tags(df: pl.DataFrame, tag_patterns: dict[str, list[str]]):
 
     replacements = yaml.safe_load(TAG_REPLACEMENTS_FILE.open("r"))
     replacement_map = {item: cat for cat, lst in replacements.items() for item in lst}
+    # Categories are stored as lists of codes into the shared vocabulary
+    enums = category_enums(TAGS_FILE, TAG_REPLACEMENTS_FILE)
 
     def find_category(pattern: list[str], df: pl.DataFrame):
         """Find all tags that match the given category."""
@@ -67,9 +83,11 @@ def process_tags(df: pl.DataFrame, tag_patterns: dict[str, list[str]]):
                 replacement_map.get(match, match) for match in pattern if match in tag
             ]
 
-            column.append(",".join(row) if row else None)
+            column.append(row if row else None)
 
-        return df.with_columns(pl.Series(category, column))
+        return df.with_columns(
+            pl.Series(category, column, dtype=pl.List(enums[category]))
+        )
 
     print("Category function defined.")
 
@@ -120,32 +138,97 @@ def clean_recipe_text(df: pl.DataFrame):
 # ==============================================================================
 
 
-def sample_recipes(sampled_recipes: pl.DataFrame):
+def price_coverage(df: pl.DataFrame, pricelist_file: Path = PRICELIST_CSV) -> pl.Series:
+    """Get the share of each recipe's ingredients that stage 05 can price.
+
+    Stage 05 looks ingredient names up exactly among the pricelist aliases, so
+    the names of all recipes are checked against the set of aliases at once.
+    """
+    aliases = (
+        read_dataset(pricelist_file, INGREDIENT_PRICELIST, ["ingredient"])
+        .select(pl.col("ingredient").str.split("|").explode().str.strip_chars("'"))
+        .to_series()
+        .unique()
+    )
+    return (
+        df.select(
+            pl.col("ingredients")
+            .str.extract_all(r"'[^']*'|\"[^\"]*\"")
+            .list.eval(
+                pl.element()
+                .str.slice(1, pl.element().str.len_chars() - 2)
+                .is_in(aliases.implode())
+            )
+            .list.mean()
+            .fill_null(0.0)
+        )
+        .to_series()
+        .alias("price_coverage")
+    )
+
+
+def filter_price_coverage(
+    df: pl.DataFrame,
+    threshold: float = MIN_PRICE_COVERAGE,
+    pricelist_file: Path = PRICELIST_CSV,
+):
+    """Keep the recipes with at least `threshold` of their ingredients priced."""
+    print("Checking price coverage...")
+    coverage = price_coverage(df, pricelist_file)
+    print(
+        f"Price coverage: {coverage.mean():.1%} of ingredients on average, "
+        f"{(coverage == 1).mean():.1%} of recipes fully priced, "
+        f"{(coverage >= threshold).mean():.1%} at least {threshold:.0%} priced."
+    )
+    for cuisine, share in (
+        df.select("cuisine", coverage)
+        .explode("cuisine")
+        .group_by("cuisine")
+        .agg(pl.col("price_coverage").mean())
+        .sort("price_coverage")
+        .iter_rows()
+    ):
+        print(f"{cuisine}: {share:.1%}")
+    return df.filter(coverage >= threshold)
+
+
+def sample_recipes(
+    sampled_recipes: pl.DataFrame,
+    n: int = SAMPLE_SIZE,
+    per_cuisine: int = SAMPLE_PER_CUISINE,
+):
+    # Group on the comma-joined cuisines, grouping on the List[Enum] is slower
+    sampled_recipes = sampled_recipes.with_columns(
+        pl.col("cuisine").cast(pl.List(pl.String)).list.join(",").alias("cuisines")
+    )
     sampled_cuisines = pl.DataFrame(None, schema=sampled_recipes.schema)
-    for cuisine, grp in sampled_recipes.group_by("cuisine"):
-        if grp.shape[0] < 50:
+    for _, grp in sampled_recipes.group_by("cuisines", maintain_order=True):
+        if grp.shape[0] < per_cuisine:
             sample = grp
         else:
-            sample = grp.sample(n=50, seed=40404, with_replacement=False)
+            sample = grp.sample(n=per_cuisine, seed=40404, with_replacement=False)
         sampled_cuisines = sampled_cuisines.vstack(sample)
     sampled_recipes = sampled_cuisines.sample(
-        n=200,
+        n=n,
         seed=40404,
         with_replacement=False,
         shuffle=True,
     )
-    for cuisine, grp in sampled_recipes.group_by("cuisine"):
-        print(f"{cuisine}: {grp.shape}")
-    return sampled_recipes
+    for (cuisines,), grp in sampled_recipes.group_by("cuisines", maintain_order=True):
+        print(f"{cuisines}: {grp.shape}")
+    return sampled_recipes.drop("cuisines")
 
 
 # ==============================================================================
 
 
 if __name__ == "__main__":
-    recipes = (
-        pl.scan_csv(RAW_RECIPES_FILES).drop(["contributor_id", "submitted"]).collect()
+    recipes = read_dataset(
+        RAW_RECIPES_FILES,
+        RAW_RECIPES,
+        [col for col in RAW_RECIPES if col not in ["contributor_id", "submitted"]],
     )
+    recipes = filter_shard(recipes)
     print(f"Raw Recipes: {recipes.shape}")
 
     # Clean the recipes
@@ -153,13 +236,31 @@ if __name__ == "__main__":
     recipes = process_tags(recipes, tag_patterns)
     print(f"Cleaned Recipes: {recipes.shape}")
 
-    recipes = sample_recipes(recipes)
-    print(f"Sampled Recipes: {recipes.shape}")
+    recipes = clean_recipe_text(recipes)
+    if DEDUP_THRESHOLD:
+        recipes = deduplicate_recipes(recipes)
+        print(f"Deduplicated Recipes: {recipes.shape}")
+
+    if SAMPLE_SIZE:
+        # Don't scrape recipes that could not be costed
+        if MIN_PRICE_COVERAGE:
+            recipes = filter_price_coverage(recipes)
+            print(f"Priceable Recipes: {recipes.shape}")
+
+        # Each shard samples its share of the recipes
+        n_shards = current_shard()[1] if current_shard() else 1
+        recipes = sample_recipes(
+            recipes, -(-SAMPLE_SIZE // n_shards), -(-SAMPLE_PER_CUISINE // n_shards)
+        )
+        print(f"Sampled Recipes: {recipes.shape}")
 
     recipes = split_nutrition(recipes)
-    recipes = clean_recipe_text(recipes)
 
-    # Save the recipes
+    # Save the recipes, with comma-joined categories
+    recipes = decode_categories(
+        recipes, category_enums(TAGS_FILE, TAG_REPLACEMENTS_FILE)
+    )
+    CLEANED_RECIPES_CSV.parent.mkdir(parents=True, exist_ok=True)
     recipes.write_csv(CLEANED_RECIPES_CSV)
 
     print("Done!")
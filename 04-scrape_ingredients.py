@@ -8,9 +8,11 @@ from bs4 import BeautifulSoup
 from statistics import mean
 
 from mixed_fractions import Mixed
+from schemas import RECIPES_1, read_dataset
+from sharding import shard_path
 
-CLEANED_RECIPES_CSV = Path("data/recipes-1.csv")
-INGREDIENTS_CSV = Path("data/ingredients-1.csv")
+CLEANED_RECIPES_CSV = shard_path(Path("data/recipes-1.csv"))
+INGREDIENTS_CSV = shard_path(Path("data/ingredients-1.csv"))
 
 
 def recipe_link(name, r_id):
@@ -57,7 +59,7 @@ def scrape_ingredients(url):
 
 
 if __name__ == "__main__":
-    recipes = pl.scan_csv(CLEANED_RECIPES_CSV).select(["name", "id"]).collect()
+    recipes = read_dataset(CLEANED_RECIPES_CSV, RECIPES_1, ["name", "id"])
 
     print("Generating links...")
     recipes = recipes.with_columns(
@@ -1,19 +1,40 @@
+import argparse
 import ast
 import json
 import re
 from pathlib import Path
 import pint
 
+import numpy as np
 import polars as pl
 
-INPUT_INGREDIENTS_CSV = Path("data/ingredients-1.csv")
-INPUT_RECIPES_CSV = Path("data/recipes-1.csv")
+from file_utils import file_hash
+from label_cache import LabelCache
+from schemas import (
+    INGREDIENT_PRICELIST,
+    INGREDIENTS_1,
+    RECIPES_1,
+    RECIPES_2,
+    read_dataset,
+    scan_dataset,
+)
+from sharding import shard_path
+from units import definitions_version, get_unit_registry, parse_quantity
+
+# Per-recipe files are the current shard's, when run on a shard
+INPUT_INGREDIENTS_CSV = shard_path(Path("data/ingredients-1.csv"))
+INPUT_RECIPES_CSV = shard_path(Path("data/recipes-1.csv"))
 PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
-OUTPUT_INGREDIENTS_CSV = Path("data/ingredients-2.csv")
-OUTPUT_INGREDIENT_RECIPE_CSV = Path("data/ingredient-recipe-2.csv")
-OUTPUT_RECIPES_CSV = Path("data/recipes-2.csv")
+OUTPUT_INGREDIENTS_CSV = shard_path(Path("data/ingredients-2.csv"))
+OUTPUT_INGREDIENT_RECIPE_CSV = shard_path(Path("data/ingredient-recipe-2.csv"))
+OUTPUT_RECIPES_CSV = shard_path(Path("data/recipes-2.csv"))
+# Product units used by every recipe, to re-cost recipes after price changes
+COST_INDEX_FILE = shard_path(Path("data/recipe-cost-index.npz"))
 
-UREG = pint.UnitRegistry(case_sensitive=False)
+UREG = get_unit_registry()
+
+# Parsed labels are reused until the units or the parsing rules below change
+LABEL_CACHE_VERSION = definitions_version() + file_hash(Path(__file__))[:16]
 
 
 def get_recipe_ingredients(
@@ -22,8 +43,7 @@ def get_recipe_ingredients(
     """Get the recipe ingredients."""
     # Read the CSV files
     ingredients = (
-        pl.scan_csv(ingredients_file)
-        .select(["id", "ingredients"])
+        scan_dataset(ingredients_file, INGREDIENTS_1, ["id", "ingredients"])
         .with_columns(
             [
                 pl.col("id").alias("recipe_id"),
@@ -33,8 +53,7 @@ def get_recipe_ingredients(
         .collect()
     )
     recipes = (
-        pl.scan_csv(recipes_file)
-        .select(["id", "ingredients"])
+        scan_dataset(recipes_file, RECIPES_1, ["id", "ingredients"])
         .with_columns(
             [
                 pl.col("id").alias("recipe_id"),
@@ -70,9 +89,12 @@ def get_recipe_ingredients(
 def get_ingredient_product_map(
     file: Path,
 ) -> dict[str, dict[str, float | pint.Quantity]]:
-    """Get a mapping of ingredient names to product prices, quantities, and units."""
+    """Get a mapping of ingredient names to product prices, quantities, and units.
+
+    Every alias of a pricelist row maps to the same product row number.
+    """
 
-    pricelist = pl.read_csv(file).to_dicts()
+    pricelist = read_dataset(file, INGREDIENT_PRICELIST).to_dicts()
 
     return {
         name.strip("'"): {
@@ -80,19 +102,15 @@ def get_ingredient_product_map(
                 f'{ingredient["quantity"]} {ingredient["unit"]}'
             ),
             "price": ingredient["price"],
+            "row": row,
         }
-        for ingredient in pricelist
+        for row, ingredient in enumerate(pricelist)
         for name in ingredient["ingredient"].split("|")
     }
 
 
 def validate_quantity(qty_str: str) -> pint.Quantity:
-    quantity = UREG.Quantity(qty_str)
-
-    if "gauss" in str(quantity.units):
-        quantity = UREG.Quantity(
-            quantity.magnitude, str(quantity.units).replace("gauss", "gram")
-        )
+    quantity = parse_quantity(qty_str, UREG)
 
     if quantity.dimensionless or (
         len(quantity.dimensionality) == 1
@@ -174,6 +192,18 @@ def extract_values(ingredient: str, mapping: dict) -> dict[str, str | pint.Quant
         return output
 
 
+def cached_extract_values(
+    ingredient: str, mapping: dict, label_cache: LabelCache
+) -> dict[str, str | pint.Quantity] | None:
+    """Extract the unit from an ingredient string, parsing each label only once."""
+    key = (ingredient, mapping[ingredient])
+    if key not in label_cache:
+        output = extract_values(ingredient, mapping)
+        label_cache[key] = output["quantity"] if output else None
+    quantity = label_cache[key]
+    return None if quantity is None else {"label": ingredient, "quantity": quantity}
+
+
 def reconcile_incompatible_units(
     quantity: pint.Quantity, product_quantity: pint.Quantity, name: str
 ):
@@ -285,6 +315,30 @@ def reconcile_incompatible_units(
     )
 
 
+def product_units(
+    product: dict[str, float | pint.Quantity], quantity: pint.Quantity, name: str
+) -> float | None:
+    """Get how many units of the product an ingredient quantity uses."""
+    # Check if the units are NOT of the same type (i.e. mass and volume, or mass and count, etc.)
+    if not quantity.is_compatible_with(product["quantity"]):
+        quantity = reconcile_incompatible_units(quantity, product["quantity"], name)
+
+    try:
+        ratio = (quantity / product["quantity"]).to_reduced_units()
+        if ratio.units.dimensionless:
+            return ratio.magnitude
+        else:
+            raise pint.errors.DimensionalityError(
+                quantity.u,
+                product["quantity"].u,
+                quantity.dimensionality,
+                product["quantity"].dimensionality,
+            )
+    except pint.errors.DimensionalityError as e:
+        print(f"{type(e)}:{e}")
+        return None
+
+
 def calculate_recipe_cost(
     product_map: dict[str, dict[str, float | pint.Quantity]],
     ingredients: list[dict[str, str | pint.Quantity]],
@@ -292,28 +346,13 @@ def calculate_recipe_cost(
     """Calculate the cost of a recipe."""
     total = 0.0
     for ingredient in ingredients:
-        product = product_map.get(ingredient["name"])
-        quantity = ingredient["quantity"]
-
-        # Check if the units are NOT of the same type (i.e. mass and volume, or mass and count, etc.)
-        if not quantity.is_compatible_with(product["quantity"]):
-            quantity = reconcile_incompatible_units(
-                quantity, product["quantity"], ingredient["name"]
-            )
-
-        try:
-            ratio = (quantity / product["quantity"]).to_reduced_units()
-            if ratio.units.dimensionless:
-                total += ratio.magnitude * product["price"]
-            else:
-                raise pint.errors.DimensionalityError(
-                    quantity.u,
-                    product["quantity"].u,
-                    quantity.dimensionality,
-                    product["quantity"].dimensionality,
-                )
-        except pint.errors.DimensionalityError as e:
-            print(f"{type(e)}:{e}")
+        units = product_units(
+            product_map.get(ingredient["name"]),
+            ingredient["quantity"],
+            ingredient["name"],
+        )
+        if units is not None:
+            total += units * product_map[ingredient["name"]]["price"]
 
     return round(total, 2)
 
@@ -321,10 +360,12 @@ def calculate_recipe_cost(
 def combine_ingredients(
     recipe_ingredients: list[dict[str, str | list[str] | dict[str, str | float]]],
     product_map: dict[str, dict[str, float | pint.Quantity]],
+    label_cache: LabelCache,
 ) -> tuple[
     list[dict[str, str | int]],
     list[dict[str, str | int | float]],
     dict[int, float],
+    dict[str, np.ndarray],
 ]:
     """Get a list of ingredient names, and a mapping of recipes and ingredients."""
     recipe_ingredient_maps = {}
@@ -332,7 +373,9 @@ def combine_ingredients(
         labels = list(recipe["ingredient_labels_quantities"].keys())
         ingredient_map = {
             name: [
-                extract_values(label, recipe["ingredient_labels_quantities"])
+                cached_extract_values(
+                    label, recipe["ingredient_labels_quantities"], label_cache
+                )
                 for label in labels
                 if name in label
             ]
@@ -344,17 +387,8 @@ def combine_ingredients(
         ingredient: i for i, ingredient in enumerate(product_map.keys())
     }
 
-    recipe_cost = {
-        recipe_id: calculate_recipe_cost(
-            product_map,
-            [
-                {"name": ingr_name, "quantity": ingr["quantity"]}
-                for ingr_name, ingr_lst in ingredient_map.items()
-                for ingr in ingr_lst
-            ],
-        )
-        for recipe_id, ingredient_map in recipe_ingredient_maps.items()
-    }
+    cost_index = build_cost_index(product_map, recipe_ingredient_maps)
+    recipe_cost = recipe_costs(cost_index, product_map)
 
     ingredient_recipe_relations = [
         {
@@ -375,13 +409,164 @@ def combine_ingredients(
 
     ingredients = [{"id": v, "name": k} for k, v in ingredient_to_id.items()]
 
-    return ingredients, ingredient_recipe_relations, recipe_cost
+    return ingredients, ingredient_recipe_relations, recipe_cost, cost_index
+
+
+# ==============================================================================
+
+
+def build_cost_index(
+    product_map: dict[str, dict[str, float | pint.Quantity]],
+    recipe_ingredient_maps: dict[int, dict[str, list[dict]]],
+) -> dict[str, np.ndarray]:
+    """Index the product units used by every ingredient of every recipe.
+
+    Costs only depend on prices through `units * price`, so with this index a
+    price change only needs the recipes using that product to be re-summed.
+    """
+    recipe_ids = list(recipe_ingredient_maps)
+    rows, names, units = [], [], []
+    for row, ingredient_map in enumerate(recipe_ingredient_maps.values()):
+        for name, ingredient_list in ingredient_map.items():
+            for ingredient in ingredient_list:
+                product_unit = product_units(
+                    product_map.get(name), ingredient["quantity"], name
+                )
+                if product_unit is not None:
+                    rows.append(row)
+                    names.append(name)
+                    units.append(product_unit)
+
+    return {
+        "recipe_ids": np.array(recipe_ids, np.int64),
+        "rows": np.array(rows, np.int64),
+        "names": np.array(names, str),
+        "units": np.array(units, np.float64),
+        # What the units depend on, besides the recipes
+        "products": np.array(list(product_map), str),
+        "product_quantities": np.array(
+            [str(product["quantity"]) for product in product_map.values()], str
+        ),
+        "product_prices": np.array(
+            [product["price"] for product in product_map.values()], np.float64
+        ),
+    }
+
+
+def recipe_costs(
+    cost_index: dict[str, np.ndarray],
+    product_map: dict[str, dict[str, float | pint.Quantity]],
+    rows: np.ndarray | None = None,
+) -> dict[int, float]:
+    """Sum the cost of the indexed recipes, or of only the given rows."""
+    selected = slice(None) if rows is None else np.isin(cost_index["rows"], rows)
+    prices = np.array(
+        [product_map[name]["price"] for name in cost_index["names"][selected]],
+        np.float64,
+    )
+    # bincount adds the ingredients of each recipe in order, like a loop would
+    totals = np.bincount(
+        cost_index["rows"][selected],
+        cost_index["units"][selected] * prices,
+        minlength=len(cost_index["recipe_ids"]),
+    )
+    if rows is None:
+        rows = np.arange(len(cost_index["recipe_ids"]))
+    return {
+        int(cost_index["recipe_ids"][row]): round(float(totals[row]), 2) for row in rows
+    }
+
+
+def cost_index_hash(recipes_file: Path, ingredients_file: Path) -> str:
+    """Hash the inputs and the unit rules the product units are derived from."""
+    return "".join(
+        file_hash(file)[:16]
+        for file in [recipes_file, ingredients_file, Path(__file__)]
+    )
+
+
+def save_cost_index(file: Path, cost_index: dict[str, np.ndarray], source_hash: str):
+    np.savez(file, source_hash=source_hash, **cost_index)
+    print(f"Cost index saved to {file}.")
+
+
+def load_cost_index(file: Path, source_hash: str) -> dict[str, np.ndarray] | None:
+    """Load the cost index, or None if it is missing or out of date."""
+    if not file.exists():
+        return None
+    with np.load(file) as data:
+        cost_index = {key: data[key] for key in data.files}
+    if cost_index.pop("source_hash") != source_hash:
+        return None
+    return cost_index
+
+
+def changed_prices(
+    cost_index: dict[str, np.ndarray],
+    product_map: dict[str, dict[str, float | pint.Quantity]],
+) -> list[str] | None:
+    """Get the products whose price changed since the recipes were costed.
+
+    Returns None if anything but prices changed, i.e. products were added,
+    removed or repackaged, and every recipe has to be costed again.
+    """
+    if list(cost_index["products"]) != list(product_map) or list(
+        cost_index["product_quantities"]
+    ) != [str(product["quantity"]) for product in product_map.values()]:
+        return None
+
+    return [
+        name
+        for name, price in zip(cost_index["products"], cost_index["product_prices"])
+        if product_map[name]["price"] != price
+    ]
+
+
+def update_recipe_cost(
+    file: Path,
+    cost_index: dict[str, np.ndarray],
+    product_map: dict[str, dict[str, float | pint.Quantity]],
+    products: list[str],
+):
+    """Re-cost only the recipes using the given products, in place."""
+    rows = np.unique(cost_index["rows"][np.isin(cost_index["names"], products)])
+    recipe_cost = recipe_costs(cost_index, product_map, rows)
+
+    recipes = read_dataset(file, RECIPES_2)
+    delta = (
+        recipes.select("name", "id", pl.col("cost").alias("old_cost"))
+        .join(
+            pl.DataFrame(
+                {"id": list(recipe_cost), "cost": list(recipe_cost.values())},
+                schema={"id": recipes.schema["id"], "cost": pl.Float64},
+            ),
+            on="id",
+        )
+        .with_columns((pl.col("cost") - pl.col("old_cost")).round(2).alias("delta"))
+        .filter(pl.col("delta") != 0)
+    )
+    recipes = recipes.with_columns(
+        pl.col("id")
+        .replace_strict(recipe_cost, default=pl.col("cost"), return_dtype=pl.Float64)
+        .alias("cost")
+    )
+    recipes.write_csv(file)
+
+    # Products, not aliases, are what was edited in the pricelist
+    n_products = len({product_map[name]["row"] for name in products})
+    print(
+        f"{n_products} prices changed, {len(recipe_cost)} recipes re-costed, "
+        f"{delta.height} costs changed."
+    )
+    print(f"Cost changes: {delta.sort('delta', descending=True)}")
 
 
 def save_recipe_cost(input: Path, output: Path, recipe_cost: dict[int, float]):
     """Update the recipe table with calculated cost."""
-    recipes = pl.read_csv(input).with_columns(
-        pl.col("id").replace(recipe_cost).alias("cost")
+    recipes = read_dataset(input, RECIPES_1).with_columns(
+        pl.col("id")
+        .replace_strict(recipe_cost, default=None, return_dtype=pl.Float64)
+        .alias("cost")
     )
     recipes.write_csv(output)
 
@@ -394,24 +579,42 @@ def save_recipe_cost(input: Path, output: Path, recipe_cost: dict[int, float]):
 
 
 if __name__ == "__main__":
-    # Define additional units (estimated)
-    UREG.define("each = count")
-    UREG.define("bunch = 150 * gram")
-    UREG.define("pinch = 1/16 * teaspoon = sprinkle")
-    UREG.define("dash = 1/8 * teaspoon = to_taste")
-    UREG.define("handful = 1/2 * cup")
-    UREG.define("splash = 2 * tablespoon")
-
-    recipe_ingredients = get_recipe_ingredients(
-        INPUT_RECIPES_CSV, INPUT_INGREDIENTS_CSV
+    parser = argparse.ArgumentParser(description="Calculate the cost of every recipe.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Cost every recipe, even if only prices changed",
     )
-    product_map = get_ingredient_product_map(PRICELIST_CSV)
+    args = parser.parse_args()
 
-    ingredients, ingredient_recipe, recipe_cost = combine_ingredients(
-        recipe_ingredients, product_map
-    )
+    product_map = get_ingredient_product_map(PRICELIST_CSV)
+    source_hash = cost_index_hash(INPUT_RECIPES_CSV, INPUT_INGREDIENTS_CSV)
+
+    # Only re-cost the recipes affected by price changes, if nothing else changed
+    products = None
+    if not args.full and OUTPUT_RECIPES_CSV.exists():
+        cost_index = load_cost_index(COST_INDEX_FILE, source_hash)
+        if cost_index is not None:
+            products = changed_prices(cost_index, product_map)
+
+    if products is not None:
+        update_recipe_cost(OUTPUT_RECIPES_CSV, cost_index, product_map, products)
+        cost_index["product_prices"] = np.array(
+            [product["price"] for product in product_map.values()], np.float64
+        )
+        save_cost_index(COST_INDEX_FILE, cost_index, source_hash)
+    else:
+        recipe_ingredients = get_recipe_ingredients(
+            INPUT_RECIPES_CSV, INPUT_INGREDIENTS_CSV
+        )
+        label_cache = LabelCache(LABEL_CACHE_VERSION)
+        ingredients, ingredient_recipe, recipe_cost, cost_index = combine_ingredients(
+            recipe_ingredients, product_map, label_cache
+        )
+        label_cache.save()
 
-    save_recipe_cost(INPUT_RECIPES_CSV, OUTPUT_RECIPES_CSV, recipe_cost)
+        save_recipe_cost(INPUT_RECIPES_CSV, OUTPUT_RECIPES_CSV, recipe_cost)
+        save_cost_index(COST_INDEX_FILE, cost_index, source_hash)
 
-    pl.DataFrame(ingredients).write_csv(OUTPUT_INGREDIENTS_CSV)
-    pl.DataFrame(ingredient_recipe).write_csv(OUTPUT_INGREDIENT_RECIPE_CSV)
+        pl.DataFrame(ingredients).write_csv(OUTPUT_INGREDIENTS_CSV)
+        pl.DataFrame(ingredient_recipe).write_csv(OUTPUT_INGREDIENT_RECIPE_CSV)
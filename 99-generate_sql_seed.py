@@ -1,13 +1,42 @@
+import argparse
 from io import TextIOWrapper
 from pathlib import Path
 
 import polars as pl
 
+from recipe_dedup import DEDUP_THRESHOLD, deduplicate_recipes
+from recipe_search import SEARCH_TABLE, get_search_table, search_table_ddl
+from schemas import (
+    INGREDIENT_RECIPE_2,
+    INGREDIENTS_2,
+    RECIPES_2,
+    read_dataset,
+)
+from sharding import read_shards, shard_files
+from tag_categories import category_enums, encode_categories
+
 RECIPES_CSV = Path("data/recipes-2.csv")
 INGREDIENTS_CSV = Path("data/ingredients-2.csv")
 INGREDIENT_RECIPE_CSV = Path("data/ingredient-recipe-2.csv")
 SQL_FILE = Path("data/seed.sql")
 
+# Primary key of the entity tables and foreign keys (column -> table) of the
+# association tables, every foreign key references the `id` of its table
+PRIMARY_KEYS = {
+    "recipes": "id",
+    "cuisines": "id",
+    "dietary_restrictions": "id",
+    "ingredients": "id",
+}
+FOREIGN_KEYS = {
+    "recipe_cuisines": {"cuisine_id": "cuisines", "recipe_id": "recipes"},
+    "recipe_restrictions": {
+        "restriction_id": "dietary_restrictions",
+        "recipe_id": "recipes",
+    },
+    "recipe_ingredients": {"recipe_id": "recipes", "ingredient_id": "ingredients"},
+}
+
 
 def get_recipes_table(recipes: pl.DataFrame) -> dict[str, pl.DataFrame]:
     """Create the recipes table."""
@@ -49,29 +78,36 @@ def get_category_table(
     category_table_name: str,
     association_table_name: str,
     association_id: str,
-) -> dict[str, pl.DataFrame | dict]:
+) -> dict[str, pl.DataFrame]:
     """Create the category and recipe_category tables."""
 
-    category_df = recipes.select(
-        pl.col(df_category)
-        .map_elements(lambda x: x.split(","), strategy="threading")
-        .explode()
-        .alias("name")
-        .drop_nulls()
-    ).unique()
-    category_df = category_df.with_row_index("id", offset=1)
-
-    cat_dict = category_df.to_dict(as_series=False)
-    recipe_dict = recipes.select(pl.col("id"), pl.col(df_category)).to_dicts()
-    recipe_category = [
-        {
-            f"{association_id}": c_id,
-            "recipe_id": recipe["id"],
-        }
-        for c_id, cat in zip(cat_dict["id"], cat_dict["name"])
-        for recipe in recipe_dict
-        if cat and recipe[df_category] and cat in recipe[df_category]
-    ]
+    # Work on integer codes into the category's vocabulary
+    enum = category_enums()[df_category]
+    recipe_categories = (
+        encode_categories(recipes.select("id", df_category), {df_category: enum})
+        .explode(df_category)
+        .drop_nulls(df_category)
+        .unique(maintain_order=True)
+    )
+
+    category_df = (
+        recipe_categories.select(pl.col(df_category).alias("name"))
+        .unique()
+        .sort("name")
+        .with_row_index("id", offset=1)
+    )
+
+    recipe_category = (
+        recipe_categories.join(
+            category_df, left_on=df_category, right_on="name", maintain_order="left"
+        )
+        .sort(pl.col("id_right"), maintain_order=True)
+        .select(
+            pl.col("id_right").alias(association_id),
+            pl.col("id").alias("recipe_id"),
+        )
+    )
+    category_df = category_df.with_columns(pl.col("name").cast(pl.String))
 
     return {
         category_table_name: category_df,
@@ -79,6 +115,70 @@ def get_category_table(
     }
 
 
+def merge_shards(
+    n_shards: int,
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Concatenate the recipes, ingredients and recipe ingredients of every shard.
+
+    Near-duplicate recipes of different shards are removed as stage 03 does
+    within a shard, keeping the one with the lowest id. Ingredient ids are the
+    pricelist's product order, so they are the same in every shard.
+    """
+    recipes = read_shards(RECIPES_CSV, RECIPES_2, n_shards).sort("id")
+    if DEDUP_THRESHOLD and n_shards > 1:
+        recipes = deduplicate_recipes(recipes)
+
+    ingredients = [
+        read_dataset(file, INGREDIENTS_2)
+        for file in shard_files(INGREDIENTS_CSV, n_shards)
+    ]
+    for shard, shard_ingredients in enumerate(ingredients):
+        if not shard_ingredients.equals(ingredients[0]):
+            raise ValueError(
+                f"Shard {shard} was priced with a different pricelist than shard 0, "
+                "re-run stage 05 on every shard"
+            )
+
+    recipe_ingredients = read_shards(
+        INGREDIENT_RECIPE_CSV, INGREDIENT_RECIPE_2, n_shards
+    ).filter(pl.col("recipe_id").is_in(recipes["id"].implode()))
+    print(f"{n_shards} shards merged: {recipes.height} recipes.")
+    return recipes.drop("ingredients"), ingredients[0], recipe_ingredients
+
+
+def sql_type(dtype: pl.DataType) -> str:
+    """Get the SQL column type of a Polars dtype."""
+    if dtype.is_integer():
+        return "INTEGER"
+    if dtype.is_float():
+        return "REAL"
+    if dtype == pl.Boolean:
+        return "BOOLEAN"
+    return "TEXT"
+
+
+def create_table_sql(table_name: str, schema: pl.Schema) -> str:
+    """Get the CREATE TABLE statement of a table, with its keys."""
+    columns = [
+        f"{col} {sql_type(dtype)}"
+        + (" PRIMARY KEY" if PRIMARY_KEYS.get(table_name) == col else "")
+        for col, dtype in schema.items()
+    ]
+    columns += [
+        f"FOREIGN KEY ({col}) REFERENCES {ref} (id)"
+        for col, ref in FOREIGN_KEYS.get(table_name, {}).items()
+    ]
+    return f"CREATE TABLE {table_name} (\n    " + ",\n    ".join(columns) + "\n);"
+
+
+def create_indexes_sql(table_name: str) -> list[str]:
+    """Get the CREATE INDEX statements of the join keys of a table."""
+    return [
+        f"CREATE INDEX idx_{table_name}_{col} ON {table_name} ({col});"
+        for col in FOREIGN_KEYS.get(table_name, {})
+    ]
+
+
 def clean_data(s) -> str:
     """Convert the row value to a string."""
     if s is None:
@@ -114,7 +214,24 @@ def write_sql(data: pl.DataFrame | list, table_name: str, file: TextIOWrapper):
 
 
 if __name__ == "__main__":
-    recipes = pl.read_csv(RECIPES_CSV)
+    parser = argparse.ArgumentParser(description="Generate the SQL seed file.")
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Merge the outputs of stages 03-05 run on this many shards",
+    )
+    args = parser.parse_args()
+
+    if args.shards:
+        recipes, ingredients, recipe_ingredients = merge_shards(args.shards)
+    else:
+        # Every column but the ingredient names, which are in recipe_ingredients
+        recipes = read_dataset(
+            RECIPES_CSV, RECIPES_2, [col for col in RECIPES_2 if col != "ingredients"]
+        )
+        ingredients = read_dataset(INGREDIENTS_CSV, INGREDIENTS_2)
+        recipe_ingredients = read_dataset(INGREDIENT_RECIPE_CSV, INGREDIENT_RECIPE_2)
 
     # Split the dataframe into individual tables
     #   Independent tables: recipes, ingredients, cuisines, dietary_restrictions
@@ -139,13 +256,40 @@ if __name__ == "__main__":
             association_id="restriction_id",
         )
     )
-    database.update({"ingredients": pl.read_csv(INGREDIENTS_CSV)})
-    database.update({"recipe_ingredients": pl.read_csv(INGREDIENT_RECIPE_CSV)})
+    database.update({"ingredients": ingredients})
+    database.update({"recipe_ingredients": recipe_ingredients})
+
+    # Full-text index of the recipe text and ingredient labels (SQLite FTS5)
+    database.update(
+        {SEARCH_TABLE: get_search_table(recipes, database["recipe_ingredients"])}
+    )
+
+    # Table definitions from the Polars schemas
+    ddl = {
+        table: create_table_sql(table, data.schema)
+        for table, data in database.items()
+        if table != SEARCH_TABLE
+    }
+    ddl[SEARCH_TABLE] = search_table_ddl()
 
     # Write the SQL file
+    #   The data is loaded in one transaction, then the indexes are built on the
+    #   loaded tables, then the query planner statistics are gathered
     with SQL_FILE.open("w", encoding="UTF-8", newline="\n") as file:
+        file.write("BEGIN TRANSACTION;\n\n")
         for table, data in database.items():
             file.write(f"-- {table} table\n")
+            file.write(f"{ddl[table]}\n")
             write_sql(data, table, file)
             file.write("\n")
+        file.write("COMMIT;\n\n")
+
+        file.write("-- indexes\n")
+        for table in database:
+            for statement in create_indexes_sql(table):
+                file.write(f"{statement}\n")
+        file.write(
+            f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize');\n"
+        )
+        file.write("ANALYZE;\n")
     print("SQL file written.")
@@ -0,0 +1,130 @@
+import argparse
+import runpy
+import time
+
+import numpy as np
+import polars as pl
+
+from tag_categories import category_enums, encode_categories
+
+SEED_SCRIPT = "99-generate_sql_seed.py"
+
+# ==============================================================================
+
+
+def synthetic_categories(n_recipes: int, seed: int = 40404) -> pl.DataFrame:
+    """Make up comma-joined category columns, one or two values per recipe."""
+    rng = np.random.default_rng(seed)
+    return pl.DataFrame({"id": np.arange(n_recipes)}).with_columns(
+        pl.concat_str(
+            pl.Series(rng.choice(enum.categories, n_recipes)),
+            pl.when(pl.Series(rng.random(n_recipes) < 0.3)).then(
+                pl.Series(rng.choice(enum.categories, n_recipes))
+            ),
+            separator=",",
+            ignore_nulls=True,
+        ).alias(category)
+        for category, enum in category_enums().items()
+    )
+
+
+def string_category_table(recipes: pl.DataFrame, df_category: str) -> list[dict]:
+    """The recipe-category association of 99-generate_sql_seed before encoding."""
+    category_df = recipes.select(
+        pl.col(df_category)
+        .map_elements(lambda x: x.split(","), strategy="threading")
+        .explode()
+        .alias("name")
+        .drop_nulls()
+    ).unique()
+    category_df = category_df.with_row_index("id", offset=1)
+
+    cat_dict = category_df.to_dict(as_series=False)
+    recipe_dict = recipes.select(pl.col("id"), pl.col(df_category)).to_dicts()
+    return [
+        {"cuisine_id": c_id, "recipe_id": recipe["id"]}
+        for c_id, cat in zip(cat_dict["id"], cat_dict["name"])
+        for recipe in recipe_dict
+        if cat and recipe[df_category] and cat in recipe[df_category]
+    ]
+
+
+def timed(function, *args, repeat: int = 5, **kwargs) -> float:
+    """Best time of a few calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare comma-joined and List[Enum] tag category columns."
+    )
+    parser.add_argument("--recipes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    enums = category_enums()
+    strings = synthetic_categories(args.recipes)
+    encoded = encode_categories(strings, enums)
+    exploded_strings = strings.select("id", pl.col("cuisine").str.split(",")).explode(
+        "cuisine"
+    )
+    exploded_encoded = encoded.select("id", "cuisine").explode("cuisine")
+    cuisines = pl.DataFrame({"cuisine": enums["cuisine"].categories}).with_row_index()
+
+    print(
+        f"{args.recipes} recipes encoded in "
+        f"{timed(encode_categories, strings, enums):.0f} ms"
+    )
+    results = {
+        "size (MiB)": (
+            strings.drop("id").estimated_size("mb"),
+            encoded.drop("id").estimated_size("mb"),
+        ),
+        "group_by cuisine (ms)": (
+            timed(lambda: strings.group_by("cuisine").len()),
+            timed(lambda: encoded.group_by("cuisine").len()),
+        ),
+        "join cuisines (ms)": (
+            timed(lambda: exploded_strings.join(cuisines, on="cuisine")),
+            timed(
+                lambda: exploded_encoded.join(
+                    cuisines.with_columns(pl.col("cuisine").cast(enums["cuisine"])),
+                    on="cuisine",
+                )
+            ),
+        ),
+    }
+
+    # The SQL seed association tables, the string version is quadratic
+    get_category_table = runpy.run_path(SEED_SCRIPT)["get_category_table"]
+    sample = strings.head(20_000)
+    results["seed cuisine table, 20k (ms)"] = (
+        timed(string_category_table, sample, "cuisine", repeat=1),
+        timed(
+            get_category_table,
+            sample,
+            df_category="cuisine",
+            category_table_name="cuisines",
+            association_table_name="recipe_cuisines",
+            association_id="cuisine_id",
+            repeat=1,
+        ),
+    )
+
+    print(
+        pl.DataFrame(
+            [
+                {
+                    "measure": measure,
+                    "string": round(string, 2),
+                    "enum": round(enum, 2),
+                    "ratio": round(string / enum, 1) if enum else None,
+                }
+                for measure, (string, enum) in results.items()
+            ]
+        )
+    )
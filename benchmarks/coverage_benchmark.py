@@ -0,0 +1,61 @@
+import argparse
+import runpy
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from benchmarks.pipeline_benchmark import REPO_DIR, WORKSPACE_DIR
+from benchmarks.synthetic_data import RAW_RECIPES_FILE, generate_dataset
+from schemas import INGREDIENT_PRICELIST, RAW_RECIPES, read_dataset
+
+CLEANING_SCRIPT = REPO_DIR / "03-recipe_cleaning.py"
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+# Shares of the pricelist products kept, as if the rest had not been priced yet
+PRICELIST_SHARES = [1.0, 0.9, 0.7]
+THRESHOLDS = [0.5, 0.8, 1.0]
+
+# ==============================================================================
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the price coverage of the raw recipes and report it."
+    )
+    parser.add_argument("--size", type=int, default=230_000)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    workspace = args.workspace / str(args.size)
+    if not (workspace / RAW_RECIPES_FILE).exists():
+        generate_dataset(workspace, args.size)
+    recipes = read_dataset(workspace / RAW_RECIPES_FILE, RAW_RECIPES, ["ingredients"])
+    pricelist = read_dataset(workspace / PRICELIST_CSV, INGREDIENT_PRICELIST)
+    price_coverage = runpy.run_path(str(CLEANING_SCRIPT))["price_coverage"]
+
+    results = []
+    for share in PRICELIST_SHARES:
+        with tempfile.TemporaryDirectory() as directory:
+            pricelist_file = Path(directory) / "pricelist.csv"
+            pricelist.sample(fraction=share, seed=40404).write_csv(pricelist_file)
+            start = time.perf_counter()
+            coverage = price_coverage(recipes, pricelist_file)
+            seconds = time.perf_counter() - start
+
+        results.append(
+            {
+                "pricelist": share,
+                "recipes": recipes.height,
+                "coverage_s": seconds,
+                "mean_coverage": coverage.mean(),
+                # Scrapes saved per recipe sampled, compared with no filter
+                **{
+                    f"below_{threshold:.0%}": (coverage < threshold).mean()
+                    for threshold in THRESHOLDS
+                },
+            }
+        )
+
+    with pl.Config(float_precision=3, tbl_cols=-1):
+        print(pl.DataFrame(results))
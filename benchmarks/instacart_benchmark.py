@@ -0,0 +1,128 @@
+import argparse
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from benchmarks.pipeline_benchmark import REPO_DIR, print_results, run_command
+
+WORKSPACE_DIR = Path("benchmarks/workspace/instacart")
+N_PRODUCTS = 50_000
+PRODUCTS_PER_ORDER = 10
+
+# Each snippet runs in a fresh process, from the workspace directory
+LOADERS = {
+    "pandas_read_all": """
+from experiments.instacart import read_files
+frames = read_files(Path("instacart.zip"))
+print(sum(len(df) for df in frames), "rows")
+""",
+    "ingest_parquet": """
+from experiments.instacart import ingest
+ingest(Path("instacart.zip"), Path("parquet"))
+""",
+    "pandas_lookup": """
+from experiments.instacart import read_files
+frames = read_files(Path("instacart.zip"))
+products = next(df for df in frames if "product_name" in df)
+order_products = next(df for df in frames if "add_to_cart_order" in df)
+print(len(products[products["product_id"].isin(range(1, 100))]))
+print(len(order_products[order_products["order_id"].isin(range(1, 1000))]))
+""",
+    "parquet_lookup": """
+from experiments.instacart import order_products, product_names
+print(len(product_names(list(range(1, 100)), Path("parquet"))))
+print(len(order_products(list(range(1, 1000)), Path("parquet"))))
+""",
+}
+
+# ==============================================================================
+
+
+def zip_csv(df: pl.DataFrame, name: str) -> bytes:
+    """Zip a DataFrame as a single CSV member, like the Kaggle download."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr(name, df.write_csv())
+    return buffer.getvalue()
+
+
+def generate_instacart(file: Path, n_orders: int, seed: int = 40404):
+    """Write a synthetic nested zip shaped like the Instacart 2017 dataset."""
+    print(f"Generating {n_orders} orders in {file}...")
+    rng = np.random.default_rng(seed)
+    n_rows = n_orders * PRODUCTS_PER_ORDER
+
+    tables = {
+        "aisles.csv": pl.DataFrame(
+            {"aisle_id": range(1, 135), "aisle": [f"aisle {i}" for i in range(134)]}
+        ),
+        "departments.csv": pl.DataFrame(
+            {
+                "department_id": range(1, 22),
+                "department": [f"department {i}" for i in range(21)],
+            }
+        ),
+        "products.csv": pl.DataFrame(
+            {
+                "product_id": range(1, N_PRODUCTS + 1),
+                "product_name": [f"product {i}" for i in range(N_PRODUCTS)],
+                "aisle_id": rng.integers(1, 135, N_PRODUCTS),
+                "department_id": rng.integers(1, 22, N_PRODUCTS),
+            }
+        ),
+        "orders.csv": pl.DataFrame(
+            {
+                "order_id": range(1, n_orders + 1),
+                "user_id": rng.integers(1, n_orders // 10 + 2, n_orders),
+                "eval_set": rng.choice(["prior", "train", "test"], n_orders),
+                "order_number": rng.integers(1, 100, n_orders),
+                "order_dow": rng.integers(0, 7, n_orders),
+                "order_hour_of_day": rng.integers(0, 24, n_orders),
+                "days_since_prior_order": rng.integers(0, 31, n_orders).astype(float),
+            }
+        ),
+        "order_products__prior.csv": pl.DataFrame(
+            {
+                "order_id": np.repeat(np.arange(1, n_orders + 1), PRODUCTS_PER_ORDER),
+                "product_id": rng.integers(1, N_PRODUCTS + 1, n_rows),
+                "add_to_cart_order": np.tile(
+                    np.arange(1, PRODUCTS_PER_ORDER + 1), n_orders
+                ),
+                "reordered": rng.integers(0, 2, n_rows),
+            }
+        ),
+    }
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(file, "w", zipfile.ZIP_STORED) as z:
+        for name, df in tables.items():
+            z.writestr(f"{name}.zip", zip_csv(df, name))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare pandas loading of the Instacart zip with Parquet."
+    )
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    parser.add_argument("--regenerate", action="store_true")
+    args = parser.parse_args()
+
+    if args.regenerate or not (args.workspace / "instacart.zip").exists():
+        generate_instacart(args.workspace / "instacart.zip", args.orders)
+
+    results = []
+    for name, code in LOADERS.items():
+        print(f"Running {name}...")
+        command = [
+            "-c",
+            f"import sys\nsys.path.insert(0, {str(REPO_DIR)!r})\n"
+            f"from pathlib import Path\n{code}",
+        ]
+        result = run_command(command, args.workspace, args.workspace / f"{name}.log")
+        results.append({"size": args.orders, "stage": name, **result})
+    print_results(results)
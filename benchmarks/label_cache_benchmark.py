@@ -0,0 +1,90 @@
+import argparse
+import os
+import runpy
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from benchmarks.pipeline_benchmark import REPO_DIR, WORKSPACE_DIR, run_benchmark
+from label_cache import LabelCache
+
+PRICE_SCRIPT = REPO_DIR / "05-match-ingredient-prices.py"
+
+# ==============================================================================
+
+
+def parse_labels(stage: dict, recipe_ingredients: list[dict], label_cache=None):
+    """Parse every ingredient label as stage 05 does, with or without the cache."""
+    outputs = []
+    for recipe in recipe_ingredients:
+        mapping = recipe["ingredient_labels_quantities"]
+        for name in recipe["ingredient_names"]:
+            for label in mapping:
+                if name not in label:
+                    continue
+                if label_cache is None:
+                    outputs.append(stage["extract_values"](label, mapping))
+                else:
+                    outputs.append(
+                        stage["cached_extract_values"](label, mapping, label_cache)
+                    )
+    return outputs
+
+
+def summary(outputs: list[dict | None]) -> list[tuple[str, float, str] | None]:
+    return [
+        output
+        and (
+            output["label"],
+            float(output["quantity"].magnitude),
+            str(output["quantity"].units),
+        )
+        for output in outputs
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time parsing the ingredient labels of stage 05, cold and warm."
+    )
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    workspace = args.workspace / str(args.size)
+    if not (workspace / "data/recipes-1.csv").exists():
+        run_benchmark([args.size], ["03"], args.workspace, False)
+
+    os.chdir(workspace)
+    stage = runpy.run_path(str(PRICE_SCRIPT))
+    recipe_ingredients = stage["get_recipe_ingredients"](
+        stage["INPUT_RECIPES_CSV"], stage["INPUT_INGREDIENTS_CSV"]
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        cache_file = Path(directory) / "label-cache.sqlite"
+        runs = {"uncached": None, "cold": None, "warm": None}
+        for run in runs:
+            start = time.perf_counter()
+            label_cache = None
+            if run != "uncached":
+                label_cache = LabelCache(stage["LABEL_CACHE_VERSION"], cache_file)
+            runs[run] = parse_labels(stage, recipe_ingredients, label_cache)
+            if label_cache is not None:
+                label_cache.save()
+                label_cache.db.close()
+            results.append(
+                {"run": run, "seconds": round(time.perf_counter() - start, 3)}
+            )
+
+    if not summary(runs["uncached"]) == summary(runs["cold"]) == summary(runs["warm"]):
+        raise ValueError("The cached labels are parsed differently")
+    print(f"{len(runs['uncached'])} labels parsed")
+    print(
+        pl.DataFrame(results).with_columns(
+            (pl.col("seconds").first() / pl.col("seconds")).round(1).alias("speedup")
+        )
+    )
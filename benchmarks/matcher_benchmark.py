@@ -0,0 +1,80 @@
+import argparse
+import time
+
+import numpy as np
+import polars as pl
+
+from ingredient_matcher import (
+    PRICELIST_CSV,
+    RECIPES_CSV,
+    load_word_vectors,
+    pricelist_aliases,
+    propose_matches,
+)
+
+# ==============================================================================
+
+
+def random_names(rng: np.random.Generator, vocabulary: list[str], n: int) -> pl.Series:
+    """Make up 1-4 word ingredient names from the corpus vocabulary."""
+    lengths = rng.integers(1, 5, n)
+    words = rng.choice(vocabulary, lengths.sum())
+    return pl.Series(
+        "name", [" ".join(name) for name in np.split(words, np.cumsum(lengths)[:-1])]
+    )
+
+
+def naive_matches(word_vectors, names: pl.Series, aliases: pl.Series) -> list[str]:
+    """Compare every name with every alias in Python, one pair at a time."""
+    return [
+        max(
+            aliases,
+            key=lambda alias: word_vectors.n_similarity(name.split(), alias.split()),
+        )
+        for name in names
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare pairwise and batched embedding matching."
+    )
+    parser.add_argument("--names", type=int, default=50_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--naive-names", type=int, default=20)
+    args = parser.parse_args()
+
+    word_vectors = load_word_vectors(RECIPES_CSV, PRICELIST_CSV)
+    vocabulary = [word for word in word_vectors.index_to_key if word.isalpha()]
+    rng = np.random.default_rng(40404)
+
+    names = random_names(rng, vocabulary, args.names)
+    aliases = pricelist_aliases(PRICELIST_CSV)
+    aliases = pl.concat(
+        [
+            aliases,
+            pl.DataFrame(
+                {
+                    "row": np.arange(args.products - aliases.height) + aliases.height,
+                    "alias": random_names(
+                        rng, vocabulary, args.products - aliases.height
+                    ),
+                },
+                schema=aliases.schema,
+            ),
+        ]
+    )
+
+    # The pairwise loop is far too slow for every name, so it is extrapolated
+    start = time.perf_counter()
+    naive_matches(word_vectors, names[: args.naive_names], aliases["alias"])
+    naive_seconds = (time.perf_counter() - start) * args.names / args.naive_names
+    print(f"naive: ~{naive_seconds:.0f}s (from {args.naive_names} names)")
+
+    start = time.perf_counter()
+    proposals = propose_matches(names, aliases, word_vectors)
+    batched_seconds = time.perf_counter() - start
+    print(
+        f"batched: {batched_seconds:.2f}s for {args.names} names x "
+        f"{aliases.height} aliases, {naive_seconds / batched_seconds:.0f}x faster"
+    )
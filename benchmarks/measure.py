@@ -0,0 +1,41 @@
+import json
+import resource
+import runpy
+import sys
+from pathlib import Path
+
+# Run as: python measure.py RESULT_FILE (SCRIPT | -c CODE) [ARGS...]
+#
+# ru_maxrss of a child process includes the high-water mark of the parent it
+# was forked from, so the command is run in this (freshly exec'd) process and
+# its own peak RSS is written to RESULT_FILE.
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process, in MiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except FileNotFoundError:
+        pass
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (2**20 if sys.platform == "darwin" else 1024)
+
+
+if __name__ == "__main__":
+    result_file = Path(sys.argv[1])
+    try:
+        if sys.argv[2] == "-c":
+            code = sys.argv[3]
+            sys.argv = ["-c", *sys.argv[4:]]
+            sys.path[0] = ""
+            exec(compile(code, "<string>", "exec"), {"__name__": "__main__"})
+        else:
+            sys.argv = sys.argv[2:]
+            sys.path[0] = str(Path(sys.argv[0]).resolve().parent)
+            runpy.run_path(sys.argv[0], run_name="__main__")
+    finally:
+        result_file.write_text(json.dumps({"max_rss_mb": round(peak_rss_mb(), 1)}))
@@ -0,0 +1,121 @@
+import argparse
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+import mixed_fractions
+
+MODULE_FILE = Path("mixed_fractions.py")
+
+# ==============================================================================
+
+
+def load_revision(revision: str) -> types.ModuleType:
+    """Import mixed_fractions.py as it was at a git revision."""
+    source = subprocess.run(
+        ["git", "show", f"{revision}:{MODULE_FILE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    module = types.ModuleType(f"mixed_fractions_{revision}")
+    exec(compile(source, f"{revision}:{MODULE_FILE}", "exec"), module.__dict__)
+    return module
+
+
+def root_revision() -> str:
+    """The first commit of the repository."""
+    return subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()[0]
+
+
+def quantity_texts(n: int, seed: int = 40404) -> list[str]:
+    """Make up scraped quantities like '1 1/2', '3/4' and '2'."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        whole = rng.randint(0, 4)
+        denominator = rng.choice([2, 3, 4, 8])
+        numerator = rng.randint(0, denominator - 1)
+        if not numerator:
+            texts.append(str(whole or 1))
+        elif whole:
+            texts.append(f"{whole} {numerator}/{denominator}")
+        else:
+            texts.append(f"{numerator}/{denominator}")
+    return texts
+
+
+def workload(Mixed, texts: list[str]) -> dict[str, float]:
+    """Time parsing, scaling, summing and formatting quantities."""
+    times = {}
+
+    start = time.perf_counter()
+    quantities = [Mixed(text) for text in texts]
+    times["parse"] = time.perf_counter() - start
+
+    factor = Mixed(1, 1, 2)
+    start = time.perf_counter()
+    scaled = [quantity * factor for quantity in quantities]
+    times["scale"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = Mixed(0)
+    for quantity in scaled:
+        total = total + quantity - Mixed(0, 1, 8)
+    times["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    formatted = [str(quantity) for quantity in scaled]
+    times["str"] = time.perf_counter() - start
+
+    times["result"] = (str(total), hash(tuple(formatted)))
+    return times
+
+
+def instance_bytes(Mixed, texts: list[str]) -> float:
+    """Bytes allocated per parsed quantity kept alive."""
+    tracemalloc.start()
+    quantities = [Mixed(text) for text in texts]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del quantities
+    return size / len(texts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the Mixed fraction class with an earlier revision."
+    )
+    parser.add_argument("--quantities", type=int, default=200_000)
+    parser.add_argument(
+        "--baseline", help="git revision to compare with (default: first commit)"
+    )
+    args = parser.parse_args()
+
+    baseline = load_revision(args.baseline or root_revision())
+    texts = quantity_texts(args.quantities)
+
+    before = workload(baseline.Mixed, texts)
+    after = workload(mixed_fractions.Mixed, texts)
+    if before.pop("result") != after.pop("result"):
+        sys.exit("Results differ from the baseline")
+
+    print(f"{args.quantities} quantities, same results")
+    for step, seconds in before.items():
+        print(
+            f"{step:>8}: {seconds * 1000:8.1f} ms -> {after[step] * 1000:8.1f} ms "
+            f"({seconds / after[step]:.1f}x)"
+        )
+    print(
+        f"{'memory':>8}: {instance_bytes(baseline.Mixed, texts):6.0f} B -> "
+        f"{instance_bytes(mixed_fractions.Mixed, texts):6.0f} B per instance"
+    )
@@ -0,0 +1,121 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_data import RAW_RECIPES_FILE, generate_dataset
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+MEASURE_SCRIPT = REPO_DIR / "benchmarks/measure.py"
+WORKSPACE_DIR = Path("benchmarks/workspace")
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Stages that can run offline against a synthetic workspace
+STAGES = {
+    "03": "03-recipe_cleaning.py",
+    "05": "05-match-ingredient-prices.py",
+    "99": "99-generate_sql_seed.py",
+}
+
+# Keep every cleaned recipe so downstream stages see the full dataset
+STAGE_ENV = {"RECIPE_SAMPLE_SIZE": "0"}
+
+# ==============================================================================
+
+
+def run_command(
+    args: list[str], cwd: Path, log_file: Path, env: dict[str, str] | None = None
+) -> dict[str, float | int]:
+    """Run a Python script or `-c` code, returning its wall time and peak memory."""
+    result_file = log_file.with_suffix(".rss.json")
+    result_file.unlink(missing_ok=True)
+    with log_file.open("w") as log:
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, str(MEASURE_SCRIPT), str(result_file.resolve()), *args],
+            cwd=cwd,
+            env={**os.environ, **(env or {})},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        seconds = time.perf_counter() - start
+
+    max_rss_mb = None
+    if result_file.exists():
+        max_rss_mb = json.loads(result_file.read_text())["max_rss_mb"]
+    return {
+        "seconds": round(seconds, 3),
+        "max_rss_mb": max_rss_mb,
+        "returncode": process.returncode,
+    }
+
+
+def run_stage(script: str, workspace: Path, log_file: Path) -> dict[str, float | int]:
+    """Run a stage in `workspace`, returning its wall time and peak memory."""
+    return run_command([str(REPO_DIR / script)], workspace, log_file, STAGE_ENV)
+
+
+def run_benchmark(
+    sizes: list[int], stages: list[str], workspace_dir: Path, regenerate: bool
+) -> list[dict[str, str | int | float]]:
+    """Generate (or reuse) a workspace per size and time each stage in it."""
+    results = []
+    for size in sizes:
+        workspace = workspace_dir / str(size)
+        if regenerate or not (workspace / RAW_RECIPES_FILE).exists():
+            generate_dataset(workspace, size)
+
+        for stage in stages:
+            print(f"Running stage {stage} on {size} recipes...")
+            result = run_stage(STAGES[stage], workspace, workspace / f"{stage}.log")
+            results.append({"size": size, "stage": stage, **result})
+            print(f"Stage {stage}: {result}")
+            if result["returncode"] != 0:
+                print(f"Stage {stage} failed, see {workspace / f'{stage}.log'}")
+                break
+    return results
+
+
+def print_results(results: list[dict], baseline: list[dict] | None = None):
+    """Print a results table, with the speedup against a baseline run if given."""
+    baseline_map = {(r["size"], r["stage"]): r for r in baseline or []}
+
+    header = f"{'size':>9} {'stage':>5} {'seconds':>10} {'max_rss_mb':>10}"
+    if baseline_map:
+        header += f" {'speedup':>8} {'mem_ratio':>9}"
+    print(header)
+    for result in results:
+        line = f"{result['size']:>9} {result['stage']:>5} {result['seconds']:>10.3f} {result['max_rss_mb'] or 0:>10.1f}"
+        base = baseline_map.get((result["size"], result["stage"]))
+        if base and result["max_rss_mb"] and base["max_rss_mb"]:
+            speedup = base["seconds"] / result["seconds"]
+            mem_ratio = result["max_rss_mb"] / base["max_rss_mb"]
+            line += f" {speedup:>7.2f}x {mem_ratio:>9.2f}"
+        if result["returncode"] != 0:
+            line += " (failed)"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time stages 03, 05 and 99 on synthetic datasets."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES[:2])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.stages, args.workspace, args.regenerate)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print_results(results, baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
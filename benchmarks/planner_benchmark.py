@@ -0,0 +1,129 @@
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import yaml
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from meal_planner import NUTRITION, POOL_SIZE, candidate_mask, plan_meals
+from recipe_query import FACETS, build_facet_index
+
+TAGS_FILE = Path("data/tags.yaml")
+
+# ==============================================================================
+
+
+def synthetic_catalog(n_recipes: int, seed: int = 40404) -> dict:
+    """Make up a catalog shaped like meal_planner.load_catalog's."""
+    rng = np.random.default_rng(seed)
+    with TAGS_FILE.open() as f:
+        tag_categories = yaml.safe_load(f)
+
+    recipes = pl.DataFrame(
+        {
+            "id": np.arange(n_recipes),
+            "name": [f"recipe {i}" for i in range(n_recipes)],
+            "cost": rng.lognormal(2, 0.8, n_recipes).round(2),
+            **{
+                column: rng.gamma(2, 200 if column == "calories" else 15, n_recipes)
+                .round()
+                .astype(float)
+                for column in NUTRITION
+            },
+        }
+    ).with_columns(
+        # One or two values of every facet
+        pl.concat_str(
+            pl.Series(rng.choice(values, n_recipes)),
+            pl.when(pl.Series(rng.random(n_recipes) < 0.5)).then(
+                pl.Series(rng.choice(values, n_recipes))
+            ),
+            separator=",",
+            ignore_nulls=True,
+        ).alias(facet)
+        for facet, values in tag_categories.items()
+        if facet in FACETS
+    )
+    return {
+        "recipes": recipes.select("id", "name", "cost", *NUTRITION),
+        "cost": recipes["cost"].to_numpy(),
+        "nutrition": recipes.select(NUTRITION).to_numpy(),
+        "index": build_facet_index(recipes, FACETS),
+    }
+
+
+def random_request(rng: np.random.Generator, catalog: dict) -> dict:
+    """A request for a week of meals with a cuisine or two and a calorie cap."""
+    index = catalog["index"]
+    return {
+        "n": 7,
+        "budget": float(rng.uniform(40, 120)),
+        "selections": {
+            "cuisine": set(rng.choice(index["facets"]["cuisine"]["values"], 2))
+        },
+        "bounds": {"calories": (None, float(rng.uniform(500, 1000)))},
+    }
+
+
+def optimal_value(catalog: dict, request: dict, objective: str) -> float:
+    """Solve the request exactly as an integer program, for comparison."""
+    rows = np.flatnonzero(
+        candidate_mask(catalog, request["selections"], request["bounds"])
+    )
+    value = catalog["nutrition"][rows, NUTRITION.index(objective)]
+    cost = catalog["cost"][rows]
+    result = milp(
+        -value,
+        constraints=[
+            LinearConstraint(np.ones(len(rows)), request["n"], request["n"]),
+            LinearConstraint(cost, 0, request["budget"]),
+        ],
+        integrality=np.ones(len(rows)),
+        bounds=Bounds(0, 1),
+    )
+    return -result.fun
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time meal plan requests.")
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--compare", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = synthetic_catalog(args.recipes)
+    print(
+        f"Catalog of {args.recipes} recipes built in {time.perf_counter() - start:.2f}s"
+    )
+
+    rng = np.random.default_rng(40404)
+    requests = [random_request(rng, catalog) for _ in range(args.requests)]
+
+    latencies = []
+    values = []
+    for request in requests:
+        start = time.perf_counter()
+        plan = plan_meals(catalog, **request)
+        latencies.append(time.perf_counter() - start)
+        values.append(plan["protein_pdv"].sum())
+    latencies = np.array(latencies) * 1000
+    print(
+        f"{args.requests} requests: p50 {np.percentile(latencies, 50):.1f} ms, "
+        f"p95 {np.percentile(latencies, 95):.1f} ms, max {latencies.max():.1f} ms"
+    )
+
+    # How close the greedy swaps get to the optimum
+    gaps = []
+    ilp_seconds = 0.0
+    for request, value in zip(requests[: args.compare], values):
+        start = time.perf_counter()
+        optimum = optimal_value(catalog, request, "protein_pdv")
+        ilp_seconds += time.perf_counter() - start
+        gaps.append(1 - value / optimum)
+    print(
+        f"Exact ILP: {ilp_seconds / args.compare * 1000:.0f} ms per request, "
+        f"greedy within {max(gaps):.2%} of optimal (pool of {POOL_SIZE})"
+    )
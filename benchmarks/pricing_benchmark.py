@@ -0,0 +1,75 @@
+import argparse
+import ast
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+import requests
+
+from pricing_client import (
+    BlueCartSource,
+    PriceClient,
+    recipe_search_terms,
+    search_terms,
+    serve_fake_prices,
+)
+from schemas import INGREDIENT_PRICELIST, read_dataset
+
+RECIPES_CSV = Path("data/recipes-1.csv")
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+
+# ==============================================================================
+
+
+def naive_refresh(url: str, recipes_file: Path) -> int:
+    """One request per recipe ingredient, in sequence, like the experiment."""
+    n_requests = 0
+    for names in pl.read_csv(recipes_file)["ingredients"]:
+        for term in ast.literal_eval(names):
+            params = {"api_key": "fake", "search_term": term, "type": "search"}
+            requests.get(url, params).json()
+            n_requests += 1
+    return n_requests
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare naive price requests with the cached, batched client."
+    )
+    parser.add_argument("--recipes", type=Path, default=RECIPES_CSV)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--skip-naive", action="store_true")
+    args = parser.parse_args()
+
+    server = serve_fake_prices(latency=args.latency)
+    url = f"http://127.0.0.1:{server.server_port}"
+    pricelist = read_dataset(PRICELIST_CSV, INGREDIENT_PRICELIST).with_row_index("row")
+    terms = search_terms(recipe_search_terms(args.recipes), pricelist)["term"]
+
+    if not args.skip_naive:
+        start = time.perf_counter()
+        n_requests = naive_refresh(url, args.recipes)
+        print(f"naive: {n_requests} requests in {time.perf_counter() - start:.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = PriceClient(
+            BlueCartSource("fake", url),
+            cache_file=Path(tmp) / "cache.sqlite",
+            quota=10**9,
+            max_workers=args.workers,
+            rate=args.rate,
+        )
+        for run in ["cold", "warm"]:
+            start = time.perf_counter()
+            used = client.requests_used()
+            client.fetch(terms)
+            print(
+                f"client {run}: {client.requests_used() - used} requests "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+        client.db.close()
+
+    server.shutdown()
@@ -0,0 +1,111 @@
+import argparse
+import multiprocessing
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from benchmarks.pipeline_benchmark import WORKSPACE_DIR, run_benchmark
+from recipe_query import load_recipes, recipe_store
+from schemas import RECIPES_2, read_dataset
+
+RECIPES_CSV = Path("data/recipes-2.csv")
+READERS = [1, 8, 32]
+
+# How each app process could load the recipes
+LOADERS = {
+    "csv": lambda file: read_dataset(file, RECIPES_2),
+    "parquet": lambda file: pl.read_parquet(file.with_suffix(".parquet")),
+    "store": lambda file: load_recipes(file, RECIPES_2),
+}
+
+# ==============================================================================
+
+
+def memory_mb() -> dict[str, float]:
+    """Resident, proportional (shared pages split between processes) and
+    private memory of this process, in MiB (Linux only)."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0]) / 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def reader(loader: str, file: Path, barrier, results):
+    """Load the recipes, use every column, then measure while all readers hold them."""
+    before = memory_mb()
+    start = time.perf_counter()
+    recipes = LOADERS[loader](file)
+    open_ms = (time.perf_counter() - start) * 1000
+    recipes.select(pl.all().cast(pl.String).str.len_bytes().sum())
+
+    barrier.wait()
+    after = memory_mb()
+    results.put(
+        {"open_ms": open_ms, **{key: after[key] - before[key] for key in after}}
+    )
+    barrier.wait()
+
+
+def run_readers(loader: str, file: Path, n_readers: int) -> dict[str, float]:
+    """Start n_readers fresh processes loading the recipes at the same time."""
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_readers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=reader, args=(loader, file, barrier, results))
+        for _ in range(n_readers)
+    ]
+    for process in processes:
+        process.start()
+    measurements = pl.DataFrame([results.get() for _ in processes])
+    for process in processes:
+        process.join()
+
+    return {
+        "loader": loader,
+        "readers": n_readers,
+        "open_p50_ms": float(np.median(measurements["open_ms"])),
+        "open_max_ms": measurements["open_ms"].max(),
+        "rss_mb": measurements["rss"].mean(),
+        "private_mb": measurements["private"].mean(),
+        # The memory all readers really use together, shared pages counted once
+        "total_pss_mb": measurements["pss"].sum(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare per-process memory and open time of concurrent readers."
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, nargs="+", default=READERS)
+    parser.add_argument("--loaders", nargs="+", choices=LOADERS, default=list(LOADERS))
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    workspace = args.workspace / str(args.size)
+    file = workspace / RECIPES_CSV
+    if not file.exists():
+        run_benchmark([args.size], ["03", "05"], args.workspace, False)
+
+    # Write the Parquet copy and the store once, outside the timed loads
+    read_dataset(file, RECIPES_2).write_parquet(file.with_suffix(".parquet"))
+    recipe_store(file, RECIPES_2)
+
+    results = []
+    for n_readers in args.readers:
+        for loader in args.loaders:
+            print(f"{n_readers} readers of the {loader}...")
+            results.append(run_readers(loader, file, n_readers))
+
+    with pl.Config(tbl_rows=-1, float_precision=1):
+        print(pl.DataFrame(results))
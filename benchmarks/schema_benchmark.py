@@ -0,0 +1,92 @@
+import argparse
+import time
+from pathlib import Path
+
+import polars as pl
+
+from benchmarks.pipeline_benchmark import STAGES, WORKSPACE_DIR, run_benchmark
+from schemas import (
+    INGREDIENT_PRICELIST,
+    INGREDIENT_RECIPE_2,
+    INGREDIENTS_1,
+    INGREDIENTS_2,
+    RAW_RECIPES,
+    RECIPES_1,
+    RECIPES_2,
+    read_dataset,
+)
+
+# The CSV reads of the pipeline: file, schema and the columns it uses
+READS = [
+    (
+        "food-com-recipes/RAW_recipes.csv",
+        RAW_RECIPES,
+        [col for col in RAW_RECIPES if col not in ["contributor_id", "submitted"]],
+    ),
+    ("food-com-recipes/RAW_recipes.csv", RAW_RECIPES, ["id", "tags"]),
+    ("data/recipes-1.csv", RECIPES_1, ["id", "ingredients"]),
+    ("data/recipes-1.csv", RECIPES_1, list(RECIPES_1)),
+    ("data/ingredients-1.csv", INGREDIENTS_1, ["id", "ingredients"]),
+    ("data/ingredient-pricelist.csv", INGREDIENT_PRICELIST, list(INGREDIENT_PRICELIST)),
+    (
+        "data/recipes-2.csv",
+        RECIPES_2,
+        [col for col in RECIPES_2 if col != "ingredients"],
+    ),
+    ("data/ingredients-2.csv", INGREDIENTS_2, list(INGREDIENTS_2)),
+    ("data/ingredient-recipe-2.csv", INGREDIENT_RECIPE_2, list(INGREDIENT_RECIPE_2)),
+]
+
+# ==============================================================================
+
+
+def timed(function, repeat: int) -> float:
+    """Best time of a few calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare inferred CSV reads with the declared schemas."
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The pipeline benchmark generates the workspace and runs the stages in it
+    workspace = args.workspace / str(args.size)
+    if not all((workspace / file).exists() for file, _, _ in READS):
+        run_benchmark([args.size], list(STAGES), args.workspace, False)
+
+    results = []
+    for file, schema, columns in READS:
+        path = workspace / file
+        read = pl.read_csv(path).select(columns)
+        if not read.equals(read_dataset(path, schema, columns)):
+            raise ValueError(f"{file} is read differently with its schema")
+        results.append(
+            {
+                "file": file.split("/")[-1],
+                "columns": f"{len(columns)}/{len(schema)}",
+                "read_csv (ms)": timed(lambda: pl.read_csv(path), args.repeat),
+                "scan_csv (ms)": timed(
+                    lambda: pl.scan_csv(path).select(columns).collect(), args.repeat
+                ),
+                "schema (ms)": timed(
+                    lambda: read_dataset(path, schema, columns), args.repeat
+                ),
+            }
+        )
+
+    with pl.Config(tbl_rows=-1, float_precision=1):
+        print(
+            pl.DataFrame(results).with_columns(
+                (pl.col("read_csv (ms)") / pl.col("schema (ms)")).alias("speedup")
+            )
+        )
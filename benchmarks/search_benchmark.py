@@ -0,0 +1,107 @@
+import argparse
+import random
+import sqlite3
+import time
+
+import numpy as np
+import polars as pl
+
+from benchmarks.synthetic_data import (
+    NAME_WORDS,
+    TEMPLATE_INGREDIENTS_CSV,
+    TEMPLATE_RECIPES_CSV,
+    load_templates,
+    random_recipe,
+)
+from recipe_search import SEARCH_COLUMNS, build_search_index, search_recipes
+
+# ==============================================================================
+
+
+def synthetic_search_table(n_recipes: int, seed: int = 40404) -> pl.DataFrame:
+    """Make up the rows of the search table from the sample recipes."""
+    rng = random.Random(seed)
+    templates = load_templates(TEMPLATE_RECIPES_CSV, TEMPLATE_INGREDIENTS_CSV)
+    rows = []
+    for recipe_id in range(n_recipes):
+        template = rng.choice(templates)
+        steps, _, labels = random_recipe(rng, templates)
+        rows.append(
+            {
+                "rowid": recipe_id,
+                "name": f"{rng.choice(NAME_WORDS)} {template['name']}",
+                "ingredients": " ; ".join(labels),
+                "description": template["description"],
+                "steps": str(steps),
+            }
+        )
+    return pl.DataFrame(rows)
+
+
+def like_search(connection: sqlite3.Connection, text: str) -> list[tuple[int]]:
+    """Get the recipes containing every word of the text anywhere, with LIKE."""
+    words = text.split()
+    any_column = (
+        "(" + " OR ".join(f"{column} LIKE ?" for column in SEARCH_COLUMNS) + ")"
+    )
+    return connection.execute(
+        f"SELECT id FROM recipes WHERE {' AND '.join([any_column] * len(words))}",
+        [f"%{word}%" for word in words for _ in SEARCH_COLUMNS],
+    ).fetchall()
+
+
+def latencies(function, connection, queries: list[str]) -> np.ndarray:
+    """Milliseconds taken by each query."""
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        function(connection, query)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare FTS5 ranked search with LIKE scans."
+    )
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    search_table = synthetic_search_table(args.recipes)
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        f"CREATE TABLE recipes (id INTEGER PRIMARY KEY, {', '.join(SEARCH_COLUMNS)})"
+    )
+    connection.executemany(
+        f"INSERT INTO recipes VALUES (?{', ?' * len(SEARCH_COLUMNS)})",
+        search_table.iter_rows(),
+    )
+
+    start = time.perf_counter()
+    build_search_index(connection, search_table)
+    print(
+        f"FTS5 index of {args.recipes} recipes built in {time.perf_counter() - start:.1f}s"
+    )
+
+    # One and two word queries from the recipe names and ingredient labels
+    rng = random.Random(40404)
+    vocabulary = sorted(
+        {
+            word
+            for text in search_table["name"].head(1000).to_list()
+            + search_table["ingredients"].head(1000).to_list()
+            for word in text.split()
+            if len(word) > 3 and word.isalpha()
+        }
+    )
+    queries = [
+        " ".join(rng.sample(vocabulary, rng.randint(1, 2))) for _ in range(args.queries)
+    ]
+
+    for name, function in [("LIKE scan", like_search), ("FTS5 top 20", search_recipes)]:
+        times = latencies(function, connection, queries)
+        print(
+            f"{name:>12}: p50 {np.percentile(times, 50):7.2f} ms, "
+            f"p95 {np.percentile(times, 95):7.2f} ms"
+        )
@@ -0,0 +1,184 @@
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import numpy as np
+import polars as pl
+
+from benchmarks.pipeline_benchmark import REPO_DIR, WORKSPACE_DIR, run_benchmark
+
+RECIPES_CSV = Path("data/recipes-2.csv")
+SERVICE_SCRIPT = REPO_DIR / "recipe_service.py"
+
+# Server options of each run, and whether clients revalidate with If-None-Match
+RUNS = {
+    "uncached": (["--cache-size", "0", "--no-warm-up"], False),
+    "cached": ([], False),
+    "revalidated": ([], True),
+}
+
+# ==============================================================================
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_service(
+    recipe_file: Path, options: list[str]
+) -> tuple[subprocess.Popen, int]:
+    """Start the service in its own process and wait until it answers."""
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(SERVICE_SCRIPT),
+            "--recipes",
+            str(recipe_file),
+            "--port",
+            str(port),
+            *options,
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    while True:
+        try:
+            get(http.client.HTTPConnection("127.0.0.1", port), "/health")
+            return process, port
+        except ConnectionRefusedError:
+            if process.poll() is not None:
+                raise RuntimeError("The recipe service did not start")
+            time.sleep(0.2)
+
+
+def get(
+    connection: http.client.HTTPConnection, path: str, etag: str | None = None
+) -> tuple[int, str | None, bytes]:
+    connection.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+    response = connection.getresponse()
+    return response.status, response.getheader("ETag"), response.read()
+
+
+def random_queries(facets: dict[str, list[str]], n: int, seed: int = 40404):
+    """Make up queries with one or two facets, a range, a sort and a page."""
+    rng = np.random.default_rng(seed)
+    names = [facet for facet, values in facets.items() if values]
+    queries = []
+    for _ in range(n):
+        params = {
+            facet: ",".join(rng.choice(facets[facet], rng.integers(1, 3)))
+            for facet in rng.choice(names, rng.integers(1, 3), replace=False)
+        }
+        if rng.random() < 0.5:
+            params["max_cost"] = int(rng.integers(5, 50))
+        if rng.random() < 0.3:
+            params["max_minutes"] = int(rng.choice([15, 30, 60, 120]))
+        params["sort"] = rng.choice(["cost", "-calories", "minutes", "id"])
+        params["page"] = int(rng.geometric(0.6))
+        queries.append("/recipes?" + urlencode(params))
+    return queries
+
+
+def load_test(
+    port: int,
+    queries: list[str],
+    n_requests: int,
+    n_clients: int,
+    revalidate: bool,
+    seed: int = 40404,
+) -> dict[str, float]:
+    """Send Zipf-distributed queries from concurrent keep-alive clients."""
+    rng = np.random.default_rng(seed)
+    # A few queries are asked much more often than the rest
+    picks = (rng.zipf(1.2, n_requests) - 1) % len(queries)
+    latencies = np.zeros(n_requests)
+    statuses = np.zeros(n_requests, np.int64)
+
+    def client(requests: range):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        etags = {}
+        for i in requests:
+            path = queries[picks[i]]
+            start = time.perf_counter()
+            status, etag, _ = get(
+                connection, path, etags.get(path) if revalidate else None
+            )
+            latencies[i] = time.perf_counter() - start
+            statuses[i] = status
+            etags[path] = etag or etags.get(path)
+        connection.close()
+
+    threads = [
+        threading.Thread(target=client, args=(range(c, n_requests, n_clients),))
+        for c in range(n_clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    latencies *= 1000
+    return {
+        "requests_per_s": n_requests / seconds,
+        "p50_ms": np.percentile(latencies, 50),
+        "p99_ms": np.percentile(latencies, 99),
+        "not_modified": float(np.mean(statuses == 304)),
+        "errors": int(np.sum((statuses != 200) & (statuses != 304))),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the recipe service.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--runs", nargs="+", choices=RUNS, default=list(RUNS))
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    workspace = args.workspace / str(args.size)
+    recipe_file = workspace / RECIPES_CSV
+    if not recipe_file.exists():
+        run_benchmark([args.size], ["03", "05"], args.workspace, False)
+
+    results = []
+    for run in args.runs:
+        options, revalidate = RUNS[run]
+        start = time.perf_counter()
+        process, port = start_service(recipe_file, options)
+        startup_seconds = time.perf_counter() - start
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port)
+            facets = json.loads(get(connection, "/facets")[2])
+            queries = random_queries(facets, args.queries)
+            print(f"{run}: {args.requests} requests from {args.clients} clients...")
+            result = load_test(port, queries, args.requests, args.clients, revalidate)
+            cache = json.loads(get(connection, "/health")[2])
+        finally:
+            process.terminate()
+            process.wait()
+
+        lookups = cache["hits"] + cache["misses"]
+        results.append(
+            {
+                "run": run,
+                "startup_s": startup_seconds,
+                **result,
+                "hit_rate": cache["hits"] / lookups if lookups else 0.0,
+            }
+        )
+
+    with pl.Config(float_precision=2, tbl_cols=-1):
+        print(pl.DataFrame(results))
@@ -0,0 +1,144 @@
+import argparse
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+
+from benchmarks.pipeline_benchmark import (
+    REPO_DIR,
+    STAGE_ENV,
+    STAGES,
+    WORKSPACE_DIR,
+    run_command,
+    run_stage,
+)
+from benchmarks.synthetic_data import RAW_RECIPES_FILE, generate_dataset
+
+SQL_FILE = Path("data/seed.sql")
+SHARD_COUNTS = [1, 2, 4, 8]
+
+# ==============================================================================
+
+
+def unsharded_run(workspace: Path) -> dict[str, float]:
+    """Run stages 03, 05 and 99 on the whole workspace, as the pipeline benchmark."""
+    times = {}
+    for stage in ["03", "05", "99"]:
+        result = run_stage(STAGES[stage], workspace, workspace / f"{stage}.log")
+        if result["returncode"] != 0:
+            raise RuntimeError(f"Stage {stage} failed, see {workspace}/{stage}.log")
+        times[stage] = result["seconds"]
+    return times
+
+
+def sharded_run(workspace: Path, n_shards: int) -> dict[str, float]:
+    """Run stages 03 and 05 on each shard in turn, then merge them in stage 99.
+
+    Each shard runs alone, so its time is what it takes on a machine of its
+    own and the slowest shard is the wall time of a run on n_shards machines.
+    """
+    # Stage 04 scrapes recipe pages, the benchmark splits its output instead
+    log_dir = workspace / "data/shards"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    run_command(
+        [
+            str(REPO_DIR / "sharding.py"),
+            "split",
+            "data/ingredients-1.csv",
+            "--shards",
+            str(n_shards),
+        ],
+        workspace,
+        log_dir / "split.log",
+    )
+
+    shard_seconds = []
+    for shard in range(n_shards):
+        result = run_command(
+            [
+                str(REPO_DIR / "sharding.py"),
+                "run",
+                "--shards",
+                str(n_shards),
+                "--stages",
+                "03",
+                "05",
+                "--workers",
+                "1",
+                "--only",
+                str(shard),
+            ],
+            workspace,
+            log_dir / f"run-{shard}-of-{n_shards}.log",
+            STAGE_ENV,
+        )
+        if result["returncode"] != 0:
+            raise RuntimeError(f"Shard {shard}/{n_shards} failed, see {log_dir}")
+        shard_seconds.append(result["seconds"])
+
+    merge = run_command(
+        [str(REPO_DIR / STAGES["99"]), "--shards", str(n_shards)],
+        workspace,
+        log_dir / f"99-{n_shards}.log",
+    )
+    if merge["returncode"] != 0:
+        raise RuntimeError(f"Merging {n_shards} shards failed, see {log_dir}")
+    return {
+        "slowest_shard": max(shard_seconds),
+        "all_shards": sum(shard_seconds),
+        "merge": merge["seconds"],
+    }
+
+
+def seed_counts(workspace: Path) -> tuple[int, int]:
+    """Load the seed file and count its recipes and recipe ingredients."""
+    connection = sqlite3.connect(":memory:")
+    connection.executescript((workspace / SQL_FILE).read_text(encoding="UTF-8"))
+    return tuple(
+        connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ["recipes", "recipe_ingredients"]
+    )
+
+
+# ==============================================================================
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time stages 03 and 05 per shard against an unsharded run."
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=SHARD_COUNTS)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    workspace = args.workspace / str(args.size)
+    if not (workspace / RAW_RECIPES_FILE).exists():
+        generate_dataset(workspace, args.size)
+
+    print(f"Running stages 03, 05 and 99 on {args.size} recipes...")
+    unsharded = unsharded_run(workspace)
+    baseline = unsharded["03"] + unsharded["05"]
+    recipes, recipe_ingredients = seed_counts(workspace)
+
+    results = []
+    for n_shards in args.shards:
+        print(f"Running stages 03 and 05 on {n_shards} shards...")
+        times = sharded_run(workspace, n_shards)
+        shard_recipes, shard_recipe_ingredients = seed_counts(workspace)
+        results.append(
+            {
+                "shards": n_shards,
+                **times,
+                "speedup": round(baseline / times["slowest_shard"], 2),
+                "recipes": shard_recipes,
+                "recipe_ingredients": shard_recipe_ingredients,
+            }
+        )
+
+    print(
+        f"Unsharded: {baseline:.2f}s (03 {unsharded['03']}s, 05 {unsharded['05']}s, "
+        f"99 {unsharded['99']}s), "
+        f"{recipes} recipes, {recipe_ingredients} recipe ingredients"
+    )
+    print(pl.DataFrame(results))
@@ -0,0 +1,116 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from benchmarks.pipeline_benchmark import WORKSPACE_DIR, run_benchmark
+from recipe_similarity import (
+    nearest_neighbors,
+    recipe_ingredient_matrix,
+    save_similarity_index,
+    score_ingredients,
+    similar_recipes,
+    tfidf_weights,
+)
+
+INGREDIENT_RECIPE_CSV = Path("data/ingredient-recipe-2.csv")
+INGREDIENTS_CSV = Path("data/ingredients-2.csv")
+SIZES = [100_000]
+
+# ==============================================================================
+
+
+def timed_ms(function, calls: list) -> np.ndarray:
+    """Time each call of function, in milliseconds."""
+    latencies = []
+    for args in calls:
+        start = time.perf_counter()
+        function(*args)
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time building the similarity index and querying it."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--workspace-size", type=int, default=100_000)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    # Recipes are drawn from the ingredient sets of a pipeline benchmark workspace
+    workspace = args.workspace / str(args.workspace_size)
+    if not (workspace / INGREDIENT_RECIPE_CSV).exists():
+        run_benchmark([args.workspace_size], ["03", "05"], args.workspace, False)
+    matrix, _, ingredients = recipe_ingredient_matrix(
+        workspace / INGREDIENT_RECIPE_CSV, workspace / INGREDIENTS_CSV
+    )
+    popularity = np.bincount(matrix.indices, minlength=matrix.shape[1])
+
+    rng = np.random.default_rng(40404)
+    results = []
+    for size in args.sizes:
+        recipes = matrix[rng.integers(0, matrix.shape[0], size)]
+        print(f"Building the index of {size} recipes...")
+        start = time.perf_counter()
+        weights, idf = tfidf_weights(recipes)
+        tfidf_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        neighbors, scores = nearest_neighbors(weights)
+        neighbor_seconds = time.perf_counter() - start
+
+        index = {
+            "recipe_ids": np.arange(size),
+            "ingredients": ingredients,
+            "idf": idf,
+            "indptr": weights.indptr,
+            "indices": weights.indices,
+            "data": weights.data,
+            "neighbors": neighbors,
+            "scores": scores,
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            index_file = Path(directory) / "index.npz"
+            save_similarity_index(index, index_file)
+            index_mb = index_file.stat().st_size / 2**20
+        index["weights"] = weights
+
+        # A fridge of 3 to 8 ingredients, common ones more likely
+        fridges = [
+            (
+                index,
+                list(
+                    rng.choice(
+                        ingredients,
+                        rng.integers(3, 9),
+                        replace=False,
+                        p=popularity / popularity.sum(),
+                    )
+                ),
+            )
+            for _ in range(args.queries)
+        ]
+        fridge_ms = timed_ms(score_ingredients, fridges)
+        similar_ms = timed_ms(
+            similar_recipes,
+            [(index, int(recipe)) for recipe in rng.integers(0, size, args.queries)],
+        )
+        results.append(
+            {
+                "recipes": size,
+                "tfidf_s": tfidf_seconds,
+                "neighbors_s": neighbor_seconds,
+                "index_mb": index_mb,
+                "fridge_p50_ms": np.percentile(fridge_ms, 50),
+                "fridge_p95_ms": np.percentile(fridge_ms, 95),
+                "similar_p50_ms": np.percentile(similar_ms, 50),
+            }
+        )
+
+    with pl.Config(float_precision=2):
+        print(pl.DataFrame(results))
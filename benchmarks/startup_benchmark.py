@@ -0,0 +1,64 @@
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks.pipeline_benchmark import REPO_DIR, print_results, run_command
+from pipeline import COMMANDS, STREAMLIT_COMMANDS
+
+WORKSPACE_DIR = Path("benchmarks/workspace/startup")
+
+# Runs a script's top level (imports, registry, ...) without its __main__ block
+IMPORT_ONLY = """
+import runpy, sys
+sys.path[0] = {repo_dir!r}
+runpy.run_path({script!r}, run_name="startup")
+"""
+
+UNIT_REGISTRY = """
+import sys
+sys.path[0] = {repo_dir!r}
+from units import get_unit_registry
+get_unit_registry({cache_folder})
+"""
+
+# ==============================================================================
+
+
+def startup_commands() -> dict[str, list[str]]:
+    """Commands measuring the cold start of each subcommand and of the registry."""
+    commands = {"pipeline --help": [str(REPO_DIR / "pipeline.py"), "--help"]}
+    for command, script in COMMANDS.items():
+        if command in STREAMLIT_COMMANDS:
+            continue
+        code = IMPORT_ONLY.format(repo_dir=str(REPO_DIR), script=str(REPO_DIR / script))
+        commands[command] = ["-c", code]
+
+    for name, cache_folder in [("uncached", None), ("cached", "'.cache/pint'")]:
+        code = UNIT_REGISTRY.format(repo_dir=str(REPO_DIR), cache_folder=cache_folder)
+        commands[f"unit registry {name}"] = ["-c", code]
+    return commands
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the cold-start time of each pipeline subcommand."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    args = parser.parse_args()
+
+    args.workspace.mkdir(parents=True, exist_ok=True)
+    results = []
+    for name, command in startup_commands().items():
+        # Best of several runs, the first one warms the OS and pint caches
+        runs = [
+            run_command(command, args.workspace, args.workspace / "startup.log")
+            for _ in range(args.repeat)
+        ]
+        best = min(runs, key=lambda r: r["seconds"])
+        results.append({"size": 0, "stage": name, **best})
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
@@ -0,0 +1,112 @@
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import scipy.sparse as sp
+
+from store_pricing import store_costs
+
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+
+# ==============================================================================
+
+
+def synthetic_catalog(
+    n_recipes: int, n_stores: int, seed: int = 40404
+) -> tuple[sp.csr_array, np.ndarray, dict[str, np.ndarray], pl.DataFrame]:
+    """Make up recipe product units and per-store copies of the pricelist."""
+    rng = np.random.default_rng(seed)
+    pricelist = pl.read_csv(PRICELIST_CSV)
+    products = {
+        "name": pricelist["ingredient"]
+        .str.split("|")
+        .list.first()
+        .str.strip_chars("'")
+        .to_numpy()
+        .astype(str),
+        "quantity": pricelist.select(pl.format("{} {}", "quantity", "unit"))
+        .to_series()
+        .to_numpy()
+        .astype(str),
+        "price": pricelist["price"].to_numpy(),
+    }
+
+    n_ingredients = rng.integers(4, 16, n_recipes)
+    rows = np.repeat(np.arange(n_recipes), n_ingredients)
+    columns = rng.integers(0, pricelist.height, len(rows))
+    units = sp.csr_array(
+        (rng.lognormal(-1.5, 1, len(rows)), (rows, columns)),
+        shape=(n_recipes, pricelist.height),
+    )
+
+    store_prices = pl.concat(
+        [
+            pricelist.with_columns(
+                pl.col("price") * rng.uniform(0.8, 1.2, pricelist.height),
+                pl.lit(f"store {store}").alias("store"),
+            )
+            for store in range(n_stores)
+        ]
+    )
+    return units, np.arange(n_recipes), products, store_prices
+
+
+def naive_store_costs(
+    units: sp.csr_array, recipe_ids: np.ndarray, store_prices: pl.DataFrame
+) -> list[tuple[int, str, float]]:
+    """Cost one recipe at one store at a time, like calculate_recipe_cost."""
+    recipe_products = [
+        list(zip(units.indices[start:end], units.data[start:end]))
+        for start, end in zip(units.indptr[:-1], units.indptr[1:])
+    ]
+    costs = []
+    for (store,), prices in store_prices.group_by("store", maintain_order=True):
+        price_map = dict(enumerate(prices["price"]))
+        for recipe_id, ingredients in zip(recipe_ids, recipe_products):
+            total = 0.0
+            for product, product_units in ingredients:
+                total += product_units * price_map[product]
+            costs.append((recipe_id, store, round(total, 2)))
+    return costs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare per-recipe costing with the sparse store cost matrix."
+    )
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--stores", type=int, default=50)
+    parser.add_argument("--skip-naive", action="store_true")
+    args = parser.parse_args()
+
+    units, recipe_ids, products, store_prices = synthetic_catalog(
+        args.recipes, args.stores
+    )
+    print(f"{args.recipes} recipes x {units.shape[1]} products, {units.nnz} entries")
+
+    if not args.skip_naive:
+        start = time.perf_counter()
+        naive = naive_store_costs(units, recipe_ids, store_prices)
+        naive_seconds = time.perf_counter() - start
+        print(f"naive: {len(naive)} costs in {naive_seconds:.2f}s")
+
+    start = time.perf_counter()
+    costs = store_costs(units, recipe_ids, products, store_prices)
+    sparse_seconds = time.perf_counter() - start
+    print(f"sparse: {costs.height} costs in {sparse_seconds:.2f}s")
+
+    if not args.skip_naive:
+        difference = (
+            costs.join(
+                pl.DataFrame(naive, schema=costs.schema, orient="row"),
+                on=["recipe_id", "store"],
+            )
+            .select((pl.col("cost") - pl.col("cost_right")).abs().max())
+            .item()
+        )
+        print(
+            f"{naive_seconds / sparse_seconds:.0f}x faster, "
+            f"max difference {difference:.2f}"
+        )
@@ -0,0 +1,236 @@
+import argparse
+import ast
+import json
+import random
+import shutil
+from pathlib import Path
+
+import polars as pl
+import yaml
+
+# Committed sample data used as templates for the synthetic recipes
+TEMPLATE_RECIPES_CSV = Path("data/recipes-1.csv")
+TEMPLATE_INGREDIENTS_CSV = Path("data/ingredients-1.csv")
+TEMPLATE_PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+TAGS_FILE = Path("data/tags.yaml")
+TAG_REPLACEMENTS_FILE = Path("data/replacements.yaml")
+
+# Layout of a generated workspace, mirroring the paths used by the stages
+RAW_RECIPES_FILE = Path("food-com-recipes/RAW_recipes.csv")
+INGREDIENTS_CSV = Path("data/ingredients-1.csv")
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+
+# Tags food.com adds to nearly every recipe, none of them categorized
+FILLER_TAGS = [
+    "time-to-make",
+    "course",
+    "main-ingredient",
+    "preparation",
+    "occasion",
+    "60-minutes-or-less",
+    "30-minutes-or-less",
+    "4-hours-or-less",
+    "number-of-servings",
+    "cuisine",
+]
+NAME_WORDS = ["easy", "classic", "quick", "spicy", "grandma s", "creamy", "best"]
+QUANTITY_SCALES = [0.5, 1.0, 1.0, 1.5, 2.0]
+# Share of recipes that are reworded copies of an earlier recipe
+DUPLICATE_RATE = 0.05
+CHUNK_SIZE = 100_000
+
+# ==============================================================================
+
+
+def load_templates(
+    recipes_file: Path, ingredients_file: Path
+) -> list[dict[str, str | int | dict[str, float]]]:
+    """Load the sample recipes joined with their scraped ingredients."""
+    recipes = pl.read_csv(recipes_file).select(
+        [
+            "id",
+            "name",
+            "steps",
+            "n_steps",
+            "description",
+            "ingredients",
+            "n_ingredients",
+        ]
+    )
+    scraped = pl.read_csv(ingredients_file).select(
+        pl.col("id"), pl.col("ingredients").alias("labels")
+    )
+    templates = recipes.join(scraped, on="id", how="inner").sort("id").to_dicts()
+    for template in templates:
+        template["labels"] = json.loads(template["labels"])
+        # The cleaned steps have their double quotes replaced, so they are
+        # not valid literals any more
+        template["steps"] = parse_list(template["steps"])
+        template["ingredients"] = parse_list(template["ingredients"])
+    return templates
+
+
+def parse_list(value: str) -> list[str]:
+    """Parse a list repr'd by Python, tolerating unescaped quotes."""
+    try:
+        return ast.literal_eval(value)
+    except (SyntaxError, ValueError):
+        return value[2:-2].split("', '")
+
+
+def random_tags(rng: random.Random, tag_categories: dict[str, list[str]]) -> list[str]:
+    """Pick a food.com-like tag list, occasionally without cuisine or course."""
+    tags = rng.sample(FILLER_TAGS, 4)
+    for category, values in tag_categories.items():
+        if category in ["cuisine", "course"]:
+            if rng.random() < 0.9:
+                tags.append(rng.choice(values))
+        elif rng.random() < 0.4:
+            tags.extend(rng.sample(values, min(len(values), rng.randint(1, 2))))
+    return tags
+
+
+def random_nutrition(rng: random.Random) -> list[float]:
+    """Calories followed by the six percent-daily-value components."""
+    return [round(rng.uniform(50, 900), 1)] + [
+        float(rng.randint(0, 120)) for _ in range(6)
+    ]
+
+
+def random_recipe(
+    rng: random.Random, templates: list[dict]
+) -> tuple[list[str], list[str], dict[str, float | str]]:
+    """Vary a template into distinct steps, ingredient names and labels.
+
+    Ingredients are a subset of one template's, keeping only the labels that
+    contain a kept name, so stage 05 sees the same name/label pairs it can
+    price. Steps mix the template's with a few from other templates.
+    """
+    template = rng.choice(templates)
+    names = template["ingredients"]
+    names = rng.sample(names, rng.randint((len(names) + 1) // 2, len(names)))
+    labels = {
+        label: qty
+        for label, qty in template["labels"].items()
+        if any(name in label for name in names)
+    }
+
+    steps = template["steps"]
+    steps = [step for step in steps if rng.random() < 0.8] or steps[:1]
+    for other in rng.sample(templates, rng.randint(1, 3)):
+        steps.insert(rng.randint(0, len(steps)), rng.choice(other["steps"]))
+    return steps, names, labels
+
+
+def generate_chunk(
+    rng: random.Random,
+    templates: list[dict],
+    tag_categories: dict[str, list[str]],
+    first_id: int,
+    size: int,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Generate `size` raw recipes and their scraped ingredients."""
+    raw = []
+    scraped = []
+    recipes = []
+    for recipe_id in range(first_id, first_id + size):
+        if recipes and rng.random() < DUPLICATE_RATE:
+            # Near-duplicate: same ingredients, one step slightly reworded
+            name, steps, names, labels, description = rng.choice(recipes)
+            steps = list(steps)
+            i = rng.randrange(len(steps))
+            steps[i] = f"{steps[i]} {rng.choice(['well', 'gently', 'then'])}"
+        else:
+            template = rng.choice(templates)
+            name = f"{rng.choice(NAME_WORDS)} {template['name']}"
+            description = template["description"]
+            steps, names, labels = random_recipe(rng, templates)
+            recipes.append((name, steps, names, labels, description))
+        scale = rng.choice(QUANTITY_SCALES)
+
+        raw.append(
+            {
+                "name": name,
+                "id": recipe_id,
+                "minutes": rng.randint(5, 240),
+                "contributor_id": rng.randint(1, 2_000_000),
+                "submitted": f"20{rng.randint(0, 18):02d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "tags": str(random_tags(rng, tag_categories)),
+                "nutrition": str(random_nutrition(rng)),
+                "n_steps": len(steps),
+                "steps": str(steps),
+                "description": description,
+                "ingredients": str(names),
+                "n_ingredients": len(names),
+            }
+        )
+        scraped.append(
+            {
+                "name": name,
+                "id": recipe_id,
+                "link": f"https://www.food.com/recipe/{name.replace(' ', '-')}-{recipe_id}?scale=1&units=us",
+                "ingredients": json.dumps(
+                    {
+                        # Unquantified labels are scraped as ""
+                        label: qty * scale if qty != "" else qty
+                        for label, qty in labels.items()
+                    }
+                ),
+            }
+        )
+    return pl.DataFrame(raw), pl.DataFrame(scraped)
+
+
+def write_pricelist(rng: random.Random, template_file: Path, output_file: Path):
+    """Copy the pricelist with every price jittered by up to 20%."""
+    pricelist = pl.read_csv(template_file)
+    jitter = [rng.uniform(0.8, 1.2) for _ in range(pricelist.height)]
+    pricelist.with_columns((pl.col("price") * pl.Series(jitter)).round(2)).write_csv(
+        output_file
+    )
+
+
+def generate_dataset(workspace: Path, n_recipes: int, seed: int = 40404):
+    """Write a synthetic food.com-shaped dataset into `workspace`.
+
+    The workspace gets the same relative layout the stages expect, so they can
+    be run with it as their working directory:
+        food-com-recipes/RAW_recipes.csv  (input of 03)
+        data/ingredients-1.csv            (output of 04, scraped ingredients)
+        data/ingredient-pricelist.csv     (input of 05)
+        data/tags.yaml, data/replacements.yaml
+    """
+    print(f"Generating {n_recipes} recipes in {workspace}...")
+    rng = random.Random(seed)
+    (workspace / RAW_RECIPES_FILE).parent.mkdir(parents=True, exist_ok=True)
+    (workspace / INGREDIENTS_CSV).parent.mkdir(parents=True, exist_ok=True)
+
+    shutil.copy(TAGS_FILE, workspace / TAGS_FILE)
+    shutil.copy(TAG_REPLACEMENTS_FILE, workspace / TAG_REPLACEMENTS_FILE)
+    write_pricelist(rng, TEMPLATE_PRICELIST_CSV, workspace / PRICELIST_CSV)
+
+    templates = load_templates(TEMPLATE_RECIPES_CSV, TEMPLATE_INGREDIENTS_CSV)
+    tag_categories = yaml.safe_load(TAGS_FILE.open("r"))
+
+    # Write in chunks so 1M recipes don't have to be held in memory at once
+    with (workspace / RAW_RECIPES_FILE).open("w", encoding="UTF-8") as raw_file, (
+        workspace / INGREDIENTS_CSV
+    ).open("w", encoding="UTF-8") as scraped_file:
+        for first_id in range(1, n_recipes + 1, CHUNK_SIZE):
+            size = min(CHUNK_SIZE, n_recipes + 1 - first_id)
+            raw, scraped = generate_chunk(
+                rng, templates, tag_categories, first_id, size
+            )
+            raw.write_csv(raw_file, include_header=first_id == 1)
+            scraped.write_csv(scraped_file, include_header=first_id == 1)
+            print(f"{first_id + size - 1}/{n_recipes} recipes written.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=generate_dataset.__doc__)
+    parser.add_argument("workspace", type=Path)
+    parser.add_argument("n_recipes", type=int)
+    parser.add_argument("--seed", type=int, default=40404)
+    args = parser.parse_args()
+
+    generate_dataset(args.workspace, args.n_recipes, args.seed)
@@ -0,0 +1,87 @@
+import argparse
+import time
+from pathlib import Path
+
+import polars as pl
+import yaml
+
+from benchmarks.pipeline_benchmark import WORKSPACE_DIR
+from benchmarks.synthetic_data import RAW_RECIPES_FILE, generate_dataset
+from tag_index import build_tag_index
+from tag_suggestions import (
+    load_tag_cooccurrence,
+    suggest_categories,
+    tag_cooccurrence,
+    tag_matrix,
+)
+
+TAGS_FILE = Path("data/tags.yaml")
+# The size of the full food.com dataset
+SIZES = [230_000]
+
+# ==============================================================================
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time building the tag co-occurrence and suggesting categories."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--workspace", type=Path, default=WORKSPACE_DIR)
+    args = parser.parse_args()
+
+    with TAGS_FILE.open("r") as f:
+        categories = {name: set(tags or []) for name, tags in yaml.safe_load(f).items()}
+
+    results = []
+    for size in args.sizes:
+        workspace = args.workspace / str(size)
+        recipe_file = workspace / RAW_RECIPES_FILE
+        if not recipe_file.exists():
+            generate_dataset(workspace, size)
+
+        print(f"Suggesting categories over {size} recipes...")
+        index, index_seconds = timed(build_tag_index, recipe_file)
+        matrix, matrix_seconds = timed(tag_matrix, index)
+        cooccurrence, product_seconds = timed(tag_cooccurrence, matrix)
+        suggestions, suggest_seconds = timed(
+            suggest_categories, index["tags"], cooccurrence, categories
+        )
+
+        # What the editor pays once the co-occurrence is saved
+        cooccurrence_file = workspace / "tag_cooccurrence.npz"
+        cooccurrence_file.unlink(missing_ok=True)
+        load_tag_cooccurrence(
+            recipe_file, workspace / "tag_index.npz", cooccurrence_file
+        )
+        saved, load_seconds = timed(
+            load_tag_cooccurrence,
+            recipe_file,
+            workspace / "tag_index.npz",
+            cooccurrence_file,
+        )
+        _, warm_suggest_seconds = timed(
+            suggest_categories, saved["tags"], saved["cooccurrence"], categories
+        )
+
+        results.append(
+            {
+                "recipes": size,
+                "tags": len(index["tags"]),
+                "suggested_tags": suggestions["tag"].n_unique(),
+                "tag_index_s": index_seconds,
+                "matrix_s": matrix_seconds,
+                "product_s": product_seconds,
+                "suggest_s": suggest_seconds,
+                "cached_s": load_seconds + warm_suggest_seconds,
+            }
+        )
+
+    with pl.Config(float_precision=3, tbl_cols=-1):
+        print(pl.DataFrame(results))
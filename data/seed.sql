@@ -1,4 +1,31 @@
+BEGIN TRANSACTION;
+
 -- recipes table
+CREATE TABLE recipes (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    cooking_minutes INTEGER,
+    cost REAL,
+    n_steps INTEGER,
+    steps TEXT,
+    n_ingredients INTEGER,
+    calories REAL,
+    total_fat_pdv REAL,
+    sugar_pdv REAL,
+    sodium_pdv REAL,
+    protein_pdv REAL,
+    saturated_fat_pdv REAL,
+    carbohydrate_pdv REAL,
+    cooking_method TEXT,
+    course TEXT,
+    difficulty TEXT,
+    dish TEXT,
+    equipment TEXT,
+    event TEXT,
+    key_ingredient TEXT,
+    season TEXT
+);
 INSERT INTO recipes (id, name, description, cooking_minutes, cost, n_steps, steps, n_ingredients, calories, total_fat_pdv, sugar_pdv, sodium_pdv, protein_pdv, saturated_fat_pdv, carbohydrate_pdv, cooking_method, course, difficulty, dish, equipment, event, key_ingredient, season) VALUES (141037, 'anthony s house salad with italian dressing', 'from one of my favorite local restaurants. adding 1/2-1 lb of diced smoked turkey breast to the salad mix turns this into a nice light lunch on it''s own.', 15, 13.14, 6, '[''whisk together olive oil , vinegar , mustard , garlic , pepper , and salt until well blended'', ''fold in cheese'', ''break the leaves off of both heads of lettuce , tear them by hand'', ''wash and drain'', ''in a large wooden bowl , toss lettuce with shredded carrots and cabbage'', ''garnish with croutons and top with dressing to taste'']', 12, 364.1, 53.0, 14.0, 11.0, 10.0, 34.0, 3.0, '', 'lunch', 'beginner-cook,easy,no-cook', 'salads', '', 'dinner-party', 'cheese,vegetables', 'spring,summer');
 INSERT INTO recipes (id, name, description, cooking_minutes, cost, n_steps, steps, n_ingredients, calories, total_fat_pdv, sugar_pdv, sodium_pdv, protein_pdv, saturated_fat_pdv, carbohydrate_pdv, cooking_method, course, difficulty, dish, equipment, event, key_ingredient, season) VALUES (261279, 'pan seared flat iron steak with spicy minted drizzle', 'these amazing flavors will make your taste buds dance. a well balanced lunch.', 30, 9.13, 11, '[''create the drizzle by combining all ingredients , except steak , peppers , scallions and lettuce'', ''place ingredients into a food processor and pulse for about 30-45 seconds to create a thin ''drizzle'''', ''rub 1 / 3 of mixture on steak and allow to sit for approximately 20-30 minutes'', ''heat heavy duty saute pan or cast iron pan just to smoking point'', ''add 1t olive oil for searing'', ''sear marinated steak for 3-4 minutes on each side'', ''do not over cook this cut of meat'', ''best served mr to rare'', ''remove from pan and allow to rest on cutting board'', ''slice thin and serve in a lettuce leaf with peppers , scallion and drizzle'', ''roll lettuce and enjoy'']', 13, 363.6, 40.0, 17.0, 61.0, 46.0, 33.0, 2.0, '', 'lunch', '', 'salads', '', 'picnic', 'beef', '');
 INSERT INTO recipes (id, name, description, cooking_minutes, cost, n_steps, steps, n_ingredients, calories, total_fat_pdv, sugar_pdv, sodium_pdv, protein_pdv, saturated_fat_pdv, carbohydrate_pdv, cooking_method, course, difficulty, dish, equipment, event, key_ingredient, season) VALUES (128372, 'the best ever donairs', 'this makes the best ever donairs - it comes from the first restaurant to sell donairs in nova scotia. everyone raves about it!!', 150, 37.38, 13, '[''flatten 3 pounds of hamburger on counter top & sprinkle with the above ingredients'', ''work all spices into the hamburger well , and form into a ball'', ''place on a cookis sheet that will fit over a cake pan , or a pan that the fat will drip off of'', ''bake at 350 degrees for 1 1 / 2 to 2 1 / 2 hours , depending on your oven'', ''sauce:'', ''3 / 4c evaporated milk 2 capsfull vinegar'', ''3 / 4 cup white sugar'', ''mix together until thickens & place in fridge'', ''when the meat is done , use the fat from the meat to slightly brown lebanese bread in frying pan'', ''cut meat in slices , place on top of heated lebanese bread'', ''top with chopped onions and tomato then put sauce on top'', ''roll up'', ''be ready for a wonderful treat !'']', 7, 164.0, 16.0, 1.0, 3.0, 26.0, 20.0, 1.0, '', 'lunch', '', '', '', '', 'beef', '');
@@ -201,73 +228,131 @@ INSERT INTO recipes (id, name, description, cooking_minutes, cost, n_steps, step
 INSERT INTO recipes (id, name, description, cooking_minutes, cost, n_steps, steps, n_ingredients, calories, total_fat_pdv, sugar_pdv, sodium_pdv, protein_pdv, saturated_fat_pdv, carbohydrate_pdv, cooking_method, course, difficulty, dish, equipment, event, key_ingredient, season) VALUES (181091, 'steamed chicken zheng ji with ginger scallion dipping sauce', 'chicken rubbed with salt and then steamed, served with a ginger-scallion dipping sauce to bring out its full flavor. serve with steamed rice. serves 4 as a main course or 8 as part of a multi-dish chinese style dinner.', 85, 31.8, 11, '[''rinse the chicken in cold , running water , and blot dry completely with paper towels'', ''rub the salt all over the skin of the chicken and inside the cavity'', ''place the chicken , breast-side down , on a heat proof platter , and set aside for 15 minutes'', ''set up your steamer , or place a rack inside a wok or other deep pan'', ''fill with about 2 inches of hot water'', ''cover tightly and gently steam over medium heat for 1 hour , replenishing the water from time to time'', ''remove the platter of cooked chicken and pour off all of the liquid'', ''in a small bowl , combine the sugar , salt , soy sauce , ginger , garlic , and scallions'', ''in a small pan , combine the oils and heat until they smoke'', ''pour the hot oils over the ginger-scallion mixture'', ''chop the chicken into serving sized pieces and serve with dipping sauce'']', 10, 361.0, 42.0, 0.0, 56.0, 50.0, 36.0, 0.0, '', 'lunch', 'easy', '', '', '', 'chicken,fruit,vegetables', 'fall,spring,winter');
 
 -- cuisines table
-INSERT INTO cuisines (id, name) VALUES (1, 'mexican');
-INSERT INTO cuisines (id, name) VALUES (2, 'indian');
+CREATE TABLE cuisines (
+    id INTEGER PRIMARY KEY,
+    name TEXT
+);
+INSERT INTO cuisines (id, name) VALUES (1, 'american');
+INSERT INTO cuisines (id, name) VALUES (2, 'chinese');
 INSERT INTO cuisines (id, name) VALUES (3, 'greek');
-INSERT INTO cuisines (id, name) VALUES (4, 'korean');
-INSERT INTO cuisines (id, name) VALUES (5, 'chinese');
+INSERT INTO cuisines (id, name) VALUES (4, 'indian');
+INSERT INTO cuisines (id, name) VALUES (5, 'italian');
 INSERT INTO cuisines (id, name) VALUES (6, 'japanese');
-INSERT INTO cuisines (id, name) VALUES (7, 'italian');
-INSERT INTO cuisines (id, name) VALUES (8, 'american');
+INSERT INTO cuisines (id, name) VALUES (7, 'korean');
+INSERT INTO cuisines (id, name) VALUES (8, 'mexican');
 
 -- recipe_cuisines table
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 121756);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 347750);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 417888);
+CREATE TABLE recipe_cuisines (
+    cuisine_id INTEGER,
+    recipe_id INTEGER,
+    FOREIGN KEY (cuisine_id) REFERENCES cuisines (id),
+    FOREIGN KEY (recipe_id) REFERENCES recipes (id)
+);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 141037);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 50414);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 448592);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 50411);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 23144);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 359738);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 41833);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 25617);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 107524);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 101730);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 52269);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 36598);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 23649);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 19378);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 11648);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 56341);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 239001);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 78576);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 107853);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 519074);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 26638);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 234453);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 425059);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 37673);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 139213);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 370972);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 73443);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 78711);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 190225);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 32682);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 86428);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 298241);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 34787);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 32667);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 161872);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 34331);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 15633);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 172647);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 346068);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 49915);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 16864);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 221057);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 23632);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 223036);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 389955);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 300447);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 471972);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 501436);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 302467);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 13586);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 115558);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 50463);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 21278);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 116415);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 288858);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 10770);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 13678);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 338874);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 12922);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 381266);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 292166);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 107724);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 104624);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 24904);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 501580);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 24666);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 213935);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 97176);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 360634);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 40018);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 335266);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 22069);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 279130);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 48613);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 120981);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 218605);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 12669);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 81105);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 25875);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 204481);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 138357);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 451785);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 129744);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 44170);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 408764);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 12732);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 448592);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 63921);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 38356);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 36598);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 273769);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 75227);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 493702);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 15633);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 49915);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 221057);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 14755);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 288345);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 469708);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 72724);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 116415);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 117455);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 59380);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 484976);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 16928);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 49945);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 9002);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 59446);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 131214);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 12669);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 71867);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 42043);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 17507);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (1, 181091);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 50411);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 37379);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 254691);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 107524);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 146603);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 107853);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 519074);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 242512);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 404755);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 50463);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 13678);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 68466);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 40561);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 428564);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 107724);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 50408);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 104624);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 360634);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 58163);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 40018);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 126427);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 394686);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 21217);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 279130);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 109483);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 511116);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 274972);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 423521);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 44170);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (2, 181091);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 128372);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 50414);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 483902);
@@ -313,47 +398,73 @@ INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 22847);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 30081);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 25875);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (3, 17507);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 261279);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 372621);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 14627);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 258187);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 490278);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 437919);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 58163);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 221939);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 394686);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 359630);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 14339);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 50411);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 37379);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 254691);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 107524);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 146603);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 107853);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 519074);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 242512);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 404755);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 50463);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 13678);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 68466);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 40561);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 428564);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 107724);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 50408);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 104624);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 360634);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 58163);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 40018);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 126427);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 394686);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 21217);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 279130);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 109483);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 511116);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 274972);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 423521);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 44170);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 181091);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 448592);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 63921);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 38356);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 36598);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 273769);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 75227);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 493702);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 15633);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 49915);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 221057);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 14755);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 288345);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 469708);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 72724);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 116415);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 117455);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 59380);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 484976);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 16928);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 49945);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 9002);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 59446);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 131214);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 12669);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 71867);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (4, 42043);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 141037);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 128372);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 50414);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 41833);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 25617);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 420277);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 346354);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 23649);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 111599);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 413290);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 26638);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 425059);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 382449);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 73443);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 34331);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 283440);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 99982);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 512678);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 172647);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 118241);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 302467);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 13586);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 125943);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 328705);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 70337);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 21278);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 18268);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 12713);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 449994);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 440166);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 213935);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 97176);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 48613);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 242261);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 120981);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 22847);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 4356);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 81105);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 311039);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 408764);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (5, 456631);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 463105);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 72581);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 185151);
@@ -372,340 +483,280 @@ INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 58163);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 394686);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 218366);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (6, 125845);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 141037);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 128372);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 50414);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 41833);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 25617);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 420277);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 346354);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 23649);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 111599);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 413290);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 26638);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 425059);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 382449);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 73443);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 34331);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 283440);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 99982);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 512678);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 172647);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 118241);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 302467);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 13586);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 125943);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 328705);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 70337);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 21278);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 18268);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 12713);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 449994);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 440166);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 213935);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 97176);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 48613);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 242261);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 120981);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 22847);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 4356);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 81105);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 311039);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 408764);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 456631);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 141037);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 50414);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 448592);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 50411);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 23144);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 359738);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 41833);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 25617);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 107524);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 101730);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 52269);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 36598);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 23649);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 261279);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 372621);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 14627);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 258187);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 490278);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 437919);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 58163);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 221939);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 394686);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 359630);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (7, 14339);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 121756);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 347750);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 417888);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 19378);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 11648);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 56341);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 239001);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 78576);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 107853);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 519074);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 26638);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 234453);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 425059);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 37673);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 139213);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 370972);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 73443);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 78711);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 190225);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 32682);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 86428);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 34331);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 15633);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 172647);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 346068);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 49915);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 16864);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 221057);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 298241);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 34787);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 32667);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 161872);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 23632);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 501436);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 302467);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 13586);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 115558);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 50463);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 21278);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 116415);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 288858);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 10770);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 13678);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 338874);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 12922);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 381266);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 292166);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 107724);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 223036);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 389955);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 300447);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 471972);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 104624);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 24904);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 213935);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 97176);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 360634);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 40018);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 335266);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 22069);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 279130);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 48613);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 120981);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 501580);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 24666);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 218605);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 12669);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 81105);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 25875);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 204481);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 138357);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 44170);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 408764);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 451785);
+INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 129744);
 INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 12732);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 17507);
-INSERT INTO recipe_cuisines (cuisine_id, recipe_id) VALUES (8, 181091);
 
 -- dietary_restrictions table
-INSERT INTO dietary_restrictions (id, name) VALUES (1, 'seafood');
-INSERT INTO dietary_restrictions (id, name) VALUES (2, 'low-sodium');
-INSERT INTO dietary_restrictions (id, name) VALUES (3, 'high-calcium');
-INSERT INTO dietary_restrictions (id, name) VALUES (4, 'low-calorie');
-INSERT INTO dietary_restrictions (id, name) VALUES (5, 'diabetic');
-INSERT INTO dietary_restrictions (id, name) VALUES (6, 'no-shell-fish');
-INSERT INTO dietary_restrictions (id, name) VALUES (7, 'gluten-free');
-INSERT INTO dietary_restrictions (id, name) VALUES (8, 'vegetarian');
-INSERT INTO dietary_restrictions (id, name) VALUES (9, 'vegan');
-INSERT INTO dietary_restrictions (id, name) VALUES (10, 'low-fat');
-INSERT INTO dietary_restrictions (id, name) VALUES (11, 'low-carb');
-INSERT INTO dietary_restrictions (id, name) VALUES (12, 'egg-free');
+CREATE TABLE dietary_restrictions (
+    id INTEGER PRIMARY KEY,
+    name TEXT
+);
+INSERT INTO dietary_restrictions (id, name) VALUES (1, 'diabetic');
+INSERT INTO dietary_restrictions (id, name) VALUES (2, 'egg-free');
+INSERT INTO dietary_restrictions (id, name) VALUES (3, 'gluten-free');
+INSERT INTO dietary_restrictions (id, name) VALUES (4, 'high-calcium');
+INSERT INTO dietary_restrictions (id, name) VALUES (5, 'low-calorie');
+INSERT INTO dietary_restrictions (id, name) VALUES (6, 'low-carb');
+INSERT INTO dietary_restrictions (id, name) VALUES (7, 'low-fat');
+INSERT INTO dietary_restrictions (id, name) VALUES (8, 'low-sodium');
+INSERT INTO dietary_restrictions (id, name) VALUES (9, 'no-shell-fish');
+INSERT INTO dietary_restrictions (id, name) VALUES (10, 'seafood');
+INSERT INTO dietary_restrictions (id, name) VALUES (11, 'vegan');
+INSERT INTO dietary_restrictions (id, name) VALUES (12, 'vegetarian');
 
 -- recipe_restrictions table
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 23144);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 41833);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 347750);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 254691);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 56341);
+CREATE TABLE recipe_restrictions (
+    restriction_id INTEGER,
+    recipe_id INTEGER,
+    FOREIGN KEY (restriction_id) REFERENCES dietary_restrictions (id),
+    FOREIGN KEY (recipe_id) REFERENCES recipes (id)
+);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 463105);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 19378);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 503392);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 461206);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 519074);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 370972);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 86428);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 493702);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 303127);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 221057);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 346830);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 13586);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 10902);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 469708);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 68466);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 12744);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 58163);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 126427);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 359630);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 404755);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 490278);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 474224);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 290853);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 427046);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 511116);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 59446);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 125845);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 129744);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 141037);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 448592);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 461206);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 139213);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (1, 204481);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 101730);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 382449);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 34787);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 118241);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 346830);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 115558);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 346586);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 290853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 116415);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 12713);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 30081);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 12732);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 12922);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 303127);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 104624);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 125845);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (2, 423521);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 261279);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 23144);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 32682);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 14755);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 18762);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 13586);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 187433);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 437919);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 176527);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 12744);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 424925);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 50414);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 23144);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 37379);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 107524);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 146603);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 23649);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 107853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 26638);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 32682);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 34787);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 346830);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 346586);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 290853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 116415);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 40561);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 12713);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 104624);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 97176);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 360634);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 463105);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 19378);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 503392);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 461206);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 519074);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 370972);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 86428);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 493702);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 303127);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 404755);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 490278);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 474224);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (3, 204481);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 12922);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (4, 424925);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 50414);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 23144);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 37379);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 107524);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 146603);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 23649);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 107853);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 26638);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 32682);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 34787);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 346830);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 18762);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 346586);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 290853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 427046);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 511116);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 59446);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 125845);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 204481);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 254691);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 261279);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 23144);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 116415);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 40561);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 12713);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 104624);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 97176);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (5, 360634);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 141037);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 50414);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 483902);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 37379);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 107524);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 146603);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 463105);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 11648);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 461206);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 139213);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 382449);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 99982);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 512678);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 34787);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 118241);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 366037);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 346586);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 290853);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 105160);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 420747);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 424925);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 360634);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 40018);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 136026);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 218605);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 22847);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 125845);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 311039);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 451785);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (6, 181091);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 23649);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 32682);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 14755);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 34787);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 13586);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 187433);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 437919);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 176527);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 12744);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 424925);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 204481);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 50414);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 12713);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 104624);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (7, 12669);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 141037);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 448592);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 63921);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 420277);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 346354);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 23649);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 19378);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 72581);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 11648);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 425059);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 461206);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 139213);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 382449);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 78711);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 32682);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 86428);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 493702);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 34331);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 15633);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 298241);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 286514);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 512678);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 346068);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 14755);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 288345);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 34787);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 118241);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 346830);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 78612);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 177728);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 428044);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 328705);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 366037);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 72724);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 474224);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 115558);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 346586);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 290853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 18268);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 117455);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 176527);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 104624);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 420747);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 449994);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 24904);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 424925);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 97176);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 360634);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 24666);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 427046);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 335266);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 136026);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 242261);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 16928);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 427782);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 59446);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 131214);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 274972);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 423521);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 204481);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 71867);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 17507);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 72581);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 32682);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 286514);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 78612);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 366037);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 72724);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 176527);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 360634);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 16928);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 59446);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 423521);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 23649);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 32682);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 34787);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 18762);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 12713);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 104624);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 12669);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 141037);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 50414);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 483902);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 37379);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 107524);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 146603);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 463105);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 11648);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 461206);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 139213);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 382449);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 99982);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 512678);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 34787);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 118241);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 116415);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 12713);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 30081);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (8, 12732);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (9, 254691);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 23144);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 41833);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 347750);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 254691);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 56341);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 370972);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 303127);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 221057);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 346830);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 13586);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 10902);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 469708);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 68466);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 12744);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 58163);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 126427);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 359630);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 125845);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (10, 129744);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 72581);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 32682);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 286514);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 18762);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 78612);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 366037);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 346586);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 290853);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 105160);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 420747);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 424925);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 72724);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 176527);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 360634);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 40018);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 136026);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 218605);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 22847);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 125845);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 311039);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 451785);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 181091);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 101730);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 16928);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 59446);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (11, 423521);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 50414);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 448592);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 63921);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 420277);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 346354);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 23649);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 19378);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 72581);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 11648);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 425059);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 139213);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 382449);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 303127);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 78711);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 32682);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 86428);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 493702);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 34331);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 15633);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 298241);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 286514);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 512678);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 346068);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 14755);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 288345);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 18762);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 78612);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 177728);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 428044);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 328705);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 366037);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 72724);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 474224);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 290853);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 18268);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 117455);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 176527);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 104624);
-INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 125845);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 420747);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 449994);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 24904);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 424925);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 97176);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 360634);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 24666);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 427046);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 335266);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 136026);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 242261);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 16928);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 427782);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 59446);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 131214);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 274972);
 INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 423521);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 204481);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 71867);
+INSERT INTO recipe_restrictions (restriction_id, recipe_id) VALUES (12, 17507);
 
 -- ingredients table
+CREATE TABLE ingredients (
+    id INTEGER PRIMARY KEY,
+    name TEXT
+);
 INSERT INTO ingredients (id, name) VALUES (0, 'lemon');
 INSERT INTO ingredients (id, name) VALUES (1, 'lemon juice');
 INSERT INTO ingredients (id, name) VALUES (2, 'lemon zest');
@@ -1469,6 +1520,15 @@ INSERT INTO ingredients (id, name) VALUES (759, 'liquid');
 INSERT INTO ingredients (id, name) VALUES (760, 'cloth');
 
 -- recipe_ingredients table
+CREATE TABLE recipe_ingredients (
+    recipe_id INTEGER,
+    ingredient_id INTEGER,
+    label TEXT,
+    quantity REAL,
+    unit TEXT,
+    FOREIGN KEY (recipe_id) REFERENCES recipes (id),
+    FOREIGN KEY (ingredient_id) REFERENCES ingredients (id)
+);
 INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit) VALUES (4356, 532, 'lb pork butt, Coarse Ground', 1.0, 'pound');
 INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit) VALUES (4356, 252, 'teaspoon fennel seeds', 0.625, 'teaspoon');
 INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit) VALUES (4356, 724, 'teaspoon white pepper', 0.5, 'teaspoon');
@@ -3570,3 +3630,217 @@ INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit)
 INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit) VALUES (519074, 642, 'tablespoons soy sauce', 2.0, 'tablespoon');
 INSERT INTO recipe_ingredients (recipe_id, ingredient_id, label, quantity, unit) VALUES (519074, 531, 'lb chinese barbeque pork, diced (Char Siu)', 1.0, 'pound');
 
+-- recipe_search table
+CREATE VIRTUAL TABLE recipe_search USING fts5(name, ingredients, description, steps, content='', tokenize='porter unicode61 remove_diacritics 2', prefix='2 3');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (141037, 'anthony s house salad with italian dressing', 'cups extra virgin olive oil ; cup apple cider vinegar or 1/2 cup white balsamic vinegar ; large garlic cloves, minced ; teaspoon black pepper ; pinch salt ; lb blue cheese, finely crumbled ; head romaine lettuce ; head red leaf lettuce ; large carrots, shredded ; small red cabbage, shredded ; crouton (to garnish)', 'from one of my favorite local restaurants. adding 1/2-1 lb of diced smoked turkey breast to the salad mix turns this into a nice light lunch on it''s own.', '[''whisk together olive oil , vinegar , mustard , garlic , pepper , and salt until well blended'', ''fold in cheese'', ''break the leaves off of both heads of lettuce , tear them by hand'', ''wash and drain'', ''in a large wooden bowl , toss lettuce with shredded carrots and cabbage'', ''garnish with croutons and top with dressing to taste'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (261279, 'pan seared flat iron steak with spicy minted drizzle', 'ounces flat iron steaks ; ounce red peppers, julienne ; ounce green onions, julienne ; ounce boston bib lettuce leaf ; tablespoon olive oil ; tablespoon fresh mint leaves ; teaspoon jalapeno pepper, minced ; teaspoon garlic, minced ; teaspoon kosher salt ; teaspoon black pepper ; teaspoon rice vinegar ; teaspoon brown sugar', 'these amazing flavors will make your taste buds dance. a well balanced lunch.', '[''create the drizzle by combining all ingredients , except steak , peppers , scallions and lettuce'', ''place ingredients into a food processor and pulse for about 30-45 seconds to create a thin ''drizzle'''', ''rub 1 / 3 of mixture on steak and allow to sit for approximately 20-30 minutes'', ''heat heavy duty saute pan or cast iron pan just to smoking point'', ''add 1t olive oil for searing'', ''sear marinated steak for 3-4 minutes on each side'', ''do not over cook this cut of meat'', ''best served mr to rare'', ''remove from pan and allow to rest on cutting board'', ''slice thin and serve in a lettuce leaf with peppers , scallion and drizzle'', ''roll lettuce and enjoy'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (128372, 'the best ever donairs', 'teaspoons pepper ; teaspoon onion powder ; teaspoons garlic powder ; teaspoons oregano ; cup breadcrumbs ; lbs ground beef', 'this makes the best ever donairs - it comes from the first restaurant to sell donairs in nova scotia. everyone raves about it!!', '[''flatten 3 pounds of hamburger on counter top & sprinkle with the above ingredients'', ''work all spices into the hamburger well , and form into a ball'', ''place on a cookis sheet that will fit over a cake pan , or a pan that the fat will drip off of'', ''bake at 350 degrees for 1 1 / 2 to 2 1 / 2 hours , depending on your oven'', ''sauce:'', ''3 / 4c evaporated milk 2 capsfull vinegar'', ''3 / 4 cup white sugar'', ''mix together until thickens & place in fridge'', ''when the meat is done , use the fat from the meat to slightly brown lebanese bread in frying pan'', ''cut meat in slices , place on top of heated lebanese bread'', ''top with chopped onions and tomato then put sauce on top'', ''roll up'', ''be ready for a wonderful treat !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (50414, 'a refreshing salad to usher in summer', 'lb watermelon ; tablespoon chopped mint leaf, sprigs for garnish ; lb mild feta, diced ; limes, juice and zest of ; to taste salt & freshly ground black pepper', 'tried this great salad out from a cookbook i own. and i thought, hey i should share this great recipe with my ''zaar family. so here it is. summer is coming for heaps of you...i think it will come in handy.', '[''remove skin , seed and the white part from the watermelon'', ''cut into bite size pieces'', ''place watermelon in a serving bowl'', ''drizzle lime juice over and season with a little salt and freshly ground black pepper'', ''add feta , mint and lime zest'', ''garnish with whole sprigs of mint'', ''a rich blue-veined cheese'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (448592, 'spice kissed masoor dal split red lentils', 'tablespoon peanut oil (or other fat such as ghee, butter, grapeseed oil, etc.) ; teaspoon garlic powder ; teaspoon ginger powder ; teaspoon garam masala powder ; teaspoons garam masala powder ; cups masoor dal ; water, to cover the dal as it cooks ; cup green peas, frozen ; tablespoon peanut oil (or other fat such as ghee, butter, grapeseed oil, etc.) ; tablespoons butter (butter or ghee preferably(other light flavor oils also ok to substitute) ; teaspoon turmeric powder ; teaspoon red pepper flakes ; onion, diced ; garlic cloves, finely minced ; teaspoon ginger powder ; teaspoon ginger, freshly grated or minced', 'i love tasty food, especially when it can be made quickly and be made from ingredients i usually have on hand. i''ve cooked many recipes for dal over the years, eaten many varieties of dal dishes out at restaurants, and i''m always looking for the next best dal recipe that i can make at home. this is it!', '[''in a medium sized pot over medium flame , add 1 tbsp peanut oil , 1 tsp garlic powder , 1 tsp ginger powder , and 1 tsp garam masala powder'', ''stir spices and oil together , allow to fry slightly'', ''add the dal and water to cover , turn the heat to high , and bring to a boil'', ''skim off foam that forms on top and discard'', ''cover and turn the heat to low'', ''allow to simmer until dal begins to fall apart and is cooked through'', ''while cooking , monitor the water level'', ''if it is too low , the dal will burn to the bottom of the pan , so add more water'', ''if the water level is too high , uncover the pan so some will evaporate'', ''when done , the dal should be a porridge consistency--not watery , but not burning to the bottom of the pot'', ''heat frozen green peas , drain excess water , and add to cooked dal'', ''taste dal and adjust salt'', ''since you have not salted the pan yet , you may need to add a few teaspoons to tablespoons of salt'', ''add slowly--you can always add more but it is hard to get rid of too much'', ''make the tadka: in a frying pan over medium heat add the butter , 1 tsp tumeric powder , 2 tsp garam masala powder , and 1 / 2 tsp red pepper flakes'', ''fry lightly until spices release their fragrance'', ''add the onion and fry for another few minutes to the softness you desire'', ''add the garlic and ginger and fry for another 2 minutes'', ''add tadka mixture to dal mixture and stir to combine'', ''taste and adjust seasonings as necessary'', ''serve spice kissed masoor dal over rice with yogurt , raita , red raw onions , cucumber , lettuce , tomatoes or other fresh vegetables of your liking'', ''to read about dal , visit the wikipedia page at:'', ''to read about tadka , visit the wikipedia page at:'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (50411, 'leftover roast beef spicy salad', 'to taste mint leaf ; head watercress ; packet mixed salad green ; tomatoes, sliced ; onion, sliced ; slices leftover roast beef (up to you how much you wanna add) ; tablespoon fish sauce ; clove garlic, finely chopped ; chili, finely chopped ; teaspoon sugar ; head watercress ; cup water ; lemon, juice of', 'had way too much of roast beef one time, and whipped this salad up to make up for the amount of meat i had consumed, and the lack of vegetables in a diet. it worked so well, i have started making extra roast beef, just so that i could have heaps of leftovers for this wonderful salad.', '[''wash and dry mint leaves and watercress in a salad spinner'', ''toss the packaged salad leaves and watercress in a salad bowl and top with tomatoes and onion'', ''add beef slices , torn into bite-sized pieces'', ''mix dressing in a bowl , stir well to combine'', ''cover salad with spicy dressing'', ''top with mint leaves and serve with rotti for a twist'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (23144, 'potatoes sauteed with shrimp', 'small red potatoes, large dice ; tablespoon olive oil, divided ; lb small shrimp, cleaned ; tablespoon minced garlic ; tablespoon lemon juice ; teaspoon parsley ; teaspoon salt ; teaspoon red pepper flakes', 'delicious, different supper.', '[''fry potatoes in 3 t olive oil until browned and tender'', ''remove and keep warm'', ''add remaining oil to skillet , add shrimp'', ''cook for 2 minutes'', ''add remaining ingredients and saute for 3 minutes'', ''return potatoes and mix well'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (121756, 'ww 6 points soft tacos with chipotle chicken salad', 'tablespoons reduced-fat mayonnaise ; tablespoon fresh lime juice ; teaspoon minced chipotle chile in adobo ; small garlic clove, minced ; lb skinless cooked chicken breast, shredded ; small jicama, peeled and sliced into matchstick size pieces or 1 cup thinly sliced celery ; small onion, finely chopped ; (6 inch) whole wheat tortillas ; cup chunky salsa', 'from ww magazine. you can make the salad up to a day ahead if you like. you can also use store bought or rotisserie chicken.', '[''to prepare the salad , blend together the mayonnaise , lime juice , chipotle , and garlic in a medium bowl'', ''add the chicken , jicama , and onion'', ''toss to coat'', ''let stand 10 minutes to allow flavors to blend , or cover and refrigerate up to 2 days'', ''heat the tortillas according to package directions'', ''keep warm'', ''to serve , spoon 1 / 2 cup of the salad filling and a tbsp of the salsa into each warmed tortilla'', ''6 points per serving'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (483902, 'guilt free ground turkey gyros', 'lb lean ground turkey ; cup oatmeal ; egg ; teaspoon paprika ; teaspoon black pepper ; teaspoon salt ; teaspoon dried parsley ; teaspoons dried oregano ; teaspoons garlic powder ; teaspoons onion powder ; teaspoon cumin ; teaspoon allspice', 'i love greek gyros sandwiches, but i don''t like to eat lamb and it''s not the healthiest food in the world. this recipe satisfies my craving. you can eat these on pita bread, but it''s just as good on any other bread in place of deli meat. serve it with tzatziki sauce, greek yogurt, or sour cream.', '[''preheat the oven to 350f'', ''put all of the ingredients in a bowl , and spend a few minutes kneading the resulting mixture with your hands so everything is combined well'', ''pour the mixture onto a lightly oiled 9x13 pan'', ''smash it down with your hands a bit until it looks like a very large hamburger patty'', ''bake it for 35 minutes'', ''remove , then cut the meat into thin slices and serve'', ''if you want a crispier , more authentic gyros texture , lay the sliced meat down on the pan and place in the broiler for 5 more minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (63921, 'mouth watering carrot and cheese parathas', 'cup whole wheat flour (atta) ; to taste salt ; to taste water, to knead ; to taste ghee or 1/8 to taste oil, to shallow fry (Use ghee for authenticity) ; cup fresh carrots, peeled and grated ; cup cheddar cheese, grated ; to taste pepper ; to taste red chili powder ; tablespoon fresh mint leaves, finely chopped ; tablespoon fresh coriander leaves, finely chopped', 'from last week''s ', '[''sieve flour and salt in a large bowl'', ''add water , a little at a time , and knead well to make a dough'', ''cover'', ''keep aside for 30 minutes'', ''now mix all the ingredients listed under carrot and cheese filling in a bowl'', ''divide the dough into 8 balls'', ''roll each ball into a paratha'', ''place spoonfuls of the carrot-cheese filling on each paratha'', ''bring together the edges of the paratha and seal completely'', ''roll out the parathas , one at a time'', ''heat a tsp'', ''or two of ghee / oil on a flat bottomed pan'', ''shallow fry the paratha with ghee on one side'', ''when light brown specs begin to appear , flip the side , and shallow fry on the other side also briefly'', ''remove from tava'', ''wipe off excess oil on clean kitchen paper napkins'', ''likewise , repeat for all the parathas'', ''serve hot !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (359738, 'the a w mama burger', 'lb ground chuck ; plain jumbo hamburger bun (4-inch diameter) ; slices pickles ; teaspoons ketchup ; teaspoon yellow mustard ; salt and pepper', 'the a&w mama burger. companion to the papa burger from the family burger line of a&w', '[''mix the ketchup and mustard'', ''this is your secret sauce'', ''cook the beef , and toast the buns as directed above'', ''dress your toasted top bun as follows:'', ''secret sauce , spread evenly with a knife , pickles'', ''place the cooked beef patty on the dressed crown'', ''finish with the toasted heel'', ''4'', ''microwave 10 seconds to warm the bun , and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (41833, 'garlic shrimp and pasta from baxter s interurban grill', 'ounces linguine ; large shrimp, peeled and deveined ; tablespoon minced garlic, more if you like ; cup white wine ; ounces butter, cold,cut into pieces ; cup diced tomato ; cup fresh spinach ; salt ; pepper ; italian seasoning', '', '[''saute shrimp in olive oil , then add garlic , salt , pepper , seasonings , tomatoes and spinach'', ''add wine and reduce by half , then add butter and allow it to melt'', ''prepare pasta according to label directions , drain and top with shrimp mixture'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (37379, 'steamed tofu with pork', 'piece tofu, crushed (about 8cmx8cmx8cm) ; lb pork, minced ; egg white ; teaspoon salt ; teaspoon pepper ; pinch pepper ; stalk spring onions, diced (optional) ; teaspoon soy sauce ; teaspoon cornflour or 1/4 teaspoon flour ; teaspoon sugar ; teaspoon sesame oil (or other vegetable oil)', 'a healthy cantonese dish suitable for both young and old. it is easy to digest. both tofu and pork are rich in protein that they are very nutritious. you can cook other chinese dishes and serve with rice. try it!', '[''marinate the pork with the seasonings for 30 minutes or more'', ''mix all the ingredients thoroughly and place them flat on a plate'', ''steam the mixture until they are cooked'', ''it is a good idea to steam it over rice cooker , using a suitable rack to hold in position , when you are cooking the rice'', ''serve hot'', ''if you want it more salty , add some soy sauce on top to suit your taste'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (25617, 'fabulous pasta salad', 'ounce medium pasta shells, cooked and drained ; cup black beans, rinsed and drained ; cup diced provolone cheese ; cup diced cheddar cheese ; cup diced cooked ham ; cup diced cooked turkey ; small red pepper, sliced ; hard-boiled eggs, chopped ; to taste salt and pepper ; (1 ounce) jar caesar salad dressing ; to taste parsley', 'every time i take this to a party, someone wants the recipe. they''re surprised to find out it''s so easy. this is so flavorful! and it''s really an attractive dish to serve too!', '[''combine first 8 ingredients in large bowl'', ''add salt and pepper and toss well'', ''pour on dressing , mix well'', ''sprinkle parsley on top'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (347750, 'shrimp quesadilla', 'lb small baby shrimp ; tablespoons lime juice or 2 tablespoons lemon juice ; jalapenos or 1/4 serrano chili, finely minced ; tablespoon green onion, chopped ; tablespoon cilantro, chopped ; medium sized flour tortillas ; cup monterey jack cheese, shredded ; avocado, sliced ; dollop sour cream ; salt and pepper', 'this recipe is from simply delicious', '[''place shrimp in a bowl'', ''add lime or lemon juice , chiles , green onion , cilantro'', ''sprinkle with salt and pepper'', ''let marinade for 10-30 minutes'', ''strain out the juice'', ''heat a cast iron or stick-free skillet on medium high'', ''add 1 / 2 tsp of oil amd spread it around the pan'', ''place 1 tortilla on the skillet'', ''flip it over a few times , 10 seconds between flips so that air pockets form'', ''do this with the second tortilla also'', ''leave the 2nd tortilla in the pan'', ''sprinkle the tortilla with the grated cheese'', ''distribute the shrimp mixture on top of the cheese'', ''place the other tortilla on top'', ''use 2 spatulas to flip the quesadilla over when the bottom tortilla is nicely toasted and the cheese has begun to melt'', ''remove the quesadilla from the pan when the now bottom tortilla has toasted sufficiently'', ''cut like a pie into six pieces'', ''serve with avocado slices and sour cream'', ''garnish with cilantro'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (254691, 'chilli salt and pepper squid', 'lb squid, cleaned ; tablespoons cornstarch ; tablespoons plain flour ; teaspoons hot chili powder ; tablespoons sea salt ; tablespoon szechuan peppercorns, dry-roasted and crushed ; cups vegetable oil ; leaves iceberg lettuce, chilled ; lemons, cut into wedges', 'this classic cantonese starter is simple to make, but for real success, there are a couple of rules you need to follow. most important: always use clean oil for your deep-frying. the resulting batter will be crisp, crunchy and light, as opposed to heavy, greasy and ''dirty'' in flavour. and be sure to serve it immediately: this dish is best eaten piping hot.', '[''rinse and dry the squid thoroughly'', ''slice each squid tube horizontally into 1 / 2in rings'', ''set aside'', ''in a large bowl , combine both types of flour with the chili powder , sea salt and szechuan pepper'', ''add the squid and toss to coat , shaking off any excess flour'', ''fill a wok with oil to about a third full and heat until the surface seems to shimmer slightly'', ''add half the squid and deep-fry it for between 45 seconds and 1 minute , or until it''s just tender and beginning to colour'', ''remove with a slotted spoon and drain well on kitchen paper'', ''repeat the process with the remaining squid'', ''arrange the lettuce leaves on a platter and top with the squid'', ''serve with the lemon wedges'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (417888, 'sweet corn mini muffins', 'lb butter, room temperature ; cup sugar ; large eggs ; red jalapenos, diced ; ounce cheddar cheese, shredded ; ounce mozzarella cheese, shredded ; quart kernel corn, drained ; cup flour ; to taste Pam cooking spray, baking with flour spray ; cup yellow cornmeal ; tablespoon baking powder ; teaspoon salt', 'needing a ''kicked up'' recipe for a chili dinner for a bunch of students at the university of wisconsin odyssey class, i dug this recipe out of my ''clippings to some day try''. very tasty and a little on the sweet side! this recipe is adapted from the all-american cookbook of the ics (international chili society). the original recipe comes from cathy and doug wilkey, ics world champions (1993 & 2005).', '[''preheat oven to 350 degrees'', ''cream butter and sugar together , then add eggs one at a time , mixing thoroughly after each egg'', ''stir in jalapenos , corn and cheeses'', ''mix well'', ''blend dry ingredients in a bowl flour , cornmeal , baking powder and salt'', ''add dry ingredients mixture to butter / sugar mixture , mix well and refrigerate for 10 minutes'', ''spray metal mini-muffin pans well with baking non stick spray'', ''fill muffin 3 / 4ths full'', ''put into preheated oven @ 300 degrees'', ''bake for 1 hour'', ''remove and place on stove top for 15 minutes'', ''knock out onto a towel'', ''garnish with fine diced cilantro'', ''serve with chips'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (107524, 'beef bean sprouts', 'lb lean beef ; egg white ; teaspoon salt ; teaspoons soy sauce ; teaspoon sugar ; tablespoons sherry wine ; tablespoons cornstarch ; teaspoons oil ; tablespoons water ; lb bean sprouts', 'an easy, yummy chinese dish. prep time includes time to marinate the beef.', '[''cut beef into very thin slices'', ''mix together the next 5 ingredients , and marinate the beef in this mixture for 1 / 2 hour'', ''heat a little oil in a frying pan and saute the beef mixture for 2 minutes'', ''mix together the cornstarch , oil and water and add it to the beef mixture'', ''cook until the cornstarch is clear , and set aside'', ''saute the bean sprouts in a little hot oil for 2 minutes'', ''mix with the beef and serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (146603, 'veggie stir fry', 'tablespoon canola oil ; cup broccoli florets, halved if large ; celery ribs, julienned (or bell pepper) ; ounces mushrooms, sliced ; garlic cloves, minced ; tablespoon tamari soy sauce ; teaspoon ground ginger ; cup chicken broth (made from bouillon) ; tablespoon cornstarch, mixed with water to form a paste ; to taste black pepper', 'made with ingredients i usually have on hand. this is what i make to clean out my fridge, so the veggies are different each time, but i love this version. this can easily be made vegetarian by substituting vegetable broth.', '[''soak broccoli in water'', ''heat canola oil in large frypan or wok and steam wet broccoli , covered , for 4-5 minutes'', ''add celery , mushrooms , garlic , soy sauce and ginger'', ''saute uncovered for about 5 more minutes , depending how crunchy you want your veggies'', ''add the chicken broth and bring to a boil'', ''stir in cornstarch paste and simmer 1 minute'', ''serve over rice , with soy sauce and chow mein noodles'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (101730, 'greek macaroni hamburger casserole makaronia phournista', 'quarts water (12 cups) ; cups warm water ; tablespoon salt ; teaspoon salt (or to taste) ; tablespoon olive oil ; tablespoons olive oil ; lb elbow macaroni (I use Barilla PLUS) or 1 lb shell macaroni (I use Barilla PLUS) ; tablespoons butter ; (12 ounce) can seasoned tomato paste ; teaspoon sugar ; teaspoon ground cinnamon ; teaspoon oregano ; tablespoon grated orange rind ; cup fresh orange juice (juice of 1 orange) ; bay leaves ; teaspoon ground cloves ; cups warm water ; lb ground beef ; teaspoon pepper (or to taste) ; cup onion, finely chopped ; garlic cloves, finely chopped ; cup red wine (I like Marsala wine) ; ounces kefalotiri (or to taste) or 8 ounces gruyere, grated (or to taste) ; ounces kasseri cheese (to cover top) or 4 -5 ounces cheddar cheese, sliced tissue thin (to cover top)', 'macaroni layered with a homemade meat sauce and greek cheeses.', '[''preheat oven to 350f'', ''put water , salt , olive oil and in a large pot and bring to a boil'', ''add macaroni , cook until well done , and drain'', ''melt butter in sauce pan , add tomato paste , stir and mix well'', ''add sugar , salt , cinnamon , oregano , orange rind , orange juice , bay leaves , and cloves , and stir well'', ''continue stirring while slowly adding warm water'', ''cover and simmer until only 2 / 3 of the liquid remains'', ''season beef with salt and pepper , and saut in olive oil until meat is dry , breaking up meat while browning , so it will not be lumpy when done'', ''add onions and garlic and continue to saut until onion is yellow'', ''pour wine over this mixture , stir well , cover tightly , and set aside'', ''when only 2 / 3 of the liquid remains in the tomato sauce , add the ground beef mixture'', ''continue to simmer covered until sauce is thickened'', ''keep hot'', ''put layers in a baking pan in the following order: macaroni meat sauce kephalotiri cheese'', ''keep layering until everything is used up , with the last layer being the meat / tomato sauce'', ''cover the top layer with a single layer of kaseri cheese'', ''bake until the kasseri is melted'', ''serve hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (38356, 'sindhi hara murgh chicken in green curry homemade sindhi style', 'kg chicken, jointed ; tablespoons cooking oil ; teaspoon coriander powder ; teaspoon turmeric powder ; teaspoon salt ; tomatoes, grated ; cup coriander leaves, chopped ; teaspoon ginger, chopped ; garlic cloves, finely chopped ; green chilies', 'the way we cook chicken traditionally at home is this way :) got this recipe from the ''femina'' magazine.', '[''heat the oil in a pan'', ''fry the paste for 5 minutes , stirring continuously'', ''add the powdered spices , salt and tomatoes'', ''fry till the oil bubbles to the top'', ''add the chicken and cook on low heat till the chicken is tender , usually takes about 20-30 minutes'', ''serve hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (52269, 'linda s herbed home fries', 'tablespoons olive oil ; medium potatoes, peeled and diced ; large onion, chopped ; garlic cloves, crushed ; teaspoon italian seasoning ; salt and pepper, to taste', 'what''s not to love about these deliciously flavored taters? they are great with eggs, bacon and toast, or as a side to pork chops, and hamburger and sausage patties. heck, they are good with just about anything!', '[''heat the oil , in a large non-stick frying pan , over med-high heat'', ''put the onions on one side of the frying pan , then put the potatoes on the other'', ''sprinkle the spices over the top'', ''mix in the garlic with the onions'', ''stir well'', ''when onions are tender add the garlic and onion mixture to the potatoes'', ''cook until the potatoes are tender and nicely browned , stirring frequently so the onions and garlic don''t burn'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (420277, 'italian panzanella salad', 'cup red wine vinegar ; cup best quality extra-virgin olive oil ; to taste coarse salt and pepper ; (3 7/8 ounce) cans cannellini beans, rinsed and drained ; cup large cubes country bread (5 to 6 ounces) ; lb plum tomato, cut into small pieces ; medium red onion, very thinly sliced ; ounce provolone cheese, in one piece diced ; cup fresh basil leaf, torn', 'big cubes of bread in this traditional italian salad soak up the zesty dressing; white beans and provolone pump up the protein for a well-balanced vegetarian meal. from martha stewart.', '[''in a large bowl , whisk together vinegar and oil'', ''season with salt and pepper'', ''add beans , bread , tomatoes , cucumber , onion , and cheese'', ''toss to combine'', ''cover and refrigerate at least 2 hours , and up to 8 hours'', ''just before serving , stir in basil'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (463105, 'sesame flavored beef', 'ounces beef, very thinly sliced ; teaspoon soy sauce (I use low sodium) ; teaspoon mirin ; teaspoon sesame oil ; teaspoon sesame oil (for frying) ; teaspoon brown sugar', 'from just bento.com this is a very simple beef recipe that i like to include in a bento box along with some rice and vegetables for an easy take to work lunch. i put the meat in the marinade the night before, then quickly stir fry it in the morning before packing into my lunchbox.', '[''combine all ingredients except the final teaspoon of oil'', ''let marinate for at least an hour , up to overnight'', ''heat remaining oil in a hot skillet'', ''add beef mixture , and fry until done'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (36598, 'curry chicken with pearl onions', 'ounces white pearl onions, peeled ; boneless skinless chicken breasts ; tablespoon curry powder ; fluid ounces no-salt-added tomato sauce ; fluid ounce white wine ; teaspoon red chili paste ; teaspoon garlic ; fluid ounce olive oil', 'the flavours of the curry and onion complement each other well in this dish.', '[''saut the chicken breasts in the olive oil'', ''when they are cooked through , remove the breasts and slice them thinly'', ''saut the onions in the same pan , adding the chilipaste , garlic and curry'', ''saut until the onions are translucent'', ''then return the sliced chiscken to the pan and stir in the tomato sauce and wine'', ''allow to simmer for 15 minutes and serve hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (346354, 'ww caprese rice salad', 'tablespoon olive oil ; teaspoon olive oil ; tablespoon balsamic vinegar ; basil leaves ; lb cherry tomatoes ; ounce mozzarella cheese ; to taste salt ; to taste pepper ; small onion ; ounce dried rice', 'ww used jasmine rice, which gives a slightly ''flowery'' flavour to this italian-inspired dish. but it can be made with other exotic varieties of rice as well, such as basmati. 4 pts per serving, from weight watchers.', '[''in a large serving bowl , mix together 2 tablespoons olive oil with the vinegar , basil , tomatoes , mozzarella , salt and pepper'', ''set aside while rice cooks'', ''heat remaining teaspoon of olive oil in a medium saucepan over medium heat'', ''add onion and cook until softened , about 3 minutes'', ''add rice and pint water'', ''bring to the boil , cover and simmer until water is absorbed and rice is tender , about 15 - 20 minutes'', ''toss rice with tomato mixture'', ''serve warm or at room temperature'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (23649, 'vegetable and pasta toss', 'cup dried corkscrew macaroni or 1/8 cup elbow macaroni ; cup broccoli floret ; cup cauliflower floret ; (1 1/2 ounce) package frozen artichoke hearts ; cup thinly sliced carrots ; cup sliced green onion ; leaf lettuce (optional)', 'another delicious low fat recipe. this is a good one for potlucks.', '[''cook pasta according to package directions omitting any oil'', ''add broccoli and cauliflower to boiling pasta for the last minute of cooking'', ''drain'', ''rinse with cold water'', ''drain well'', ''cook artichoke hearts according to package directions'', ''drain'', ''rinse with cold water'', ''drain well'', ''halve any large pieces'', ''in a large mixing bowl combine pasta mixture , artichoke hearts , carrot and green onions'', ''add the italian dressing'', ''toss to coat'', ''cover and refrigerate for 2 hours'', ''if desired , serve on lettuce lined plates'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (19378, 'cheese and bean burritos', '(1 1/2 inch) flour tortillas ; ounces vegetarian refried beans (I highly recommend using Diana Neal''s recipe for refried beans refer to Recipezar Refried Beans) ; ounce canned green chilies, chopped ; teaspoon cumin ; teaspoon garlic powder ; ounces cheddar cheese, shredded', 'busy night time-saving meal. kids love them.', '[''preheat oven to 400f'', ''prepare filling by mixing refried beans , chilies , cumin and garlic together in a bowl'', ''spoon approximately 4 ounces bean filling into the center of each tortilla and top with about one tablespoon of cheese'', ''fold in ends and then sides'', ''place burritos seam side down on baking sheets that have been sprayed with vegetable oil spray'', ''bake for 2025 minutes until golden brown'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (72581, 'golden tofu salad with carrots and hijiki', 'tablespoon dried hijiki seaweed ; cup water ; ounces firm tofu ; tablespoon sesame oil ; tablespoon soy sauce or 1/4 tablespoon tamari ; teaspoon fresh ginger, grated ; tablespoon rice vinegar ; teaspoon sea salt ; teaspoon sea salt, and pressed lightly ; medium carrots, julienned ; scallions, sliced thinly,sprinkled with', 'the mild hijiki is a great way to introduce seaweed to wary family and friends. this was my favorite recipe from the whole foods class i took in spring of 2003 at bastyr university. careful - the salad is highly addictive!', '[''in a small saucepan , soak hijiki for 10 minutes'', ''once rehydrated , simmer the seaweed uncovered for 20 minutes or until the water has evaporated'', ''remove from heat and allow to cool'', ''meanwhile , drain the tofu and slice the cake horizontally'', ''place between sheets of paper towels and put on a cutting board with a heavy weight atop the tofu to press away excess water'', ''a cast iron skillet or heavy book is ideal'', ''drain the tofu for at least 15 minutes'', ''cut into cubes and brown evenly on all sides using 1 tabblespoon of sesame oil'', ''remove from pan and sprinkle with tamari'', ''set aside to cool'', ''in a large bowl , whisk together vinegar , oil , ginger , and salt'', ''add seaweed , tofu , and veggies'', ''toss well and allow flavors to marry for at least 30 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (273769, 'chicken curry with chickpeas', '(3 3/4 ounce) can chickpeas, drained ; cup roasted vegetables (we did peppers, carrots and onion) ; to taste roasted hot peppers (for heat) or 1/4 to taste cayenne (for heat) ; cup yogurt ; teaspoon curry powder (I used more) ; teaspoon cumin (I used more) ; to taste garlic (optional) ; cup fresh cilantro ; to taste salt and pepper', 'my sister gave me this recipe to try for my indian husband. it was a hit. you can eat it with rice or get adventurous and make chapati', '[''cook the rice'', ''cut the chicken into 1 / 2 to 1 inch pieces'', ''transfer'', ''chicken into med pan'', ''add chick peas , veggies , yoturt'', ''and spices and mix well'', ''set pan over med-low heat'', ''and cook 3-5 min to eat through'', ''remove from heat and'', ''stir in cilantro'', ''season to taste with salt / pepper'', ''soooo yummy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (11648, 'greek pita lunch', 'lb cottage cheese, blended until smooth ; cup feta cheese, crumbled ; teaspoon dried basil ; teaspoon dried oregano ; garlic cloves, finely minced (optional) ; tablespoon tahini ; cup tahini ; whole pita breads, cut in half ; spinach leaves, washed and dried ; medium tomatoes, chopped ; medium sweet green pepper, chopped ; red onion, cut in rings ; cup mixed sprouts ; medium sweet green pepper, chopped ; to taste pepper ; lemon, juice of ; cup water ; teaspoon cumin ; cup minced parsley ; teaspoon tamari ; dash cayenne', 'if you do not want to serve with the tahini dressing just serve with your favorite dressing. try the tahini dressing on other salads, it is excellent. this is an easy to make lunch for anyone not just vegetarians', '[''in a bowl combine'', ''cottage cheese with feta , basil , oregano , garlic , tahini , pepper to taste'', ''mix well'', ''put 1 / 2 cup of the cheese mixture in each half pita pocket'', ''put in 400f degrees oven for 5-7 minutes'', ''add spinach , tomatoes , onion rings , pepper and sprouts to each pocket'', ''serve with tahini dressing on the side'', ''--------tahinidressing-----------'', ''mix tahini with lemon juice , then slowly add water until the tahini , thins out stir in the cumin , parsley , tamari and cayenne'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (111599, 'chef pierre s mediterranean omelette', 'large eggs ; tablespoon extra virgin olive oil ; teaspoon balsamic vinegar ; tablespoon butter ; tablespoon milk ; marinated artichoke hearts (slice them up) ; roundtop mushrooms (sliced) ; stalk asparagus (cut into discs, staying in the soft parts) ; sweet green pepper (cut into bite-sized pieces) ; cup freshly shredded parmesan cheese (you shred it)', 'i was getting bored with traditional omelettes, i needed something zesty and tangy, so i looked in the refridgerator and it all came to me.', '[''you can also add your own veges to this as well'', ''in a small bowl whisk the two eggs and milk together and put them aside'', ''using medium-high heat , in a saute pan or small skillet , saute the artichokes , green peppers , asparagus and mushrooms in the extra virgin olive oil , and balsamic vinegar--'', ''when through , put them aside'', ''on medium high heat , melt the butter in a ten inch skillet and then pour the egg mixture inches be sure it is even as it cooks'', ''when the surface of the eggs looks firm , put the sauteed veggies and parmesan cheese on half of the egg mixture , fold the side without veggies and cheese over onto the side that does'', ''cook for another 1-2 minutes and get ready to eat something special'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (413290, 'orecchiette pasta with veal capers and herb white wine sauce', 'tablespoons extra virgin olive oil ; medium onion, finely chopped ; garlic clove, minced ; lb ground veal ; teaspoons salt ; teaspoons fresh ground black pepper ; cup dry white wine ; cups chicken stock ; teaspoon fresh thyme, chopped ; teaspoon fresh rosemary, chopped ; tablespoons capers, drained ; ounces orecchiette, dry ; cup parmigiano-reggiano cheese, grated ; cup fresh flat-leaf parsley, chopped ; tablespoons butter', 'i made this for my ''foody'' italian spouse and it totally impressed! this ended valentine''s day on a very high note (*wink*). packed full of earthy flavors and light, creamy sauce. this will now be part of our bi-weekly recipe rotation!', '[''in a large skillet , heat the olive oil'', ''add onion and garlic and cook over moderately high heat , stirring frequently , until softened , about 5 minutes'', ''add the ground veal , season with salt and pepper , and cook until veal is no longer pink and most of the liquid has evaporated , about 8 minutes'', ''add the wine to the skillet and boil over high heat until nearly evaporated , about 5 minutes'', ''reduce heat to moderate , and add the chicken stock , thyme , rosemary and capers and simmer until the liquid is reduced by half , about 10 minutes'', ''meanwhile , cook the orecchiette in large pot of boiling , heavily salted water until al dente'', ''drain pasta well , then return it to the pot'', ''on top of the pasta , add the cheese , parsley , and butter , and stir gently'', ''now add the veal sauce mixture to the pasta , stir gently'', ''cook the pasta and sauce over moderate heat , stirring frequently , until sauce is thick and creamy , about 2 minutes'', ''transfer to bowls and serve right away'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (56341, 'greek style scampi', 'teaspoon olive oil ; clove garlic, minced ; (4 2/3 ounce) cans whole tomatoes, drained and coarsley chopped ; cup fresh parsley, divided ; lb large shrimp, peeled and deveined ; cup crumbled feta cheese (4 oz) ; tablespoon lemon juice ; teaspoon fresh ground pepper', 'this recipe came from cooking light and it is supposedly voted one of their 10 best recipes of all time. serve with orzo.', '[''preheat oven to 400 degrees'', ''heat oil in a large dutch oven over medium heat'', ''add garlic'', ''saute'' 30 seconds'', ''add tomatoes and 1 / 4 cup parsley'', ''reduce heat'', ''simmer 10 minutes'', ''add shrimp'', ''cook 5 minutes'', ''pour into a 13x9 baking dish'', ''sprinkle with cheese'', ''bake at 400 degrees for 10 minutes'', ''sprinkle with 1 / 4 cup parsley , lemon juice and pepper'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (239001, 'fried green tomato and bacon sandwich', 'green tomato, sliced ; cup self-rising cornmeal ; teaspoon salt ; teaspoon pepper ; cup oil ; slices bacon, cooked ; slices tomatoes ; slice fresh mozzarella cheese ; teaspoons chipotle chili mayonnaise, see my recipe ; slices sourdough bread ; tablespoon butter', 'people beg me to make these sandwiches. it''s a great way to use extra tomatoes from your garden. some grocery stores carry green tomatoes year round. this is my very favorite sandwich ever. the fresh mozzarella cheese can be substituted with regular mozzarella but it won''t be a yummy! you can also use tempeh bacon for a vegetarian version (not vegan).', '[''mix cornmeal , salt and pepper'', ''coat green tomato slices with cornmeal mix'', ''heat oil in frying pan'', ''fry green tomatoes until lightly browned and slightly soft'', ''coat bread slices with chipotle mayonnaise'', ''stack with bacon , cheese , fried green tomatoes and red tomato'', ''melt butter in frying pan'', ''grill at medium-low temperature until cheese is melted'', ''eat hot or cold'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (185151, 'japanese hambagu hamburg steak', 'lb ground beef ; onion ; egg ; cup milk ; cup panko breadcrumbs ; pepper (to season) ; vegetable oil, for frying ; tablespoons ketchup', 'this is a popular japanese dish, sort of a really tasty take on salisbury steak. its quick, cheap, easy and sooo good. panko bread crumbs are key here..', '[''chop onion finely'', ''heat vegetable oil in a frying pan and saute onion well and set aside'', ''put egg and milk in a bowl and mix well'', ''add breadcrumb in the bowl and mix lightly and set aside'', ''put beef in another bowl and add cooked onion and breadcrumb mixture in it'', ''season the beef mixture with salt and pepper'', ''mix the meat well with hands well'', ''make four meat balls and toss each ball from one hand to the other hand repeatedly'', ''make four hamburger patties and indent the center of each one with a finger'', ''heat oil in a pan and saute hamburgers over medium heat'', ''turn over and saute the other side'', ''add 1 / 4 cup of hot water in the pan and put lid and steam hamburgers for a few minutes'', ''remove the lid and cook until the water is gone'', ''transfer hamburgers into individual plates'', ''add ketchup and worcestershire sauce in the pan after hamburgers are removed'', ''mix quickly over low heat to make sauce'', ''pour the sauce over hamburgers'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (503392, 'grilled chicken tzatziki wrap', 'pita bread ; tablespoon yogurt (for garnish) ; cup yogurt ; tablespoon honey ; teaspoon fresh lemon juice ; teaspoon lemon zest ; teaspoon hot sauce ; large garlic clove, minced ; garlic clove, minced ; teaspoon dried oregano ; teaspoon ground cumin ; teaspoon fresh ground pepper ; teaspoon salt ; boneless skinless chicken breasts ; cup diced tomato (dice finely) ; cup diced red onion (diced finely) ; tablespoons black olives (chopped and pitted) ; tablespoon fresh parsley (coarsely chopped) ; tablespoon fresh dill weed (coarsely chopped) ; tablespoon extra virgin olive oil', 'this delicious wrap is a slightly modified version from styleathome.com. for the best flavor it requires a marinade time of 2 hours minimum, which is not included in the prep time.', '[''to prepare chicken marinade , whisk all marinade ingredients except chicken breasts together in a bowl'', ''combine marinade with chicken breasts in a large zip-lock bag , seal and gently shake to evenly distribute marinade over chicken'', ''place in refrigerator and chill for 2 to 4 hours'', ''meanwhile , prepare the cucumber relish'', ''lay cucumber slices in a sieve placed over a bowl and sprinkle with pinch of salt'', ''leave for about 30 to 40 minutes , or until cucumbers soften and their liquid begins to drain into the bowl'', ''stir occasionally'', ''combine the tomato , onion , olives , parsley , dill , garlic , olive oil and lemon juice in a medium bowl'', ''stir in drained cucumbers , then cover the bowl and refrigerate for 1 to 2 hours'', ''grease grill and preheat to medium-high'', ''remove chicken from zip-lock bag and discard marinade'', ''grill chicken breasts until cooked through , about 12 minutes'', ''remove chicken from grill , let rest for a few minutes and slice thinly on the diagonal'', ''lay chicken slices on top of each pita round and divide relish evenly among them'', ''garnish with a little extra yogurt and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (78576, 'chili cheddar pinwheels', '(1/8 ounce) package cream cheese, softened ; cup shredded cheddar cheese (4 ounces) ; (1/16 ounce) can chopped green chilies, drained ; tablespoon picante sauce ; teaspoon chili powder ; to taste additional chili powder (optional) ; teaspoon garlic salt ; teaspoon onion powder ; (1/8 ounce) cans refrigerated crescent dinner rolls', 'these are great for parties, holidays or for a late night snack. i love the crescent dough for a change from the tortillas. one thing i know is, they will disappear in no time!', '[''in a mixing bowl , beat cream cheese'', ''add the cheddar cheese , chilies , picante sauce , chili powder , garlic salt and onion powder'', ''separate each tube of crescent roll dough into four rectangles'', ''press perforations to seal'', ''spread about 1 / 4 cup cheese mixture over each rectangle'', ''roll up jelly-roll style , starting with a short side'', ''wrap in plastic wrap and chill for at least 1 hour'', ''cut each roll into eight slices'', ''place on ungreased baking sheets'', ''sprinkle with additional chili powder , if desired'', ''bake at 350 degrees for 10-12 minutes or until golden brown'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (107853, 'chicken lo mein soft noodles', 'lb rice noodles or 1/4 lb fine egg noodles, prepared according to package ; tablespoons oil ; lb cooked chicken, cut into shreds ; stalks celery, cut into shreds ; mushrooms, cut into shreds ; cup cabbage, chopped ; ounces fresh snow peas, cut to bite-size ; cup bean sprouts ; cups chicken stock ; tablespoons cornstarch ; tablespoons water ; tablespoons soy sauce ; tablespoons teriyaki sauce ; salt, to taste ; teaspoon black pepper (or to taste)', 'wonderful flavor and easy to make. a good way to use leftover chicken.', '[''cook the noodles in salted boiling water , rinse in cold water , and drain'', ''in a wok or large skillet , saute the chicken in hot oil for 2 minutes'', ''add the vegetables and saute for another 2-3 minutes'', ''add the chicken stock and mix well'', ''cover , reduce heat and simmer for 10 minutes'', ''mix together the cornstarch , water , soy sauce and teriyaki sauce until smooth , and add the mixture to the chicken and vegetables'', ''season with salt and pepper'', ''stir in the noodles , re-heat and serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (461206, 'salt grilled chicken thighs', 'boneless chicken thighs, skin on ; salt ; pepper', 'from just bento.com this is one of my favorite things to take for lunch! it''s so simple, yet the salt brings out the wonderful flavor of the chicken, and crisping the skin in the pan makes it taste even better. i like to salt the chicken the night before, cover, and refrigerate overnight; then cook in the morning, although you could do the whole thing the night before.', '[''butterfly the chicken , to get an even thickness and ensure fast cooking'', ''sprinkle both sides liberally with salt'', ''let stand , chilled , for 1 hour , then pat off any excess moisture with a paper towel'', ''heat a non stick skillet over medium heat'', ''add chicken , skin side down'', ''cook until skin is golden brown'', ''turn over , and cook until chicken is cooked through'', ''remove from pan and let rest for a few minutes , then slice into bite sized pieces'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (519074, 'classic manapua steamed buns hawaiian style', '(1/4 ounce) package dry yeast ; tablespoons lukewarm water ; cups warm water ; cup water ; tablespoons lukewarm water ; cups warm water ; tablespoons cooking oil or 1 1/2 tablespoons shortening ; cup sugar, shopping list ; tablespoons brown sugar ; teaspoon salt ; cups sifted flour ; tablespoon sesame oil ; tablespoons cornstarch ; tablespoons brown sugar ; tablespoon hoisin sauce ; tablespoon dry sherry ; tablespoon catsup ; tablespoons oyster sauce ; tablespoons soy sauce ; lb chinese barbeque pork, diced (Char Siu)', 'manapua or baozi or steamed bun - whatever name you chose to call them, delicious they are!! commercial versions have fillings like chicken mushroom, chicken curry, teriyaki chicken or beef, shoyu chicken, purple yam (ube), pork hash (bola bola), and lup choung. some hawaiian manapua makers offer pizza filled, turkey melt, ham and cheese omelet, teriyaki burger and spicy sausage. imagine the flavors you could fill with your manapua. have fun and enjoy!! note: times do not include proofing time for the dough.', '[''sprinkle yeast over 3 tablespoons lukewarm water and allow to stand until yeast softens'', ''to remaining water , add oil or shortening , sugar and salt , stirring until melted or dissolved'', ''cool'', ''add yeast mixture'', ''place flour in a large mixing bowl or a heavy-duty mixer and add most of the liquid'', ''combine until flour incorporates liquid and starts to become a ball'', ''add remaining liquid to make a very heavy dough'', ''begin kneading the dough in the bowl'', ''continue kneading until you have a smooth ball that is beginning to show signs of long strands on the outside , indicating that the gluten has fully developed'', ''remove dough from bowl and rinse out bowl'', ''pour sesame oil into bowl , return dough and turn it around until covered with a thin layer of the oil'', ''cover with plastic wrap'', ''allow to rise until double in bulk'', ''place the dough in the refrigerator and allow it to rise'', ''punch it down again and allow it to rise again'', ''proceed with the filling while the dough is rising'', ''in a saute pan , stir cornstarch , hoisin sauce , dry sherry , oyster sauce , ketchup , soy sauce and brown sugar into the 1 cup water until dissolved'', ''bring to a boil , reduce heat and simmer 1 minute , stirring constantly'', ''add char siu and simmer for 5 minutes'', ''take off heat and allow to cool completely'', ''chill covered until 1 hour before you are ready to stuff the manapua'', ''allow to return to room temperature before using'', ''when ready to cook , cut 12 squares of waxed paper and coat 1 side with very light coat of nonstick cooking spray'', ''punch down dough and divide into 12 pieces'', ''roll each into a ball'', ''make the dough as thin as you can and try to keep the edges thinner than the center'', ''place the circle of dough in the palm of your hand'', ''spoon in a couple of tablespoons of filling , cupping the dough around it'', ''with the thumb and finger of the other hand , pinch the edges of the dough as if you were making a fluted edging on a pie crust'', ''pinch the folds together , twisting them as you do so'', ''place the completed manapua on a square of greased waxed paper'', ''allow to plump up into a globe with a taut exterior'', ''heat a steamer with plenty of water or preheat an oven at 350 degrees f'', ''if using steamer , fill steamer with manapua on their papers about 1 to 2 inches apart'', ''cover and steam vigorously for 15 minutes'', ''remove steamer from heat , let stand 5 minutes , then open'', ''if using a metal steamer , place a folded tea towel across top of steamer , holding it in position with the lid'', ''this will prevent steam from dropping onto manapua while steaming'', ''if baking , place manapua on their papers on a baking sheet about 1-2 inches apart'', ''brush top of buns with a little vegetable oil and bake 20 to 25 minutes'', ''remove from oven and allow to stand 1 minutes'', ''serve hot'', ''manapua can be frozen'', ''frozen bau may be reheated by wrapping with a paper towel and microwaving for 1 minute'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (75227, 'potato toast', 'cup potatoes, boiled,peeled and mashed ; slice bread, edges trimmed ; eggs, beaten ; cup onion, finely chopped ; tablespoon coriander leaves, washed and finely chopped ; tablespoon mint leaf, washed and finely chopped ; green chilies, washed and finely chopped ; tablespoon lime juice ; teaspoon red chili powder ; teaspoon knorr chicken stock powder ; cup potatoes, boiled,peeled and mashed ; to taste oil, to fry', 'here''s a nice snack to have when you want to eat potatoes! from the weekend magazine.', '[''lightly dry roast the potatoes in a non-stick frying pan to dry out the water'', ''heat 2 tsps'', ''oil in a pan'', ''add onions and green chillies to it'', ''saute until the onions are softened'', ''add the mashed potatoes , corriander and mint leaves , red chilli powder , knorr chicken stock powder and lime juice'', ''mix well'', ''remove from heat'', ''spread a thick layer of potato mixture on each bread slice'', ''brush over with the beaten egg'', ''shallow fry in hot oil until lightly browned and cooked on both sides'', ''serve hot with tomato ketchup !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (26638, 'zippy snack melts', 'cup shredded cheddar cheese ; tomatoes, slices ; tablespoon fresh parmesan cheese, shredded', 'these are good with soup, or just by themselves for a snack.', '[''on each muffin half , sprinkle 1 / 4 of the cheddar'', ''top with a tomato slice'', ''sprinkle 1 / 4 of the parmesan over each tomato'', ''broil , 6 inches from the heat , for 5-7 minutes , until cheese is melted and bubbly'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (234453, 'delicious nachos', 'tortilla chips ; tablespoons refried beans (or black beans) ; cup cheese (cheddar or Mexican mix, whatever you have around) ; jalapeno, chopped (optional) ; cup salsa (I use Salsa) ; avocado, chopped (or mashed) ; tablespoons sour cream ; tablespoon black olives, chopped (or sliced) ; tablespoon tomatoes, chopped', 'great quick snack and very delicious. my dh and i will often have these for lunches on weekends or when i just don''t feel like cooking. i never measure what i''m putting on this; i just put what looks right - so my measurements are estimates. very easy to adjust to individual tastes - for example i don''t like tomatoes and my dh doesn''t like black olives so those two items get put on separate halves of the nachos.', '[''spread the chips evenly on a plate'', ''spread the beans on top of the chips'', ''if you use refried beans , put little globs of them on the chips around the plate - these don''t spread easily'', ''cover with the cheese'', ''sprinkle the chopped jalapenos over the cheese'', ''microwave for 1 minute or until all the cheese is melted'', ''spread the salsa over the nachos'', ''spread the sour cream over the salsa'', ''spread the avocado , black olives , and tomatoes over the sourcream'', ''enjoy ! we usually end up making a second plate'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (307636, 'greek lamb wraps', 'cup unpeeled cubed cucumber ; cup reduced-fat sour cream ; teaspoon red wine vinegar ; cup crumbled feta cheese ; teaspoon fresh ground black pepper ; teaspoon dried mint flakes ; lb lean boneless leg of lamb, cub into 1/4 inch slices ; onion, cut into quarters and thinly sliced ; (2 inch) flour tortillas ; large tomatoes, thinly sliced ; cup packed baby spinach leaves', 'this is a tasty, easy sandwich. the recipe is from cooking light superfast suppers. posted for zwt 2008.', '[''combine first 6 ingredients in a small bowl'', ''stir well'', ''cover and chill'', ''coat a large nonstick skillet with cooking spray or a little olive oil'', ''add lamb and onion'', ''cook over medium-high heat , stirring occasionally , 6-7 minutes or until lamb is done'', ''remove from heat'', ''stir in greek seasoning'', ''divide lamb mixture evenly among 4 tortilla'', ''topp with cucumber sauce , tomato , and spinach'', ''roll up tortillas'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (425059, 'mini spinach feta calzone pockets no phyllo', 'ounces pizza dough, approximately (Easy 30-Minute Pizza Dough II) ; cups fresh spinach ; ounces feta cheese (about 1/2 cup) ; tablespoons olive oil, divided ; garlic clove, chopped (1/2 tsp minced garlic) ; teaspoon oregano ; teaspoon ground black pepper ; teaspoon paprika ; dash nutmeg', 'i''m on a spinach feta craze right now. i''m not fond of most phyllo doughs but loooove pizza dough. i like calzones that don''t have ricotta. how to satisfy all three? this concoction that was a lot of fun to make! feel free to use another pizza dough recipe or a tube/bag of storebought dough, you need something that yields about one 12'' pizza. some greek seasoning owuld also probably work great in this. a can with about a 5'' diameter works as a nice cutter, so does a 10-oz ramekin or wide biscuit cutter. cook/prep time doesn''t account for the pizza dough. depending on the dough yield and how much filling you put in each cutout, yields about 10-12 mini calzones.', '[''run the spinach through a food chopper / processor until it has about the same consistency as tabouleh , then put into a mixing bowl'', ''finely grate the feta cheese with a grater or food chopper then mix with the spinach'', ''add all the other ingredients on the list except the dough to the bowl and mix thoroughly-- except the olive oil , make sure just 1 tablespoon of oil goes in the mix'', ''roll the pizza dough onto a floured surface and make cutouts , about 10-12'', ''spoon about 3-4 tablespoons of spinach mixture into the center of each cutout'', ''place each cutout on a cookie sheet greased with cooking spray'', ''fold the cutouts over so they resemble little calzones'', ''make sure that there are no pointy edges or tops because they''ll burn easily'', ''with the remaining tablespoon of olive oil , brush the tops of the calzones'', ''about 1 tablespoon should be enough to lightly brush them all'', ''bake at 375f for 15-20 minutes or until golden brown on top'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (37673, 'hefty defty roly poly weebles wobbles but they don t fall down burritos', 'ounces lean ground beef ; tomatoes, diced ; cloves garlic, chopped ; tablespoons chili powder ; tablespoon cumin ; ounces low-sodium refried beans ; ounces diced green chilies ; fluid ounces no-salt-added tomato sauce ; flour tortillas ; cup shredded monterey jack cheese ; head lettuce, shredded ; avocados, pitted,peeled and mashed ; fluid ounces sour cream', 'eat ''em or freeze ''em.', '[''in a large skillet over medium-high heat , cook the ground beef until brown'', ''drain excess fat'', ''reduce the heat to medium and add the tomatoes , chili powder , garlic and cumin'', ''cook for 2 minutes , blending well'', ''preheat oven to 375f'', ''fill each tortilla with a layer of refried beans , a sprinkling of green chili peppers , a heaping tablespoon of tomato sauce and a small portion of ground beef'', ''roll up the tortillas , burrito-style , and place seam side down in a 13x9x2-inch baking dish'', ''when all the tortillas that you plan to cook are in the baking dish , sprinkle them liberally with monterey jack cheese'', ''bake for 20 minutes , or until the cheese is bubbly'', ''serve immediately with shredded lettuce , mashed avocados , and sour cream'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (139213, 'huevos a la mexicana', 'eggs ; medium sized tomatoes, washed and diced ; onion, finely chopped ; serrano pepper, chopped ; tablespoon butter ; tablespoon oil ; to taste salt', 'found for the world tour 2005, i can''t wait to make this - it looks so simple & yummy! this recipe is easily doubled, tripled, quadrupled...', '[''melt the butter with the oil in a deep skillet , add the onion and the peppers and saut until the onion is translucent'', ''add the tomato and the eggs , stirring constantly to prevent sticking until the eggs are done'', ''season to taste with salt'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (370972, 'fish tacos with yogurt sauce', 'cup plain yogurt ; tablespoon low-fat mayonnaise ; tablespoon light sour cream ; teaspoon ground red pepper ; lime, juiced ; cup chopped fresh cilantro ; teaspoon salt ; teaspoon black pepper ; cup cornstarch ; lb tilapia fillets ; tablespoon canola oil or 1/4 tablespoon vegetable oil ; corn tortillas ; cup finely shredded red and green cabbage ; cup finely chopped tomatoes', 'this is a quick, flavourful, and healthy recipe from chef lala on a recent ''today show''.', '[''mix yogurt , mayonnaise , sour cream , red pepper , lime juice , cilantro , salt and pepper in a small bowl'', ''set aside'', ''mix cornstarch , salt and pepper on large , flat plate'', ''place fish in cornstarch mixture'', ''turn to coat both sides with cornstarch mixture'', ''heat oil in large skillet'', ''shake excess cornstarch off fish'', ''place fish in pan'', ''cook fish 3 minutes'', ''turn fish and cook 3 more minutes'', ''remove from pan and place on paper towels to drain excess oil'', ''place tortillas on grill or griddle over medium heat 10 seconds on each side , or until beginning to bubble and brown lightly'', ''fill tortillas with fish'', ''top with sauce , cabbage and tomatoes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (382449, 'tomato goat cheese and black olive salad', 'plum tomatoes, sliced somewhat thick (room temperature) ; salt and pepper ; ounce goat cheese ; tablespoon black olives, sliced ; tablespoon extra virgin olive oil', 'i threw this together with ingredients i often have on hand, since i love mediterranean flavors. it''s a great dinner starter or a perfect lunch when served with good quality bread and wine. this recipe will serve one for a lunch portion or 2-3 for a dinner starter.', '[''arrange the sliced tomatoes on a plate without overlapping'', ''season to taste with salt and pepper'', ''crumble the goat cheese all over the tomatoes and then sprinkle the black olives on top'', ''drizzle with extra virgin olive oil and serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (428331, 'chicken gyros with cucumber salsa and tsatsiki', 'kirby cucumbers, divided ; teaspoon fresh lemon juice, divided ; garlic cloves, minced, divided ; pint grape tomatoes, quartered ; small red onion, halved and thinly sliced ; to taste feta (optional, to taste) ; cup chopped flat leaf parsley ; cup chopped mint ; cup extra-virgin olive oil ; teaspoon dried oregano ; teaspoon dried rosemary, crumbled ; (3 ounce) package naan bread (four 8-inch pieces) ; pocketless pita bread round ; roast chicken, skin discarded, meat shredded (about 2 1/4 cups) ; head iceberg lettuce, thinly sliced', 'gourmet march 2009 posting this for zwt 6 greece.', '[''preheat broiler'', ''peel and grate 1 cucumber , then squeeze it to remove excess water'', ''stir in yogurt , 1 / 2 teaspoon lemon juice , one third of garlic , and 1 / 4 teaspoon each of salt and pepper to make tsatsiki'', ''cut remaining cucumber into 1 / 4-inch pieces and stir together with tomatoes , feta , onion , parsley , mint , remaining 1 / 2 teaspoon lemon juice , and 1 / 4 teaspoon each of salt and pepper to make salsa'', ''gently simmer oil , oregano , rosemary , remaining garlic , 1 / 4 teaspoon salt , and 1 / 8 teaspoon pepper in a small heavy saucepan , stirring constantly , until garlic is fragrant but not browned , 1 to 2 minutes'', ''toss chicken with 3 tablespoons garlic oil and brush one side of bread with remainder'', ''heat bread , oiled side up , in a 4-sided sheet pan , covered with foil , 3 to 4 inches from broiler 3 minutes'', ''uncover and broil , rotating bread for even coloring , until golden in spots , about 2 minutes'', ''spread some of tsatsiki on warm bread and top with chicken and some of lettuce and salsa'', ''serve remaining lettuce , salsa , and tsatsiki on the side'', ''cooks'''']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (73443, 'rolled stuffed eggplant aubergine', 'garlic cloves, finely chopped ; cup vegetable oil ; (28 ounce) cans crushed tomatoes, with puree ; (6 ounce) can tomato sauce ; teaspoon salt ; teaspoon pepper ; teaspoon dried basil (can substitute fresh accordingly) ; teaspoon dried oregano (can substitute fresh accordingly) ; teaspoon dried parsley (can substitute fresh accordingly) ; bay leaf (can substitute fresh accordingly) ; cups plain breadcrumbs ; cups sifted all-purpose flour ; eggs ; cup milk ; eggplants (1 lb. each) ; (15 ounce) containers ricotta cheese ; (8 ounce) package mozzarella cheese, grated ; cup grated parmesan cheese ; cups chopped fresh parsley', 'take the work out of entertaining with this make-ahead main dish! original recipe by joanne scanapico with a few adapations of my own. it makes a ''delish'' italian meal. prep and cook times are estimates since i haven''t made it in awhile. been on diets...poor us!!', '[''saute garlic in 1 tbls'', ''of oil in large saucepan until golden brown , about 4 minutes'', ''working in batches , combine crushed tomatoes , tomato sauce , salt , pepper , basil , oregano , and parsley in blender'', ''whirl until smooth'', ''pour into saucepan'', ''add bay leaf'', ''bring to boiling'', ''lower heat'', ''simmer , partially covered , 30 minutes'', ''reserve'', ''combine crumbs and flour in large shallow pan'', ''beat eggs and milk in large bowl'', ''peel eggplants'', ''cut lengthwise into 1 / 8-inch-thick slices'', ''dip into egg mixture'', ''dredge with flour mixture , shaking off excess'', ''set on wax paper'', ''working in batches and using about 3 tbls'', ''of oil per batch , saute eggplant in large skillet until golden , 1 minute per side'', ''drain on paper toweling'', ''combine ricotta , mozzarella , parmesan and parsley in bowl'', ''mix well'', ''spread 2 to 3 tbls'', ''on one side of each slice of eggplant'', ''roll up jelly-roll fashion'', ''spread 1 cup tomato sauce over bottom of each of two 11 3 / 4''x7 1 / 2''x1 3 / 4'' baking dishes'', ''arrange rolls seam-side down in single layer in dishes'', ''spoon sauce over rolls'', ''save remaining sauce to pass'', ''bake , covered in preheated 450 degree oven for 30 minutes or until sauce is bubbly'', ''garnish with chopped parsley , if you wish'', ''to make ahead: prepare rolls early in day'', ''bake just before serving'', ''or freeze'', ''defrost in refrigerator overnight'', ''bake as above'', ''it''s up to you !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (78711, 'cinnamon crispas', '(1/8 inch) flour tortillas ; cup sugar ; teaspoon cinnamon (or more to taste) ; to taste oil (for frying)', 'crunchy cinnamon-sugar snacks like my girls love to get at taco bell...yummy for snacks, dessert, slumber parties, football parties, or ''just cause.'' great with mexican hot chocolate! :o)', '[''combine cinnamon and sugar'', ''set aside'', ''pour oil 2'' deep in medium skillet'', ''heat to 375'', ''cut each tortilla into 8 strips , each approx 1'' wide'', ''fry 3-5 strips at a time until golden brown and crisp , turning once'', ''remove and drain on paper towels'', ''sprinkle with cinnamon mix while still warm'', ''serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (418095, 'mediterranean chopped salad with shrimp and chickpeas', 'head romaine lettuce, cut crosswise into thin strips (8 cups) ; lb cooked peeled and deveined medium shrimp, cut in half crosswise ; (3 7/8 ounce) can chickpeas, rinsed ; medium sweet onion, chopped (such as Vidalia or Walla Walla) ; cup crumbled feta (about 3 ounces) ; cup pitted kalamata olive, halved ; cup pita chips, broken into pieces ; tablespoon olive oil ; tablespoon red wine vinegar ; to taste kosher salt and black pepper, to taste', 'this is a wonderful salad that will become one of your favorites! i like to make a meal out of it. this doesn''t call for tomatoes, but you could put them in if you wish, and you can use red onion rather than the sweet onion. i like to use lemon juice with the olive oil occasionally. this is a very refreshing salad, great for before meals, or a quick lunch.', '[''in a large bowl , add the lettuce , shrimp , cucumber , chickpeas , onion , feta , olives , and pita chips to the oil and vinegar'', ''add 1 / 4 teaspoon each salt and pepper , and toss'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (190225, 'savory croissant breakfast pudding', 'tablespoon unsalted butter ; cup yellow onions, thinly sliced ; ounce hot sausage, removed from casings and crumbled ; large eggs ; cup whole milk ; cup heavy cream ; tablespoon unsalted butter ; teaspoon salt ; tablespoon salt ; teaspoon fresh ground black pepper ; stale croissants, torn into 1/2-inch pieces (about 7 cups) ; cup grated fontina or 1/4 cup grated gouda cheese ; cup breadcrumbs ; cup grated parmesan cheese ; tablespoon paprika ; tablespoon garlic powder ; teaspoon fresh ground black pepper ; tablespoon black pepper ; tablespoon onion powder ; tablespoon cayenne pepper ; tablespoon dried oregano ; tablespoon dried thyme', 'this is an emeril lagasse recipe that has rave reviews on the food network site; i just wanted to post it here so that i don''t lose it. i''ll be doing it for xmas morning; if anyone tries it before then let me know what you think! the recipe for his ''essence'' seasoning is included, but it can be purchased at almost any grocery store nowadays, under emeril''s label. add more veggies, omit meats for a tasty vegetarian option.', '[''preheat the oven to 350 degrees f'', ''lightly grease a 3-quart casserole dish and set aside'', ''in a large skillet , melt 1 1 / 2 tablespoons of the butter over medium-high heat'', ''add the onions , reduce the heat to medium , and cook , stirring , until soft and lightly caramelized , about 15 minutes'', ''in a medium skillet , melt another 1 / 2 tablespoon butter over medium-high heat'', ''add the canadian bacon and cook , stirring , for 3 minutes'', ''drain on paper towels'', ''add the sausage to the skillet and cook , stirring , until browned , about 5 minutes'', ''drain on paper towels'', ''in a large bowl , beat the eggs'', ''add the milk , cream , salt , essence , and pepper and whisk to combine'', ''add the croissants and let sit for 5 minutes'', ''add the sausage , bacon , onions , fontina cheese , stir together , and let sit for 5 to 10 minutes'', ''pour into the prepared dish and bake until almost completely set , 35 to 45 minutes'', ''cover with aluminum foil if it''s browning too much'', ''in a small bowl , melt the remaining 2 tablespoons butter in the microwave , then combine with the bread crumbs and parmesan'', ''uncover the pudding and evenly cover with the bread crumb mixture'', ''return to the oven , increase the heat to 375 degrees f and bake until completely set in the center and golden brown on top , about 15 minutes'', ''serve hot'', ''emeril''s essence creole seasoning :'', ''2 1 / 2 tablespoons paprika'', ''2 tablespoons salt'', ''2 tablespoons garlic powder'', ''1 tablespoon black pepper'', ''1 tablespoon onion powder'', ''1 tablespoon cayenne pepper'', ''1 tablespoon dried oregano'', ''1 tablespoon dried thyme'', ''combine all ingredients thoroughly'', ''yield: 2 / 3 cup'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (32682, 'mexfast', 'cup spinach, firmly packed,washed and chopped ; cup cooked brown rice ; cup frozen corn kernels ; cup salsa ; flour tortillas or 1 corn tortillas', '', '[''place the spinach in a saucepan with only the water you washed it in still clinging to the leaves'', ''cook stirring until just wilted about 2 minutes'', ''remove from the saucepan and drain well'', ''place the brown rice corn and salsa in the saucepan'', ''cook stirring until heated through'', ''stir in the spinach'', ''spoon a line of the mixture down the center of each tortilla and roll up'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (86428, 'tex mex corn squares', 'cup vegetable stock ; teaspoon salt ; cup yellow cornmeal ; cup shredded cheddar cheese, divided ; (3 1/4 ounce) can black beans, drained and rinsed ; cup salsa (mild, medium or hot) ; cup kernel corn, frozen, thawed or 1/4 cup canned corn, drained ; chipotle chiles in adobo, diced ; teaspoon chili powder ; teaspoon ground cumin ; cup chopped fresh coriander', 'a great vegetarian recipe from homemakers'' magazine. a bean, corn and salsa mixture on a polentalike base. the chipotles (smoked jalapeno peppers) can be quite hot! i often just add a dab of the peppers when cooking for folks who are not keen on spicy food. love the smokey flavour. edited:feb.08...we really enjoy this served with puppitypup''s ''mexican night salad'' (#188160)', '[''preheat oven to 350'', ''lightly oil an 11 x 7-inch baking dish'', ''bring stock and salt to a boil'', ''slowly whisk in cornmeal until mixture thickens'', ''bring to boil'', ''take off the heat'', ''stir in 1 / 2 cup of the cheddar cheese and mix until melted'', ''spread in prepared pan and cover to keep warm'', ''combine beans , salsa , corn , chipotle peppers , chili powder and cumin in a bowl'', ''stir in remaining cheese and coriander'', ''spread mixture over cornmeal base'', ''bake for 25-30 minutes-- until heated through and cheese is melted'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (493702, 'what a dal', 'tablespoon olive oil ; large yellow onion, cut into pieces ; garlic cloves, peeled ; teaspoon fresh ginger, peeled and minced ; teaspoon ground coriander ; teaspoon ground cumin ; teaspoon turmeric ; teaspoon ground cardamom ; teaspoon dry mustard ; teaspoon cayenne pepper ; teaspoon ground allspice ; cup dried brown lentils, picked over and rinsed ; (2 5/8 ounce) can kidney beans, drained and rinsed ; cup water (more as needed) ; to taste salt & freshly ground black pepper', 'aromatic spices turn everyday beans and lentils into an exotic dish with the flavors of india. if a smoother texture is desired, puree up to two cups of the finished product in a blender or food processor and stir back into the pot. serve over freshly cooked basmati rice. recipe is from my fresh from the vegetarian slow cooker cookbook.', '[''pour the oil into a 4-quart slow-cooker and set it on high'', ''in a food processor , puree the onion , garlic , and ginger and add it to the cooker'', ''cover and cook to mellow the flavor and remove the raw taste while you assemble the other ingredients'', ''stir in the coriander , cumin , turmeric , cardamom , mustard , cayenne , and allspice , and cook , stirring for 30 seconds'', ''turn the setting to low'', ''add the lentils , kidney beans , and water'', ''cover , and cook for 8 hours'', ''add additional water , if needed'', ''before serving , season with salt and pepper and adjust the other seasonings , if necessary'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (34331, 'linguine with wild mushroom alfredo', 'ounces linguine ; tablespoon olive oil or 1/4 tablespoon canola oil ; tablespoon dry white wine ; ounces button mushrooms, sliced ; fresh shiitake mushrooms, sliced ; ounce oyster mushrooms, sliced ; clove garlic, minced ; cup low-fat milk ; tablespoon fresh parsley, chopped ; teaspoon dried thyme ; teaspoon white pepper ; teaspoon salt ; tablespoon cornstarch ; tablespoon cold water', 'from vegetarian times, here is a new take on the classic alfredo sauce with 3 different kinds of mushrooms which makes a light but appetizing sauce. proof that an appetizing sauce does not have to be a ', '[''cook linguine in 3 qts'', ''boiling water until al dente , about 8-10 minutes'', ''drain'', ''in another large saucepan , heat the oil and wine over medium high heat'', ''add mushrooms and garlic , and cook for 6-8 minutes , stirring often'', ''stir in the milk , parsley , mustard , thyme , pepper , and salt'', ''bring to a gentle simmer over medium heat'', ''combine cornstarch and water until smooth'', ''stir into the mushroom sauce and return to a gentle simmer'', ''fold in the cooked linguine'', ''cook for about 1 minute more over low heat , stirring frequently'', ''transfer to warm serving plates and serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (283440, 'chicken parmigiana pie', 'cup cottage cheese ; cup parmesan cheese, grated ; teaspoon garlic powder ; teaspoon oregano ; teaspoon basil ; tablespoon tomato paste ; cup cream ; cup water ; eggs ; teaspoon pepper ; cup chicken, cooked & shredded ; cup mozzarella cheese, grated, separated', 'i wanted a parma pie without using bisquick (we don''t have it here in oz)so went searching, i found this on a low-carb web site. i''m posting the recipe as written but i simply combined all the ingredients together,(except water)spooned into pastry, wacked them in the pie maker & voila, chicken parma pies!', '[''heat oven to 200'', ''c'', ''spread cottage cheese on the bottom of a glass pie plate and then sprinkle with parmesan cheese'', ''mix chicken & 3 / 4 cup mozzarella cheese with the herbs & tomato paste and then add eggs'', ''mix cream with water and add to the chicken mixture'', ''pour into pie plate and bake for 25-30 mins'', ''top with remaining mozzarella and bake for 5 mins more'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (15633, 'sheer korma', 'gallon fresh whole milk ; cup sugar ; cloves whole cardamom pods ; teaspoon cardamom powder ; cup slivered almonds, cashews and pistachioes ; cup fresh cream ; teaspoon saffron strand ; tablespoon charoli nuts ; cup light brown raisins ; teaspoon rose water ; tablespoon butter', 'this special muslim dish is traditionally served on eid day (both eid al-fitr and eid al-adha) to the household after they come back from eid prayers. it is then served throughout the day to all well wishers and guests who come to celebrate eid with you. it is served by muslims from a variety of ethnic backgrounds, arab, asian, america, european, southeast asian, oriental, etc.. s', '[''fry the vermicelli in the butter until well browned but not burnt'', ''fry on low heat until all the butter is dried'', ''add in 1 / 4 cup sugar and fry again'', ''add in the whole milk cup by cup , stirring constantly , and bring to boil'', ''add in the raisins , whole cardamon , and 1 / 2 cup slivered almonds , cashews and pistachioes , and the remaining sugar'', ''reduce the heat and thicken the sheer korma to three-strand consistency , letting the milk boil until it is halved'', ''the vermicilli must be very soft by now'', ''quikly add in the rose water , charoli and fresh cream and let simmer covered for 10 mins'', ''garnish with the saffron strands and powdered cardamom , and serve immediately'', ''this special dish is served on the morning of eid day to all the household , after the eid prayer , as breakfast , and throughout the day to every guest that visits you'', ''it keeps fresh for up to one week in the fridge'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (99982, 'meatballs with parmesan and sausage', 'lb premium ground beef ; slice bread ; tablespoon grated parmesan cheese ; teaspoon minced sweet onions or 1/16 teaspoon white onion ; teaspoon oregano, chopped ; teaspoon basil, chopped ; cup milk ; teaspoon ground black pepper ; teaspoon garlic ; to taste salt ; egg ; to taste olive oil', 'tradtional, italian style, juicy meatballs. this can be cooked with beef, turky, chicken etc etc mince. it just depends on what your tastes are! this is a fab recipe!serve it with a simple sauce ( may i suggest my simple italian sauce ) as the meatballs have a flavour all of their own.', '[''in a bowl soak the bread in the milk until it soaks up most of milk'', ''once bread has done this , remove from bowl , disgard milk , roughly brake bread apart and place all of the other ingredients in a bowl with the bread and mix together'', ''roll the mixture into small / medium sized balls with your hands'', ''brown meat balls in pan with oil then place into oven for 10 minutes at 225 degrees'', ''add to a great italian sauce and simmer for 60 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (298241, 'vegetarian black bean hamburger tacos', '(2 2/3 ounce) can black beans ; garlic cloves, chopped ; jalapeno peppers, seeds & membrane removed, finely chopped ; teaspoon olive oil ; cup lettuce, shredded ; cup tomatoes, chopped ; cup cheddar cheese or 1/4 cup soy cheese, shredded ; cup salsa (your favorite) ; cup sour cream (optional) ; avocados (optional) ; taco shells or 1 tostado shells', 'this recipe uses mexican flavored vegetarian hamburger and it is very good. you may cook your own black beans but to simplify the recipe i used a 16oz can of black beans. be inventive and add your own choice of vegetables. your shells should be heated but watch they burn very quickly. i like to put everything on the table and let folks build their own so the shells stay crisp and the ingredients hot. if you are making tostados add more black beans , burger etc to the shell because 1 tostado is a whole meal. this recipe makes 6 tacos or 4 tostados', '[''over medium heat fry the garlic & peppers in the olive oil for 3 minutes'', ''add drained beans and mash them , mixing in the peppers & garlic ,'', ''add bean juice as needed for a nice consistency'', ''mix well & stir frequently'', ''heat the vegetarian hambugerr in a skillet over medium heat , stir frequently'', ''when the beans are ready , the burger heated through assemble your tacos'', ''put 3 tbsp of beans in the bottom of the shell , add 3 tbsp burger , then the lettuce , tomatoes , cheese and salsa'', ''top with sour cream and sliced avocado or serve your avocado on the side'', ''enjoy'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (286514, 'okara hummus', 'cup okara ; lb canned chick-peas (about 1 1/2 cups) ; tablespoon fresh lemon juice ; garlic cloves ; cup extra virgin olive oil (more if you like a thinner hummus) ; tablespoon tahini ; salt and pepper', 'since buying a soy toy soymilk maker about a year and a half ago, i have been an avid user of recipes that include okara, which is the by-product that is leftover from the soymilk making process. this recipe comes from the cookbook that was included with the soy toy. it''s a delicious--and nutritious!--way to include more soy in your diet.', '[''saute the garlic cloves in olive oil until golden brown'', ''add the chickpeas to a food processor or blender and blend until smooth'', ''add all of the other ingredients'', ''adjust the seasonings to taste'', ''serve with raw vegetable crudites , crackers , or toasted pita points'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (372621, 'asian style sweet sour meatballs', 'g ground beef ; g tofu ; egg ; tablespoons breadcrumbs ; teaspoon nutmeg ; teaspoon ground black pepper ; tablespoons soy sauce ; tablespoons ketchup ; tablespoon chinese plum juice ; tablespoon blackberry vinegar ; cups water ; tablespoon honey', 'this is a recipe i made my own version of sweet sour sauce. so delicious!! this is good for side dish.', '[''mix all the ingredients of meatballs with plastic gloves and make meatballs ,'', ''fry the meatballs with olive oil'', ''put all sauce ingredients and boil it in a pot'', ''when it''s boiled you can put the prepared meatballs in the sauce and boil down until when it become a little sticky'', ''you can put them on the dish and enjoy with rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (82170, 'lamb or beef kebab pitas with tzatziki', 'lb ground lamb (preferably leg, with all the fat) or 1/4 lb ground chuck ; small red onion, finely minced ; to taste thinly sliced red onion ; garlic cloves, finely minced ; tablespoon red wine vinegar ; egg, lightly beaten ; cup dry breadcrumbs ; teaspoon dried oregano (well-rubbed between your fingers) ; teaspoon ground cumin ; teaspoon ground cinnamon ; teaspoon ground allspice ; teaspoon ground cayenne pepper ; to taste salt and pepper ; garlic cloves, finely minced ; garlic clove, crushed to a paste ; tablespoon olive oil ; fresh mint leaves, minced ; cup fresh dill, minced ; cup cucumber, grated, squeezed dry (unpeeled, washed) ; to taste salt and pepper ; to taste salt ; to taste fresh tomato, thinly-sliced ; to taste minced parsley ; to taste grilled pita bread', 'because of the use of ground meat, this is what we call a kebab here. delicious! they can be oven-roasted, but i highly recommend you do these on the bbq.', '[''in a bowl , knead together all the kebab ingredients'', ''form into sausages of about 4-5 inches in length'', ''cover and leave in the fridge for about an hour'', ''prepare the tzatziki: in a bowl , whisk together all the ingredients'', ''taste , and adjust seasoning'', ''refrigerate for 30 minutes'', ''preheat oven to 400f'', ''grill the kebabs until brown and crusty on all sides , and cooked through , about 12-14 minutes'', ''get some grilled pita breads'', ''place 1 or 2 kebabs inside each pita and add some slices of tomato , onion , some tzatziki , and a generous sprinkling of parlsey'', ''roll up as tightly as you can without mushing up your sandwich , and wrap a piece of aluminum foil around bottom to catch any drips'', ''enjoy one of the best sandwiches you''ve ever had'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (512678, 'mini vegetable frittatas', 'large onion, diced ; tablespoon minced garlic ; tablespoon olive oil ; to taste olive oil, for muffin tins ; tablespoon unsalted butter ; cup chopped artichoke heart ; cup sliced mushrooms ; cup grated zucchini ; large eggs ; tablespoon unsalted butter ; teaspoon salt ; teaspoon pepper ; cup grated romano cheese ; cup marinara sauce', 'this is rustic italian recipe adapted from an old immigrant cookbook. simple ingredients that combine to make delicious sandwich sized frittatas. these are amazing eaten as a warm sandwich with olive oil-drizzed, grilled italian bread. enjoy!', '[''preheat oven to 375 degrees f'', ''oil 2 - 12 muffin cup tins with olive oil'', ''saute the onion and garlic in the olive oil and butter until onion is clear'', ''add artichoke hearts , mushrooms and zucchini'', ''saute 5 to 10 minutes'', ''spoon this mixture into muffin tins about half way up'', ''beat the eggs with the salt , pepper and herbs until frothy'', ''mix in the grated cheese , then pour evenly over the top of the vege mixture'', ''top each with a tablespoon of the marinara sauce and bake 15 minutes , or until egg mixture is set'', ''let cool for 5 minutes'', ''use a knife to loosen the edges of each frittata and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (172647, 'easy crust pizza', 'to taste cornmeal ; lb ground beef ; cup flour ; teaspoon italian seasoning ; teaspoon salt ; teaspoon pepper ; cup milk ; eggs ; cup onion, finely mined ; (2/3 ounce) can mushrooms, drained & minced ; (1 1/3 ounce) can premade pizza sauce ; ounce mozzarella cheese, shredded', 'from the back of a pillsbury flour bag - a no knead/no toss pizza crust that even those of us dough challenged cooks can make. even though not mentioned in the ingredients, i think it needs some minced garlic.', '[''heat oven to 425'', ''grease a 12-inch pizza pan'', ''lightly sprinkle with cornmeal'', ''in a skillet , brown the ground beef'', ''drain off fat'', ''in a medium bowl , combine flour , italian seasoning , salt , pepper , milk & eggs'', ''blend until smooth'', ''pour batter in pizza pan , tilting to cover bottom evenly'', ''spread beef over batter'', ''top with mushrooms & onions'', ''bake on lowest oven rack for 20-25 minutes or until golden brown'', ''remove from oven'', ''pour pizza sauce evenly on top & sprinkle with cheese'', ''return to oven for another 7-12 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (182058, 'the authentic greek gyro a greek grill party', 'lbs lamb (use lean, boneless lamb meat cut in 1 in cubes) ; cup olive oil ; teaspoon olive oil ; cup lemon juice ; tablespoon lemon juice ; garlic cloves (peeled and quartered) ; teaspoon fresh thyme leave (chopped) ; teaspoon fresh oregano (chopped) ; ground black pepper ; large onions (use red onion cut in thinly sliced rings) ; small romaine lettuce leaves (washed and dried) ; large pita bread rounds ; tomatoes (ripe & sliced in thin wedges) ; cups yoghurt (plain per prep instruction #3 or thick Greek style) ; garlic cloves (peeled and quartered) ; garlic clove (peeled & minced) ; teaspoon fresh oregano (chopped) ; teaspoon oregano (fresh, chopped) ; salt and black pepper (to taste)', 'inspired by peacefulnightdove’s lovely & yummy looking photo today of “easy beef gyros” by mama’s kitchen & because beef is so expensive here in iceland, i went looking for the classic gyro using lamb cubes … only to find it hasn’t been entered here on rz. i decided to chg that & found this recipe at recipeland.com. its simple title was “greek gyro”, but it’s way more than that – it’s the authentic greek gyro - “a greek grill party” (even if served inside). it’s clearly more work than hybrid versions & requires planning, but i bet it’s well worth the effort … esp if you’re able to get the real thick greek yoghurt & eliminate prep step #3. (time was given by the site & didn''t include marination, but did include time to make the yoghurt which can be eliminated.) i hope you enjoy these!', '[''the morning before an afternoon or evening bbq , make marinade by combining oil , lemon juice , garlic cloves , herbs & pepper in a med bowl'', ''set aside about 1 / 4 cup of the marinade to mix w / the onions'', ''place cubed lamb in bowl w / remaining marinade & toss to coat well'', ''refrigerate lamb & marinade reserved for onions'', ''the morning of the bbq , place onions in small bowl & toss w / reserved marinade'', ''cover w / plastic wrap , refrigerate several hrs & stir to mix well several times'', ''make yoghurt sauce by lining a med bowl w / cheesecloth & spooning in the yoghurt'', ''tie up edges of cheesecloth w / string to form a pouch'', ''suspend over a bowl or place in a colander over a bowl & let stand to drain several hours'', ''moisture will drip from the yoghurt & give it a thick consistency'', ''mix yoghurt w / minced garlic , herbs , lemon juice , oil , salt & pepper'', ''cover & chill'', ''when ready to bbq , stack pita bread in 2 piles of 6 & wrap each pile in foil'', ''heat coals or gas grill'', ''remove meat from marinade & reserve marinade for basting'', ''thread lamb onto greased skewers & grill over greased grill about 4 in from hot coals'', ''cook about 10 min or till lamb is brown on the outside , but still pink inside'', ''warm pita rounds over barbecue'', ''before serving , lift onions from the marinade w / a slotted spoon & place in a serving bowl'', ''cut whole tomatoes into thin wedges & place on a serving plate w / the lettuce leaves'', ''set out yoghurt sauce & lots of napkins'', ''to serve , cut each warmed pita round in half & separate to form 2 pockets'', ''each person fills a warmed pita picket with some of the grilled lamb cubes , lettuce , tomatoes & onions , then tops with a spoonful of the sauce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (34787, 'crispy burritos sandwich maker', '6-inch flour tortillas ; beef or pork, shredded and cooked ; refried beans, warmed ; salsa ; shredded cheese', 'in response to sandwich maker recipes.', '[''preheat sandwich maker'', ''lightly mist wells with non-stick cooking spray'', ''place a tortilla in the sandwich maker , top with 1 tbsp'', ''each: meat , beans , salsa , and cheese'', ''top with remaining tortilla'', ''close and cook for about 3 minutes'', ''serve with a dollop of sour cream and some shredded lettuce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (346068, 'spiced persimmon bread', 'cups all-purpose flour ; teaspoon ground cinnamon ; teaspoon ground cloves ; teaspoon ground nutmeg ; teaspoon ground ginger ; teaspoons baking powder ; teaspoon baking soda ; eggs ; tablespoons unsalted butter (3/4 stick/3 oz/85g) ; cup buttermilk ; teaspoon lemon juice ; cups mashed hachiya persimmons ; cup granulated sugar ; tablespoons unsalted butter (3/4 stick/3 oz/85g) ; teaspoon salt ; cup chopped pecans (optional) or 1 cup walnuts (optional) ; confectioners'' sugar, for dusting top (optional)', 'a wonderful, moist, sweet, and flavourful loaf that is a nice alternative to banana or pumpkin bread. it''s great with coffee on a winter morning or as an afternoon snack. i think this would make really good muffins, as well. be sure to only use soft and ripe persimmons. from ''diana''s desserts''.', '[''preheat oven to 350 degrees f'', ''grease and flour a 9 x 5-inch loaf pan'', ''line pan with parchment paper if desired and grease parchment paper also'', ''in a mixing bowl , sift together the flour , ground cinnamon , ground cloves , ground nutmeg , ground ginger , baking poder and baking soda'', ''set aside'', ''in the bowl of an electric mixer , food processor or blender add eggs , butter , buttermilk , lemon juice , mashed persimmons , sugar and salt'', ''mix or blend until smooth'', ''slowly add reserved flour mixture and mix until well incorporated'', ''by hand , fold in nuts'', ''pour batter into prepared loaf pan and bake in preheated oven for 75 to 85 minutes , or until toothpick inserted into the center of bread comes out clean'', ''transfer to wire rack and let cool in pan for 10 minutes before turning out onto rack to cool completely'', ''once cooled , dust top with confectioners'' sugar if desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (303127, 'herby tuna burgers with wasabi low fat and healthy', 'cup onion, roughly chopped ; teaspoon garlic, minced ; cup fresh parsley, roughly chopped ; cup fresh cilantro, roughly chopped ; tablespoons low sodium soy sauce ; lb tuna steak, cut up into chunks ; tablespoons wasabi paste', 'these tuna burgers are a great way to get people that don''t think they like fish to eat and enjoy it. these burgers are very low fat, particularly for a burger, easy to make and taste really good. the wasabi paste i used didn''t overpower the other flavors but added a nice background taste but if you wanted a stronger strength you could certainly use more of the paste. the cooking time includes the 30 minute chilling time.', '[''put the onion , garlic , parsley , cilantro and soy sauce into a food processor or mini chopper and blitz together for about 20 to 30 seconds until everything is blended and the herbs are finely chopped'', ''empty the herb mixture into a mixing bowl and set aside'', ''put the tuna chunks into the food processor and blitz until the tuna is ground up but not yet a paste'', ''this takes me about 30 seconds with the need to pulse a bit to get the stubborn chunks'', ''scrape the tuna out into the same mixing bowl you put the herb mixture into'', ''add the wasabi paste into the bowl and them combine with your hands to make sure everything is well mixed'', ''divide the mixture into four and make into four even sized patties'', ''put patties on a plate and chill in the fridge for 30 minutes'', ''take the burgers out of the fridge and heat a non-stick frying pan until it is hot and use either a bit of canola oil or a cooking spray if you want to save those extra fat grams'', ''though , if you keep it canola oil it is mostly unsaturated fat'', ''so , whatever works for you'', ''put the burger patties in the hot pan and cook for about 5 minutes on each side until they are cooked through'', ''serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (49915, 'mango cheese spread', '(8 ounce) packages cream cheese ; cup mango chutney (Jaipur) ; onion, chopped ; tablespoon curry powder ; cup unsalted mixed nuts ; teaspoons ginger paste (Jaipur) ; teaspoon cinnamon ; teaspoon cardamom', 'i have to thank sharon123 for inspiring me to make this!!! if you like this check out her east indian cheese log #48072. i wanted to make this but was snowed in, and made my alternative to it for a christmas appetizer. and if i must say so quite interesting ! impressive !!!!!!! you can replace the onions with 1/4 cup powdered sugar and use for topping for french toast or cake filling!', '[''mix all in a food processor to make a nice spread'', ''serve with crackers , toasted indian bread{naan} , grilled chicken , or fresh vegies and fruit'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (32667, 'mexican cream cheese rollups', '(1 ounce) package cream cheese, softened (I use FF cream cheese) ; cup mayonnaise (I use FF mayo) ; cup pitted green olives, chopped ; (1/3 ounce) can black olives, chopped ; green onions, chopped ; 10-inch flour tortillas ; cup salsa', 'light, tasty, creative appetizer, and can become almost fat-free with the substitutions i recommend. yum! (cook time==refrigeration time).', '[''in a medium bowl , mix together cream cheese , mayonnaise , green olives , black olives and green onions'', ''spread cream cheese mixture in a thin layer onto each tortilla'', ''roll up tortillas'', ''chill about 1 hour , or until the filling is firm'', ''slice chilled rollups into 1 inch pieces'', ''serve with salsa for dipping'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (161872, 'angels easy breakfast burritos', 'soft taco-size flour tortillas ; large eggs ; to taste shredded cheese ; (2/3 ounce) bag frozen tater tots ; to taste salsa ; to taste salt ; to taste cooking spray', 'i ate a similar burrito to this at sonic and loved it. i was suprised that for a little burrito it filled me up. this recipe is large because i love to make these and freeze them for those mornings when i am in a hurry, but need to eat.', '[''heat oven to temp as instructed on package'', ''line a baking sheet with foil then spray with cooking spray to prevent sticking'', ''lay tater tots on pan and sprinkle with salt'', ''cook until done , set aside to cool completely'', ''brown sausage in a skillet until done'', ''drain to remove fat then set aside to cool completely'', ''scramble eggs and cook until desired doneness'', ''set aside to cool completely'', ''once all cooked ingredients are cooled completely , begin making burritos'', ''lay sausage , then eggs , then cheese , then tater tots on a tortilla'', ''roll tortilla into a burrito'', ''set aside'', ''once all burritos are rolled , cover each in plastic wrap'', ''use a freezer safe plastic bag to store burritos inches'', ''use salsa when you reheat burritos'', ''burritos take 2-3 minutes to reheat , depending on your microwave'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (16864, 'greek chicken with capers raisins and feta', '(4 ounce) boneless skinless chicken breast halves ; tablespoons all-purpose flour ; teaspoon dried oregano ; tablespoon olive oil ; cup thinly sliced onion ; cups reduced-sodium fat-free chicken broth ; cup golden raisin ; tablespoons lemon juice ; tablespoons capers ; cup crumbled feta cheese ; slices lemons, thin slices (optional)', 'not only quick and delicious but low cal too!! from cooking light. serve with curried couscous (recipe #16866), and a light green salad.', '[''place each chicken breast half between 2 sheets of plastic wrap'', ''flatten to 1 / 4 inch thickness using a meat mallet or rolling pin'', ''combine the flour and oregano in a shallow dish , dredge chicken in flour mixture'', ''heat oil in a large nonstick fry pan over medium high heat'', ''add chicken and cook for 4 minutes on each side'', ''remove chicken from pan , keep warm'', ''add onions to pan , saut 2 minutes'', ''stir in broth , raisins , and juice , cook 3 minutes , scraping pan to loosen browned bits'', ''return chicken to pan'', ''cover , reduce heat , and simmer for 8 minutes or until chicken is done'', ''place chicken on individual plates and keep warm'', ''stir capers into sauce , and top each chicken breast with 1 / 3 cup sauce and 1 tablespoon cheese'', ''garnish with lemon slices if desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (221057, 'sweet and zingy tuna sandwich', 'ounces tuna in water ; salad greens ; slices bread', 'i was tired of the old mayo and tuna fish combo for my salads and sandwiches and thought i would try something out of my ordinary ingredients. this is a great topping for a leafy green salad or use between your favorite sandwich bread or wrap.', '[''drain water from tuna'', ''in a small bowl , mix ingredients together using a fork'', ''use as a topping for your salad or as a filling on your favorite sandwich bread with lettuce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (118241, 'seared italian marinated breast of chicken with tomato and basil', 'cup olive oil ; garlic cloves, crushed ; tablespoon minced fresh rosemary ; tablespoon minced fresh sage ; to taste salt & freshly ground black pepper (to taste) ; lb boneless skinless chicken breasts, split and trimmed ; lb ripe plum tomato, cored, peeled, seeded, and thinly sliced, juices reserved ; to taste red pepper flakes (to taste) ; cup shredded fresh basil leaf', 'in italian it''s petto di pollo marinato e saltato con pomodoro e basilico! simple but full of flavor, this dish is a home cook''s dream! the chicken can marinate overnight and the sauce can be made early in the day. serve over pasta for a less formal meal, or at room temperature for an easy summer lunch! delicious! (note: cook time does not reflect marinating time of at least 8 hours). from lidia bastianich.', '[''to make the marinade , in a small bowl , combine the olive oil , garlic , rosemary , sage , and salt and pepper to taste'', ''slice the chicken breasts on the diagonal into thirds'', ''using a large knife or cleaver , lightly pound each piece to flatten slightly'', ''place in a shallow glass or ceramic dish'', ''pour the marinade over the chicken , cover , and refrigerate for at least 8 hours , turning occasionally'', ''to make the sauce , in a medium-sized saucepan , heat 3 tablespoons of the olive oil over moderate heat'', ''add the garlic and saute for about 4 minutes , or until lightly browned'', ''stir in the tomatoes with their juices , the red pepper flakes , and salt and pepper to taste'', ''simmer for 5 minutes'', ''stir in half of the basil leaves'', ''remove from the heat and cover to keep warm'', ''heat a large saute pan over medium-high heat until very hot'', ''drain the chicken , discarding the marinade'', ''add the chicken to the hot pan , without crowding , and saute for 5 to 10 minutes , or until golden brown on both sides and just cooked through'', ''transfer to a large , warm serving platter'', ''drizzle the remaining 1 tablespoon olive oil over the tomato sauce and pour over the chicken'', ''sprinkle the remaining basil over the top and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (23632, 'breakfast burritos filling', 'cup potatoes, cooked and cubed ; small onion, chopped ; green pepper, chopped ; garlic clove, chopped ; lb bacon, cooked and chopped to equal 1/2 cup ; large eggs ; tablespoon milk or 1/3 tablespoon water ; tablespoon butter or 1/4 tablespoon margarine ; flour tortillas', 'this is a daily breakfast item in new mexico. you can even get breakfast burritos at macdonalds and burger king! feel free to substitute 1/2 cup ham, beef or pork for the bacon.', '[''melt margarine in skillet'', ''brown the potato , onion , pepper , and garlic in the skillet'', ''add the meat and heat until the meat is heated through'', ''mix the eggs with milk or water , and pour over the meat and veggies'', ''cook , stirring , until the eggs are done'', ''spoon into flour tortillas , along with 1 tablespoon of grated cheese per tortilla'', ''serve with sour cream and salsa on the side'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (14755, 'yam latkes with mustard seeds and curry', 'cup packed coarsely grated peeled yams (red-skinned sweet potatoes; about 8 ounces) ; cup chopped red bell pepper ; tablespoon cornstarch ; (1 1/3 ounce) can garbanzo beans, well drained ; egg ; teaspoon curry powder ; teaspoon salt ; cup chopped cilantro ; teaspoon mustard seeds ; tablespoon vegetable oil', 'these innovative latkes are great as a first course, side dish or entree. serve them with chutney and yogurt.', '[''combine yams and bell pepper in large bowl'', ''add cornstarch'', ''toss to coat'', ''puree garbanzo beans in processor to coarse paste'', ''add egg , curry powder and salt and blend'', ''transfer mixture to small bowl'', ''mix in cilantro and mustard seeds'', ''stir garbanzo mixture into yam mixture'', ''preheat oven to 325f'', ''place baking sheet in oven'', ''heat 6 tablespoons oil in large skillet over medium heat'', ''working in batches , drop 1 heaping tablespoon batter per pancake into hot oil'', ''using back of spoon , spread to 3-inch rounds'', ''cook until brown , about 3 minutes per side'', ''transfer to baking sheet in oven'', ''repeat with remaining batter , spooning off any liquid from surface of batter and adding more oil to skillet by tablespoonfuls as necessary'', ''serve hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (14627, 'mixed rice dish bibim bap', 'g beef (soy sauce, pepper, green onion, garlic, sesame oil) ; cucumber (salt, sesame oil, sesame seed) ; carrot (salt, sesame oil) ; g bean sprouts (salt, green onion, garlic, sesame oil, and sesame seed) ; leaf lettuce ; dried mushrooms (sesame oil, salt) ; egg ; sheet jelly (buckwheat, acorn or green pea) ; red pepper paste', '', '[''season sliced beef and lightly stir-fry until cooked'', ''season bellflower , bean sprouts , cucumber , and mushrooms each separately'', ''add 1ts'', ''sesame oil to hot frying pan and stir-fry the cucumbers quickly so the color stays vivid'', ''spread on a big plate to cool'', ''add more oil to the frying pan , then stir-fry bellflower , carrots , and mushrooms consecutively'', ''fry an egg sunny-side up on a clean frying pan'', ''place 1 leaf of lettuce in a dish'', ''place about 1 bowl of rice on top , and then arrange the prepared ingredients attractively on the rice'', ''place a fried egg on the center top'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (242512, 'mu shu style pork roll ups', '(2 1/2 inch) flour tortillas ; teaspoon toasted sesame oil ; ounces lean boneless pork, cut into strips ; cup loose-pack frozen stir fry vegetables (any combination) ; cup bottled hoisin sauce', 'this recipe is from the summer 2007 edition of eat magazine. this is a delicious and easy weeknight meal. my family loved it!', '[''preheat oven to 350 degree f'', ''wrap tortillas tightly in foil'', ''heat in preheated oven for 10 minutes to soften'', ''meanwhile , in a large skillet heat sesame oil over medium-high heat'', ''add pork strips'', ''stir-fry for 2 to 3 minutes or until done add stir-fry vegetables'', ''cook and stir for 3 to 4 minutes or until vegetables are crisp-tender'', ''spread each tortilla with 1 tablespoon of the plum or hoisin sauce'', ''place a quarter of the meat mixture just below the center of each tortilla'', ''fold the bottom edge of each tortilla up and over the filling'', ''fold in the sides until they meet'', ''roll up over the filling'', ''makes 4 servings'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (346830, 'smoked salmon sushi', 'cup cooked sushi rice ; sheet nori ; cup smoked salmon ; cup cream cheese ; tablespoon red onion, finely chopped', 'ths is my favourite sushi! i first had it in rockhampton a couple of years ago while on vacation, and love to make it at home now!', '[''combine the cream cheese and red onion'', ''the nori on a bamboo mat , shiny side down'', ''spread 1 cup of rice on the nori'', ''spread half the cream cheese mixture along the edge of the rice , and top with half of the smoked salmon'', ''using the bamboo mat , roll the nori , forming a log'', ''moisten the edge of the nori with water to seal'', ''cut in half to form 2 single serve rolls , or cut into 6 finger food slices'', ''serve with wasabi and soy sauce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (501436, 'greek pasta with meatballs', 'cup orzo pasta, cooked ; cup dry breadcrumbs ; teaspoon dried oregano ; teaspoon salt ; teaspoon ground cinnamon ; teaspoon fresh ground black pepper ; lb lean ground lamb ; garlic clove, minced ; tablespoon fresh parsley, chopped (divided) ; large egg whites ; teaspoon olive oil ; cup marinara sauce (bottled, store bought) ; cup feta cheese, crumbled', 'recipe is from cooking light magazine, nov. 2009. unlike traditional spaghetti, this recipe uses orzo pasta , ground lamb and feta cheese.', '[''preheat oven to 375 degrees f'', ''cook orzo pasta according to package directions'', ''drain'', ''keep warm'', ''combine breacrumbs and next 6 ingredients in a medium bowl'', ''stir in 1 1 / 2 tablespoons parsley'', ''add egg whites , stirring mixture until just combined'', ''shape mixture into 12 meatballs'', ''cover and chill meatballs 5 minutes'', ''heat oil in a large ovenproof skillet over medium-high heat'', ''add meatballs to pan'', ''cook 8 minutes , turning to brown on all sides'', ''drain well'', ''wipe pan clean with paper towels'', ''return meatballs to pan'', ''spoon marinara sauce over meatballs'', ''sprinkle with cheese'', ''bake at 375 degrees f'', ''for 11 minutes or until meatballs are done'', ''sprinkle with remaining 1 1 / 2 teaspoons parsley'', ''serve over orzo'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (302467, 'easy grilled burgers italiano for the bbq', 'lbs ground beef ; cup parmesan cheese, grated ; cup fresh basil, chopped ; tablespoon italian seasoning, like the ones in the grinders ; teaspoons salt ; teaspoon pepper ; kaiser rolls, spilt horizontally', 'only a few ingredients necessary which you probably have available. i usually have dried basil but this calls for fresh. if you use dried, use a little less. from first magazine, july, 2007. i haven''t tried it yet. lettuce, tomatoes, pickles and onions are suggested as possible garnishes.', '[''heat grill'', ''in a bowl , mix all the ingredients , except for the rolls , until just blended and shape into 6 patties'', ''grill 12 minutes or until an instant read thermometer inserted in center of the burgers reads 160 degrees f'', '', turning once'', ''place grilled patties on rolls and garnish as desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (288345, 'indian restaurant style onion bhajia deep fried onion fritters', 'large onions, sliced thinly ; g chickpea flour ; teaspoon baking powder ; tablespoons rice flour ; teaspoon turmeric ; teaspoon black onion seeds ; teaspoon chili powder ; teaspoon cumin, ground ; teaspoon coriander, ground ; salt ; ml water ; ml vegetable oil', 'an absolute must as an accompaniment to curry or wonderful as a starter for an indian meal. onion bhajis are tasty little onion balls bound together with lightly spiced and fragrant chickpea flour batter. serve these with coriander chutney or cucumber raita. you will always be offered these on any british indian restaurant menu; they also make great snacks if served with salad and assorted chutneys and spicy dips. you can lighten these up a little bit by frying them, and then allowing them to drain over a wire rack before reheating them in a medium to hot oven for about 3 to 5 minutes.', '[''put the vegetable oil into a large pan and heat over a medium to high heat'', ''make the batter: in a large bowl , add the chickpea flour , baking powder , rice flour , turmeric , black onion seeds , chili powder , cumin , coriander , salt and the water'', ''mix together well and then add the sliced onion - mix the onion through until well coated'', ''check the temperature of the oil by dropping a small cube of bread in - it should brown fairly slowly - not burn or go dark brown straight away'', ''carefully drop spoons of the bhaji batter in to the oil , do not overcrowd as they will stick together'', ''fry them in small batches for 1 to 2 minutes until they are a golden brown and crispy'', ''remove them with a slotted spoon and allow them to drain on a paper covered plate in a warm oven'', ''repeat until all the bhaji batter is finished and they are all cooked'', ''sprinkle over a little salt and serve straight away with coriander chutney or cucumber raita'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (404755, 'beijing style pork shrimp jiaozi chinese dumplings', 'lbs ground pork ; lb minced raw shrimp ; garlic cloves, minced ; green onions, chopped finely ; head cabbage, chopped and salted ; inches peeled ginger, grated ; head cabbage, chopped and salted ; tablespoons salt ; dumpling wrappers (1 package of shui jiao-style ones or 1 1/2 cups flour, pinch of salt and pinch of water to make by h) ; pinch salt ; tablespoons soy sauce ; teaspoons sugar ; egg ; tablespoons sesame oil ; teaspoons five-spice powder ; tablespoon red pepper powder ; dumpling wrappers (1 package of shui jiao-style ones or 1 1/2 cups flour, pinch of salt and pinch of water to make by h) ; dumpling wrappers (1 package of shui jiao-style ones or 1 1/2 cups flour, pinch of salt and pinch of water to make by h) ; pinch water', 'i got this recipe from my old land lord in beijing. he was a ''lao beijing ren'' (native beijinger), so his recipes are very authentic. he decided that my roommate and i needed to learn all the beijing dishes, and thus took it upon himself to teach us. my friends and i like to have dumpling parties, where we get together and wrap dumplings and talk, which makes it not as labor intensive.', '[''clean the cabbage , chop it , and put it in a large non-reactive pot with salt set it aside and let it sweat out water for 45 min or so'', ''if you''re using a meat grinder , feed the shrimp , pork , garlic , onions , and ginger through the meat grinder , getting everything to be a smooth , yet chunky mixture'', ''if you''re using a food processor , you''re going to half way freeze the meat , and chop each ingredient on it''s own , and then mix them in a pasta bowl'', ''traditionally , all these ingredients are minced and chopped using a large cutting board and a cleaver'', ''however you do it , it''s up to you'', ''put the meat and veggie mixture into a a large bowl'', ''add the salt , soy sauce , egg and sugar to the mixture'', ''in a heavy skillet , heat up the oil'', ''add the spice powders and toast the spices'', ''pour this mixture hot over the meat mixture in the bowl , and stir inches'', ''drain the cabbage , rinse it and drain again'', ''mix it in to the meat mixture'', ''make the dumpling wrappers: mix together 1 1 / 2 cup flour and pinch of salt and then slowly add just enough water to result in a springy dough'', ''knead it a lot to make the gluten stringy and strong'', ''roll the dough out into a long rope , cut the rope apart into ping pong ball sized pieces'', ''flatten the pieces out into small flat discs , and flour a table or cutting board , and roll them out using a beer bottle or small rolling pin'', ''as you make them , hand them to the person wrapping the dumplings'', ''or just buy the pre-made wrappers'', ''wrap the dumplings in the dumpling skins , pinching together the sides and tucking in the ends'', ''cook the dumplings: boil a pot of water'', ''drop the dumplings in , they are ready when the float to the top of the pot'', ''don''t boil too many at once , or they''ll stick together'', ''scoop them out with a strainer , so you can use the water for the next batch'', ''serve with soy sauce , dipping sauce , raw garlic , chili sauce , or cut up green onions'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (13076, 'yaprach stuffed grape leaves', 'cups rice ; medium onion, chopped ; package fresh coriander, chopped ; small tomatoes, chopped or grated ; teaspoon citric acid ; teaspoon salt ; pinch black pepper, or to taste if you like it hotter ; (100 g) can tomato paste ; jar pickled grape leaves', 'this recipe was given to me by my upstairs neighbor. my daughter enjoyed it so much my neighbor always used to make extra just to give to her. now that we have the receipe my daughter makes it herself.', '[''mix all the ingredients except for the grape leaves together in a large bowl'', ''rinse the grape leaves well in hot water and leave them in a bowl of hot water while you work with each one individually'', ''place one leaf on your working surface , smooth side down'', ''take one teaspoon of rice filling and place it in a finger shape in the middle of the leaf'', ''roll the outer edges towards but not quite reaching the middle'', ''roll from the bottom towards the top into a cigar shape and place in a large pot'', ''continue until all the leaves and filling has been used up , placed the filled leaves in the pot in a circular fashion , one level on top of another'', ''add water until slightly covering the leaf layers'', ''add a few drops of oil , a pinch of pepper and citric acid and 1 / 2 tablespoon of tomato paste to the water'', ''boil covered until all the water has been absorbed'', ''remove from heat'', ''place a kitchen towel between the pot and cover , cover well and return to a small flame'', ''cook for an additional 1 / 2 hour'', ''serve hot or cold'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (18762, 'greek style oven fries', 'medium unpeeled baking potatoes (about 1 1/2 pounds) ; tablespoon lemon juice ; teaspoon olive oil ; teaspoon dried oregano ; teaspoon pepper ; teaspoon salt ; clove garlic, minced ; to taste vegetable oil cooking spray', 'when i first saw this recipe i though it was ', '[''cut each potato lengthwise into 8 wedges'', ''combine lemon juice , olive oil , oregano , pepper , salt , and garlic in a large bowl'', ''add potatoes and toss well to coat'', ''place potatoes , skin side down , on a baking sheet that has been coated with cooking spray'', ''bake at 400 degrees for 45 minutes or until potatoes are tender and lightly browned'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (223036, 'chicken souvlaki quesadilla', 'cooked boneless skinless chicken breast (I use Chicken Souvlaki Wrap) ; cup mozzarella cheese ; cup feta cheese ; cup sauteed onion (optional) ; (5 inch) whole wheat tortillas (may use smaller, just use less of the ingredients)', 'an odd but yummy creation of mine using chicken from recipe #222467.', '[''spray skillet with cooking spray or lightly coat it with oil and heat to medium high'', ''lightly brown one side of the tortilla and set to the side'', ''re oil or spray pan and place un toasted tortilla in the pan and top with cheeses and chicken , then place toasted tortilla on top'', ''continue cooking until cheese is melted and warmed'', ''slice into wedges and serve with tzatziki sauce'', ''or if you don''t like waiting over the stove top , you may bake at 400 for about 10 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (13586, 'antipasto', 'large green peppers ; large carrots ; can pitted black olives ; (1 1/8 ounce) jar broken green olives ; (7/8 ounce) jars pickling onions ; (1/3 ounce) cans pimientos ; (3 1/4 ounce) jar sweet pickles ; large cauliflower ; ounce olive oil ; clove garlic, smashed ; (1 ounce) bottles ketchup ; (1 ounce) bottle hot ketchup ; (1 ounce) bottle hot ketchup ; cup red wine ; (3/8 ounce) cans tomato paste ; tablespoon oregano ; (1 ounce) cans artichokes ; (2/3 ounce) cans mushroom pieces ; can anchovies, chopped ; (1/2 ounce) cans solid tuna', 'the best antipasto i''ve ever come across, the recipe is requested with every serving. wonderful on crackers and have used it as a cold topper for a brie cheese wheel. (originally from ', '[''chop green peppers , cut carrots into julienne strips'', ''chop ripe olives , green olives , pickled onions , pimento , sweet pickle and set aside'', ''break cauliflower into bite sized pieces'', ''put 2 oz of olive oil into frying pan and add 2 cloves garlic , add cauliflower and saute'', ''remove from heat and set aside'', ''in a large pot add remaining olive oil and saute the remaining 3 cloves of garlic , add ketchup , wine , tomato paste and oregano'', ''add chopped vegetables , pickles , olives , artichokes , pimento , cauliflower and mushrooms'', ''simmer for 10 minutes , stirring frequently'', ''add anchovies and tuna to mixture and bring to a boil , stirring constantly to prevent sticking'', ''serve for use immediately , refrigerate for up to 2 weeks , place in containers for freezing or place immediately in hot sterilized jars'', ''[editors'', '']'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (78612, 'hummus with raspberry vinegar', 'tablespoon olive oil ; cup diced onions ; tablespoon raspberry vinegar ; (7 3/4 ounce) can chickpeas, undrained (garbanzo beans) ; tablespoon chopped fresh cilantro ; to taste fresh cilantro stem (optional) ; teaspoon ground cumin ; teaspoon fresh coarse ground black pepper ; teaspoon salt ; to taste fresh cilantro stem (optional)', 'my dad sent me this recipe when i told him i was going to the mediterranean deli almost everyday for hummus! i leave out the cilantro entirely when i make it, and i play around with different flavored vinegar or oil - my favorite is to use chili-flavored vinegar and balsamic vinegar! experiment and let me know how it turns out!', '[''heat oil in a nonstick skillet over medium-high heat'', ''add onion , and saut 5 minutes or until onion begins to brown'', ''add vinegar , bring to a boil , and cook 2 minutes or until vinegar evaporates'', ''cool to room temperature'', ''drain chickpeas , reserving cup liquid'', ''place chickpeas and chopped cilantro in a food processor , and process until mixture resembles coarse meal'', ''add onion mixture , cup reserved liquid , cumin , pepper , salt , and process until smooth'', ''garnish with cilantro sprigs if desired'', ''per serving : 44 calories , 2 grams protein , 1 gram fat , 7 grams carbohydrates , no cholesterol , 75 milligrams sodium , 1 gram fiber'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (258187, 'kimchi pancakes kimchi jun', 'cup flour ; cup water ; teaspoon salt ; cup cabbage kimchi, minced ; tablespoons green onions, minced ; teaspoon garlic clove, minced ; teaspoons sesame oil', 'i buy kimchi by the gallon at our local korean market, but you can even buy it at walmart on the fresh vegetable isle. these are great as a snack or part of a korean dinner. be sure to dip them in a good soy sauce dipping sauce! yum!', '[''mix flour , water and salt together and combine with the rest of the ingredients to create a thick ''pancake'' batter'', ''heat 2 tablespoons oil'', ''place 1 / 4 of the batter in the pan to form a pancake'', ''fry until both sides are golden'', ''reduce heat to low and cook all the way through'', ''repeat with remaining portions'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (177728, 'spring onion and feta noodle cakes', 'lb fine egg noodles ; lb fine egg noodles ; medium egg (beaten) ; lb plain flour (sifted) ; tablespoon milk ; bunch spring onion, chopped ; lb feta, crumbled ; to taste oil (for frying)', 'this is a recipe for a basic noodle cake. on their own they are a little bland (i still like to eat them plain sometimes)they can be easily jazzed up by serving with a dipping sauce or adding garlic, chilli anything you like really!', '[''break up noodles into shorter lengths and boil in lightly salted water for 3 minutes remove , drain and rinse in cold water'', ''mix egg , flour and milk to make a batter add the onions , feta and noodles and mix together'', ''heat some oil in a pan'', ''fry each cahe for about 2 mins each side giving them a press down after the first turning'', ''eat hot or cold'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (125943, 'chocolate hazelnut phyllo dessert fit for queens', 'sheets phyllo dough ; cup nutella ; cup light corn syrup ; cup cinnamon sugar ; cup butter', 'this is a perfect recipe for people who have never used phyllo. some people make it sound as though if you break a sheet the whole dish is broken. sheets can be broken and it''s still ''all good'' and elegant.', '[''preheat oven to 375f'', ''measure nutella , corn syrup , and cinnamon sugar in measuring cups'', ''set aside the measuring cups'', ''melt butter and set aside with a pastry brush in it'', ''unroll 1 sleeve of defrosted phyllo dough on work space'', ''grease a square baking pan with butter'', ''now pick up a sheet of phyllo dough and put it into the bottom of the pan'', ''try to work fast because it''s easy'', ''use up 5 of the sheets this way'', ''layer the next 5 sheets by sprinkling cinnamon sugar on top of the butter'', ''put a sheet down and butter it'', ''next , put a sheet down and brush it with butter and while holding down the phyllo sheet spread all of the nutella on the sheet'', ''don''t worry about getting it perfectly smooth and even'', ''use the rest of the sheets by alternating buttered sugar cinnamon layers and buttered corn syrup drizzled layers'', ''when doing the corn syrup , use the amount you think you would like'', ''brush the top with butter and sprinkle cinnamon sugar and drizzle a tiny bit of corn syrup'', ''cook in oven on the bottom rack for about 9 minutes or until the top layer is nice and brown'', ''cut and eat !'', ''this dessert''s quality is compromised after a couple hours so you really shouldn''t plan on storing it'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (10902, 'marinated octopus', 'medium octopus ; cup olive oil ; cup wine vinegar ; large onion ; teaspoon pepper ; teaspoon rosemary ; cup lemon juice', 'this is an adopted recipe and should be made with larger, older, not itty bitty baby octopus. the flavour of vinegar and lemon here are strong and not to everyone''s taste. if you are fond of tako sashimi, this is not for you. but if mediterranean fish salads are your thing, this is authentic.', '[''place octopus in a large pan with plenty of water and boil for 2 hours'', ''remove from heat'', ''wash and remove the skin'', ''cut in desired size pieces'', ''in a bowl , combine all the ingredients , except the lemon juice , and add octopus'', ''mix well'', ''cover'', ''and refrigerate for several hours or overnight'', ''when ready to serve , stir in the lemon juice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (59800, 'halloumi omelette', 'eggs ; teaspoons cold milk ; to taste butter (for frying) or 1/2 to taste oil (for frying) ; to taste salt and pepper ; cup grated halloumi cheese', 'serve with a fresh salad.', '[''break eggs into a bowl'', ''add milk , salt and pepper'', ''beat lightly'', ''add the butter to a preheated frying pan and increase the heat until the butter sizzles'', ''pour in the egg mixture and cook until the top is still liquid'', ''add the grated halloumi and fold over one-third of the omelette'', ''reduce heat to medium and cook 2-3 minutes on each side'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (115558, 'cranberry nut snack mix', 'cup sunflower seeds ; cup pine nuts ; cup pumpkin seeds ; cup craisins ; cup craisins ; cup raisins', 'great snack or salad topping', '[''measure all of the ingredients into a mixing bowl and stir with a wooden spoon until well combined'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (428044, 'greek grain salad', 'cup barley ; to taste salt ; to taste salt and pepper ; cup rye berries ; cup wheat berries ; cup pitted halved kalamata olive ; cup crumbled feta cheese ; cup diced cucumber ; cup diced tomato ; cup diced red onion ; cup chopped fresh parsley leaves ; cup chopped dill ; tablespoon minced dill ; tablespoon cider vinegar ; garlic cloves, minced ; cup olive oil ; to taste salt and pepper', 'recipe found on foodnetwork.com and it is very highly rated. perfect main course for a vegetarian or side dish for a summer bbq! the original recipe called for a crazy amount of grains, so it has been revised taking other recommendations.', '[''make the salad: bring a large pot of water to a boil'', ''add the barley and cook for 15 minutes'', ''using a sieve , remove barley from the water and transfer to a bowl'', ''bring the water back to a boil and salt , to taste'', ''add the barley and rye and wheat berries and cook , stirring occasionally , until tender , about 30 to 40 minutes'', ''drain , transfer to a bowl , and cool'', ''when cool , combine with the remaining ingredients'', ''meanwhile , make the dressing: whisk together the vinegar , dill , and garlic'', ''while whisking , drizzle in the oil to make a smooth dressing'', ''season with salt and pepper , to taste'', ''toss the salad with the dressing and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (328705, 'pasta with crunchy crumbs and feta for one', 'ounces tagliatelle pasta noodles or 3 ounces spaghetti ; ounce butter ; tablespoons white breadcrumbs (day old or from the freezer) ; lemon ; ounces feta cheese, cubed ; chopped parsley, a good handful ; salt & freshly ground black pepper ; olive oil, for drizzling', 'a simple pasta dish but with more of a bite! you get to use up old bread so you''ll save more money. serves one but easily doubled, tripled etc.', '[''pour boiling water into a large pan , add some salt and the pasta and cook according to the pack instructions'', ''meanwhile , heat the butter in a small saucepan and when sizzling add the breadcrumbs and cook for about 5 mins , stirring occasionally until crisp and golden'', ''use a zester to grate the lemon zest into the crumbs'', ''cut the lemon half into two wedges and set aside'', ''drain the pasta , put it back in the pan , toss in the crumb mixture , add the feta cheese chunks , parsley and seasoning'', ''serve in a large warm bowl drizzled with olive oil and with the lemon wedges on the side'', ''squeeze lemon juice over as you eat the pasta to bring out the flavour'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (389955, 'baked taquitos', 'tablespoon olive oil, plus more for brushing tortillas and oiling a baking sheet ; cup onion, chopped ; garlic cloves, chopped ; teaspoon cumin ; teaspoon paprika ; teaspoon sea salt (I used regular salt) ; cup cilantro, chopped ; cup cooked chicken, shredded ; cup low sodium chicken broth ; tablespoon olive oil, plus more for brushing tortillas and oiling a baking sheet ; tortillas (6inches)', 'i got this recipe off of a blog (bigboldbeautifulfood.blogspot.com). i have made it once and the flavour was really good, but it looked funny! the instructions are long but it is actually very simple and quick to make. i am posting how the recipe is originally written (well almost) but you might want to add a bit more spice. i served it with a spicy salsa and it tasted great. the chicken broth is needed if you are using corn tortillas only.', '[''preheat oven to 425f and oil a baking sheet'', ''heat olive oil over medium heat in a skillet'', ''add onions and cook until starting to turn translucent , 3-5 minutes'', ''add garlic , cumin , paprika , and salt'', ''stir to combine and cook 2 to 3 minutes longer , until fragrant'', ''take from heat and stir in cilantro and chicken'', ''set aside'', ''if you are using flour tortillas:'', ''lay tortilla on work surface and spread 2 or 3 tablespoons of chicken mixture over bottom third'', ''top with cheese and roll up'', ''place seam side down on the baking sheet'', ''repeat with remaining tortillas'', ''spray or brush tortillas lightly with oil'', ''bake until crisp and lightly browned , 12-15 minutes'', ''serve immediately'', ''if you are using corn tortillas'', ''bring chicken broth to a simmer in a skillet or pot wide enough to hold tortillas'', ''dip tortillas one at a time , briefly , just to soften , 1-2 seconds'', ''lay tortilla on work surface and spread 2 or 3 tablespoons of chicken mixture over bottom third'', ''top with cheese and roll up'', ''place seam side down on the baking sheet'', ''repeat with remaining tortillas'', ''spray or brush tortillas lightly with oil'', ''bake until crisp and lightly browned , 12-15 minutes'', ''serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (469708, 'tandoori shrimp', 'teaspoon cumin seeds ; lb large raw shrimp, peeled and deveined ; cup fresh green chili, finely chopped (sounds like alot to me, use less if you don''t want as much heat) ; cup plain nonfat yogurt ; tablespoon fresh lemon juice ; teaspoon fresh lemon juice ; teaspoon ground red pepper (this is Indian red pepper and it is extremely hot, reduce amount if you don''t want as much heat) ; teaspoon salt ; teaspoon ground red pepper (this is Indian red pepper and it is extremely hot, reduce amount if you don''t want as much heat) ; teaspoon pepper ; teaspoon garam masala ; large garlic cloves, chopped ; to taste hot cooked basmati rice (or rice of your choice)', 'recipe is from the celebrate chicago cookbook, junior league of chicago. love the aroma and flavor of garam masala - this sounds like a great grilling recipe. prep time does not include marinating time in refrigerator.', '[''cook cumin seeds in a small skillet over medium-high heat 3 minutes or until seeds are lightly toasted'', ''remove from heat , and let cool'', ''peel shrimp , and devein , if desired'', ''cut a slit almost through back of each shrimp'', ''place shrimp in a large heavy duty , zip-top plastic bag'', ''combine cumin seeds , chilies , yogurt , lemon juice , red pepper , salt , pepper , garam masala and garlic'', ''pour over shrimp'', ''seal bag securely , and shake until shrimp are well coated'', ''marinate in refrigerator 4 hours , turning bag occasionally'', ''remove shrimp from marinade , discarding marinade'', ''thread shrimp onto 16 skewers'', ''grill , covered , over medium-hot coals 2 minutes on each side or until shrimp turn pink'', ''serve immediately over rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (490278, 'spicy korean pork barbecue', 'lb pork tenderloin, trimmed ; tablespoon brown sugar ; tablespoon low sodium soy sauce ; tablespoon sambal oelek (or Thai chile paste) ; teaspoon fresh ginger, peeled and minced ; teaspoon dark sesame oil ; teaspoon crushed red pepper flakes ; garlic cloves, minced ; to taste cooking spray', '(daeji bulgogi) - from cooking light. a distinctive asian flavor -- the caramel notes of brown sugar balance the heat of the sambal oelek and crushed red pepper). prep time does not include refrigeration and marinating times.', '[''wrap pork in plastic wrap'', ''freeze 1 1 / 2 hours or until firm'', ''remove plastic wrap'', ''cut pork diagonally across grain into 1 / 16 inch thick slices'', ''combine pork , sugar and next 6 ingredients in a large zip-top plastic bag'', ''seal and marinate in refrigerator 1 hour , turning bag occasionally'', ''prepare grill'', ''place a wire grilling basket on grill rack'', ''remove pork from bag'', ''discard marinade'', ''place pork on grilling basket-coated with cooking spray'', ''grill 5 minutes or until desired degree of doneness , turning frequently'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (366037, 'lemony baked tofu', '(8 ounce) package firm tofu ; cup fresh lemon juice ; tablespoon soy sauce ; tablespoons olive oil (or vegetable oil) ; cup water ; cup chopped fresh cilantro ; tablespoon minced scallion ; tablespoon minced fresh rosemary (or 1 tsp. dried, crumbled) ; teaspoon black pepper', 'yummy as a snack, sandwich filling, or topping for salads! it''s got lots of flavor and holds it''s shape well. a choice is given for two very different but equally inviting marinades. be sure not to use an aluminum baking pan! use the smallest baking pan you have that will hold the tofu in a single layer. an 8'' square pan and a 7x9'' pan both work fine. adapted from moosewood restaurant new classics cookbook.', '[''preheat the oven to 400f'', ''cut the tofu cake horizontally into four slices and set aside'', ''choose a marinade and whisk together all ingredients until smooth'', ''pour half in a small nonreactive baking pan'', ''place the tofu slices in the pan and pour on the remaining marinade'', ''bake 45-60 minutes , turning the tofu once after about 30 minutes'', ''the baked tofu should be browned , bubbling , and curling up at the edges'', ''remove from the oven and with a metal spatula , move the tofu slices to a serving platter'', ''serve hot , warm , at room temperature , or chilled'', ''the tofu will keep in an airtight contaiiner or plastic bag in the fridge for up to 5 days'', ''enjoy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (70337, 'potato parmesan and anchovy focaccia', 'package dry yeast ; teaspoon sugar ; cup lukewarm water ; cups all-purpose flour ; cups mashed potatoes ; teaspoons salt ; tablespoon coarse salt ; tablespoons olive oil ; cloves garlic, sliced thin ; teaspoon crumbled rosemary ; teaspoon anchovy paste, to taste ; cups mashed potatoes ; lbs potatoes, peeled,sliced thin with a mandoline ; cup parmesan cheese, grated ; tablespoon coarse salt', 'awww...c''mon, live a little - the anchovies won''t kill you. promise.', '[''proof yeast in sugar and water for 5 minutes , until foamy'', ''add flour , mashed potatoes , salt and 2 tblsps olive oil and combine dough well'', ''knead for 2 minutes , form into a ball , transfer to an oiled bowl and turn to coat'', ''let rise , covered with plastic wrap in a warm place , for 1 hours , or until double in size'', ''press dough into 15 x 10 inch oiled jelly-roll pan'', ''cover loosely , put in a warm place and let rise 1 more hour'', ''preheat oven to 400 degrees f'', ''place rack in bottom third'', ''stir together garlic , rosemary , anchovy paste and remaining 4 tblsps oil'', ''arrange sliced potatoes on dough , overlapping'', ''brush with oil mixture'', ''sprinkle with parmesan and salt and bake in bottom third of oven for 40-50 minutes , or until golden-brown'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (187433, 'greek yoghurt and honey', 'tablespoon honey (approx)', 'i have this most days at school because it is the only yoghurt they provide, but i also have it everyday at home because i love it so much. i like to have it when i have a sore throat as well because it is the best medicine!!!', '[''serve yoghurt in bowl with honey on top'', ''very sticky but satisfying'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (72724, 'very good for your health and mine vegetarian lemon pepper soup', 'medium carrot, washed, peeled and thinly sliced ; small cabbage, washed and finely shredded ; medium tinned mushrooms, drained, cleaned, washed and sliced ; medium red capsicum, washed, de-seeded and chopped (bell pepper) ; medium tomatoes, washed, peeled and finely chopped ; salt ; teaspoon oil ; cups vegetable stock (I love using 2 cubes of Maggi Vegetable stock with onions) ; teaspoon crushed black peppercorns ; cup bean sprouts ; tablespoons lemon juice, fresh', 'mmmm, nothing like a good bowl of veg soup! this is the famous indian chef sanjeev kapoor''s recipe. like him, i believe that good soup is easy to make if you take care to choose the freshest ingredients, especially those that are in season. beautifully garnished, any soup would look as pretty as a bride with a veil over her charming face;-) add a few croutons in the centre of your soup for a contrasting texture and a complementary flavour! scoop up your soup from a special cook with a wonderous look, looking up from his favourite cookbook(ah i''m in a scooby dooby good mood n playing with words;-) )', '[''firstly , prepare vegetable stock'', ''for this , dissolve 2 cubes of maggi vegetable stock with onions in 4-5 cups of water and boil until the cubes are completely dissolved'', ''your veg'', ''stock is ready'', ''now keep this aside and proceed'', ''heat oil in a saucepan'', ''add carrot , cabbage and mushrooms and stir well'', ''add capsicum , tomato and salt'', ''stir-cook for 10-15 minutes till the veggies are tender'', ''then , add the stock and let it come to a boil'', ''lower heat , stir in the crushed peppercorns and remove from flame'', ''add bean sprouts and lemon juice'', ''stir well and serve hot on a cold windy winter night'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (437919, 'london broil bulgogi', 'lb london broil beef ; onion, sliced ; tablespoon soy sauce ; tablespoon fish sauce ; tablespoon brown sugar ; tablespoon maple syrup (or butter pancake syrup) ; tablespoon red wine ; tablespoon garlic, minced ; tablespoon garlic powder ; tablespoon garlic powder ; tablespoon toasted sesame oil ; teaspoon black pepper ; teaspoon sambal oelek (chili sauce) ; teaspoon minced ginger ; pinch ginger powder', 'cheap, but yummy bulgogi!!!!!', '[''it is very important to freeze the meat first , this aids you in cutting the meat into thin slices'', ''after freezing , slightly defrost - make sure the meat is still frozen , but workable'', ''cut the meat into thin slices , as thin as possible'', ''to prepare marinate mix all ingredients in a medium glass bowl'', ''place sliced london broil in marinate and press meat into bowl'', ''top with sliced onion'', ''marinate in refrigerator for 16-24 hours'', ''meat will turn dark brown'', ''it is a must to marinate for 16-24 hours if using london broil ! if you do not want to wait use a better cut of beef'', ''heat 2 tdsp of oil in a cast iron skillet or wok'', ''grab most of the onions out of bowl'', ''squeeze marinate out'', ''add onions to skillet and cook for 3 to 5 minutes'', ''drain marinate out of beef and add to onions'', ''cook on high for an additional 3 to 4 minutes flipping often'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (346586, 'yemista greek stuffed peppers', 'large bell peppers ; tablespoons olive oil ; large onions, chopped ; ounces long grain rice ; ounces ground pork ; tablespoon of fresh mint, chopped ; tablespoons fresh parsley, chopped ; teaspoons ground cinnamon ; (14 ounce) can plum tomatoes ; sliced potato (optional) ; lemon, juice of ; cup water', 'these peppers stuffed with a seasoned ground pork and rice mix are a greek favourite. you can also use the pork mixture to stuff zucchini and baby eggplants. serve with a green salad and crusty bread.', '[''neatly cut the tops off the peppers and set the tops aside'', ''remove the membrane and seeds from the peppers and discard'', ''heat 4 tablespoons of the oil in a heavy-based saucepan and fry the onion until it begins to colour'', ''stir in the rice and ground pork'', ''add the herbs , cinnamon , salt and freshly ground black pepper to taste and the tomatoes'', ''stir until the rice becomes transparent and the meat loses its redness'', ''preheat the oven to 350f'', ''use the mixture to loosely fill the empty peppers'', ''arrange the filled peppers snugly in a casserole dish'', ''put the reserved pepper tops back on the peppers , like lids'', ''combine the lemon juice , water and remaining oil and pour into the dish around the peppers'', ''bake for about 30 minutes until the peppers are tender and the filling is cooked and hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (50463, 'wild crazy rice', '(6 ounce) box long grain and wild rice blend (such as Uncle Ben''s) ; (10 1/2 ounce) can beef consomme (broth) ; cup water chestnut, sliced ; (6 ounce) can sliced mushrooms', 'this recipe is good with grilled chicken or steak. i got this recipe from a news web site here in town and thought it sounded great so i thought i would share it.', '[''preheat oven to 350 degrees'', ''in a medium-size baking dish , combine rice and seasonings , soups , water chestnuts and mushrooms'', ''using one of the opened soup cans , add one additional can of water to the mixture'', ''stir until combined'', ''cook uncovered for approximately 1 hour or until rice is tender'', ''serve hot'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (448296, 'zaru soba chilled japanese noodles', 'g dried soba noodles ; cup dashi ; tablespoons shoyu or 2 tablespoons light soy sauce ; tablespoons mirin ; tsbpn rice wine vinegar ; spring onions ; teaspoon wasabi ; sheet nori', 'this is a dish i became addicted to in thailand, of all places... i''d never seen it here in australia, so i learned to make it myself. it''s extremely refreshing in hot weather. one way of serving the noodles is to place them over a dish of ice to keep them cool, but that''s not necessary if you prefer not to. if you can''t find dashi, which is a type of stock prepared with bonito flakes and seaweed, i have found that shop bought instant miso soup can do at a pinch. you might need to fiddle with the proportions of ingredients for the sauce to suit your taste. some people like to add a little bit of sugar to the sauce as well.', '[''combine dashi , shoyu , mirin and vinegar in a pan and bring to a simmer'', ''remove from heat and store in refrigerator to chill'', ''bring litre of water to boil'', ''add soba noodles'', ''cook for 4 mins'', ''drain noodles using a colander'', ''rinse with cold water and wash noodles , making sure all the starch is rinsed off'', ''cut nori sheet in four'', ''take one quarter and slice thinly'', ''place slices of nori on noodles'', ''slice spring onion and place on a small dish'', ''put wasabi paste on another small dish'', ''serve noodles on a bamboo mat traditionally , or just use a plate , with the dipping sauce and condiments in separate bowls'', ''combine desired condiments into the sauce'', ''dip noodles in sauce and eat !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (474224, 'vegetarian japanese curry', 'tablespoon vegetable oil ; large onion, diced ; large carrots, cut into 1/2 inch thick half moons ; tablespoon japanese-style curry powder (S&B Oriental brand recommended) ; garlic cloves, minced ; cup low sodium vegetable broth ; small yukon gold potatoes, peeled and cubed ; small apple, peeled and finely grated ; tablespoon ketchup ; tablespoon vegetarian worcestershire sauce ; tablespoon miso ; cup fresh shelled edamame (optional) or 1/4 cup frozen shelled edamame (optional) ; cup hot cooked white rice (Hinode Calrose brand recommended)', 'curry was introduced to japan by the first japanese sent overseas to learn the western ways. of course, they have taken it and made it their own. recipe from vegetarian times, march 2012, p.66', '[''heat oil in large pot over medium heat'', ''saute onion 7 to 9 minutes , or until onion starts to brown'', ''add carrots and saute 5 minutes'', ''stir in curry powder and garlic and cook 1 minutes , or until fragrant'', ''add broth , potatoes , apple , ketchup , worcestershire sauce and miso'', ''bring to a simmer'', ''reduce heat to medium-low and cook 30 minutes , or until the potatoes are tender'', ''add edamame and simmer 5 minutes more'', ''serve over sticky rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (290853, 'amazing watermelon greek salad with feta', 'cup red onion, thinly sliced ; tablespoon fresh lime juice ; cup seedless watermelon, cubed ; cup feta cheese, cubed (or crumbled) ; cup black olives, pitted and halved (or use sliced ripe olives) ; tablespoon extra virgin olive oil ; to taste balsamic vinegar, to taste ; to taste fresh parsley, chopped, to garnish', 'this refreshing salad will surprise you and your guests with how well the flavours work together. at first, it might seem strange, but one taste and you will be hooked. the cool, crunchy watermelon is the perfect base for the pungent, greek flavours - it''s a perfect balance of savoury and sweet. a similar salad was served to me at a cafe a few years back. i had always remembered it and finally decided to try to recreate it. this is about as close to the original i could get. :) ***note*** feel free to experiment with flavours. try adding in some fresh basil or fresh mint in place of the balsamic vinegar. or leave out the vinegar altogether.', '[''in a small bowl , cover the onion slices with the lime juice'', ''the acid in the lime juice will help to mellow the onion a bit'', ''in a large salad bowl , combine the watermelon , feta , olives , and onions set aside'', ''wisk together the reserved lime juice , olive oil and as much balsamic vinegar to suit your taste and preferences'', ''keep in mind there is quite a bit of flavour in the salad from the feta and olives so just 1 or 2 tbsp usually does the trick'', ''pour vinegrette over melon mixture and toss'', ''garnish with freshly chopped parsley'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (21278, 'tortellini salad with garden vegetables', 'lb frozen or refrigerated tortellini ; yellow peppers or 1/8 red pepper, diced ; cup frozen peas, thawed ; small zucchini, cut into thin sticks ; small red onion, chopped', '', '[''cook tortellini according to package to package directions until just tender'', ''drain , then rinse under cold running water'', ''drain again and transfer to large bowl'', ''add remaining ingredients and toss well to combine'', ''serve at room temperature or chilled'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (105160, 'greek bbq baby octopus', 'kg baby octopus ; cup water ; lb chopped garlic ; teaspoon baking soda ; lb butter ; cup cream ; tablespoon lemon juice ; shallots ; to taste cognac, to taste ; cup olive oil ; lime ; tablespoon lemon juice ; lemon ; to taste salt ; to taste pepper', 'the hard long work pays off, i got it from a chef mate and he got it off his grandma. he tells a story of his grandfathers aussie neighbours couldn''t believe he would cook up very cheap fish bait (baby octopus) for his family. that was untill he tried it, and my family has been eating it ever since.', '[''place the octopus and garlic in a pot with water and bring to boil'', ''add baking soda and simmer for 40 minutes'', ''to prepare the marinade'', ''in a bowl add 300ml of olive oil , juice of one lemon and lime , salt'', ''and pepper'', ''when the octopus is tender rinse it in cold water'', ''place in the'', ''marinade and leave overnight'', ''the following day , grill on a hot plate until lightly coloured'', ''flamb cognac in a fry pan , add the butter and slowly melt , whisking'', ''constantly'', ''add a touch of cream and worcestershire sauce and whisk'', ''till they are all combined'', ''finish with shallots'', ''serve on a bed of rice with the cognac sauce poured all over'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (327691, 'william sonoma s greek yogurt with pears and honey', 'cups milk ; ounces dried yogurt starter ; pears, peeled and sliced ; cup roughly chopped toasted nuts (pistachios walnuts or almonds) ; tablespoons honey', 'greek yogurt (yiaourti) is thicker and creamier than the variety commonly found in u.s. markets. in greece, yogurt is a much-used ingredient in many recipes and a favorite treat spooned from the bowl with honey or nuts. traditionally made with sheeps milk, greek yogurt is easy to prepare at home using cow''s milk. the yogurt is always strained to remove excess moisture, producing a luscious, creamy texture.', '[''in a large saucepan over medium heat , warm the milk , stirring occasionally , until it registers 160f on an instant-read thermometer'', ''transfer the milk to a large bowl with a pouring spout and let cool to lukewarm'', ''pour 1 / 4 cup of the milk into a small bowl and whisk in the yogurt starter'', ''whisk the starter mixture into the large bowl of milk , making sure to incorporate all of the starter'', ''pour the milk into yogurt jars , dividing evenly , and place in a yogurt maker'', ''process for 13 hours according to the manufacturers instructions'', ''line a fine-mesh sieve with coffee filters or 4 layers of cheesecloth and place over a bowl'', ''pour the yogurt into the sieve and cover with plastic wrap'', ''refrigerate until the yogurt is thick , at least 8 hours'', ''transfer the drained yogurt to a clean bowl and stir until smooth'', ''if the yogurt is too thick , like cream cheese , whisk a little of the strained liquid back into the yogurt'', ''to serve , divide the yogurt among 4 shallow bowls'', ''top with the pears and nuts and drizzle with the honey'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (116415, 'savory potato skins worth waiting for', 'baby red potatoes ; tablespoon ground coriander ; tablespoon ground coriander, for dusting ; hard-boiled eggs, peeled ; large boneless chicken breast ; cup white wine ; tablespoon powdered milk, do not rehydrate ; large red onion, diced ; to taste salt and pepper ; hard-boiled eggs, peeled ; tablespoon oil, for frying', 'these potato skins are different from the usual potato skins you get in a restaurant – no tomato sauce or cheese. my dh asked for more of these, and he doesn’t even like potatoes! if you bake the potatoes in the microwave, you might try crisping up the skins by rubbing them with butter and salt, and putting them, empty, in the oven for a few minutes or briefly frying them. cook time is marinating time, and it is assumed that most of the prep work is done sometime during that time.', '[''marinate chicken in wine for 2 hours minimum'', ''bake potatoes'', ''fry chicken in a little oil in a frying pan'', ''add marinade to the chicken in the pan and cook it down to make a kind of glaze on the chicken'', ''cut potatoes in half'', ''scoop out the insides , leaving in shell'', ''reserve the insides of the potato for another use'', ''place chicken , eggs , onion , coriander , dehydrated milk , salt and pepper in a food processor and pulse until the ingredients are ground finely'', ''scrape down the sides of the bowl a couple of times so that everything gets ground evenly'', ''adjust seasoning at this time'', ''scoop chicken mixture into potato skins and dust with remaining coriander'', ''serve warm or cold'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (18268, 'garlicky tortellini spinach and tomato soup', 'tablespoons unsalted butter ; cloves garlic, chopped ; cup chopped onion ; cups vegetable broth ; cups water ; ounces fresh cheese tortellini or 9 ounces frozen cheese tortellini ; (14 1/2 ounce) can diced tomatoes, with their liquid ; ounces spinach, washed and stemmed,coarsely chopped ; basil leaves, coarsely chopped ; egg ; cup grated parmesan cheese ; salt and pepper', 'i first found this in fine cooking magazine and adapted it for my family. it''s one of the few times i will be ready-made tortellini.', '[''in a large saucepan , melt the butter over medium heat'', ''add the garlic and onion and saute until fragrant , 2-3 minutes'', ''add the chicken broth and water'', ''bring to a boil'', ''add the tortellini and cook halfway , about 5 minutes for frozen pasta , less if using fresh'', ''add the tomatoes and their liquid , reduce the heat to a simmer and cook just until the pasta is tender , about 4 minutes'', ''stir in the spinach and basil and cook until wilted , 1-2 minutes'', ''meanwhile , whisk together the egg , parmesan cheese , salt and pepper'', ''drizzle into the soup and cook , stirring about 3 minutes more'', ''remove from heat and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (288858, 'garlic roast beef pinwheels', 'tablespoon olive oil ; small onion, halved and thinly sliced ; garlic cloves, minced ; lb deli roast beef, cut into thin strips ; teaspoon basil leaves ; teaspoon dried marjoram ; teaspoon cracked black pepper ; (1/2 ounce) can refrigerated flaky butter crescent rolls ; to taste sesame seeds (optional)', 'a recipe i saw recently!! very good and easy to make. made these for a baby shower i hosted and they were a big hit!!!', '[''preheat oven to 375f heat olive oil in medium nonstick skillet over medium heat'', ''add onion and garlic'', ''cook and stir 3 to 4 minutes or until onion is tender'', ''remove from heat'', ''add beef , basil , marjoram and pepper'', ''toss to mix well'', ''set aside'', ''unroll dough and separate into 2 long rectangles'', ''press each into 12x4-inch rectangle , firmly pressing perforations to seal'', ''spread each half with half of beef mixture'', ''starting at one short side , firmly roll both pieces , crimping seam to seal'', ''with serrated knife and sawing motion , gently cut each roll into 8 pieces'', ''place cut side down on baking sheet sprayed with nonstick cooking spray'', ''gently reshape pinwheels after placing on cookie sheet , if necessary'', ''spray pinwheels lightly with nonstick cooking spray and sprinkle with sesame seeds before baking , if desired'', ''bake 13 to 16 minutes or until edges are golden brown'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (10770, 'fassolia gigantes plaki giant beans baked in the oven', 'kg tomatoes ; ml olive oil ; g onions, finely sliced ; tablespoon tomato puree ; cloves garlic, peeled & finely sliced ; teaspoon sugar ; salt and black pepper ; tablespoons parsley, finely chopped ; tablespoon oregano ; teaspoon thyme', '', '[''pick the beans clean from stones and grit and soak them in cold water overnight'', ''drain and rinse them in a colander , put into a large saucepan or a pressure cooker , cover with plenty of cold water and boil them until they are cooked but still a little hard'', ''this type of bean cooks quickly , so be aware until you get used to them'', ''they take hardly 2 minutes in a pressure cooker and about 30-40 minutes otherwise'', ''if they get overcooked , they get mushy and soggy and they do not taste at their best'', ''this first step then is also the most important in this recipe'', ''drain the beans through a colander and keep aside'', ''in the same saucepan , heat the olive oil and fry the onions , the garlic and the dried herbs , until they start turning pale golden'', ''add the tomatoes with all the juice from the cans or , if fresh tomatoes are used , add 150 ml water'', ''then add the tomato puree and sugar , break up the mixture with a fork , season with salt and pepper , cover and cook for 30 minutes or until the sauce thickens'', ''mix the parsley into the tomato sauce , add the beans and mix well'', ''spread the beans in an oven dish'', ''sprinkle a little oregano and black pepper on the top and cook in a pre-heated oven at 350 grades f / 80 grades c , for 30 minutes , without stirring , until they look slightly crisp on top and quite dry'', ''alternatively , add the beans to the tomato sauce , mix well , cover and simmer for 10-15 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (13678, 'tempeh sukiyaki with broccoli cauliflower', 'ounces tempeh, steamed 10 minutes, cut into thin strips ; tablespoons tamari ; tablespoons mirin ; tablespoon arrowroot ; teaspoon honey ; tablespoon fresh ginger, finely minced ; green pepper, thinly sliced ; large onion, cut in thin wedges ; large carrot, cut into match sticks ; cup celery, thinly sliced ; cup broccoli floret ; cup cauliflower, thinly sliced ; cup vegetable stock ; tablespoons oil ; tablespoons oil (additional)', 'a meal in one pan and very good. this recipe is from ''the tempeh cook book''. tempeh is a soy product sometimes combined with wild rice or other grains. there are several different kinds. tempeh has more texture than tofu, you can actually see the soy beans. for vegetarians sub vegetarian worcestershire sauce for regular and for vegan leave out the honey.', '[''put the steamed tempeh in the marinade and stir once in a while to coat all of the tempeh'', ''bring the vegetable stock to a boil and add carrots , broccoli& cauliflower , boil for 1 minute only , remove veggies immediately , reserve stock for sauce'', ''drain tempeh , adding any left over marinade to the stock'', ''heat wok or skillet add 2 tbsp oil'', ''fry tempeh uintil browned remove to a bowl'', ''heat pan add remaining 2 tbsp oil'', ''stir fry onions& peppers for a few minutes add celery cook 2 minutes'', ''pour liquid stock into the pan , bring to a simmer , add 2 tbs tamari'', ''add tempeh , carrots , broccoli & cauliflower stir until heated'', ''do not over cook the vegetables should still be crisp'', ''serve with brown rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (338874, 'waffles', 'cup flour ; teaspoon baking powder ; teaspoon salt ; eggs ; cup milk ; tablespoon lard (melted) ; tablespoon sugar (optional)', 'from mom''s spiral recipe notebook', '[''sift dry ingredients'', ''beat eggs , milk , & melted lard'', ''add wet mixture to dry ingredients'', ''if sweet waffles are desired , add the sugar'', ''pour onto a hot waffle iron'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (68466, 'fat free egg rolls', 'ounce chicken, cooked and chopped ; can baby shrimp, drained ; ounce beef, cooked and chopped ; ounce pork, cooked and chopped ; bunch green onion, chopped ; lb bean sprouts ; can water chestnut, drained and chopped ; head bok choy, chopped ; carrots, shredded ; tablespoon peanut butter ; tablespoon soy sauce ; to taste salt and pepper ; egg roll wraps', 'this was a surprise to me at how good the results were--egg rolls with no fat, no deep frying---wow! they are fantastic, and fast and easy to make. don''t let the list of ingredients scare you, you can use more or less of one thing, or eliminate a vegetable, or replace one, with no problems. a really great recipe, very low calorie too!', '[''make sure all meat is cooked , and everything mentioned as''chopped'' above is chopped'', ''i use the food processor'', ''mix everything but the egg roll wrappers in a very large bowl'', ''use your hands to be sure to get a good mix'', ''place an eggroll wrapper in front of you , with a point up , as in a diamond'', ''put about a third of a cup of filling horozontally across the middle , bring down the top point , tuck under the filling , and roll , folding in the two side points as you go'', ''seal the bottom point with some water before you roll completely up'', ''if in doubt , check the back of the eggroll wrapper package for pictures'', ''spray the biggest cookie sheet you have with pam , put eggrolls on it , make sure they aren''t touching'', ''spray the tops of the eggrolls with pam'', ''bake for 30-40 minutes'', ''if the tops seem cooked and crispy , flip them over for the last ten minutes of baking'', ''eggrolls are done when they are crispy-crunchy and browned'', ''check oven to be sure of progress and time , as the cooking time seems to vary with how wet , and how much filling you use'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (300447, 'cinco de mayo sloppy joes', 'tablespoon butter ; green bell pepper, seeded and chopped ; large garlic clove, crushed and chopped ; jalapeno, seeded and chopped ; lb lean ground beef ; (2 1/2 ounce) can ro-tel diced tomatoes with lime and cilantro, drained ; teaspoon ground coriander ; teaspoon ground red pepper (cayenne) ; tablespoon white vinegar ; teaspoon brown sugar', 'i love cinco de mayo and i wanted to invent a recipe for my celebration! these sloppy joes have a cheesy, spicy, kick to them. i hope you like them!', '[''in a medium skillet'', ''melt the butter on medium heat and then saute the bell pepper , garlic , and jalapeno until soft'', ''add the beef and cook it until no longer pink'', ''in a medium bowl'', ''mix the soup , ro-tel , coriander , cayenne , vinegar , and brown sugar'', ''drain any fat from the beef'', ''pour soup mix into beef and mix well'', ''cook for about 5 more minutes until heated through and bubbly'', ''serve on buns and garnish with lime and avocado'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (40561, 'hotsy totsy pork n peppers', '(5 ounce) package chinese noodles, cooked ; lb pork tenderloin, cut into 3/4 inch cubes ; tablespoons soy sauce, divided ; cup fresh orange juice ; tablespoons balsamic vinegar ; tablespoon honey ; teaspoons cornstarch ; pepper ; cup sweet red pepper, seeded,deveined & cubed ; cup yellow sweet pepper, seeded,de veined & cubed ; cup mixed hot pepper, seeded,deveined and finely chopped (if you do not wish to use them increase the sweet peppers by 1/2 cup each) (optional) ; vegetable oil cooking spray, for pan ; cup sweet red pepper, seeded,deveined & cubed ; cup yellow sweet pepper, seeded,de veined & cubed ; cup mixed hot pepper, seeded,deveined and finely chopped (if you do not wish to use them increase the sweet peppers by 1/2 cup each) (optional)', 'have it hot or not (it''s best hot) quick and easy. this is a chinese/ very canadian dish', '[''combine pork & 1 tbsp soy , stir well & set aside'', ''combine the remaining soy , juice , vinegar , honey & cornstartch'', ''stir well'', ''spray a skillet and over high heat stir fry the pork until browned'', ''remove pork from skillet'', ''stir fry the peppers for 2 minutes'', ''return pork to skillet & add juice mixture'', ''bring to a boil and cook 1 minute , stirring constantly'', ''add noodles'', ''cook until heated through'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (12713, 'broccoli garlic pasta for one', 'tablespoon onion, chopped ; garlic cloves, minced ; teaspoon lite olive oil or 1 teaspoon virgin olive oil ; tablespoons white wine ; cup chicken broth, defatted or 1/4 cup vegetable broth ; cup broccoli floret ; cups cooked pasta ; salt and pepper ; tablespoons parmesan cheese or 2 tablespoons romano cheese, grated', 'nice simple dinner add a chicken breast on the side and a salad.', '[''saute the onions and garlic in the olive oil until soft'', ''add wine , broth& broccoli'', ''cover and cook for 3 minutes'', ''toss pasta with broccoli and cook until both are heated through'', ''season to taste , put on a dinner plate and sprinkle with cheese'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (12922, 'sesame wafers', 'cup all-purpose flour ; teaspoon baking powder ; cup butter ; cup packed brown sugar ; egg ; teaspoon vanilla ; cup sesame seeds, toasted', 'these have a nice crisp snap (do not freeze)', '[''sift flour and baking powder'', ''cream butter , sugar , egg and vanilla'', ''add sifted flour and baking powder'', ''mix to combine'', ''stir in seeds'', ''line cookie sheet with parchment paper or aluminum foil'', ''spray with veggie oil'', ''drop by small teaspoonfuls , leaving room for spreading'', ''bake at 350 for 6-8 minutes or until lightly browned'', ''cool on sheet , then remove to rack to cool completely'', ''store in an airtight container'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (117455, 'samosas', 'cup all-purpose flour ; teaspoon salt ; tablespoon melted butter or 1/4 tablespoon ghee ; cup cold water ; lb potatoes, peeled ; tablespoon vegetable oil ; teaspoon mustard seeds (yellow or black) ; medium onions, finely chopped ; tablespoon fresh ginger, chopped ; teaspoon fennel seeds ; teaspoon ground cumin ; tablespoon ground coriander ; teaspoon turmeric ; cup frozen green pea, defrosted ; cup cold water ; tablespoon water ; teaspoon garam masala ; teaspoon ground cayenne pepper', 'this comes from the time life series of international cookbooks and has been a family favourite in our house for at least 10 years. it''s best to set aside a morning to make these and haul someone in the kitchen to help put them together. although they are not difficult to make, it does go faster if you set up an ''assembly line''. the seasoning given here is what i would consider a minimum but you may want to add more to your taste, especially when it comes to the hot pepper. you could also do half potatoes and half carrots for the filling if you like. the amount this recipe makes is also a guess based on our samosas, which are bigger than bite sized but not as big as you get in some indian shops. if you don''t have a deep fryer, you could use a wok instead. if you are really set on doing a healthier version, you could brush these with oil and bake in an oven until browned on both sides, however the texture of the dough is not as good as if you fry them. if you choose the baking option, you may also have to brush them with oil a few times and flip at least once to get them reasonably browned all over. frying is really the preferred method.', '[''first put the potatoes on to boil until tender , then drain and cool'', ''while the potatoes are cooking , make the pastry by mixing the flour and salt in a bowl'', ''pour in the butter or ghee and rub together wtih the flour until it becomes slightly flaky'', ''pour 3 / 4 cup water over the flour and pull the dough together with your hands'', ''you can add up to 4 tbsp more water , one spoonful at a time , until everything comes together in a bowl'', ''from here you can knead the dough by hand for about 10 minutes or throw it in a mixer with a dough attachment , going until the dough is smooth and elastic'', ''when the dough is done , place it in a bowl , rub with oil and cover until you are ready to fill the samosas'', ''next , start making the filling by cutting your cooked potatoes into cubes'', ''heat the oil in a frying pan and throw in the mustard seeds'', ''cook until they start to crackle and burst and when that happens immediately add your chopped onion and ginger'', ''cook for a few minutes until the onion softens and then add the fennel , cumin , turmeric , potatoes , peas , salt and water'', ''stir well and then reduce the heat to low and let cook for about 5 minutes'', ''sprinkle over the garam masala and hot pepper and stir again'', ''taste for seasoning and then take off the heat'', ''now it is time to start filling your samosas'', ''grab a piece of dough by pinching off a piece and rolling it thinly and into a circle'', ''you can make the samosas any size you like'', ''with a knife , cut the circle in half , moisten the straight edge with a finger dipped in water and then shape it into a cone , pressing the straight edges together to form a seal'', ''you should now have a little ice cream cone shaped piece of dough which you can spoon filling into'', ''fill and then moisten the top edges and press closed'', ''set on a plate and cover with foil or plastic wrap until you are ready to cook'', ''to deep fry the samosas , pour 3 cups of vegetable oil into a 12 inch wok and heat until a piece of dough thrown into the oil bubbles'', ''if you have a deep fryer , you want a temperature around 375f'', ''brown on both sides and drain on paper towel'', ''finally , you can enjoy a samosa !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (471972, 'mexican grilled cheese sandwich quesadilla', 'small whole wheat tortillas ; cup black beans, rinsed and drained ; cup red green or yellow bell pepper ; green onions, chopped ; tablespoons cilantro or 2 tablespoons parsley, chopped ; cups jalapeno havarti cheese, diced', 'ok, a mexican grilled cheese is a quesadilla but this is a good one! this recipe is from a canadian cheese magazine. enjoy!', '[''evenly distribute toppings on 4 tortillas'', ''top with remaining four tortillas'', ''heat skillet over medium heat and cook tortilla sandwiches approximately 4 minutes on each side or until cheese is melted and tortillas are browned'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (381266, 'grilled chicken with greek flavors', 'chicken breasts, about 2 pounds (skinned & boned) ; cup red wine vinaigrette ; tablespoons red wine vinaigrette (from the marinade) ; tablespoon fresh oregano (or 1 tsp dried) ; tablespoon fresh oregano (1 tsp dry) ; teaspoon salt ; lb cherry tomatoes ; ounces feta cheese, crumbles', 'only five ingredients makes this one come together quickly and flavorfully, too! from one of my favorite magazines (country living, june 09), this recipe is just right for a summer meal with the family or to serve guests. prep time includes marinating time. cook time includes only the time on the grill.', '[''marinate breast meat with other marinade ingredients for at least one hour'', ''remove chicken from marinade'', ''cook on a grill over medium-high heat , turning once until cooked through , about 10-12 minutes'', ''keep warm'', ''while the chicken is cooking , half the tomatoes and toss with reserved vinaigrette and salt in a medium bowl'', ''lower grill heat to medium'', ''spread tomatoes in a foil pan'', ''sear tomatoes cut sides down , about 2 minutes'', ''return tomatoes to bowl , toss with oregano'', ''slice chicken and transfer to serving platter'', ''spoon tomatoes alongside chicken'', ''sprinkle feta cheese and more oregano over tomatoes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (292166, 'buffalo chicken sandwiches', 'tablespoons butter ; garlic cloves, minced ; tablespoon barbecue sauce ; teaspoon chili powder ; (1 1/2 ounce) packages pre-cooked southwestern chicken strips ; hoagie rolls, split ; cup shredded lettuce ; cup blue cheese dressing', 'i found this recipe online and made a few changes to suit what i had available. if you have leftover grilled chicken, use it instead of the pre-cooked chicken strips. i like to use homemade blue cheese dressing. these are very sloppy sandwiches so be sure to have lots of napkins or a wet washcloth handy! enjoy!', '[''in a medium saucepan , melt the butter over medium-low to low heat'', ''add the garlic and cook for 30 seconds'', ''add the hot sauce , barbecue sauce , and chili powder and stir to combine'', ''add the chicken and cook the mixture uncovered over medium-low heat for five minutes , or until heated through'', ''spoon chicken onto bun bottoms'', ''top with lettuce and blue cheese dressing'', ''top with bun tops'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (428564, 'five happiness fried noodles', 'cups water ; lb egg noodles ; tablespoon olive oil, divided (or vegetable oil) ; cup bean sprouts ; cup bamboo shoot, julienned (sliced thinly in strips) ; cup shredded carrot ; cup dried shiitake mushroom, soaked, stems removed, and julienned ; green onions, julienned ; teaspoon salt ; teaspoon sugar ; tablespoon soy sauce', 'from food stamps/snap-ed recipe finder. per recipe: $ 3.76 per serving: $ 0.75 i added a dash pf sesame oil. you could add leftover chicken or ham, baby corn, zucchini...', '[''1'', ''in a large pot on high heat , bring 10 cups of water to boil'', ''cook noodles in boiling water until tender or al-dente , approximately 5 - 7 minutes , drain and set aside'', ''heat a nonstick wok or pan over high heat'', ''add 1 / 2 tablespoon oil , swirling to coat the pan , add noodles and pan-fry until noodles are golden , about 7 to 10 minutes'', ''remove noodles from wok'', ''add remaining 1 / 2 tablespoon oil to wok , add vegetables , and stir-fry until just cooked , about 5 to 7 minutes'', ''return noodles to the wok , add salt , sugar and soy sauce'', ''stir to combine and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (363866, 'good karma schawarma', 'cup plain yogurt ; cup minced garlic ; tablespoon minced garlic or 1/4-1/4 teaspoon garlic powder ; cup minced onion ; cup red wine vinegar ; tablespoon freshly chopped fresh parsley leaves ; tablespoon chopped fresh oregano leaves ; tablespoon salt (original recipe calls for 2 tablespoons) ; teaspoon salt ; tablespoon ground cumin ; tablespoon fresh ground black pepper ; teaspoon fresh ground black pepper ; tablespoon red chili pepper flakes ; teaspoon fresh sage ; lb boneless skinless chicken thighs (cut or pounded 1/8-inch thick) ; cup frozen spinach, thawed and chopped ; cup roasted red pepper, cut into strips ; cup sour cream ; cup freshly minced mint leaf (I substitute 1/2 t. dried dill for the mint) ; tablespoon lemon juice ; cup whole wheat flour, plus extra for kneading and rolling out dough ; cup water', 'from food network, guy''s big bite, nomadic dishes. i use boneless, skinless chicken breasts. [sometimes i cheat and marinate the chicken as the recipe calls for but then just bake the chicken. i then make wraps with the chicken, tzatziki sauce, fresh spinach leaves, chopped tomato, thinly sliced onion and store bought flat bread.] the tzatziki sauce is very good. you can substitute 1 1/2 - 2 t. garlic powder if you do not have fresh garlic cloves. i also sometimes use fresh dill or 1/2 t. dried dill in place of the fresh mint leaves.', '[''in a large bowl , combine yogurt with garlic , onion , vinegar , parsley , oregano , salt , cumin pepper , red chili flakes , and sage'', ''add chicken and marinate in the refrigerator for 12 to 24 hours'', ''preheat oven to 350 degrees f with oven rack in center'', ''fit a 9 by 13-inch baking sheet with a cooling rack'', ''remove chicken from marinade , taking off excess marinade'', ''place meat randomly on top of each other on the aluminum foil tray , creating 1-inch of meat'', ''add spinach , spreading evenly , and repeat with another 1-inch layer of meat'', ''add a layer of red bell peppers , and finish by covering with another inch of meat'', ''press layers firmly together'', ''remove foil tray with chicken to the baking sheet'', ''poke holes in bottom of foil to allow excess liquid to drain'', ''bake in center of oven for 45 minutes until chicken is firm and holds together'', ''cut corners of tray and push the sides of foil down , to expose meat to brown'', ''continue to cook for another 30 minutes or until the meat registers an internal temperature of 165 degrees f'', ''using an instant-read thermometer'', ''let rest for 10 minutes'', ''remove schawarma to a cutting board , discarding foil'', ''slice into 1 / 2-inch thick pieces'', ''serve sandwiched in flatbread and drizzled with tzatziki sauce'', ''flatbread:'', ''in a medium bowl , combine flour and salt'', ''using a wooden spoon , slowly stir in water , until dough forms'', ''lightly flour a clean board and knead dough until smooth , about 10 minutes'', ''rest dough in bowl , covered with damp towel for 20 minutes'', ''preheat a griddle over medium heat'', ''divide dough into 8 equal balls'', ''using a rolling pin , roll balls out on floured board to 7 inches in diameter , about 1 / 4-inch thick'', ''place the rolled out dough onto griddle'', ''flip when raised bumps appear on the surface of the dough , about 1 to 2 minutes'', ''cook second side until it turns golden'', ''do not cook too long or flatbread will become brittle'', ''cover flatbread with a towel up to 20 minutes before serving'', ''yield: 8 flatbread rounds'', ''tzatziki sauce:'', ''in a medium bowl , mix all ingredients together well'', ''refrigerate at least 1 hour'', ''yield: 2 1 / 2 cups'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (59380, 'indian mutton biryani', 'lb mutton, pieces ; lb basmati rice, washed, drained and soaked for one hour before cooking ; lb potatoes ; lb onions, thinly sliced and fried crisp ; lb tomatoes, peeled and chopped ; tablespoon garlic paste ; tablespoon ginger paste ; cup fresh yogurt ; to taste salt ; cup oil or 1/16 cup ghee ; piece cinnamon ; cloves ; black peppercorns ; green cardamoms ; bay leaves ; green chilies, slit ; tablespoon cumin powder ; tablespoon red chili powder ; teaspoon turmeric powder ; saffron strands, dissolved in a little ; to taste warm milk ; leaf of fresh mint ; leaf fresh coriander', 'this recipe is from last week''s thursday magazine. it was posted by hoorbanu iqbal. i feel that if you really want to enjoy biryani, have it hot with your fingers and not with a spoon. mmmmm! my brother loves biryani. come friday and biryani is what he wants;)', '[''first of all , cut potatoes into quarters'', ''apply salt to them'', ''deep fry'', ''pour oil / ghee in a skillet'', ''fry the onions until pink in colour and crisp , remove them and keep aside before adding the cinnamon , cloves and the pastes'', ''add cinnamon , cloves , peppercorns , bay leaves and green cardamoms'', ''add ginger-garlic pastes'', ''fry for 3 minutes'', ''add in the washed mutton pieces'', ''saute until the mutton gives out its own juices'', ''add the slit green chillies'', ''add turmeric , chilli and cumin powders'', ''mix well'', ''saute for 5 minutes , stirring continuously'', ''mix in fresh yogurt'', ''simmer until the mutton is cooked'', ''add salt'', ''continue to cook until the oil separates from the meat'', ''add finely chopped corriander and mint leaves'', ''in a separate pot , parboil rice until the grains are half cooked'', ''strain the rice'', ''spread out the mutton mixture in a heavy bottom pan'', ''sprinkle the rice on top'', ''add fried potatoes'', ''sprinkle saffron milk over this'', ''sprinkle crisp fried onions on top'', ''cover the platter with a tight fitting lid'', ''cook on low flame for 20 minutes'', ''serve with plain chilled yogurt or raita and pappadams'', ''enjoy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (107724, 'chinese braised beef and noodles', 'lb egg noodles ; lb lean beef ; clove garlic, crushed ; teaspoon salt ; teaspoon ginger, grated ; teaspoon five-spice powder ; tablespoon oil ; cup soy sauce ; cup duck broth or 1/8 cup chicken broth ; teaspoon cornstarch ; teaspoon water ; green onions, sliced', 'braised beef with egg noodles and chinese seasonings.', '[''cook the noodles in salted boiling water just until tender'', ''drain , and rinse under cold water'', ''cut the beef into very thin slices'', ''mix together the garlic , salt , ginger , and five-spice powder , and add the mixture to the beef'', ''mix'', ''heat the oil and saute the beef over high heat for 2 minutes'', ''mix together the soy sauce and broth , and add it to the beef'', ''bring to a boil'', ''mix the cornstarch with the remaining 4 tsp water , stir into the beef and cook until smooth and thick'', ''add noodles , mix well and heat thoroughly'', ''add the green onions , and stir for another minute'', ''serve immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (169964, 'mouth watering teriyaki burgers', 'cup soy sauce ; tablespoon red wine vinegar ; cup sugar ; teaspoon vegetable oil (I use olive oil) ; minced garlic clove ; teaspoon ground ginger ; lb lean ground beef', 'this twist for a burger will have them coming back for more! wish i could take credit for this recipe, however i got it out of a cookbook. my husband said it was the best burger he ever had!!!', '[''mix first 6 ingredients in a mixing bowl'', ''mix anywhere from 1 / 2 to all of sauce into ground beef and form patties to your desired size'', ''fry or grill patties as you would for any burger you would make'', ''serve on sandwich buns or rolls'', ''you can also freeze patties to be served at a later time'', ''use wax paper in between patties and store them in freezer bags'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (176527, 'perfect japanese rice', 'lb short-grain rice (nikishi brand is the best) ; cup water ; to taste nori, strips', 'basic onigiri (riceball) recipe. add any filling you want i particularly like egg scrambled with some soy sauce (dark) and toasted (brush with a little miso mixed with sake and grill) onigiri can be very hard to handmake. moulds are available but difficult to get in the uk without paying high prices, small jelly mould or egg cups work really well.', '[''wash rice in a colander until water runs clear'', ''drain well and then soak for 30 minutes'', ''put rice and water in a sauce pan make sure it has a tight fitting lid and wrap a tea towel around the lid to keep the steam inside'', ''heat until boiling then turn to low and steam for 15 mins finally turn the heat off and let stand for a further 15 minutes'', ''do not lift the lid off at this time !'', ''let the rice cool enough so it is warm but won''t burn your hands when picked up'', ''at this point if using fillings or flavorings add them to the rice'', ''wet hands and add a little salt if you feel like it'', ''take some rice and shape it into a circle , triangle , cat head whatever you want'', ''it is quite difficult don''t worry if yours are wonky !'', ''add filling and or garnish at this stage and finish with a strip of nori either round the edge or as a ''napkin'' at one end'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (50408, 'oriental roasted stuffed chicken', 'large chicken, obvious fat removed but with the skin on ; bunch boiled baby bok choy ; shallots, peeled and left whole ; garlic cloves, peeled and left whole ; cup red wine (any sort) ; teaspoon light soya sauce ; tablespoon honey ; teaspoon salt', 'found this recipe in a cookbook, and made this for christmas instead of the usual roast turkey. just for a little oriental touch. looks good on the table, as good as restaurant made, or better! according to my christmas guest.', '[''soak the mushroom slices in water till they soften'', ''keep the soaking liquid aside'', ''loosen skin of chicken'', ''rub the marinade under the skin , in the cavity and over the skin'', ''do keep a little bit of marinade aside for the gravy'', ''tuck the sliced mushrooms under the skin of the chicken'', ''heat oven to 200c'', ''roast chicken in a large roasting tin , loosely covered with foil for 30 minutes'', ''turn heat down to 150c , add shallots and garlic , and roast uncovered for 20 minutes'', ''pierce with a skewer , if the juice runs clear , the chicken is ready'', ''to make the gravy: pour out excess oil from the roasting tin , add a cup or so of mushroom water , and leftover marinade to the pan'', ''heat through on top of the stove'', ''taste to adjust seasoning'', ''place the chicken on a pretty plate , and garnish with the baby pak choy'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (104624, 'black bean and corn wontons with 3 cheese sweet pepper sauce', 'cup canned black beans, drained ; tablespoon salsa ; cup frozen whole kernel corn, thawed ; tablespoons green onions, minced ; teaspoon ground cumin ; fresh or frozen wonton skins, thawed if frozen ; ounces jars diced sweet red peppers, drained ; cup cottage cheese ; tablespoons beer ; clove garlic, minced ; ounce mozzarella cheese, shredded (1/4 cup) ; tablespoon parmesan cheese, grated ; quarts water ; to taste vegetable oil cooking spray ; to taste fresh cilantro, to garnish', 'something a bit different. for healthier version use no-salt-added black beans, no-salt-added salsa, nonfat cottage cheese, light beer, and fat-free mozzarella.', '[''mash together beans and salsa'', ''stir in corn , onions and cumin'', ''place bean mixture evenly in centers of 10 wonton skins'', ''brush edges of wontons with water , top with remaining skins , and seal by press edges firmly together , pushing out air'', ''trim edges with a fluted pastry wheel , and cover with a damp towel until ready to cook'', ''combine red pepper , cottage cheese , beer , and garlic in an electric blender , cover and process until smooth , stopping once to scrape down the sides'', ''transfer pepper mixture to a saucepan , and add the mozzarella and parmesan'', ''cook until cheese is melted , stirring constantly'', ''remove from heat and keep warm'', ''bring water to a boil in a dutch oven'', ''add wontons , and return to a boil'', ''reduce heat and simmer 4-5 minutes or until wontons are tender'', ''remove wontons with a slotted spoon and drain well'', ''coat a baking sheet with cooking spray , and place wontons on it'', ''broil 5 1 / 2'' from heat with door partially open for 3-4 minutes or until lighlty browned'', ''divide wontons and cheese mixture between two plates , and garnish with cilantro if desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (12744, 'miso shiru soup', 'cups dashi (recipe following) ; tablespoon miso (red bean paste) ; ounce firm tofu, cube into 1/2 '' cubes ; green onions, sliced diagonally ; mushrooms ; cups water ; piece kelp (2 inch square) ; ounce bonito tuna or 3/4 tablespoon dried bonito flakes', 'a very traditional japanese soup', '[''----------make the dashi---------'', ''bring water to a boil'', ''wash kelp under cold water tap'', ''add to water when it comes to a boil'', ''stir and let boil 3 minutes'', ''remove kelp from the water and add the bonito'', ''allow to come to boil and remove from heat immediately'', ''let it settle for a few minutes'', ''strain off the bonito and set aside for whenever you need the dashi'', ''---------make the miso shiru-----------'', ''bring the dashi to a boil'', ''mix a little hot liquid with the bean paste , stirring until smooth'', ''pour mixture back into the saucepan , stir well'', ''add tofu and return to boil'', ''simmer for a few seconds only'', ''ladle into bowls and garnish with green onion and a slice or two of mushroom'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (420747, 'feta and pepper frittata', 'tablespoon olive oil ; red peppers, cut into chunks ; yellow peppers, cut into chunks ; ounces feta, cubed ; eggs, beaten ; tablespoon heavy cream ; tablespoon fresh chives, chopped ; tablespoon fresh parsley, chopped', 'this flavorful frittata is perfect for a light and easy family lunch. or serve with sauteed potatoes and green beans for a more substantial dinner. this frittata is also delicious served with roasted vine tomatoes.', '[''heat the oil in a large , non-stick frying pan , add the peppers and cook over a medium heat for 15 mins until softened and lightly coloured'', ''scatter over the feta'', ''combine the eggs , cream and herbs , then season well'', ''pour over the pepper mixture , reduce the heat and cook for 15-20 mins until just set'', ''cook the top under a pre-heated broiler for 5 mins until just golden'', ''cut into thick wedges and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (449994, 'lemon herb homemade ricotta roasted tomato crostini', 'cups whole milk ; cups heavy cream ; teaspoon kosher salt ; tablespoons good white wine vinegar ; cheese cloth ; baguette, cut in thin slices (I like to cut on an angle for presentation purposes) ; olive oil ; garlic clove (optional) ; cup arugula (optional) ; cups ricotta cheese ; teaspoon lemon zest ; teaspoon fresh lemon juice (more or less to taste) ; scallions, fine diced (white and green parts) ; tablespoons fresh basil, chopped ; tablespoons fresh parsley, chopped ; teaspoons fresh thyme ; teaspoon kosher salt ; salt ; pepper ; plum tomatoes, cut in thick slices (you should be able to get about 16 slices)', 'this is such a nice fresh appetizer and so easy to make. don''t shy away because there are 3-4 steps; it is actually very very easy, and so worth making. the ricotta will last 5 days (approx) in the refrigerator, and very important is to make sure to use good fresh milk and cream. i like to top my crostini with the arugula then the ricotta and tomato, but feel free to skip the arugula. to me it is such a nice compliment to the creamy ricotta. these bite size appetizers and a bowl of soup or a salad can be dinner for me.', '[''ricotta -- first step is to make your ricotta which - seriously makes itself'', ''it is so easy'', ''you will need a heavy bottomed pot or strainer or colander , cheese cloth and a big bowl'', ''step 1: set up your colander over a large bowl'', ''make sure there is plenty of room in the bowl for the liquid to drain'', ''take 2 pieces of damp cheese cloth and line the colander'', ''step 2: in a medium to large pot , bring the milk , cream and salt to a rolling boil on medium heat stirring often'', ''once it is boiling add in the vinegar and immediately remove from the heat and stir'', ''the vinegar will cause the milk and cream to separate and form curds'', ''stir a couple of times , wait 2-3 minutes , and then pour it into the strainer or colander on top of the cheese cloth'', ''you will see the whey or clear liquid separate from the milk curds and drain to the bottom of the bowl'', ''let it rest at room temp for about 15-20 minutes to cool before you put it in the refrigerator'', ''just make sure as it sets in the refrigerator that none of the liquid in the bowl is touching the bottom of the ricotta'', ''make sure to cover the ricotta with saran wrap'', ''personally , i like to let mine set over night , but at least 4 hours to cool down and set'', ''tomatoes -- i like to have these chilled rather than hot , so i make these ahead of time too'', ''couldn''t be easier'', ''oven at 425 , line a baking sheet with aluminum foil or parchment paper and add the tomatoes'', ''drizzle with olive oil and season with salt and pepper'', ''bake for approximately 10 minutes until they begin to soften , but not falling apart'', ''let cool , transfer to a plate and cover'', ''done !'', ''herbed topping -- add the ricotta , lemon zest and juice , scallions , herbs , salt and pepper'', ''mix well and set to the side'', ''i prefer to make this right before i serve'', ''baguettes -- some people bake them on a high temp in the oven , personally , i prefer to broil mine'', ''they take only a minute or two and it is easy'', ''i line a baking sheet with foil or parchment paper and add the baguette slices'', ''drizzle with olive oil and broil the first side'', ''once golden brown , flip and broil just another minute until brown'', ''remove and rub the garlic on the side you drizzled with olive oil'', ''that is the side you will add the toppings to'', ''the garlic is optional , but i think it gives it a great taste'', ''finish -- top each of the baguette with a little of the arugula , then a spoon of the ricotta and a tomato slice'', ''enjoy !'', ''prep time doesn''t include the chilling of the ricotta'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (24904, 'portabella mushroom quesadillas', 'inches fat-free flour tortillas ; cup reduced-fat monterey jack cheese ; cup kraft free shredded fat-free cheddar cheese ; large portabella mushroom caps ; fresh garlic cloves ; tablespoon chopped fresh oregano ; pinch cayenne pepper (optional) ; to taste olive oil flavored cooking spray', 'a healthy choice for cheesy eating! if you wish to lower the fat further, you could use all fat-free cheese, but it doesn''t melt as well.', '[''preheat oven to 450 degrees'', ''cut portabello mushrooms into slices about 1 / 4'' thick'', ''heavily spray large baking sheet with olive oil cooking spray'', ''spread mushrooms in single layer on sheet'', ''place garlic on there also'', ''bake in 450 degree oven for about 30 minutes , or until roasted and tender'', ''lightly spray baking sheet'', ''place tortillas on baking sheet'', ''remove skin from garlic'', ''mash garlic on tortilla with fork , spread around'', ''do the same with the other tortillas'', ''chop mushroom into pieces and divide among tortillas'', ''mix together cheeses in a bowl'', ''put approximately 1 / 4 cup of cheese blend on each tortilla'', ''divide oregano among tortillas , and add a pinch of cayenne , if desired'', ''fold tortilla in half and spray top lightly with olive oil spray'', ''bake in 450 degree oven for approximate 5-8 minutes , or until cheese is melted and top is lightly browned'', ''cut each quesadilla into 3 pieces and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (501580, 'lime chicken taco s', 'lbs skinless chicken breasts ; cup red wine vinegar ; limes, juice of ; teaspoon sugar ; teaspoon salt ; teaspoon black pepper ; green onions, stalks chopped ; cloves fresh garlic, minced ; teaspoon dried oregano or 2 teaspoons fresh oregano ; cilantro (to taste) ; tequila, splash ; cayenne pepper ; tortilla ; diced tomato ; shredded lettuce ; salsa ; guacamole (S) ; rice or beans', 'this is a trim healty mama recipe from gwen''s nest. i have ammended it to taste. use any chicken left over so for supper the next night i reheated the chicken and added white wine, cream, and romano cheese. i served it over pasta and it was phenomenal.', '[''dice chicken into 1 chunks or make into strips'', ''put chicken into medium saucepan over medium heat'', ''cook , stirring occasionally until cooked through and no longer pink'', ''marinate the chicken in 2 / 3s of the sauce mixture'', ''add a splash of tequila'', ''dump the marinade and added the last 1 / 3 of fresh marinade to the chicken as it was nearly done cooking through and add cilantro'', ''sprinkle with cayene pepper'', ''heat tortillas in the oven on 200 by removing them from plastic packaging and placing them in lightly damp tea towel or paper towels and wrapping in foil'', ''prep other side dishes and toppings'', ''when chicken is finished cooking , add toppings and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (484976, 'corn capsicum curry', 'cup corn kernel ; cup tomato puree ; cup finely chopped onion ; cup finely chopped tomatoes ; cup finely chopped bell pepper ; teaspoon chili paste with garlic and ginger ; teaspoon black pepper ; teaspoon red chili pepper ; teaspoon turmeric powder ; teaspoon coriander powder ; teaspoon cumin seed', 'a flavorful corn curry which is simple, high on taste, and served as main course', '[''soak corn kernels in warm water for 15 minutes and keep aside'', ''heat oil in a pan and add cumin seeds and ginger garlic paste'', ''now add finely chopped onions and saute it'', ''add black pepper and tomato puree and let it simmer for 10 minutes'', ''now add remaining tomatoes and chilly pwder , turmeric powder and coriander powder and mix it well'', ''when the paste thickens , add chopped bell peppers'', ''add little water if it turns very dry'', ''now add corn kernels and salt and saute for 10 minute'', ''serve with paratha or chapati or rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (424925, 'cypriot fried haloumy cheese saganaki haloumi', 'ounces haloumy cheese (or 250g called "haloom" in Arabic) ; flour, for coating (To be gluten free I use a mix of white rice flour and half the amount of tapioca starch) ; olive oil (best to use unrefined) ; lemon, cut in wedges ; crusty bread (or pita bread or to be gluten free, rice crackers)', 'with gluten free option. a very quick to prepare tasty meze. we enjoy this as a delicious breakfast item or it could always be a snack! i serve it with pita bread but a crusty bread would be very good. modified from the complete middle east cookbook by tess mallos, cyprus section.', '[''cut cheese into 1 / 4 inch slices , dip in water and dredge in flour if desired'', ''heat enough oil in a small frying pan to cover base , fry cheese until slightly golden on each side'', ''squeeze some lemon on top and serve with rest of the lemon wedges and a crusty bread or some pita to dip into the lemon flavoured oil'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (440166, 'eggs baked in tomatoes with prosciutto basil', 'large tomatoes ; basil leaves, a handful (plus extra whole and finely chopped to serve) ; extra virgin olive oil, for cooking ; slices prosciutto (or pancetta) ; large eggs', 'adapted from delicious magazine, 8/08', '[''preheat the oven to 350'', ''remove the tomato tops with a sharp knife'', ''scoop out the seeds with a teaspoon and discard , them place the tomatoes upside-down on paper towel for about 15 minutes to drain'', ''smash the basil with a pinch of salt with a mortar and pestle until it becomes a paste , then add a little extra virgin olive oil to loosen it'', ''season with black pepper and smear the oil inside the tomatoes'', ''wrap a slice of prosciutto or pancetta around each tomato and secure with a toothpick'', ''place the tomatoes on a greased baking tray or in an ovenproof fry pan and cook in the oven for 15 minutes until the tomatoes soften slightly and the prosciutto is beginning to crisp around the edges'', ''remove the tomatoes from the oven and carefully break an egg into each one'', ''bake for about 5 minutes or until the eggs are cooked but the yolks are still runny'', ''scatter with extra basil and serve immediately with toast soldiers'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (213935, 'meatball sub sandwich casserole', 'cup chopped onion ; cup breadcrumbs or 1/4 cup crushed saltine ; tablespoons parmesan cheese, grated ; lb ground beef or 1 lb ground venison ; (8 ounce) package cream cheese, softened ; cup mayonnaise (no substitutes) ; salt & pepper ; cups shredded mozzarella cheese (divided) ; quart spaghetti sauce (or 28 oz can) ; cup water ; garlic cloves, minced (or pressed)', 'winter supper at its best! comfort food with a tantalizing sauce & lovely meatballs. get the kids in on the act, rolling meatballs is fun and gooshy (okay, everyone, ''wash your hands first!''). thanks to taste of home''s quick cooking 2000 year book for their inspiration.', '[''preheat oven to 400'', ''in a bowl , combine onions , crumbs & cheese'', ''add beef and mix well'', ''shape beef into 1-inch balls'', ''place on rimmed cookie sheet'', ''bake for 15-20 minutes'', ''turn oven down to 350'', ''meanwhile , arrange bread cubes in an ungreased 13x9 pan'', ''combine cream cheese , mayo , seasonings , and s&p'', ''spread over bread'', ''sprinkle one cup mozzarella cheese over the cream-cheese mixture layer'', ''combine sauce , water & garlic'', ''add meatballs and gently mix'', ''pour this over the cheese layer'', ''sprinkle remaining mozzarella'', ''bake at 350 for 30 minutes'', ''options: use half cheddar and half mozzarella'', ''try some sliced black olives'', ''sprinkle some grated zucchini in for added nutritional value'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (97176, 'artichokes and shells', 'ounces small shell pasta, uncooked ; (4 2/3 ounce) can water-packed artichoke hearts, quartered ; cup tomatoes, chopped ; cup black olives or 1/4 cup kalamata olive, sliced ; cup bell pepper, diced (I used red but use whatever''s on hand) ; cup onion, chopped ; cup white wine ; pepperoncini pepper, chopped and seeded ; tablespoon olive oil, divided ; teaspoon garlic, minced ; cup fresh parsley, chopped ; tablespoon fresh basil, chopped ; tablespoon fresh oregano, chopped ; tablespoon feta cheese, to taste ; to taste salt, to taste ; to taste fresh ground black pepper, to taste', 'i came up with this one night to satisfy both my husband''s wish for an olive oil-based pasta dish, and my craving for artichokes. we really enjoyed this hot and also the next day for lunch as a cold pasta salad. cooking times are approximate since i didn''t keep track, but it is a fairly good guess. everything should only be cooked until heated through and the sauce is thickened.', '[''cook pasta according to package instructions'', ''drain and set aside'', ''while pasta cooks , heat 1 tablespoon of olive oil in a large pan over medium heat'', ''add garlic and onion and saute for about 1 minute'', ''add olives , bell pepper , pepperoncini , and white wine and cook for about 3 minutes'', ''add artichokes with their liquid and tomatoes , cook for another 3 minutes , or until liquid reduces'', ''remove from heat'', ''stir in pasta , herbs , salt , pepper , and 1 tablespoon of olive oil'', ''top with feta cheese and serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (360634, 'tofu and broccoli stir fry martha stewart', '(14 1/2 ounce) package firm tofu, drained, cut crosswise into 6 slabs (about 3/4 inch wide), each slab halved horizontally and cut int ; lbs broccoli, stalks trimmed, peeled, and cut into 1/4-inch rounds, florets separated into bite-size pieces ; coarse salt ; tablespoons vegetable oil ; tablespoons soy sauce ; tablespoons rice vinegar ; teaspoon red pepper flakes ; garlic cloves, minced ; tablespoon cornstarch ; cup cashews, toasted', 'this recipe is from martha stewart''s ''everyday food''. this stir-fry is delicious over brown rice or asian noodles. to toast the cashews, spread them on a baking sheet and cook in a 350-degree oven for about 10 minutes. if you like a sweet-and-sour flavor, add 1 tablespoon of sugar to the sauce in step 4.', '[''arrange tofu in a single layer on a baking sheet lined with several layers of paper towels'', ''top with more paper towels and another baking sheet'', ''weight with canned goods'', ''let tofu drain , about 20 minutes'', ''meanwhile , cook broccoli in a large pot of boiling salted water until bright green , 2 minutes'', ''drain'', ''set aside'', ''heat oil in a large nonstick skillet over medium heat'', ''add tofu'', ''cook until golden brown , turning gently halfway through , 10 to 15 minutes'', ''transfer to paper towels'', ''meanwhile , make sauce: in a small bowl , whisk together soy sauce , vinegar , red-pepper flakes , garlic , cornstarch , and 3 / 4 cup water'', ''set aside'', ''add broccoli to skillet'', ''cook over high heat , stirring often , until crisp-tender , 2 to 3 minutes'', ''whisk reserved sauce to combine'', ''pour into pan'', ''return tofu to pan'', ''stir to coat , about 1 minute more'', ''serve topped with cashews'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (58163, 'rice paper wrapped fish', 'lb firm fish fillets ; green chilies, chopped ; tablespoon sesame oil ; tablespoon chopped coriander ; tablespoon chopped basil ; teaspoon cumin seed ; large rice paper, rounds ; tablespoon sesame oil ; to taste oil (for frying) ; to taste black sesame seed (optional)', 'a dish that takes no time to whip up, but good for a normal meal or finger food for a party you are organizing. double the recipe...it''s worth it! from donna hay''s dining cookbook', '[''wash fish , pat dry on absorbent paper and cut into 12 pieces'', ''place chillies , sesame oil , coriander , basil and cumin seeds in a spice grinder or mortar and pestle , and grind until they form a rough paste'', ''spread paste over fish'', ''brush rice papers with warm water and set aside for 4 minutes or until they are soft'', ''place a piece of fish on each round , fold in sides and roll to enclose'', ''heat a little oil in a frypan over medium heat'', ''cook fish parcels for 2-3 minutes on each side , or until rice paper is golden and crispy , and fish is tender'', ''drain on absorbent paper'', ''sprinkle fish with sesame seeds , and serve with steamed asian greens drizzled with oyster sauce and steamed jasmine rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (24666, 'sopa seca de tortilla', '6-inch corn tortillas ; to taste cooking oil (olive or canola) ; green bell peppers, cut in strips ; medium onion, chopped ; clove garlic, minced ; teaspoon salt ; cup whipping cream ; cup shredded monterey jack cheese', 'a rich and creamy mexican side dish - full of peppers, onions, cheese and corn tortillas. it will surprise you. the name means ', '[''cut tortillas in strips about 3 inches long and 1 / 2 inch wide'', ''in medium skillet heat 1 / 4 inch of oil'', ''fry tortilla strips , a few at a time , about 10 seconds or just until limp'', ''remove with slotted spoon'', ''drain on paper toweling'', ''pour off all but about 2 tablespoons oil from skillet'', ''add green pepper strips , onion and garlic'', ''cook till onion is tender'', ''sprinkle vegetables with salt'', ''in 1-1 / 2 quart casserole , combine tortilla strips , vegetables , and half of the cheese'', ''pour whipping cream over all'', ''cover and bake in 350-degree oven for 20 minutes'', ''uncover'', ''stir gently'', ''sprinkle with remaining cheese'', ''bake uncovered about 10 minutes more or until heated through'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (427046, 'feta stuffed avocados', 'cup feta (small cubes) ; cup sweet red pepper (short slivers) ; tablespoon scallions, chopped ; cup black olives, sliced ; teaspoon dried oregano ; tablespoon olive oil ; tablespoon raspberry vinegar (or cider) ; ripe avocados ; teaspoon lemon juice', 'this is from ''can-am cooks'', from the can-am world police and fire games. posted for zwt #6!', '[''combine feta , red pepper , green onion , olives , oregano , olive oil and vinegar , stir well , and set aside'', ''just before serving , cut the avocados in half lengthwise , remove the pit and discard'', ''brush the surface of the pulp with lemon juice , fill the cavities with the stuffing mix and serve immediately !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (40018, 'frankfurter vegetable stir fry', 'teaspoon oil ; cup sliced onion ; cup thinly sliced carrot ; cup thinly sliced green bell pepper ; clove garlic, minced or 1/4 teaspoon garlic powder ; cup shredded green cabbage ; ounces frankfurters, sliced ; cup prepared instant chicken broth, and seasoning mix (prepared according to packet directions, at room temperature) ; teaspoon cornstarch ; teaspoon soy sauce', 'hey we stir-fry everything else these days, so why not hot dogs!!', '[''in 9 or 10'' nonstick skillet , heat oil over medium heat'', ''add onion , carrot , pepper and garlic'', ''saute about 5 minutes or until onion is translucent'', ''reduce heat to low'', ''add cabbage'', ''cover skillet'', ''cook stirring occasionally , about 10 minutes or until cabbage wilts'', ''add frankfurter'', ''cook until heated through'', ''meanwhile in measuring cup or small bowl stir broth , cornstarch and soy sauce until cornstarch dissolves'', ''pour over franfurter mixture'', ''cook and stir until slightly thickened'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (335266, 'the simplest bean burgers mark bittman', 'cups well-cooked beans (can be white, black, or red beans or chickpeas or lentils) or 14 ounces beans, drained (can be white, black, or red beans or chickpeas or lentils) ; medium onion, quartered ; cup soy flakes (preferably not instant) or 1/2 cup rolled oats (preferably not instant) ; tablespoon mixed spice, of your choice (for example 1 tbs chili powder or a mix of cumin, smoked paprika, and chili flakes) ; teaspoon minced garlic ; salt & freshly ground black pepper ; egg ; bean-cooking liquid (or other liquid wine, cream, milk, water, ketchup, etc.) or stock (or other liquid wine, cream, milk, water, ketchup, etc.)', 'this is based on a recipe from mark bittman''s cookbook, ''how to cook everything vegetarian: simple meatless recipes for great food''. you can choose whatever beans you prefer. when made with chickpeas, they''re golden brown and lovely; with black beans, much darker; with red, somewhere in between. lentils give you a slightly grainy texture. if you start with beans you''ve cooked yourself-especially well-seasoned ones-the results will be even better. like almost all veggie burger mixtures, these will hold together a little better if you refrigerate them first (ideally you''d refrigerate both before and after shaping, but that''s only if you have the time). if you use the soy flakes rather than rolled oats, it will be higher in protein..', '[''combine the beans , onion , oats , spices , salt , pepper , and egg in a food processor and pulse until chunky but not pured , adding a little liquid if necessary to produce a moist but not wet mixture'', ''let the mixture rest for a few minutes if time allows'', ''with wet hands , shape into whatever size patties you want and again let rest for a few minutes if time allows'', ''film the bottom of a large nonstick or well-seasoned cast-iron skillet with oil and turn the heat to medium'', ''a minute later , add the patties'', ''cook until nicely browned on one side , about 5 minutes'', ''turn carefully and cook on the other side until firm and browned'', ''serve on buns with the usual burger fixings'', ''or cool and refrigerate or freeze for later use'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (221939, 'kimchi fried rice kimchi bok eum bap', 'tablespoons vegetable oil (part sesame gives a good flavour) ; cup kim chee, cut small and squeezed or drained ; garlic clove, minced ; cup prepared rice (preferably Korean or Japanese) ; green onions, sliced on bias ; sheet korean fish cake, cut in bite-size pieces ; teaspoon sesame seeds ; teaspoon soy sauce ; salt and pepper, to taste', 'the name says it all. a great way to use up left over rice. don''t feel limited to the listed ingredients; mushrooms, a bit of meat, a scrambled egg etc... are all great in this dish. this recipe makes one really generous serving or two side dish servings. multiplies easily.', '[''heat oil in wok or good-sized frying pan'', ''add kim chi and garlic'', ''stir-fry until kim chi is translucent'', ''be careful: it will really spatter when it hits the oil !'', ''add rice , green onions , fish cake or meat , mushrooms'', ''stir-fry until well mixed and heated through'', ''remove from heat'', ''add in sesame seeds , soy sauce , salt and pepper to taste'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (126427, 'crab soup dumplings dim sum', 'cup dried agar-agar, loosely packed ; cups chicken broth, clear ; cup crabmeat, fresh or frozen. drained on paper towels ; ounces shrimp, shelled, deveined, cut into pea-sized pieces ; ounces lean pork, cut into pea-sized pieces ; teaspoon salt ; teaspoon sugar ; teaspoon white pepper ; tablespoons soy sauce ; tablespoons black soy sauce ; teaspoons sesame oil ; cups all-purpose white flour ; egg, beaten ; cold water ; cup fresh ginger, finely shredded ; tablespoons black soy sauce', 'not soup with dumplings in it, but dumplings with soup in them. this is a famous kind of steamed dumpling for dim sum. you bite a little hole in the dumpling, then carefully sip the scalding hot broth out of it, then dip the rest of the dumpling in a dip and eat. it''s amazing how they get it inside-out like that. i have just learned, from a cookbook called ''dim sum and other chinese street food'' by mai leung, that the secret is to gel some broth with agar-agar and seal the solid broth inside the dumplings. when the dumplings are heated, the broth liquifies again, so you get dumplings full of soup. i haven''t tried this recipe yet, but i don''t usually make my own dim sum, so i thought i''d go ahead and post it for those who do. she says you can only make these a few hours in advance, and if you do, you should refrigerate them before steaming.', '[''hours or a day before making the dumplings , cook the agar-agar in the chicken broth until completely dissolved'', ''pour into a shallow dish'', ''cover and refrigerate for a few hours until it gels'', ''mix all the filling ingredients'', ''dice the gelled agar-agar / broth into small pieces and mix with the filling ingredients'', ''refrigerate this mixture'', ''to make the wrappers:'', ''mix flour and egg'', ''add water a little at a time until a soft but not sticky dough is formed'', ''knead until dough is smooth and elastic'', ''roll the dough into a long sausage , 1 inch in diameter'', ''cut the dough into walnut-sized pices , then roll them into round balls'', ''cover the balls with a damp towel'', ''you are now going to make crescent-shaped dumplings'', ''dust your work surface with a little flour'', ''roll a piece of dough into a paper-thin circle'', ''put about a tablespoon of filling in the center of the circle'', ''fold the circle in half to look like a half-moon'', ''pleat the top curved edge'', ''pinch the pleated edge and the unpleated edge together to seal'', ''gently tap the crescent''s round bottom so that it can stand up'', ''place the crescent-shaped dumpling between towels'', ''make the remaining crescents in the same way'', ''place a layer of cheesecloth in the bottom of a steamer'', ''arrange the crescent dumplings on the cloth'', ''cover and steam over high heat for 10 minutes'', ''serve hot with ginger-vinegar-soy dip'', ''to make the dip:'', ''mix all dip ingredients in a serving bowl , cover , and allow to stand at room temperature for at least 10 minutes before serving'', ''it should keep for hours at room temperature'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (394686, 'ramen delight', '(3 ounce) package ramen noodles ; cup frozen spinach ; egg, beaten ; furikake seasoning (to garnish)', 'take your 20cent ramen package lunch to a whole new level! you''ll never scoff at that package again.', '[''1'', ''add 1'', ''5c water and spinach to a small pot and bring it to a boil'', ''use the seasoning packet to your liking in this step'', ''2'', ''add the dry noodles to the pot to cook for 3 minutes total'', ''3'', ''2 minutes into the cooking time , slowly incorporate the beaten egg'', ''4'', ''after the egg has cooked through , take the pot off the burner'', ''serve immediately and garnish with the furikake seasoning'', ''if you are not going to eat ramen right away , separate the broth from the ''solid'' parts and combine before you serve it so the noodles don\''t turn to mush'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (218366, 'user friendly onigiri', 'lb ground beef ; saltine crackers, crushed ; tablespoon asian-style dressing, divided ; cup beef stock ; cup cooked sushi rice (Minado''s Perfect Sushi Rice shows how)', 'my dh and roommate both love sushi, and hate the fact that i don''t like nori so i won''t learn to make japanese food for them at home. after looking around here and doing some playing around in the kitchen yesterday, this is what i came up with: onigiri using an asian flavored version of my user friendly meatballs (recipe #216180). my picky picky dd told me to keep this recipe, so i am posting it. :) i had ground beef on hand, but you could use any ground meat (pork sounds really yummy).', '[''combine beef , crackers , and 1 t'', ''of the dressing in a bowl'', ''heat remaining dressing in a nonstick skillet over medium high heat'', ''roll the meat mixture into little meatballs , 1 / 2'' to 3 / 4'' in diameter'', ''cook meatballs in skillet for 8 minutes , turning occasionally'', ''drain any extra fat off'', ''add beef stock , and simmer uncovered on low for 5 minutes'', ''when meatballs are done , put them in a bowl and pour the sauce over them'', ''refrigerate while you cook and season the rice'', ''when you are ready to roll , have meatballs , rice , a bowl of salty water to dip your hands in to keep the rice from sticking , and a plate for the finished rice balls in front of you'', ''take about 1 / 4 cup of rice in your hand and shape it into a flat rectangular shape'', ''place a meatball on top of the rice , and then wrap the rice around it'', ''pat the rice into place , and then gently squeeze the ball together , not compressing the rice , just getting extra air and moisture out so the rice sticks to the meatball'', ''repeat about 19 times'', ''this took me a while , but i imagine you can get faster with practice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (136026, 'greek spinach quiche', 'pastry dough, for a 9-inch, one-crust pie ; (10 ounce) package frozen chopped spinach ; cup milk (recommended -- low fat or 2%) ; cup crumbled feta cheese ; eggs, beaten ; cup butter or 1/4 cup margarine, melted ; tablespoons grated romano cheese ; tablespoons all-purpose flour ; teaspoon white pepper ; teaspoon salt ; dash ground nutmeg', 'this is a tasty quiche that combines frozen spinach, feta, and romano cheeses into a beautiful dish that you will be proud to serve. the hint of nutmeg gives it that authentic greek touch.', '[''line a 9-inch quiche or pie dish with pastry'', ''trim excess pastry around edges'', ''prick bottom and sides of pastry with a fork'', ''bake at 400 degrees f for 3 minutes'', ''remove from oven , and prick with a fork'', ''bake for 5 more minutes'', ''cook spinach according to package directions , omitting salt'', ''drain spinach thoroughly , pressing out excess water'', ''combine spinach and remaining ingredients in a mixing bowl'', ''mix well'', ''pour mixture into prepared pastry shell'', ''bake at 350 degrees f for 30--35 minutes , or until center is set'', ''let stand 10 minutes before serving'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (21217, 'crispy wontons', 'ounces ground pork ; water chestnuts, chopped ; ounce green onion, chopped (with tops) ; tablespoon low sodium soy sauce ; teaspoon salt ; teaspoon cornstarch ; teaspoon fresh gingerroot, grated ; lb wonton skins', 'guilt-free and delicious', '[''combine pork , water chestnuts , green onions , soy sauce , salt , cornstarch and ginger in a medium bowl'', ''mix well'', ''place a half teaspoon of the pork mixture in center of each wonton skin'', ''fold wonton skin over filling to form a triangle'', ''turn top of triangle down to meet fold'', ''turn over'', ''moisten one corner with water'', ''overlap opposite corner over moistened corner'', ''press firmly'', ''heat oil in wok or large saucepan over medium-high heat to 375f / 190c'', ''deep fry wontons , a few at a time , 2 to 3 minutes , or until golden brown and crispy'', ''drain on paper towels'', ''serve warm with asian dipping sauce or catsup and hot mustard or sweet& sour sauce , as desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (22069, 'super chocolate ice cream sundae', 'scoops friendly''s forbidden chocolate chocolate ice cream (any other chocolate ice cream would also work) ; cup hot fudge ; tablespoon chocolate sprinkles ; whipped cream (homemade or canned)', 'this recipe has come about through many experimentations with ice cream and toppings.', '[''heat hot fudge to taste'', ''when fudge is hot , put ice cream in serving dish or bowl'', ''top with hot fudge'', ''dollop on whipped cream'', ''sprinkle chocolate jimmies on top'', ''enjoy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (279130, 'st paul sandwich', 'eggs, lightly beaten ; teaspoon black pepper ; teaspoon salt ; cup fresh bean sprout ; cup green onion, finely chopped ; cup sliced celery ; cup slivered yellow onion ; teaspoon soy sauce ; teaspoon cornstarch ; teaspoon sesame oil ; slices soft white bread (such as Wonder) ; cooking oil ; pieces iceberg lettuce ; slices ripe tomatoes ; dill pickle slices ; cup mayonnaise', 'a take-off of the well known cantonese egg fu yung and local to the st. louis area, this can now be found nationwide, in the local chop suey houses and chinese express type restaurants. surprisingly, the sandwich has nothing to do with st. paul and why the sandwich is named that is unclear. but for anyone growing up in the st. louis area might find this sandwich to be a happy memory, and a recipe almost lost to the culinary community.', '[''in a small bowl , whisk together eggs , salt , and pepper'', ''whisk together the soy sauce with cornstarch in a small bowl or cup'', ''heat a small amount of oil in a skillet and add vegetables , and saute over medium heat until they cook through'', ''set them aside to cool'', ''when cool , add the cooked vegetables , soy sauce with cornstarch , sesame oil , and main ingredient of choice to the beaten eggs , stirring to mix well'', ''heat a small amount of oil in a skillet and when hot pour in about 1 / 2 cup of the foo yung mixture'', ''when the underside browns , flip the patty and brown the other side'', ''serve patty on soft white bread with lettuce , tomato , pickle , and mayo'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (48613, 'sloppy giuseppi s crock pot', 'tablespoon olive oil ; large onion, diced ; large green pepper, seeded and diced ; lb lean ground beef ; garlic cloves, minced ; medium carrot, peeled and grated ; stalk celery, sliced thin ; teaspoons dried parsley ; teaspoon dried basil ; teaspoon dried oregano ; teaspoon chili powder, to taste ; teaspoon sugar ; salt ; large green pepper, seeded and diced ; teaspoon pepper ; (26 ounce) jar garlic & cheese chunky style spaghetti sauce', 'i got this recipe from one of my good friends. my kids even like it!', '[''in a large skillet over medium-high heat , heat oil and saute onion and green pepper until tender'', ''stir in both meats and cook until no longer pink'', ''as the meat cooks , break up the large pieces and stir to combine the meats'', ''drain fat from meat'', ''return meat to skillet'', ''add garlic and stir gently until you begin to smell the garlic cooking'', ''place meat in a 3-1 / 2 quart or larger crock pot'', ''add remaining ingredients'', ''stir to blend ingredients'', ''cook on high for 1 hour then reduce to low and cook for another 3 to 4 hours'', ''serve on slightly crusty buns along with a caesar salad'', ''garnish with grated mozzarella cheese'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (242261, 'low fat stuffed pasta shells', 'jumbo pasta shells ; cups spinach leaves ; small zucchini (chopped) ; cup nonfat cottage cheese ; egg white ; teaspoon garlic powder ; tablespoon parmesan cheese ; cup spaghetti sauce ; to taste salt ; to taste pepper', 'supper low fat and very cheap to make! and don''t for get full of flavor!', '[''preheat oven to 350 degrees'', ''bring water to a boil and add pasta shells'', ''in a bowl add spinach and zucchini and wilt by heating in the microwave for 1 minute'', ''then add to the cottage cheese and parmasan mixture'', ''in a glass baking pan put 1 / 2 cup of marnaria sauce'', ''drain and stuff shells and put in baking dish'', ''cover with rest of the sauce'', ''bake for 20 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (16928, 'papadams', 'cup gram flour (chickpea flour) ; teaspoon cracked/coarsely ground black pepper ; teaspoon ground cumin ; teaspoon salt ; clove garlic, pressed ; cup water ; tablespoon water ; to taste cayenne (for dusting tops) ; to taste oil, for frying (optional)', 'found this recipe on the net in response to a request. here''s what the recipe said: ', '[''stir together the flour , pepper , ground cumin seed , and salt in a large bowl or in the food processor'', ''mix thoroughly until the spices are evenly distributed'', ''add the garlic and mix well'', ''add enough of the water to form a dough that will hold together in a cohesive ball'', ''if necessary , add up to 1 additional tablespoon water'', ''the dough should be fairly stiff and dry'', ''if it is too wet , it will not roll well'', ''knead the dough for about 5 minutes by hand or pulse for about 15 seconds in the food processor'', ''the dough should be smooth'', ''with your hands , shape the dough into a cylinder or log about 2 inches thick and 6 inches long'', ''with a sharp knife , cut the cylinder into 1 / 2-inch thick slices'', ''the next step uses oil , so do not use your pastry cloth and rolling pin sleeve'', ''place each slice on a lightly oiled surface'', ''lightly oil the top of the slice and then roll out into a very thin circle about 6 or 7 inches in diameter'', ''papadams must be rolled extremely thin , maximum 1 / 16 inch'', ''if the dough sticks to your rolling pin , gently pull it off'', ''dust the tops of each papadam with cayenne pepper'', ''using a metal spatula to loosen the edges of the papadams from the rolling surface , carefully place them on large baking sheets'', ''the traditional method for preparing and frying papadams is described below'', ''you can also bake them in a 300f oven for about 15 to 25 minutes , or until crisp and dry'', ''the cooking time may vary beyond this range depending upon the thickness and moisture in the rolled dough'', ''cool them on a rack'', ''to prepare the papadams in an authentic manner , don''t bake them'', ''first allow them to dry by leaving them in the sun for a few hours or by placing them in a very low oven for 1 to 2 hours , turning occasionally'', ''dry the papadams until they are just slightly flexible and show no moisture'', ''they should not brown or bake , however'', ''at this point , the papadams may be stacked flat and stored in an airtight container until needed'', ''they will keep for months if stored properly'', ''when ready to serve , heat about 1 / 8 inch of oil in a large skillet'', ''the oil should be hot , but not smoking'', ''a drop of water flicked into the skillet should sizzle immediately'', ''one at a time , drop the papadams into the hot oil'', ''turn the papadam when it begins to curl at the edges'', ''it will quickly fry and become crisp'', ''remove it before it turns brown'', ''cool and drain the papadams on paper towels and eat them immediately'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (109483, 'lo bak go chinese radish cakes', 'cup dried shrimp ; dried shiitake mushrooms ; cups boiling water ; lb rice flour ; teaspoons salt ; cups chicken stock', 'this is my favourite chinese dim-sum. it is a steamed cake of rice flour and grated chinese radish (lo-bak), which is then cut into slices and pan fried. not unlike scrapple, in some ways, although less meaty. it''s delicious with lots of hot sauce. lo-bak looks very similar to daikon; it is just a little bit milder in flavour. i suspect daikon would work okay if need be. you don''t have to use both the shrimp and the shiitake; one or the other would be alright.', '[''soak the shrimp and mushrooms in the boiling water'', ''peel and grate the radish directly into the chicken stock'', ''simmer for about 15 minutes'', ''drain the chicken stock from the lo bok , and the soaking water from the shrimp and mushrooms , and reserve them both'', ''mince the shrimp and the shiitake'', ''add the combined stock and soaking water slowly to the rice flour , stirring constantly , to make a batter of medium viscosity'', ''season with salt , if required , and a little pepper'', ''mix the lo bak , shrimp and shiitake into it , and put it in a large sauce pan'', ''cook , stirring constantly , until the mixture begins to thicken'', ''pour it into an oiled 10'' square cake pan , and cover it tightly in foil'', ''bake it at 300 deg in a water bath until thoroughly set- 1 1 / 2 to 2 hours ?'', ''let cool'', ''slice into 1 / 2'' slices and fry until nicely browned on both sides in a lighlty oiled pan'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (427782, 'basil feta olive toast', 'tablespoon virgin olive oil ; to taste basil leaves (enough to cover each slice of bread) ; ounce feta cheese, crumbled ; ounce kalamata olives, chopped ; to taste salt, to taste (optional)', 'i love the flavors of kalamata olives, feta, and basil! this is a greek inspired recipe i threw together for zaar world tour 6.', '[''preheat oven to 350 degrees fahrenheit'', ''mix together the crumbled feta cheese and chopped kalamata olives'', ''set aside'', ''place bread slices on a baking sheet'', ''brush virgin olive oil on top of each slice of bread'', ''cover each slice of bread with whole basil leaves flattened'', ''cover basil leaves with feta cheese and olive mixture'', ''bake for about 15 minutes or until toasted to your liking'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (359630, 'korean shrimp and scallion pancakes', 'garlic cloves ; teaspoon salt ; cup water ; large eggs, beaten ; tablespoon sesame oil ; cup flour ; bunch scallion, cut finely lengthwise, then crosswise ; red bell pepper, cut to match the scallion pieces ; red bell pepper, cut to match the scallion pieces ; lb medium shrimp, peeled and halved lengthwise ; cup vegetable oil, divided', 'from the march 2009 gourmet magazine.', '[''mince and mash garlic with t salt , then whisk together with water , eggs and sesame oil'', ''add flour and whisk until smooth'', ''stir in scallions , bell pepper and shrimp'', ''heat 1 t oil in large skillet over medium-high heat until hot'', ''stir batter , then cook pancakes in batches of four'', ''press each down lightly with a large spatula , to flatten and evenly distribute the vegetables and cook until golden and cooked through , turning once'', ''drain on paper towels then transfer to a rack in a very low oven'', ''add oil to the skillet between batches'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (511116, 'pork and green bean stir fry', 'lb ground pork ; garlic cloves, thinly sliced ; teaspoon salt ; teaspoon ground red pepper (cayenne or you could use red pepper flakes which I prefer) ; tablespoon peanut oil (or vegetable oil) ; cup teriyaki sauce ; teaspoon fresh lime zest, loosely packed ; tablespoon fresh lime juice ; to taste rice, cooked ; to taste red jalapeno chile, thinly sliced for garnish (or red bell pepper strips) ; teaspoon fresh lime zest, loosely packed ; tablespoon fresh lime juice ; to taste lime, halves (to garnish)', 'a picture tells a thousand words and the photograph of this recipe in southern living magazine looks wonderful. feel free to sub strips of red bell peppers in place of the hot chiles. **the key to this dish is developing a nice char on the green beans. to do so, heat the oil in your skillet until it almost smokes before adding the beans. let them sear, stirring every 20 - 30 seconds, and they''ll take on color.', '[''brown ground pork and next 3 ingredients in a large stainless steel skillet over medium high heat , stirring often , 7 - 8 minutes or until meat crumbles and is no longer pink'', ''drain'', ''wipe skillet clean'', ''cook green beans in hot oil in skillet over medium high heat , stirring occasionally , 4 -5 minutes or until just tender and slightly charred'', ''stir together teriyake sauce and next 2 ingredients'', ''stir pork mixture into green beans'', ''stir in teriyaki mixture , tossing to coat'', ''serve immediately over rice or noodles'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (120981, 'chops or chicken with prosciutto and artichoke in cream sauce', 'ounces artichoke hearts (drained if from a can or thawed if frozen, rinsed & quartered either way) ; ounces mushrooms, sliced ; tablespoons olive oil ; onion, thinly sliced ; teaspoon pepper ; teaspoon cayenne pepper ; teaspoon garlic powder ; teaspoon cayenne pepper ; teaspoon oregano ; tablespoons white wine ; ounces prosciutto, chopped ; lbs boneless pork chops or 2 lbs boneless skinless chicken thighs, trimmed of fat ; cup heavy cream ; cup romano cheese, grated ; cup mozzarella cheese, shredded', 'bold, italian flavor that''s sure to please. low carb on it''s own, but for those not low carbing this goes great over fettuccine.', '[''mix all ingredients except for the cream and cheese in the crockpot'', ''cover and cook on low for 8 hours'', ''remove the porkchops from the crockpot'', ''mix the cream and cheese with the juices and vegetables remaining in the pot'', ''return the chops to the pot and coat with sauce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (49945, 'the best coffee lover s coffee cake', 'cups all-purpose flour ; teaspoons instant coffee granules (heaped) ; teaspoon cinnamon, ground ; cups light brown sugar, firmly packed ; teaspoon salt ; cup butter, melted ; (8 ounce) carton sour cream, beaten ; teaspoon baking soda ; large egg, beaten ; cup walnuts or 3/4 cup pecans, chopped', 'this is the cake i''ve reserved all through 2002, just to welcome 2003! my guests are in for a treat and can you imagine, i''ve waited the whole year long to post this:) try it! it lives up to its name, imo.', '[''combine flour , coffee granules , salt , baking soda , cinnamon and brown sugar in a large sized bowl'', ''mix well'', ''keep aside'', ''in another bowl , beat an egg until light and frothy'', ''add butter and mix well'', ''add the dry ingredient mixture alternating with the sour cream'', ''mix well'', ''add nuts'', ''mix'', ''pour into a greased 9 inch cake tin'', ''bake at 180c for 40 minutes or till a wooden toothpick inserted in the center comes out clean'', ''allow to cool completely on wire racks'', ''slice and serve for a wonderful breakfast dish to go with your morning or afternoon coffee'', ''enjoy while you sing- ring out the old , ring in the new , ring happy bells across the snow !'', ''ho !'', ''ho !'', ''ho !'', ''happy new year !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (9002, 'tangy tamarind chicken', 'medium chicken, cubed ; cup tamarind pulp (WITHOUT SEEDS) ; cup spicy tomato sauce or 1/8 cup tomato chili sauce ; tablespoon olive oil or 1/3 tablespoon canola oil ; onions, finely chopped ; teaspoon black pepper ; teaspoon cumin powder ; teaspoon coriander powder ; teaspoon salt', 'it is tangy and hot and very very yummy!', '[''heat oil in a deep pan or skillet'', ''add black pepper powder , cumin powder , coriander powder and add cubed chicken pieces'', ''saute for 5 minutes on medium heat'', ''cover the lid and let chicken cook in its own juices for 15 minutes or until tender on low heat'', ''open the lid and add tamarind pulp , hot tomato sauce , salt and 3 / 4 cup of water'', ''cover and leave on high heat for 5 minutes'', ''turn off the heat , garnish with fresh parsley sprigs and serve hot on a bed of steamed basmati rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (218605, 'tex mex chicken sandwiches', 'boneless skinless chicken breasts ; cup salsa or 1 cup picante sauce ; slices cheddar cheese ; small tomatoes, sliced ; leaves lettuce ; avocado, mashed with ; teaspoon garlic salt ; hamburger buns, toasted', 'i make these often in the summer months for a light meal as an alternative to hamburgers. serve with grilled corn on the cob. they are fantastic!', '[''place chicken breasts in plastic zippered bag with salsa or picante sauce'', ''zip shut and refrigerate 1 hour'', ''place on barbecue grill and cook for 5 minutes on each side'', ''top with cheese and close top of grill until cheese melts'', ''spread bottoms of each hamburger bun with avocado mixture'', ''top with lettuce , tomato , chicken breasts and top of buns'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (59446, 'nigella lawson caramelized onion lentil pilaf', 'onion, peeled, halved and thinly sliced into half-moons ; teaspoon turmeric ; teaspoon ground cumin ; teaspoon ground coriander ; cloves ; teaspoon mustard seeds ; dried curry leaves (optional) ; teaspoons salt ; fresh ground black pepper ; cup green lentil (french green is suggested) ; cup basmati rice', 'came across this recipe on nytimes.com in an article written by the kitchen goddess herself: nigella lawson. haven''t tried it yet, but i thought i''d share this. i''m drooling over the thought of it! :) i did omit the ghee to make it healthier.', '[''in a large heavy-based saucepan , heat over medium heat'', ''add onion slices , and saut until softened and deep golden brown'', ''remove half the onions and set aside'', ''reduce heat to medium-low and add turmeric , cumin , coriander , cloves , mustard seeds and curry leaves'', ''add salt , and season with black pepper to taste'', ''combine lentils and rice in a fine-meshed sieve , and rinse well with cold water'', ''drain , then add to pan'', ''add 4 cups water , raise heat , and bring to a boil'', ''cover , reduce heat to very low , and cook for 15 to 20 minutes'', ''water should be completely absorbed'', ''if not , remove pan from heat , remove lid and cover pan with a kitchen towel , then replace lid and allow to stand for 10 minutes'', ''to serve , fluff pilaf with a fork , and transfer to a serving bowl'', ''garnish with reserved onions'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (131214, 'creamy lentil risotto kichdi', 'cup basmati rice ; cup assorted lentils (I use 1/3 cup each of mung, chana, masoor) ; teaspoon turmeric powder (check the color, add more if needed till yellow) ; tablespoons ghee (opt for the upper limit for a richer flavor) ; cinnamon stick ; bay leaves ; cloves ; garlic cloves ; cardamom pods ; teaspoons cumin seeds ; onion, finely chopped ; garlic cloves ; salt, to taste ; lemon juice (optional) ; cilantro, to garnish', 'this is my version of my mom''s recipe that was made for us so often while growing up. this is sort of the indian cousin of the risotto, since the rice grains are not separate but cooked to a porridge-like consistency. it is immensely flavorful even in the simple version i have written, but you can make a heartier version by adding extra veggies to it too. my mom used to add carrots, potatoes, and peas to it sometimes. it''s delicious with pickles or a simple vegetable curry, but can be eaten by itself with a dab of butter to make it even more creamy. you''ll find there is nothing too distinctive about the ingredients in this recipe, but the technique of cooking is what makes this dish decidedly different from regular pilafs etc.', '[''rinse the rice and lentils in several changes of water , and let soak for 1-4 hours'', ''drain'', ''add enough water to cover the lentils and rice by 1 inch , and bring to a boil'', ''reduce heat and add turmeric and salt'', ''cover and let simmer on low heat until rice and lentils are tender , about 30mins'', ''keep checking to see if water needs replenishing , you don''t want it to dry out'', ''stir often so it doesn''t stick at the bottom'', ''keep adding water till rice is overcooked and you have a thick porridge-like consistency'', ''in a small saucepan , heat ghee and then add the cinnamon stick , bay leaves , cloves , cardamom and cumin seeds'', ''when they are fragrant and splutter , add the onion and garlic and cook till onion is softened'', ''pour this mixture into the lentil-rice mixture and stir to combine well'', ''just before serving serving , drizzle with lemon juice if desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (14339, 'bulgogi korean barbecued beef lettuce wraps', 'large round steaks or 3 large sirloin steaks, about 2 pounds total,thinly sliced ; cup soy sauce ; cup sugar ; cloves garlic, crushed ; green onions, minced ; inch fresh ginger, peeled and grated or finely minced ; tablespoons sesame oil ; tablespoons sesame seeds ; iceberg lettuce, separated into leaves and kept chilled until serving', 'this dish is great for hot summer days. the crisp lettuce makes a nice wrapper, but doesn''t leave you overstuffed like a starchy wrapper can', '[''heat a nonstick pan at medium-low for about 30 seconds'', ''add sesame seeds and toast , shaking or stirring pan occasionally , until seeds are a nice golden brown , 2 to 3 minutes'', ''set aside'', ''combine soy sauce , sugar , garlic , green onions , ginger , sesame oil , and toasted sesame seeds'', ''stir until the sugar has more or less dissolved'', ''add meat , tossing to coat'', ''marinate 30 minutes or up to overnight'', ''grill meat on a rack over hot coals until beef firms up and slightly charred'', ''you want that nice glossy brown look , not the sweaty grayish look'', ''serve with lettuce leaves and asian pear slices , allowing guests to roll wraps themselves'', ''to assemble , layer a lettuce leaf with a slice or two of grilled beef and a few thin asian pear slices , then roll up and enjoy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (274972, 'green onion cakes', 'cup all-purpose flour ; cup hot water ; cup green onion, finely chopped ; teaspoon honey ; teaspoon salt ; tablespoon vegetable oil', 'these chewy fried chinese flatbreads are delicious! they are common at fairs and festivals in edmonton, alberta, canada where i lived for 5 years. they are commonly served with fiery hot chinese chili garlic sauce that you can find at most grocery stores. if you''re not into spicy food, you can serve this with plum sauce or sweet and sour dipping sauce instead. although, these are lengthy instructions, the green onion cakes are pretty easy to make and well worth the effort. if you don''t want to cook them all at once, you can freeze the uncooked cakes, then thaw and fry them as needed. if you freeze them, separate each cake with a small piece of wax paper.', '[''add salt to flour in a mixing bowl and mix throughly'', ''add honey to hot water in a separate cup or dish until the honey melts and mixes with the water'', ''slowly add water / honey mixture into the flour while stirring the flour'', ''knead the mixture until smooth'', ''if it is too dry add a little extra water'', ''if it is too wet , add a little flour'', ''cover with plastic wrap and refrigerate for at least 1 hour'', ''after at least an hour remove mixture and roll into a sausage shape and divide into 10 equal portions'', ''you will work with one cake at a time so cover the others so they don''t dry up'', ''for each portion of dough , roll into a ball between the palms of your hands , then on a floured surface roll the dough out into a thin round pancake'', ''sprinkle the surface of the dough with green onions'', ''roll the pancake into a sausage shape , trapping all the green onions inside the dough'', ''roll the dough again along the length of the sausage to make a coil shape'', ''with the coil still standing up on your counter top flatten it with the palm of your hand'', ''roll the dough into a circle about 5 inches in diameter and place to the side while you make the rest of the cakes'', ''heat up the oil in a frying pan or skillet at a medium heat and fry each cake , one side at a time , until it is light brown'', ''cut into quarters and serve with chili garlic dipping sauce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (389844, 'super simple gyros with cucumber mint yogurt', 'cup plain yogurt (preferably Greek) ; fresh mint leaves, finely minced ; teaspoon sugar ; cup cucumber, peeled, seeded and finely chopped ; pinch kosher salt ; ripe tomatoes, diced ; to taste red wine vinegar and olive oil (to season tomatoes and feta) ; cup feta cheese, crumbled ; cup flat leaf parsley, roughly chopped ; to taste red wine vinegar and olive oil (to season tomatoes and feta) ; teaspoon olive oil ; to taste salt and pepper, to taste ; lb lean ground lamb ; teaspoon dried oregano, rub between fingers to waken flavor ; teaspoon dried whole thyme, rub between fingers to waken flavor ; teaspoon garlic powder ; teaspoon onion powder ; tablespoon fresh lemon juice ; pita bread rounds, halved and warm (6-inch) ; cup white onion, sliced into thin rings ; cup iceberg lettuce, shredded', 'looking for something that you can pull together for lunch or dinner in a jiffy? this easy, greek-inspired gyros recipe may be the way to go. to serve: heat and split the pitas; serve the lamb, seasoned tomatoes and feta, cucumber-mint yogurt, onion, and lettuce in separate dishes. have your family and friends stuff the warm bread pockets to their liking. enjoy!', '[''mix yogurt , mint , sugar and salt in a small bowl'', ''stir in the cucumber'', ''cover and chill for at least 30 minutes'', ''season the diced tomato , feta cheese , and parsley with the red wine vinegar , olive oil , salt and pepper'', ''set aside'', ''in a large non-stick skillet , heat the oil over medium heat until hot'', ''add the ground lamb , oregano , thyme , garlic and onion powders , and black pepper'', ''cook until browned - stirring to crumble'', ''drain on paper towel-lined plate'', ''transfer lamb to to a mixing bowl'', ''add the lemon juice and stir well'', ''warm the pita bread rounds'', ''split open each pita half forming a pocket'', ''have everyone spoon even amounts of the lamb mixture into their pita pocket , and top with onions , lettuce , tomatoes and feta , and cucumber-mint yogurt'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (12669, 'gold rice with chicken and pistachio', 'teaspoon oil ; lb boneless skinless chicken breast, cut in strips ; cup chopped onion ; cup uncooked long-grain white rice ; cup shredded carrot ; cup golden raisin ; teaspoon curry powder (or as much as you like) ; teaspoon coriander ; teaspoon salt ; (3 5/8 ounce) can ready-to-serve chicken broth ; cup water ; cup shelled pistachio nut (or slivered almonds, toasted)', 'wonderful rice and chicken, pistachios add a nice touch.garnish plate with crisp romaine lettuce, topped with chopped tomatoes and black olives, sprinkled with salt and pepper and splashed with a little balsamic vinegar.', '[''heat oil in a large no stick frypan over medium high heat until hot'', ''add chicken strips and onion , cook 5 minutes or until chicken is browned and onion is tender , stirring often'', ''add all remaining ingredients except nuts'', ''mix well'', ''bring to boil and reduce heat to medium low , cover and cook 15-20 minutes or until chicken is no longer pink , rice is tender and liquid is absorbed'', ''just before serving , sprinkle nuts over top'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (22847, 'mushrooms stuffed with feta cheese and garlic', 'lb medium to large mushroom ; ounces feta cheese, mashed ; cup cream cheese, softened ; cup grated parmesan cheese ; cup chopped green onion ; cup finely chopped parsley ; egg ; cup garlic crouton, crushed into crumbs', '', '[''clean and remove stems of mushrooms and baste mushrooms with melted butter'', ''combine all ingredients except for the mushrooms and stir until mixture is well blended'', ''fill the mushrooms with the mixture , mounding the mixture high into the caps'', ''bake in a 350 f oven until hot'', ''then broil for a few seconds until lightly browned'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (125845, 'japanese tuna spring onion topping for rice', '(70 g) can canned tuna ; small spring onion, chopped finely ; tablespoons soy sauce ; teaspoon sesame oil', 'i found this recipe on the internet. i like canned tuna.this is inexpensive and simple to make! this recipe is great when you are lazy to cook but want something yummy.', '[''combine all the ingridients in a boul'', ''serve on the top of warm rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (4356, 'italian sausage sweet', 'lb pork butt, Coarse Ground ; teaspoon fennel seeds ; teaspoon white pepper ; teaspoon sage leaves ; cloves ; garlic cloves, pressed ; teaspoon salt ; cup white wine ; garlic cloves, pressed', 'to stuff the casings, you will need a meat grinder with a sausage horn attachment. if you don''t have such a device, use the mixture to make fried patties by shaping 1/4 cup of filling into a 1/2 inch thick patty and frying in hot oil until golden brown on both sides.', '[''to prepare casings: let casings soak in cool water about five minutes to remove salt on outer surface and flush salt from the inside by placing one end on faucet nozzle and turn on cold tap water'', ''remove casing from faucet and gently squeeze out water'', ''cover rinsed casings and refrigerate until ready to use'', ''mix all ingredients very well in a large bowl'', ''fill the casings with the mixture and make links by twisting the sausage where you wish the links to be'', ''four inches is a good size for a regular serving , smaller links may be made for appetizer servings'', ''place the sausage in large saucepan or dutch oven in a single layer'', ''cover and heat over high heat to a low simmer'', ''reduce heat to maintain low simmer until the sausage is heated through , approximately 15 minutes'', ''drain and let rest for about 15 minutes before slicing'', ''serve while warm'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (30081, 'ground beef gyros', '(2 ounce) container plain yogurt ; cup chopped seeded cucumber (thinly slice remainder of cucumber) ; tablespoon finely chopped onions ; garlic clove, minced ; teaspoon sugar ; lb lean ground beef (I use ground turkey) ; teaspoon dried oregano ; teaspoon garlic powder ; teaspoon onion powder ; teaspoon salt (optional) ; teaspoon pepper ; pita breads ; cup shredded lettuce ; large tomatoes, chopped ; tablespoon finely chopped onions ; teaspoon onion powder ; small onion, chopped', 'this is a great summer meal and quick and easy to put together and tastes wonderful. refreshing served with the cucumber sauce and is even low in fat. i think this came from quick cooking. it''s a favorite in our house.', '[''in a bowl , combine first 5 ingredients'', ''cover and refrigerate'', ''in separate bowl , combine ground beef and seasonings'', ''mix well'', ''shape into 4 patties'', ''grill , covered , over medium to high heat for 10 to 12 minutes or until meat is no longer pink , turning once'', ''cut patties into thin slices'', ''stuff into pitas'', ''add lettuce , cucumber , tomato , and onion'', ''serve with yogurt sauce'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (81105, 'marinated stuffed cherry peppers', 'lb prosciutto (1 lb sliced is ~37 slices) ; lb provolone cheese (sliced ~ 1/2" thick) ; lbs cherry peppers (~ 2 pt or 49 peppers) ; gallon white vinegar ; quart extra virgin olive oil ; quart canola oil ; small onion, thinly sliced ; rosemary ; bay leaf ; dill weed ; basil ; chopped garlic ; parmesan cheese', 'i originally found this recipe here on recipezaar from cc. http://www.recipezaar.com/recipe/getrecipe.zsp?id=34555 after playing around with it i came up with this variation. hope you enjoy!', '[''wash cherry peppers and place whole , stems intact , in 1 gallon jar'', ''fill jar with white vinegar'', ''let stand at least one week'', ''i''ve let them soak as long as 3 weeks'', ''you may need to add more vinegar to keep the jar full as the peppers soak it in'', ''the peppers will float , make sure to keep them covered'', ''after soaking for at least a week , pour out vinegar and rinse peppers in cool water'', ''remove stems and seeds'', ''expect to lose 3 or 4 peppers during soaking'', ''cut provolone to the appropriate size to fill the peppers'', ''cut the proscuitto slices in half'', ''wrap the provolone with a 1 / 2 slice of proscuitto and stuff into pepper'', ''add some olive oil to the jar'', ''add onion , rosemary , 2 or 3 bay leaves , dill weed , basil and chopped garlic to oil'', ''place the peppers in the jar and fill the jar with 50% olive oil and 50% canola oil'', ''top off the jar with a sprikle coating of parmesan cheese'', ''let soak a minimum of one week'', ''i let them soak and store them at room temperature'', ''you may want to refrigerate for longer shelf life'', ''enjoy !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (25875, 'mighty good moussaka', 'medium zucchini ; to taste vegetable oil cooking spray ; tablespoon olive oil ; large onion, chopped finely ; garlic cloves, minced ; lb lean ground beef ; (1 1/3 ounce) can tomato sauce ; large ripe tomatoes, cut into pieces ; banana peppers or 1/4 jalapeno pepper ; bay leaf ; teaspoon beau monde seasoning ; tablespoon honey ; banana peppers or 1/4 jalapeno pepper ; to taste pepper ; teaspoon oregano (dried) ; fresh mushrooms, sliced ; teaspoon cinnamon ; teaspoon allspice ; cup 2% fat cottage cheese ; cup marsala wine ; cup fresh grated parmesan cheese (use imported) or 1/16 cup romano cheese (use imported) ; tablespoon fresh parsley, chopped or 1/3 teaspoon dried parsley', 'there are many moussaka recipes but i have found none as good as this recipe. originally it was from ''the complete garlic lovers cookbook from gilroy, the garlic capital of the world'' i made a few minor changes and this recipe is the result. i''ve never had anyone turn down seconds and have served it at least a dozen times.', '[''peel the zucchini and slice into 1 / 2-inch rounds'', ''heat a skillet and spray with the veggie oil'', ''quickly brown the zucchini slices on both sides , spray with oil as necessary arrange half the zucchini slices in an oiled 9x12x2-inch baking dish'', ''heat the olive oil in the same skillet and saut the onion and garlic until translucent'', ''add meat , stir to break up any lumps , and cook for about 5 minutes'', ''in a saucepan heat the tomato sauce , tomato pieces , bay leaf , beau monde , honey , oregano , chili pepper and black pepper'', ''simmer gently for 10 minutes'', ''meanwhile , in a separate pan , heat a little oil and brown the mushrooms , then add them to the meat and mix well'', ''pour all of the meat mixture over the zucchini slices'', ''top with cinnamon , allspice and cottage cheese'', ''cover with remaining zucchini slices , then the tomato sauce and wine'', ''sprinkle with the cheese and bake for 1 hour in a 350f oven'', ''remove from oven , sprinkle with the parsley , serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (423521, 'lomo saltado vegan', 'cups rice ; lb yukon gold potato (or your choice) ; oil, for deep frying potatoes ; tablespoons canola oil ; tablespoons canola oil ; large red onion, cut into eights or large strips ; lb wheat gluten, strips about 1-2-inch long or 1 lb portabella mushroom ; teaspoons aji yellow paste ; tomatoes, cut into eighths ; tablespoon parsley, chopped ; tablespoon cilantro, chopped ; tablespoon balsamic vinegar ; tablespoons soy sauce ; teaspoon paprika ; teaspoon ground cumin ; teaspoon salt ; teaspoon black pepper ; tablespoon lime juice', 'lomo saltado is a peruvian dish with chinese influences. this dish is normally prepared with beef tenderloin, potatoes, and vegetables and served with rice - but this version ditches the beef!! the recipe calls for wheat gluten strips but you could also use seitan, tofu, or portabella mushrooms. look for jarred aji yellow paste or aji amarillo paste in a latin food market. if you can''t find the paste, you can use frozen aji amarillo peppers (south american hot yellow chile pepper) or equivilant pepper. thaw and dice one pepper, and saute it in olive oil until it''s soft. this recipe is from vegan international.', '[''prepare the rice and set aside'', ''heat oil to 325 , cut potatoes into french fries and fry for 5 minutes'', ''remove from oil'', ''reheat oil to 375 and resume cooking fries for about 2-3 more minutes until golden brown , crispy , and cooked through'', ''keep warm'', ''heat 2 tablespoons oil in pan over medium-high heat'', ''add onion , gluten strips or mushrooms and fry until browned'', ''add aji , tomatoes , parsley , cilantro , vinegar , soy sauce , and spices and cook for 2 minutes until tomatoes are softened'', ''if desired , sprinkle pisco on top of the dish and ignite'', ''squeeze lime juice over pan , add french fries , and quickly toss together'', ''serve over rice'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (204481, 'broccomoli', 'cup broccoli, chopped and steamed very soft ; cup low-fat yogurt or 1/16 cup sour cream ; tablespoon onions, minced ; tablespoon low-fat mayonnaise ; tablespoon lemon juice ; teaspoon chili powder ; garlic clove, (use less if you don''t love garlic)', 'this comes from the taste of home website...i was skeptical at first, but as a calorie watcher and a broccoli lover i gave it a try. the original recipe did not call for garlic, but i found that garlic was delicious! i suppose you could experiment with cilantro or cumin as well. don''t taste it until it is well chilled or you will be disappointed. try not to use the preminced bottled garlic...throw in a real clove (or less)...it is fantastic...but very strong garlic flavor with one clove!', '[''place all ingredients in a food processor and blend until very smooth'', ''chill at least a few hours before tasting'', ''can serve with chips , crackers , or as a veggie dip'', ''keeps well in fridge'', ''cooking time listed is for chilling time'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (311039, 'chicken florentine crepe ihop s copycat', 'lb chicken breast (boneless, skinless, cubed) ; garlic cloves (minced) ; (10 ounce) can cream of chicken soup ; ounces cheddar cheese (your preference, I prefer both!) or 4 ounces swiss cheese (your preference, I prefer both!) ; ounces spinach (frozen or fresh, chopped, I prefer fresh) ; cup milk ; tablespoons butter ; tablespoon melted butter ; parmesan cheese (optional) ; salt and pepper ; cup flour ; eggs ; salt and pepper ; teaspoon salt', 'i just love this dish! i never knew how yummy spinach can be till i tried this entree in ihop. it was a limited time only dish and when they took it out, i searched through the internet for the recipe but couldn''t find one so i decided to take the matters into my own hands! this recipe is really easy and the ingredients may already be in your fridge! serve it alone or with garlic bread or steamed veggies on the side. notes: you can substitute chicken with leftover turkey or chicken rotisserie, lets face it, nobody ever eats those leftover turkey and rotisserie! you can also serve this as an appetizer. just cook smaller proportions of crepes. and for those on protein diet, substitute the crepe with omelet!', '[''combine flour , milk , eggs , butter and salt in a bowl'', ''beat until all the flour lumps are gone'', ''the consistency will be like thin pancake batter'', ''set aside'', ''saut chicken and garlic on butter until golden brown'', ''pour in milk and cream of chicken'', ''simmer'', ''reduce to low to medium heat'', ''after simmer , put the spinach and cheese inches keep stirring until the cheese completely melts'', ''salt and pepper to taste'', ''make sure the bottom wont stick'', ''keep simmering until the sauce is reduced'', ''while the chicken is simmering , start cooking the crepes'', ''in a lightly greased skillet , pour about 3 tbsp of batter and spread it as thin as possible'', ''do not flip'', ''in about 1 minute , check the bottom side of the crepe if light brown'', ''cook only one side of the crepe or else it will be crunchy'', ''by the time you''re done with the crepes , chicken should be done too'', ''pour about 3 / 4 cup of chicken on each crepe on the center'', ''wrap each side'', ''top lightly with parmesan cheese'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (71867, 'hyderabadi khatti dal mango lentil curry from the indian state', 'g yellow lentils, cleaned,washed and drained (Toovar dal) ; raw mangoes, peeled,de-seeded and chopped ; tomatoes, peeled and chopped ; fresh curry leaves ; g fresh coriander leaves ; pinches turmeric powder ; cloves garlic ; teaspoons red chili powder ; salt ; tablespoons oil ; teaspoons cumin seeds ; teaspoon mustard seeds ; green chilies', 'a wonderful recipe submitted by syeda basarath to this week''s thursday magazine. totally delicious and a must have for mango lovers!', '[''put the first three ingredients in a pressure cooker'', ''pressure cook for upto 2-3 whistles'', ''remove from flame and let out the steam'', ''mix the cooked lentils with water using a wooden spoon'', ''boil the mixture for 5 minutes'', ''heat oil in a pan'', ''add cumin seeds and mustard seeds'', ''allow to splutter'', ''once they stop spluttering , add curry leaves'', ''stir-fry until fragrant'', ''add garlic and stir-fry until the raw smell is gone'', ''mix in the red chilli and turmeric powders and the corriander leaves'', ''fry till it turns slightly brown'', ''pour over the boiled lentils'', ''serve hot over cooked white rice'', ''enjoy a hearty lunch !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (138357, 'bunuelos', 'cup sugar ; teaspoon cinnamon ; teaspoon ground nutmeg ; (1/4 inch) flour tortillas ; to taste vegetable oil (for frying)', 'i love ordering these, soo yummy! they are easy and a good quick dessert. from texascooking.com.', '[''combine sugar , cinnamon and nutmeg in a large plastic bag , mixing well'', ''set aside'', ''cut tortillas into 3x2 inch strips , or just into strips'', ''fry a few at a time in 1 inch of hot oil until crisp and golden , turning once'', ''drain on paper towels'', ''while still warm , place a few at a time in sugar mixture in bag'', ''shake gently to coat'', ''store in airtight container'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (44170, 'chinese chicken wraps', 'cup chopped cooked chicken ; tablespoon chopped green onions ; tablespoon drained canned pineapple ; tablespoon honey ; tablespoon soy sauce ; teaspoon dry mustard ; egg, beaten ; teaspoon sesame seeds, toasted', 'another type of asian appy roll. get your hot mustard and sweet & sour ready, :)', '[''preheat oven to 375 degrees f'', ''beat egg lightly and set aside for egg wash'', ''mix together honey , soy sauce , and dry mustard in a bowl'', ''add chicken , green onion , and pineapple and stir well'', ''unroll crescents and separate into 4 pieces and pinch together the seams'', ''cut each triangle crosswise into halves'', ''spoon 1 tablespoonful of mix onto each dough piece , pull corners to center , and roll up to seal'', ''brush top of roll with more egg wash and sprinkle with seame seeds'', ''place on an ungreased baking sheet while waiting for others to get done'', ''repeat procedure with rest of dough and filling'', ''bake in preheated oven for 10-15 minutes , or until rolls are a nice golden brown'', ''serve with hot mustard or sweet and sour sauce , if desired'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (408764, 'toasted turkey subs with smoked mozzarella', 'tablespoon extra virgin olive oil ; garlic cloves, minced ; teaspoon red pepper flakes ; (3 5/8 ounce) cans diced tomatoes, drained ; cup basil pesto ; to taste salt, to taste ; to taste ground black pepper, to taste ; (1 1/2 inch) sub rolls, slit partially open lengthwise ; lb thinly sliced deli turkey ; ounces smoked mozzarella cheese, sliced into thin rounds', 'published in cook''s country magazine, dec/jan 2007. a nice italian dinner sandwich.', '[''adjust oven rack to upper-middle position and heat oven to 500f'', ''heat oil , garlic , and red pepper flakes in a large skillet over medium-high heat until fragrant , about 1 minute'', ''add tomatoes and cook until mixture is dry , about 10 minutes'', ''turn heat off'', ''stir in 2 tablespoons pesto and salt and pepper to taste'', ''spread remaining pesto on insides of each roll and layer each roll with turkey , tomato mixture , and sliced cheese'', ''place sandwiches on baking sheet , with open sides facing up'', ''bake until edges of bread are golden and cheese begins to melt , about 5 minutes'', ''serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (451785, 'sarasota s green chili mexican burger', 'hamburger buns (don''t use those small store bought rolls in a package, get a nice hearty roll) ; lbs ground turkey (1/3 lb per burger) ; tablespoons grated onions ; tablespoons salsa (don''t use the extra chunky kind, and use hot, med or mild, depending on how spicy you like it) ; teaspoons chili powder ; teaspoon cumin ; salt ; pepper ; slices monterey jack pepper cheese (2 per burger, and take advantage of the deli, purchase what you need rather than a whole block) ; slices monterey jack pepper cheese (2 per burger, and take advantage of the deli, purchase what you need rather than a whole block) ; avocado, cut in thin wedges (2-3 per burger) ; teaspoon lime juice (I use 1 fresh lime, the remaining lime I squeeze over the avocado so it doesn''t brown) ; lettuce leaves ; cup mayonnaise ; (4 ounce) can green chilies, minced ; garlic clove, minced ; teaspoon lime juice (I use 1 fresh lime, the remaining lime I squeeze over the avocado so it doesn''t brown)', 'these are easy but very full of flavor. i also prefer to use turkey for this, but if you are a die hard ''beef fan'' go ahead and use beef. the burger is moist and delicious and the cheese, avocado and mayonnaise just make this a wonderful burger.', '[''mayonnaise -- in a small bowl , add the green chilies mayonnaise , garlic and lime juice and mix well'', ''if you want , you can blend this in a small food processor or blender , but i actually like a little texture to mine'', ''cover and refrigerate until ready to use'', ''this can easily be made ahead of time'', ''burgers -- in a medium size bowl , add the salsa , chili powder , cumin , grated onion , pinch of salt and pepper'', ''if you use a mild salsa you can add a bit more chili powder , but i use a medium heat salsa which works just fine for this'', ''mix everything well'', ''then add in the turkey and mix lightly , i prefer to use my hands'', ''and make sure not to over work the burgers'', ''make 4 nice size burgers and place on a small sheet pan lined with either foil or parchment'', ''make a small indentation in the center of the burger with your thumb'', ''not too deep , just a little indent'', ''this helps the burger not to shrink up as it grills'', ''season with salt and pepper and put in the freezer'', ''we are not freezing them , just firming them up'', ''they cook better after they rest a bit and are chilled'', ''about 15-20 minutes in the freezer'', ''these also can be made a head of time'', ''garnish -- prepare your avocado slices and drizzle with the remaining lime juice , lettuce leaves and cheese'', ''grill -- i prefer an outside grill , but a inside grill pan or even a heavy saute pan will work just fine'', ''spray the pan or grill with a non stick spray and cook the burgers on the first side until you get a nice sear and golden brown , depending on how thick you make them , about 5 minutes'', ''flip , and make sure when you flip , the burger releases from the pan or grill easily'', ''if you have to scrape to flip it , it isn''t ready to be flipped'', ''the second side again will take about 5 minutes , maybe a bit less'', ''add 2 slices of cheese per burger and melt'', ''as the cheese melts , add the burger rolls either to a broiler or grill to lightly brown'', ''finish -- top the bottom bun with a thin slather of the mayonnaise , then a lettuce leaf'', ''then the burger with melted cheese , another lettuce leaf , avocado slices and top with the second bun slathered with the mayonnaise'', ''serve -- enjoy ! a crisp green salad goes great with this'', ''fries of course or chips and a pickle'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (129744, 'ceviche tacos', 'limes ; cup tomatoes, chopped & seeded ; cup avocado, peeled & diced ; cup cilantro, chopped ; teaspoon salt ; teaspoon pepper ; garlic cloves, minced ; lb medium shrimp, peeled and cooked ; to taste corn tortilla', 'cerviche is a mexican appetizer, kind of like shrimp cocktail but better. this is served in almost all mexican restaurants. try it and let me know.....', '[''finely grate rind from limes to measure 1 tablespoon'', ''juice limes to measure 1 / 4 cup'', ''place rind and juice in a large bowl'', ''add tomato , avocado , cilantro , salt , pepper , garlic and shrimp'', ''if you want , you can add some chopped onion and fresh jalapenos'', ''toss well to combine'', ''cover and chill for 15 minutes , stirring occasionally'', ''heat tortillas'', ''spoon about 1 / 2 cup of shrimp mixture down the center of tortilla'', ''fold and eat'', ''you can serve it plain and / or eat with crackers or you can use hard tacos shells , tostadas , tortilla chips or whatever you like'', ''my dad eats it with saltine crackers'', ''he adds extra onion and jalapenos , personal preference !'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (12732, 'rice verde for one or two', 'cup cooked rice ; cup sour cream ; tablespoon green chilies (or both) or 1 tablespoon green onions (or both) ; cup sharp cheddar cheese or 1/4 cup monterey jack cheese', 'very good rice, serve with mexican dishes. recipe can be cut in half to make for one.', '[''place half of the rice in two buttered ramekins'', ''combine sour cream , chilies and half the cheese in a mixing bowl'', ''mix and spread over rice and cover with remaining rice'', ''top with the other half of the cheese'', ''bake in a 350f oven for 15 minutes'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (456631, 'easy mini muffulettas', '(2 2/3 ounce) jar italian olive salad ; small deli rolls, cut in half ; thin swiss cheese slices ; thin provolone cheese slices ; thin deli ham slices ; genoa salami, slices', 'one for the new orleans way.', '[''spread 1 tablespoon olive salad evenly over each cut side of roll bottoms'', ''top each with 1 swiss cheese slice , 1 ham slice , 1 tablespoons olive salad , 1 provolone cheese slice , 1 salami slice and 1 tablespoon olive salad'', ''cover with roll tops and wrap sandwiches together in a large piece of aluminum foil'', ''place on a baking sheet'', ''bake at 350 for 14 to 16 minutes or until cheeses are melted'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (42043, '6 step chicken tikka', 'kg chicken ; teaspoon red food coloring ; teaspoon cumin powder ; tablespoon low-fat plain yogurt ; tablespoon green chili, chopped ; tablespoon ginger-garlic paste ; pieces limes, chopped ; to taste salt ; to taste oil, to fry', 'd-e-l-i-c-i-o-u-s!', '[''cut the chicken and make deep cuts on the pieces'', ''mix all the ingredients'', ''marinate the chicken for a minimum of 2 hours'', ''deep fry'', ''drain on paper towels'', ''serve'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (17507, 'bread machine spinach feta bread', 'cup frozen chopped spinach ; teaspoons yeast ; cups bread flour ; cup wheat bran ; tablespoons sugar ; tablespoon salt ; tablespoon nutmeg ; teaspoon black pepper ; tablespoons oil ; egg ; cup feta cheese ; cup water', 'found on the net in response to a request. i know nothing about bread machines, so the timing here is a total guess on my part :-)', '[''defrost spinach but do not cook'', ''squeeze out all the liquid'', ''bring all ingredients to room temperature and add to machine'', ''select white bread cycle'']');
+INSERT INTO recipe_search (rowid, name, ingredients, description, steps) VALUES (181091, 'steamed chicken zheng ji with ginger scallion dipping sauce', '(3 1/2 lb) roasting chickens ; tablespoon kosher salt ; pinch sugar ; tablespoon kosher salt ; teaspoon salt ; teaspoons light soy sauce ; tablespoons gingerroot, peeled & finely chopped ; garlic cloves, chopped ; tablespoons scallions, finely chopped ; tablespoons peanut oil ; teaspoon sesame oil', 'chicken rubbed with salt and then steamed, served with a ginger-scallion dipping sauce to bring out its full flavor. serve with steamed rice. serves 4 as a main course or 8 as part of a multi-dish chinese style dinner.', '[''rinse the chicken in cold , running water , and blot dry completely with paper towels'', ''rub the salt all over the skin of the chicken and inside the cavity'', ''place the chicken , breast-side down , on a heat proof platter , and set aside for 15 minutes'', ''set up your steamer , or place a rack inside a wok or other deep pan'', ''fill with about 2 inches of hot water'', ''cover tightly and gently steam over medium heat for 1 hour , replenishing the water from time to time'', ''remove the platter of cooked chicken and pour off all of the liquid'', ''in a small bowl , combine the sugar , salt , soy sauce , ginger , garlic , and scallions'', ''in a small pan , combine the oils and heat until they smoke'', ''pour the hot oils over the ginger-scallion mixture'', ''chop the chicken into serving sized pieces and serve with dipping sauce'']');
+
+COMMIT;
+
+-- indexes
+CREATE INDEX idx_recipe_cuisines_cuisine_id ON recipe_cuisines (cuisine_id);
+CREATE INDEX idx_recipe_cuisines_recipe_id ON recipe_cuisines (recipe_id);
+CREATE INDEX idx_recipe_restrictions_restriction_id ON recipe_restrictions (restriction_id);
+CREATE INDEX idx_recipe_restrictions_recipe_id ON recipe_restrictions (recipe_id);
+CREATE INDEX idx_recipe_ingredients_recipe_id ON recipe_ingredients (recipe_id);
+CREATE INDEX idx_recipe_ingredients_ingredient_id ON recipe_ingredients (ingredient_id);
+INSERT INTO recipe_search (recipe_search) VALUES ('optimize');
+ANALYZE;
@@ -1,16 +1,169 @@
 # extract data from the instacart dataset which is a bunch of indicidual zips of csv
 # files in a zip file and load them into a pandas dataframe. Store this dataframe as
 # a parquet file for faster loading in the future.
+#
+# `ingest` streams each inner CSV in chunks (one process per CSV) into typed,
+# partitioned Parquet datasets, so the full 3M orders never have to fit in memory
+# and later lookups only read the columns and partitions they need.
 
-import pandas as pd
-from pathlib import Path
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
 
 INPUT_FILE = Path("instacart_2017_05_01").resolve()
+OUTPUT_DIR = Path("instacart_parquet")
+
+# Orders per partition of the order_products tables
+ORDER_PARTITION_SIZE = 500_000
+BLOCK_SIZE = 16 << 20
+
+SCHEMAS = {
+    "aisles": pa.schema([("aisle_id", pa.int16()), ("aisle", pa.string())]),
+    "departments": pa.schema(
+        [("department_id", pa.int8()), ("department", pa.string())]
+    ),
+    "products": pa.schema(
+        [
+            ("product_id", pa.int32()),
+            ("product_name", pa.string()),
+            ("aisle_id", pa.int16()),
+            ("department_id", pa.int8()),
+        ]
+    ),
+    "orders": pa.schema(
+        [
+            ("order_id", pa.int32()),
+            ("user_id", pa.int32()),
+            ("eval_set", pa.dictionary(pa.int32(), pa.string())),
+            ("order_number", pa.int16()),
+            ("order_dow", pa.int8()),
+            ("order_hour_of_day", pa.int8()),
+            ("days_since_prior_order", pa.float32()),
+        ]
+    ),
+    "order_products": pa.schema(
+        [
+            ("order_id", pa.int32()),
+            ("product_id", pa.int32()),
+            ("add_to_cart_order", pa.int16()),
+            ("reordered", pa.int8()),
+        ]
+    ),
+}
 
 
 def read_files(file: Path):
     """Reads a zip file and returns a list of pandas dataframes"""
     with zipfile.ZipFile(file) as z:
-        with zipfile.ZipFile(z) as z2:
-            return [pd.read_csv(z2.open(f)) for f in z2.namelist()]
+        return [
+            pd.read_csv(z2.open(f))
+            for name in z.namelist()
+            if name.endswith(".zip")
+            for z2 in [zipfile.ZipFile(z.open(name))]
+            for f in z2.namelist()
+            if f.endswith(".csv") and not f.startswith("__MACOSX")
+        ]
+
+
+def list_members(file: Path) -> list[tuple[str, str]]:
+    """List the (inner zip, csv) members of the nested zip file."""
+    with zipfile.ZipFile(file) as z:
+        return [
+            (name, member)
+            for name in z.namelist()
+            if name.endswith(".zip")
+            for member in zipfile.ZipFile(z.open(name)).namelist()
+            if member.endswith(".csv") and not member.startswith("__MACOSX")
+        ]
+
+
+def table_schema(table: str) -> pa.Schema:
+    """Get the schema of a table, order_products__prior/train share one."""
+    return SCHEMAS[table.split("__")[0]]
+
+
+def convert_member(file: Path, inner_zip: str, member: str, output_dir: Path) -> str:
+    """Stream one CSV member into a Parquet dataset, chunk by chunk."""
+    table = Path(member).stem
+    schema = table_schema(table)
+
+    with zipfile.ZipFile(file) as z, zipfile.ZipFile(z.open(inner_zip)) as z2:
+        reader = pv.open_csv(
+            z2.open(member),
+            read_options=pv.ReadOptions(block_size=BLOCK_SIZE),
+            convert_options=pv.ConvertOptions(column_types=schema),
+        )
+
+        partitioning = None
+        if "order_id" in schema.names and table != "orders":
+            # Partition by order_id range so order lookups only read one part
+            partitioning = ds.partitioning(
+                pa.schema([("order_part", pa.int32())]), flavor="hive"
+            )
+            batches = (
+                batch.append_column(
+                    "order_part",
+                    pc.divide(batch["order_id"], ORDER_PARTITION_SIZE).cast(pa.int32()),
+                )
+                for batch in reader
+            )
+            schema = schema.append(pa.field("order_part", pa.int32()))
+            reader = pa.RecordBatchReader.from_batches(schema, batches)
+
+        ds.write_dataset(
+            reader,
+            output_dir / table,
+            format="parquet",
+            partitioning=partitioning,
+            existing_data_behavior="delete_matching",
+        )
+    return table
+
+
+def ingest(file: Path = INPUT_FILE, output_dir: Path = OUTPUT_DIR, workers=None):
+    """Convert every CSV of the nested zip to Parquet, in parallel."""
+    members = list_members(file)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(convert_member, file, inner_zip, member, output_dir)
+            for inner_zip, member in members
+        ]
+        for future in futures:
+            print(f"{future.result()} written.")
+
+
+def scan_table(table: str, output_dir: Path = OUTPUT_DIR) -> pl.LazyFrame:
+    """Lazily scan a converted table, pruning partitions on order_part filters."""
+    return pl.scan_parquet(output_dir / table / "**/*.parquet", hive_partitioning=True)
+
+
+def product_names(product_ids: list[int], output_dir: Path = OUTPUT_DIR) -> dict:
+    """Get the names of the given products, e.g. for pricing candidates."""
+    return dict(
+        scan_table("products", output_dir)
+        .filter(pl.col("product_id").is_in(product_ids))
+        .select(["product_id", "product_name"])
+        .collect()
+        .iter_rows()
+    )
+
+
+def order_products(order_ids: list[int], output_dir: Path = OUTPUT_DIR):
+    """Get the products of the given orders, only reading their partitions."""
+    parts = {order_id // ORDER_PARTITION_SIZE for order_id in order_ids}
+    return (
+        scan_table("order_products__prior", output_dir)
+        .filter(pl.col("order_part").is_in(parts) & pl.col("order_id").is_in(order_ids))
+        .collect()
+    )
+
+
+if __name__ == "__main__":
+    ingest()
@@ -1,15 +1,23 @@
-import ast
+import re
+import sys
 from pathlib import Path
 
-import pandas as pd
+import polars as pl
 import streamlit as st
 import yaml
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from recipe_query import build_facet_index, filter_recipes, load_recipes
+
 st.set_page_config(layout="wide")
 
 RECIPE_FILE = Path("../data/recipes-1.csv")
 TAGS_FILE = Path("../food-com-recipes/tags_original.yaml")
 
+# Time tags are limits on the recipe's minutes, e.g. 30-minutes-or-less
+TIME_TAG = re.compile(r"(\d+)-(minute|hour|day)s?-or-(less|more)")
+MINUTES_PER_UNIT = {"minute": 1, "hour": 60, "day": 24 * 60}
+
 
 def load_tags(tags_file: Path) -> dict:
     """Load the tags from the yaml file."""
@@ -18,8 +26,33 @@ def load_tags(tags_file: Path) -> dict:
     return tags
 
 
+def time_limit(tag: str) -> tuple[int, str]:
+    """Get the minutes and direction ("less" or "more") of a time tag."""
+    match = TIME_TAG.fullmatch(tag)
+    return int(match[1]) * MINUTES_PER_UNIT[match[2]], match[3]
+
+
+def time_filter(time_tags: set[str]) -> pl.Expr:
+    """Match the recipes within any of the selected time tags."""
+    conditions = []
+    for tag in time_tags:
+        minutes, direction = time_limit(tag)
+        if direction == "less":
+            conditions.append(pl.col("minutes") <= minutes)
+        else:
+            conditions.append(pl.col("minutes") >= minutes)
+    return pl.any_horizontal(conditions) if conditions else pl.lit(True)
+
+
+@st.cache_resource
+def load_recipe_index(recipe_file: Path):
+    """Load the recipes and their facet index once for all sessions."""
+    recipes = load_recipes(recipe_file)
+    return recipes, build_facet_index(recipes)
+
+
 with st.spinner("Loading recipes..."):
-    recipes_df = pd.read_csv(RECIPE_FILE, index_col=0)
+    recipes_df, facet_index = load_recipe_index(RECIPE_FILE)
 
 # st.dataframe(recipes_df.head(50))
 
@@ -43,7 +76,11 @@ with st.form(key="preferences_form"):
         st.multiselect(label="Key Ingredient", options=tags["key_ingredient"])
     )
     # Time Dropdown
-    time = set(st.multiselect(label="Cooking Time", options=tags["time"]))
+    # Only the tags that are time limits can be applied to the recipes' minutes
+    time_tags = sorted(
+        (tag for tag in tags["time"] if TIME_TAG.fullmatch(tag)), key=time_limit
+    )
+    time = set(st.multiselect(label="Cooking Time", options=time_tags))
     # Difficulty Dropdown
     difficulty = set(st.multiselect(label="Difficulty", options=tags["difficulty"]))
     # Equipment Dropdown
@@ -68,30 +105,21 @@ with st.form(key="preferences_form"):
 # Button clicked, filter recipes
 if submit_button:
     with st.spinner("Filtering recipes..."):
-        # If selections are empty, set to all
-        cuisine = tags["cuisine"] if not cuisine else cuisine
-        dietary_restrictions = (
-            tags["dietary_restrictions"]
-            if not dietary_restrictions
-            else dietary_restrictions
-        )
-
-        # Check each index for tags
-        dietary_restrictions_filter = pd.Series(
-            [
-                any(tag in dietary_restrictions for tag in ast.literal_eval(tags))
-                for tags in recipes_df["dietary_restrictions"]
-            ]
-        )
-        cuisine_filter = pd.Series(
-            [
-                any(tag in cuisine for tag in ast.literal_eval(tags))
-                for tags in recipes_df["cuisine"]
-            ]
-        )
-
-        # Filter recipes
-        filtered_recipes = recipes_df[dietary_restrictions_filter & cuisine_filter]
+        # Empty selections match all recipes
+        selections = {
+            "dietary_restrictions": dietary_restrictions,
+            "cuisine": cuisine,
+            "key_ingredient": key_ingredient,
+            "difficulty": difficulty,
+            "equipment": equipment,
+            "cooking_method": cooking_method,
+            "course": course,
+            "dish": dish,
+            "season": season,
+            "event": event,
+        }
+        filtered_recipes = filter_recipes(recipes_df, facet_index, selections)
+        filtered_recipes = filtered_recipes.filter(time_filter(time))
 
     # Display 20 random filtered recipes
     if len(filtered_recipes) == 0:
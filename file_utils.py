@@ -0,0 +1,17 @@
+import hashlib
+from pathlib import Path
+
+
+def file_hash(file: Path) -> str:
+    """Hash a file's contents, used to invalidate anything derived from it."""
+    digest = hashlib.blake2b()
+    with file.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_version(file: Path) -> tuple[int, int]:
+    """Get a file's modification time and size, a cheap key to check often."""
+    stat = file.stat()
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,281 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from gensim.models import FastText, KeyedVectors
+
+from file_utils import file_hash
+from schemas import (
+    INGREDIENT_PRICELIST,
+    RECIPES_1,
+    quote_alias,
+    read_dataset,
+    scan_dataset,
+)
+
+RECIPES_CSV = Path("data/recipes-1.csv")
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+WORD_VECTORS_DIR = Path(__file__).resolve().parent / ".cache" / "word-vectors"
+
+VECTOR_SIZE = 64
+TOP_K = 3
+# Minimum cosine similarity of a proposal to be written to the pricelist
+MATCH_THRESHOLD = 0.9
+CHUNK_SIZE = 4096
+# Small corpora are trained for more epochs, up to MAX_EPOCHS, so that every
+# word is seen at least about this many times in total
+TRAINING_WORDS = 2_000_000
+MAX_EPOCHS = 50
+
+# Quoted names, names with an apostrophe are repr'd with double quotes
+NAME_PATTERN = r"'[^']*'|\"[^\"]*\""
+WORD_PATTERN = r"[a-z]+"
+
+
+def quoted_names(column: str) -> pl.Expr:
+    """Extract the names of a stringified list column."""
+    return (
+        pl.col(column)
+        .str.extract_all(NAME_PATTERN)
+        .list.eval(pl.element().str.slice(1, pl.element().str.len_chars() - 2))
+    )
+
+
+def words(expr: pl.Expr) -> pl.Expr:
+    return expr.str.to_lowercase().str.extract_all(WORD_PATTERN)
+
+
+def pricelist_aliases(pricelist_file: Path) -> pl.DataFrame:
+    """Get one (row, alias) row per pricelist alias, as stage 05 looks them up."""
+    return (
+        read_dataset(pricelist_file, INGREDIENT_PRICELIST, ["ingredient"])
+        .with_row_index("row")
+        .select("row", pl.col("ingredient").str.split("|").alias("alias"))
+        .explode("alias")
+        .with_columns(pl.col("alias").str.strip_chars("'"))
+    )
+
+
+def recipe_ingredient_names(recipes_file: Path) -> pl.Series:
+    """Get the unique ingredient names of all recipes."""
+    return (
+        scan_dataset(recipes_file, RECIPES_1)
+        .select(quoted_names("ingredients").explode().unique().alias("name"))
+        .drop_nulls()
+        .collect()
+        .to_series()
+    )
+
+
+# ==============================================================================
+
+
+def train_word_vectors(
+    recipes_file: Path, pricelist_file: Path, vector_size: int = VECTOR_SIZE
+) -> KeyedVectors:
+    """Train word vectors on the recipe steps, ingredient names and aliases.
+
+    FastText's subword vectors also embed misspelled and plural words that
+    are not in the corpus.
+    """
+    recipes = scan_dataset(recipes_file, RECIPES_1)
+    sentences = (
+        pl.concat(
+            [
+                recipes.select(words(pl.col("steps")).alias("words")),
+                recipes.select(
+                    words(quoted_names("ingredients").explode()).alias("words")
+                ),
+                scan_dataset(pricelist_file, INGREDIENT_PRICELIST).select(
+                    words(pl.col("ingredient").str.split("|").explode()).alias("words")
+                ),
+            ]
+        )
+        .collect()["words"]
+        .drop_nulls()
+    )
+    n_words = sentences.list.len().sum()
+
+    model = FastText(
+        sentences.to_list(),
+        vector_size=vector_size,
+        window=5,
+        min_count=1,
+        epochs=int(np.clip(TRAINING_WORDS / max(n_words, 1), 5, MAX_EPOCHS)),
+        seed=40404,
+        workers=1,
+    )
+    return model.wv
+
+
+def load_word_vectors(
+    recipes_file: Path = RECIPES_CSV,
+    pricelist_file: Path = PRICELIST_CSV,
+    cache_dir: Path = WORD_VECTORS_DIR,
+) -> KeyedVectors:
+    """Load the word vectors trained on these files, training them if needed."""
+    digest = file_hash(recipes_file)[:16] + file_hash(pricelist_file)[:16]
+    vectors_file = cache_dir / f"{digest}.kv"
+    if vectors_file.exists():
+        return KeyedVectors.load(str(vectors_file))
+
+    print("Training word vectors...")
+    word_vectors = train_word_vectors(recipes_file, pricelist_file)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    word_vectors.save(str(vectors_file))
+    return word_vectors
+
+
+def embed_names(
+    word_vectors: KeyedVectors, names: pl.Series, idf: dict[str, float] | None = None
+) -> np.ndarray:
+    """Embed each name as the normalized, IDF-weighted sum of its word vectors.
+
+    Word vectors trained on a small corpus share a large common direction,
+    so they are centered on the vocabulary mean before being normalized.
+    Every distinct word is only looked up once, then the word vectors are
+    summed per name with a single scatter-add.
+    """
+    exploded = (
+        pl.DataFrame({"name": names})
+        .select(words(pl.col("name")).alias("word"))
+        .with_row_index("name")
+        .explode("word")
+        .drop_nulls("word")
+    )
+    vocabulary = exploded["word"].unique().sort()
+    word_ids = exploded["word"].cast(pl.Enum(vocabulary)).to_physical().to_numpy()
+
+    embeddings = np.zeros((len(names), word_vectors.vector_size), np.float32)
+    if vocabulary.is_empty():
+        return embeddings
+
+    word_matrix = np.stack([word_vectors[word] for word in vocabulary])
+    word_matrix -= word_vectors.vectors.mean(axis=0)
+    word_matrix /= np.linalg.norm(word_matrix, axis=1, keepdims=True) + 1e-12
+    if idf:
+        weights = np.array([idf.get(word, max(idf.values())) for word in vocabulary])
+        word_matrix *= weights[:, None].astype(np.float32)
+
+    np.add.at(embeddings, exploded["name"].to_numpy(), word_matrix[word_ids])
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+    return embeddings
+
+
+def inverse_document_frequencies(names: pl.Series) -> dict[str, float]:
+    """Get the IDF of every word of the names, so rare words weigh more."""
+    document_frequency = (
+        pl.DataFrame({"name": names})
+        .select(words(pl.col("name")).list.unique().explode().alias("word"))
+        .drop_nulls()
+        .group_by("word")
+        .len()
+    )
+    return dict(
+        zip(
+            document_frequency["word"],
+            np.log((1 + len(names)) / (1 + document_frequency["len"].to_numpy())) + 1,
+        )
+    )
+
+
+def top_k_matches(
+    queries: np.ndarray, products: np.ndarray, k: int = TOP_K
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the indices and cosine similarities of the k most similar products.
+
+    The embeddings are normalized, so the similarities of a chunk of queries
+    against all products are one matrix multiply.
+    """
+    k = min(k, len(products))
+    indices = np.empty((len(queries), k), np.int64)
+    scores = np.empty((len(queries), k), np.float32)
+    for start in range(0, len(queries), CHUNK_SIZE):
+        similarity = queries[start : start + CHUNK_SIZE] @ products.T
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarity, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        indices[start : start + CHUNK_SIZE] = np.take_along_axis(top, order, axis=1)
+        scores[start : start + CHUNK_SIZE] = np.take_along_axis(
+            top_scores, order, axis=1
+        )
+    return indices, scores
+
+
+def propose_matches(
+    names: pl.Series,
+    aliases: pl.DataFrame,
+    word_vectors: KeyedVectors,
+    k: int = TOP_K,
+) -> pl.DataFrame:
+    """Get the k most similar pricelist aliases of every name."""
+    idf = inverse_document_frequencies(pl.concat([names, aliases["alias"]]))
+    indices, scores = top_k_matches(
+        embed_names(word_vectors, names, idf),
+        embed_names(word_vectors, aliases["alias"], idf),
+        k,
+    )
+    return pl.DataFrame(
+        {
+            "name": names.to_numpy().repeat(indices.shape[1]),
+            "rank": np.tile(np.arange(1, indices.shape[1] + 1), len(names)),
+            "row": aliases["row"].to_numpy()[indices.ravel()],
+            "alias": aliases["alias"].to_numpy()[indices.ravel()],
+            "score": scores.ravel(),
+        }
+    )
+
+
+def apply_matches(
+    pricelist_file: Path, proposals: pl.DataFrame, threshold: float = MATCH_THRESHOLD
+):
+    """Add the names of the confident best matches as aliases of their product."""
+    accepted = proposals.filter((pl.col("rank") == 1) & (pl.col("score") >= threshold))
+    new_aliases = accepted.group_by("row").agg(
+        quote_alias(pl.col("name")).sort().str.join("|").alias("name")
+    )
+
+    pricelist = (
+        read_dataset(pricelist_file, INGREDIENT_PRICELIST)
+        .with_row_index("row")
+        .join(new_aliases, on="row", how="left")
+        .with_columns(
+            pl.when(pl.col("name").is_not_null())
+            .then(pl.concat_str("ingredient", "name", separator="|"))
+            .otherwise(pl.col("ingredient"))
+            .alias("ingredient")
+        )
+        .drop("row", "name")
+    )
+    pricelist.write_csv(pricelist_file)
+    print(f"{accepted.height} names added as aliases of {new_aliases.height} products.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Match recipe ingredients missing from the pricelist to products."
+    )
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--threshold", type=float, default=MATCH_THRESHOLD)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only print the proposals"
+    )
+    args = parser.parse_args()
+
+    aliases = pricelist_aliases(PRICELIST_CSV)
+    names = recipe_ingredient_names(RECIPES_CSV)
+    unmatched = names.filter(~names.is_in(aliases["alias"].implode()))
+    print(f"{unmatched.len()} of {names.len()} ingredient names are not priced.")
+
+    if unmatched.len():
+        proposals = propose_matches(
+            unmatched,
+            aliases,
+            load_word_vectors(RECIPES_CSV, PRICELIST_CSV),
+            args.top_k,
+        )
+        with pl.Config(tbl_rows=50, fmt_str_lengths=40):
+            print(proposals.filter(pl.col("rank") == 1).sort("score", descending=True))
+        if not args.dry_run:
+            apply_matches(PRICELIST_CSV, proposals, args.threshold)
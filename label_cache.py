@@ -0,0 +1,93 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pint
+
+from units import definitions_version, get_unit_registry
+
+CACHE_FILE = Path("data/label-cache.sqlite")
+
+
+class LabelCache:
+    """Quantities parsed from ingredient labels, kept in SQLite between runs.
+
+    Entries are keyed by (label, scraped quantity) and only used with the
+    same version, the hash of the unit definitions and of the parsing code.
+    Every entry of the version is read at once when opened, and the new ones
+    are written in one transaction by `save`. A label without a valid
+    quantity is cached as None.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        cache_file: Path = CACHE_FILE,
+        ureg: pint.UnitRegistry | None = None,
+    ):
+        self.version = version
+        self.ureg = ureg or get_unit_registry()
+        self.units = {}
+        self.new = {}
+
+        self.db = sqlite3.connect(cache_file, timeout=60)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS labels (
+                label TEXT, quantity TEXT, version TEXT,
+                magnitude REAL, unit TEXT, dimension TEXT,
+                PRIMARY KEY (label, quantity, version)
+            ) WITHOUT ROWID;
+            """)
+        with self.db:
+            self.db.execute("DELETE FROM labels WHERE version != ?", (version,))
+        self.entries = {
+            (label, quantity): (magnitude, unit)
+            for label, quantity, magnitude, unit in self.db.execute(
+                "SELECT label, quantity, magnitude, unit FROM labels "
+                "WHERE version = ?",
+                (version,),
+            )
+        }
+        print(f"{len(self.entries)} parsed ingredient labels loaded from {cache_file}.")
+
+    @staticmethod
+    def key(label: str, quantity: float | str) -> tuple[str, str]:
+        return label, json.dumps(quantity)
+
+    def __contains__(self, key: tuple[str, float | str]) -> bool:
+        return self.key(*key) in self.entries
+
+    def __getitem__(self, key: tuple[str, float | str]) -> pint.Quantity | None:
+        magnitude, unit = self.entries[self.key(*key)]
+        if unit is None:
+            return None
+        # Parse each unit once, building a quantity from a unit is cheap
+        if unit not in self.units:
+            self.units[unit] = self.ureg.Unit(unit)
+        return self.ureg.Quantity(magnitude, self.units[unit])
+
+    def __setitem__(self, key: tuple[str, float | str], quantity: pint.Quantity | None):
+        key = self.key(*key)
+        if quantity is None:
+            entry = (None, None, None)
+        else:
+            entry = (
+                float(quantity.magnitude),
+                str(quantity.units),
+                str(quantity.dimensionality),
+            )
+        self.entries[key] = entry[:2]
+        self.new[key] = entry
+
+    def save(self):
+        """Write the entries added since the cache was opened."""
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (label, quantity, self.version, *entry)
+                    for (label, quantity), entry in self.new.items()
+                ],
+            )
+        print(f"{len(self.new)} parsed ingredient labels saved.")
+        self.new = {}
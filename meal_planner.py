@@ -0,0 +1,186 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from recipe_query import FACETS, build_facet_index, load_recipes, query_recipes
+from schemas import RECIPES_2
+
+RECIPE_FILE = Path("data/recipes-2.csv")
+
+# Nutrition columns split out by 03-recipe_cleaning
+NUTRITION = [
+    "calories",
+    "total_fat_pdv",
+    "sugar_pdv",
+    "sodium_pdv",
+    "protein_pdv",
+    "saturated_fat_pdv",
+    "carbohydrate_pdv",
+]
+
+# Recipes considered for swaps, the best by the objective
+POOL_SIZE = 1024
+MAX_SWAPS_PER_MEAL = 10
+
+
+def load_catalog(recipe_file: Path = RECIPE_FILE) -> dict:
+    """Load the costs, nutrition and facet bitmaps of every recipe, once."""
+    recipes = load_recipes(recipe_file, RECIPES_2)
+    return {
+        "recipes": recipes.select("id", "name", "cost", *NUTRITION),
+        "cost": recipes["cost"].cast(pl.Float64).fill_null(np.inf).to_numpy(),
+        "nutrition": recipes.select(NUTRITION).cast(pl.Float64).to_numpy(),
+        "index": build_facet_index(recipes, FACETS),
+    }
+
+
+def candidate_mask(
+    catalog: dict,
+    selections: dict[str, set[str]] | None = None,
+    bounds: dict[str, tuple[float | None, float | None]] | None = None,
+) -> np.ndarray:
+    """Get the recipes matching the facets and the per-recipe nutrition bounds."""
+    mask = np.isfinite(catalog["cost"])
+    if selections:
+        facet_mask = np.zeros_like(mask)
+        facet_mask[query_recipes(catalog["index"], selections)] = True
+        mask &= facet_mask
+
+    for column, (low, high) in (bounds or {}).items():
+        values = catalog["nutrition"][:, NUTRITION.index(column)]
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+    return mask
+
+
+def select_meals(
+    cost: np.ndarray, value: np.ndarray, n: int, budget: float
+) -> np.ndarray:
+    """Choose n items of total cost at most budget, with a high total value.
+
+    Starts from the n cheapest items and repeatedly makes the swap that
+    increases the total value the most while staying under budget. Only the
+    POOL_SIZE most valuable affordable items are considered for swaps.
+    """
+    if n < 1:
+        raise ValueError(f"At least 1 recipe must be selected, not {n}")
+    if len(cost) < n:
+        raise ValueError(f"Only {len(cost)} recipes match, {n} needed")
+
+    cheapest = np.argpartition(cost, n - 1)[:n]
+    spent = cost[cheapest].sum()
+    if spent > budget:
+        raise ValueError(f"The {n} cheapest recipes cost {spent:.2f} > {budget:.2f}")
+
+    # A single item can cost at most the budget left by the other cheapest ones
+    affordable = np.flatnonzero(cost <= budget - spent + cost[cheapest].max())
+    if len(affordable) > POOL_SIZE:
+        affordable = affordable[np.argpartition(-value[affordable], POOL_SIZE)][
+            :POOL_SIZE
+        ]
+    pool = np.union1d(affordable, cheapest)
+    pool_cost = cost[pool]
+    pool_value = value[pool]
+
+    selected = np.isin(pool, cheapest)
+    for _ in range(MAX_SWAPS_PER_MEAL * n):
+        slack = budget - pool_cost[selected].sum()
+        inside = np.flatnonzero(selected)
+        outside = np.flatnonzero(~selected)
+        # Every candidate is already selected
+        if outside.size == 0 or inside.size == 0:
+            break
+
+        gain = pool_value[outside][None, :] - pool_value[inside][:, None]
+        extra_cost = pool_cost[outside][None, :] - pool_cost[inside][:, None]
+        affordable_swaps = extra_cost <= slack + 1e-9
+        # No swap fits in the budget left
+        if not affordable_swaps.any():
+            break
+        gain[~affordable_swaps] = -np.inf
+        best = np.unravel_index(np.argmax(gain), gain.shape)
+        if not gain[best] > 0:
+            break
+        selected[inside[best[0]]] = False
+        selected[outside[best[1]]] = True
+
+    return pool[selected]
+
+
+def plan_meals(
+    catalog: dict,
+    n: int,
+    budget: float,
+    selections: dict[str, set[str]] | None = None,
+    bounds: dict[str, tuple[float | None, float | None]] | None = None,
+    objective: str = "protein_pdv",
+    maximize: bool = True,
+) -> pl.DataFrame:
+    """Get n recipes costing at most budget in total, with the best objective.
+
+    Only recipes with the selected facets (AND across facets, OR within a
+    facet) and within the nutrition bounds of each recipe are considered.
+    """
+    rows = np.flatnonzero(candidate_mask(catalog, selections, bounds))
+    value = catalog["nutrition"][rows, NUTRITION.index(objective)]
+    chosen = select_meals(
+        catalog["cost"][rows], value if maximize else -value, n, budget
+    )
+    return catalog["recipes"][rows[chosen]].sort("cost")
+
+
+def parse_assignments(values: list[str]) -> dict[str, list[str]]:
+    """Parse repeated "key=value" arguments."""
+    parsed = {}
+    for value in values:
+        key, _, item = value.partition("=")
+        parsed.setdefault(key, []).append(item)
+    return parsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Choose recipes for a meal plan under a budget."
+    )
+    parser.add_argument("--meals", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=70.0)
+    parser.add_argument(
+        "--facet", action="append", default=[], help="e.g. cuisine=italian"
+    )
+    parser.add_argument(
+        "--min", action="append", default=[], help="e.g. protein_pdv=20"
+    )
+    parser.add_argument("--max", action="append", default=[], help="e.g. calories=800")
+    parser.add_argument("--objective", choices=NUTRITION, default="protein_pdv")
+    parser.add_argument("--minimize", action="store_true")
+    args = parser.parse_args()
+
+    selections = {
+        facet: set(values) for facet, values in parse_assignments(args.facet).items()
+    }
+    lows = parse_assignments(args.min)
+    highs = parse_assignments(args.max)
+    bounds = {
+        column: (
+            float(lows[column][-1]) if column in lows else None,
+            float(highs[column][-1]) if column in highs else None,
+        )
+        for column in {*lows, *highs}
+    }
+
+    catalog = load_catalog()
+    plan = plan_meals(
+        catalog,
+        args.meals,
+        args.budget,
+        selections,
+        bounds,
+        args.objective,
+        not args.minimize,
+    )
+    print(plan)
+    print(plan.select("cost", *NUTRITION).sum())
@@ -5,11 +5,18 @@ from decimal import Decimal
 import math
 import numbers
 import operator
+import re
 from fractions import Fraction
 
+# '2', '-3/4' or '1 1/2', which Mixed can parse without going through Fraction
+_SIMPLE_MIXED = re.compile(r'\s*(-?[0-9]+)(?:\s+([0-9]+)/([0-9]+)|/([0-9]+))?\s*\Z')
+
 class Mixed(Fraction):
     """This class implements Fraction, which implements rational numbers."""
-    
+
+    # No instance dict; the mixed form is computed once, on construction
+    __slots__ = ('_whole', '_fnumerator')
+
         # We're immutable, so use __new__ not __init__
     def __new__(cls, whole=0, numerator=None, denominator=None):
         """Constructs a Rational.
@@ -52,7 +59,33 @@ class Mixed(Fraction):
         Mixed(1, 47, 100)
 
         """
-        self = super(Mixed, cls).__new__(cls)
+        # Fast paths for ints and simple strings, with the same results
+        if denominator is None:
+            if type(whole) is int:
+                if numerator is None:
+                    return cls._from_coprime_ints(whole, 1)
+                if type(numerator) is int:
+                    return cls._from_ints(whole, numerator)
+            elif numerator is None and type(whole) is str:
+                m = _SIMPLE_MIXED.match(whole)
+                if m and m.group(3) and int(m.group(3)):
+                    w, n, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
+                    return cls._from_ints(w * d - n if w < 0 else w * d + n, d)
+                elif m and m.group(4) and int(m.group(4)):
+                    return cls._from_ints(int(m.group(1)), int(m.group(4)))
+                elif m and not m.group(3) and not m.group(4):
+                    return cls._from_coprime_ints(int(m.group(1)), 1)
+        elif (type(whole) is int and type(numerator) is int and
+              type(denominator) is int and denominator != 0):
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            if whole < 0 < numerator:
+                numerator = whole * denominator - numerator
+            elif numerator < 0 < whole:
+                numerator = numerator - whole * denominator
+            else:
+                numerator = whole * denominator + numerator
+            return cls._from_ints(numerator, denominator)
 
         attempt_failed = False
         zerodiv = False
@@ -111,10 +144,35 @@ class Mixed(Fraction):
             f2 += -f1
         else:
             f2 += f1
-        self._numerator = f2.numerator
-        self._denominator = f2.denominator
+        return cls._from_coprime_ints(f2.numerator, f2.denominator)
+
+    @classmethod
+    def _from_coprime_ints(cls, numerator, denominator):
+        """Build from a numerator and a positive denominator in lowest terms.
+
+        Skips the argument parsing of __new__, for arithmetic results.
+        """
+        self = object.__new__(cls)
+        self._numerator = numerator
+        self._denominator = denominator
+        if numerator < 0:
+            whole, fnumerator = divmod(-numerator, denominator)
+            self._whole = -whole
+            self._fnumerator = -fnumerator
+        else:
+            self._whole, self._fnumerator = divmod(numerator, denominator)
         return self
 
+    @classmethod
+    def _from_ints(cls, numerator, denominator):
+        """Build from any numerator and denominator, like Mixed(n, d)."""
+        if denominator == 0:
+            raise ZeroDivisionError('Mixed(%s, 0)' % numerator)
+        g = math.gcd(numerator, denominator)
+        if denominator < 0:
+            g = -g
+        return cls._from_coprime_ints(numerator // g, denominator // g)
+
     def __repr__(self):
         """repr(self)"""
         if (self._numerator < 0) and (self.whole !=0):
@@ -138,12 +196,7 @@ class Mixed(Fraction):
             return '%s/%s' % (self.fnumerator, self._denominator)
 
     def to_fraction(self):
-        n = self.fnumerator
-        if self.whole != 0:
-            if self.whole < 0:
-                n *= -1
-            n += self.whole * self._denominator
-        return Fraction(n, self._denominator)
+        return Fraction(self._numerator, self._denominator)
 
     def limit_denominator(self, max_denominator=1000000):
         """Closest Fraction to self with denominator at most max_denominator.
@@ -155,7 +208,8 @@ class Mixed(Fraction):
         >>> Mixed(4321, 8765).limit_denominator(10000)
         Mixed(0, 4321, 8765)
         """
-        return Mixed(self.to_fraction().limit_denominator(max_denominator))
+        f = self.to_fraction().limit_denominator(max_denominator)
+        return Mixed._from_coprime_ints(f.numerator, f.denominator)
 
     @property
     def numerator(a):
@@ -178,10 +232,7 @@ class Mixed(Fraction):
         >>> Mixed(10,3).whole
         3
         """
-        if a._numerator < 0:
-            return -(-a._numerator // a._denominator)
-        else:
-            return a._numerator // a._denominator
+        return a._whole
 
     @property
     def fnumerator(a):
@@ -189,37 +240,35 @@ class Mixed(Fraction):
         >>> Mixed('1 3/4').fnumerator
         3
         """
-        if a._numerator < 0:
-            return -(-a._numerator % a._denominator)
-        else:
-            return a._numerator % a._denominator
+        return a._fnumerator
 
     def _add(a, b):
         """a + b"""
-        return Mixed(a.numerator * b.denominator +
-                     b.numerator * a.denominator,
-                     a.denominator * b.denominator)
+        return Mixed._from_ints(a.numerator * b.denominator +
+                                b.numerator * a.denominator,
+                                a.denominator * b.denominator)
     __add__, __radd__ = Fraction._operator_fallbacks(_add, operator.add)
 
     def _sub(a, b):
         """a - b"""
-        return Mixed(a.numerator * b.denominator -
-                        b.numerator * a.denominator,
-                        a.denominator * b.denominator)
+        return Mixed._from_ints(a.numerator * b.denominator -
+                                b.numerator * a.denominator,
+                                a.denominator * b.denominator)
 
     __sub__, __rsub__ = Fraction._operator_fallbacks(_sub, operator.sub)
 
     def _mul(a, b):
         """a * b"""
-        return Mixed(a.numerator * b.numerator, a.denominator * b.denominator)
+        return Mixed._from_ints(a.numerator * b.numerator,
+                                a.denominator * b.denominator)
 
     __mul__, __rmul__ = Fraction._operator_fallbacks(_mul, operator.mul)
 
 
     def _div(a, b):
         """a / b"""
-        return Mixed(a.numerator * b.denominator,
-                        a.denominator * b.numerator)
+        return Mixed._from_ints(a.numerator * b.denominator,
+                                a.denominator * b.numerator)
 
     __truediv__, __rtruediv__ = Fraction._operator_fallbacks(_div, operator.truediv)
 
@@ -233,7 +282,8 @@ class Mixed(Fraction):
         """
         if isinstance(b, numbers.Rational):
             if b.denominator == 1:
-                return Mixed(Fraction(a) ** b)
+                f = Fraction.__pow__(a, b)
+                return Mixed._from_coprime_ints(f.numerator, f.denominator)
             else:
                 # A fractional power will generally produce an
                 # irrational number.
@@ -257,30 +307,27 @@ class Mixed(Fraction):
 
     def __pos__(a):
         """+a: Coerces a subclass instance to Fraction"""
-        return Mixed(a.numerator, a.denominator)
+        return Mixed._from_coprime_ints(a._numerator, a._denominator)
 
     def __neg__(a):
         """-a"""
-        return Mixed(-a.numerator, a.denominator)
+        return Mixed._from_coprime_ints(-a._numerator, a._denominator)
 
     def __abs__(a):
         """abs(a)"""
-        return Mixed(abs(a.numerator), a.denominator)
+        return Mixed._from_coprime_ints(abs(a._numerator), a._denominator)
 
     def __trunc__(a):
         """trunc(a)"""
-        if a.numerator < 0:
-            return -(-a.numerator // a.denominator)
-        else:
-            return a.numerator // a.denominator
+        return a._whole
 
     def __hash__(self):
         """hash(self)"""
-        return self.to_fraction().__hash__()
+        return Fraction.__hash__(self)
 
     def __eq__(a, b):
         """a == b"""
-        return Fraction(a) == b
+        return Fraction.__eq__(a, b)
 
     def _richcmp(self, other, op):
         """Helper for comparison operators, for internal use only.
@@ -292,7 +339,7 @@ class Mixed(Fraction):
         comparison operators.
 
         """
-        return self.to_fraction()._richcmp(other, op)
+        return Fraction._richcmp(self, other, op)
 
     def __reduce__(self):
         return (self.__class__, (str(self),))
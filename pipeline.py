@@ -0,0 +1,55 @@
+import argparse
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# Each subcommand runs its script on demand, so only the libraries that step
+# needs (polars, pint, bs4, docx, streamlit, ...) are ever imported
+COMMANDS = {
+    "tags": "01-recipe_tags.py",
+    "clean-tags": "02-clean_tags.py",
+    "clean": "03-recipe_cleaning.py",
+    "scrape": "04-scrape_ingredients.py",
+    "price": "05-match-ingredient-prices.py",
+    "seed": "99-generate_sql_seed.py",
+    "tag-index": "tag_index.py",
+    "suggest-tags": "tag_suggestions.py",
+    "refresh-prices": "pricing_client.py",
+    "match-ingredients": "ingredient_matcher.py",
+    "store-costs": "store_pricing.py",
+    "plan": "meal_planner.py",
+    "search": "recipe_search.py",
+    "shard": "sharding.py",
+    "similar": "recipe_similarity.py",
+    "serve": "recipe_service.py",
+}
+
+# Scripts that are Streamlit pages rather than plain scripts
+STREAMLIT_COMMANDS = ["tags"]
+
+
+def run(command: str, args: list[str]):
+    """Run a pipeline step as if its script had been run directly."""
+    script = REPO_DIR / COMMANDS[command]
+    if command in STREAMLIT_COMMANDS:
+        sys.exit(
+            subprocess.call(
+                [sys.executable, "-m", "streamlit", "run", str(script), *args]
+            )
+        )
+
+    sys.argv = [str(script), *args]
+    sys.path[0] = str(REPO_DIR)
+    runpy.run_path(str(script), run_name="__main__")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a step of the data pipeline.")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    run(args.command, args.args)
@@ -0,0 +1,416 @@
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import polars as pl
+import requests
+from dotenv import dotenv_values
+
+from schemas import (
+    INGREDIENT_PRICELIST,
+    RECIPES_1,
+    quote_alias,
+    read_dataset,
+    scan_dataset,
+)
+
+ENV_FILE = Path(".env")
+RECIPES_CSV = Path("data/recipes-1.csv")
+PRICELIST_CSV = Path("data/ingredient-pricelist.csv")
+CACHE_FILE = Path("data/price-cache.sqlite")
+
+BLUECART_URL = "https://api.bluecartapi.com/request"
+# BlueCart charges for more than 1200 requests a month
+MONTHLY_QUOTA = 1200
+CACHE_TTL = 30 * 24 * 3600
+MAX_WORKERS = 8
+REQUESTS_PER_SECOND = 5.0
+
+# Package sizes in product titles, e.g. "Great Value Fennel Seed, 1.5 oz"
+SIZE_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(fl\.? ?oz|ounces?|oz|pounds?|lbs?|grams?|g|kg|ml|"
+    r"liters?|l|count|ct|pack|pk)\b",
+    re.IGNORECASE,
+)
+UNITS = {
+    "fl oz": "floz",
+    "fl. oz": "floz",
+    "floz": "floz",
+    "fl.oz": "floz",
+    "ounce": "oz",
+    "ounces": "oz",
+    "oz": "oz",
+    "pound": "lb",
+    "pounds": "lb",
+    "lb": "lb",
+    "lbs": "lb",
+    "gram": "g",
+    "grams": "g",
+    "g": "g",
+    "kg": "kg",
+    "ml": "ml",
+    "liter": "liter",
+    "liters": "liter",
+    "l": "liter",
+    "count": "each",
+    "ct": "each",
+    "pack": "each",
+    "pk": "each",
+}
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when fetching would use more paid requests than allowed."""
+
+
+# ==============================================================================
+
+
+class PriceSource(ABC):
+    """A product search API returning BlueCart-shaped search results."""
+
+    @abstractmethod
+    def search(self, term: str) -> dict | None:
+        """Search for a term, returning the JSON response or None on failure."""
+
+
+class BlueCartSource(PriceSource):
+    """The BlueCart API, or anything serving the same format at `url`."""
+
+    def __init__(self, api_key: str | None, url: str = BLUECART_URL):
+        # Every request without a key would fail and still count as paid
+        if not api_key:
+            raise ValueError(f"BLUECART_API_KEY is not set in {ENV_FILE}.")
+        self.api_key = api_key
+        self.url = url
+        self.session = requests.Session()
+
+    def search(self, term: str) -> dict | None:
+        params = {"api_key": self.api_key, "search_term": term, "type": "search"}
+        api_result = self.session.get(self.url, params=params, timeout=30)
+
+        # Check if the request was successful
+        if api_result.status_code != 200:
+            print(f"API request failed with status code {api_result.status_code}")
+            print(api_result.text)
+            return None
+
+        return api_result.json()
+
+
+class FakePriceSource(PriceSource):
+    """Deterministic offline prices, for tests and benchmarks."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def search(self, term: str) -> dict | None:
+        time.sleep(self.latency)
+        digest = int(hashlib.md5(term.encode()).hexdigest(), 16)
+        return {
+            "search_results": [
+                {
+                    "product": {
+                        "title": f"Fake {term.title()}, {digest % 32 + 1} oz",
+                        "item_id": str(digest % 10**9),
+                    },
+                    "offers": {"primary": {"price": round(digest % 1000 / 100 + 1, 2)}},
+                }
+            ]
+        }
+
+
+def serve_fake_prices(port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    """Serve FakePriceSource in the BlueCart format on localhost, in a thread.
+
+    Use with `BlueCartSource("fake", f"http://127.0.0.1:{server.server_port}")`.
+    """
+    source = FakePriceSource(latency)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            term = parse_qs(urlparse(self.path).query)["search_term"][0]
+            body = json.dumps(source.search(term)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ==============================================================================
+
+
+class RateLimiter:
+    """Space out calls to at most `rate` per second, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.next_call = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            call_at = max(now, self.next_call)
+            self.next_call = call_at + self.interval
+        time.sleep(call_at - now)
+
+
+class PriceClient:
+    """Fetch search results with an on-disk TTL cache and a monthly quota.
+
+    Terms are normalized and de-duplicated, cached responses younger than
+    `ttl` seconds are reused, and only the remaining terms are requested,
+    concurrently and at most `rate` per second.
+    """
+
+    def __init__(
+        self,
+        source: PriceSource,
+        cache_file: Path = CACHE_FILE,
+        ttl: float = CACHE_TTL,
+        quota: int = MONTHLY_QUOTA,
+        max_workers: int = MAX_WORKERS,
+        rate: float = REQUESTS_PER_SECOND,
+    ):
+        self.source = source
+        self.ttl = ttl
+        self.quota = quota
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate)
+
+        self.db = sqlite3.connect(cache_file)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                term TEXT PRIMARY KEY, response TEXT, fetched_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS usage (month TEXT PRIMARY KEY, requests INTEGER);
+            """)
+
+    def requests_used(self) -> int:
+        """Number of paid requests made this month."""
+        row = self.db.execute(
+            "SELECT requests FROM usage WHERE month = ?", (time.strftime("%Y-%m"),)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def cached(self, terms: list[str]) -> dict[str, dict]:
+        """Get the cached responses that have not expired."""
+        self.db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (term TEXT)")
+        self.db.execute("DELETE FROM wanted")
+        self.db.executemany("INSERT INTO wanted VALUES (?)", [(t,) for t in terms])
+        rows = self.db.execute(
+            "SELECT term, response FROM responses JOIN wanted USING (term) "
+            "WHERE fetched_at >= ?",
+            (time.time() - self.ttl,),
+        )
+        return {term: json.loads(response) for term, response in rows}
+
+    def _search(self, term: str) -> dict | None:
+        self.rate_limiter.wait()
+        try:
+            return self.source.search(term)
+        except requests.RequestException as e:
+            print(f"API request for {term!r} failed: {e}")
+            return None
+
+    def _save(self, term: str, response: dict | None):
+        """Cache a response and count the request, paid even if it failed."""
+        with self.db:
+            if response is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (term, json.dumps(response), time.time()),
+                )
+            self.db.execute(
+                "INSERT INTO usage VALUES (?, 1) ON CONFLICT (month) "
+                "DO UPDATE SET requests = requests + 1",
+                (time.strftime("%Y-%m"),),
+            )
+
+    def fetch(self, terms, allow_overage: bool = False) -> dict[str, dict]:
+        """Get the search results of every term, requesting only uncached terms."""
+        terms = sorted({normalize_term(term) for term in terms} - {""})
+        results = self.cached(terms)
+        missing = [term for term in terms if term not in results]
+        print(f"{len(terms)} terms, {len(results)} cached, {len(missing)} to request.")
+
+        used = self.requests_used()
+        if not allow_overage and used + len(missing) > self.quota:
+            raise QuotaExceededError(
+                f"{len(missing)} requests needed but only {self.quota - used} "
+                f"of the monthly quota of {self.quota} are left."
+            )
+
+        # Save each response as it arrives, so a stopped run loses none of them
+        fetched = {}
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {executor.submit(self._search, term): term for term in missing}
+            for future in as_completed(futures):
+                term, response = futures[future], future.result()
+                self._save(term, response)
+                if response is not None:
+                    fetched[term] = response
+
+        return results | fetched
+
+
+# ==============================================================================
+
+
+def normalize_term(term: str) -> str:
+    return " ".join(term.lower().strip("' ").split())
+
+
+def normalize_terms(expr: pl.Expr) -> pl.Expr:
+    """Vectorized normalize_term."""
+    return expr.str.to_lowercase().str.replace_all(r"\s+", " ").str.strip_chars("' ")
+
+
+def pricelist_aliases(pricelist: pl.DataFrame) -> pl.DataFrame:
+    """Get the normalized (row, alias) pairs of the pricelist, in file order."""
+    return (
+        pricelist.select("row", pl.col("ingredient").str.split("|").alias("alias"))
+        .explode("alias")
+        .with_columns(normalize_terms(pl.col("alias")))
+        .filter(pl.col("alias") != "")
+    )
+
+
+def search_terms(names: list[str], pricelist: pl.DataFrame) -> pl.DataFrame:
+    """Get one search term per pricelist row that any of the names matches.
+
+    A product is searched by its first alias however many recipe names match
+    it, names matching no alias are searched as new products with a null row.
+    Returns (row, term) pairs, with the rows in pricelist order.
+    """
+    aliases = pricelist_aliases(pricelist)
+    names = pl.DataFrame({"alias": names}, schema={"alias": pl.String}).select(
+        normalize_terms(pl.col("alias")).unique().sort()
+    )
+    # Names that are aliases of several products match the first one
+    matched = names.join(aliases, on="alias").group_by("alias").agg(pl.col("row").min())
+    products = (
+        aliases.group_by("row", maintain_order=True)
+        .first()
+        .join(matched.select("row").unique(), on="row", how="semi")
+        .rename({"alias": "term"})
+    )
+    new_products = (
+        names.join(aliases, on="alias", how="anti")
+        .filter(pl.col("alias") != "")
+        .select(pl.lit(None, pl.UInt32).alias("row"), pl.col("alias").alias("term"))
+    )
+    return pl.concat([products, new_products])
+
+
+def recipe_search_terms(recipes_file: Path) -> list[str]:
+    """Get the unique ingredient names of all recipes."""
+    return (
+        scan_dataset(recipes_file, RECIPES_1)
+        .select(
+            pl.col("ingredients")
+            # Names with an apostrophe are repr'd with double quotes
+            .str.extract_all(r"'[^']*'|\"[^\"]*\"")
+            .list.eval(pl.element().str.slice(1, pl.element().str.len_chars() - 2))
+            .explode()
+            .unique()
+        )
+        .drop_nulls()
+        .collect()
+        .to_series()
+        .to_list()
+    )
+
+
+def parse_search_results(result: dict) -> dict[str, float | str] | None:
+    """Get the price and package size of the first priced search result."""
+    for item in result.get("search_results", []):
+        price = item.get("offers", {}).get("primary", {}).get("price")
+        if price is None:
+            continue
+
+        size = SIZE_PATTERN.search(item["product"]["title"])
+        if size:
+            quantity, unit = float(size.group(1)), UNITS[size.group(2).lower()]
+        else:
+            quantity, unit = 1.0, "each"
+        return {"price": float(price), "quantity": quantity, "unit": unit}
+    return None
+
+
+def update_pricelist(
+    pricelist_file: Path, terms: pl.DataFrame, results: dict[str, dict]
+):
+    """Update the prices of the searched pricelist rows, append new products.
+
+    `terms` are the (row, term) pairs of search_terms, so each row gets the
+    price of the one term searched for it.
+    """
+    prices = pl.DataFrame(
+        [
+            {"alias": term, **parsed}
+            for term, result in results.items()
+            if (parsed := parse_search_results(result))
+        ],
+        schema={
+            "alias": pl.String,
+            "price": pl.Float64,
+            "quantity": pl.Float64,
+            "unit": pl.String,
+        },
+    )
+    pricelist = read_dataset(pricelist_file, INGREDIENT_PRICELIST).with_row_index("row")
+
+    priced = terms.join(prices, left_on="term", right_on="alias")
+    matched = priced.filter(pl.col("row").is_not_null())
+    updated = pricelist.update(matched.drop("term"), on="row")
+    new_terms = priced.filter(pl.col("row").is_null()).select(
+        quote_alias(pl.col("term")).alias("ingredient"), "price", "quantity", "unit"
+    )
+    updated = pl.concat([updated.drop("row"), new_terms], how="vertical_relaxed")
+    updated.write_csv(pricelist_file)
+    print(f"{matched.height} prices updated, {new_terms.height} products added.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Refresh the pricelist with the prices of all recipe ingredients."
+    )
+    parser.add_argument("--fake", action="store_true", help="Use offline prices")
+    parser.add_argument("--allow-overage", action="store_true")
+    args = parser.parse_args()
+
+    if args.fake:
+        # Keep fake responses out of the real cache
+        client = PriceClient(
+            FakePriceSource(),
+            cache_file=CACHE_FILE.with_name("price-cache-fake.sqlite"),
+            rate=float("inf"),
+        )
+    else:
+        api_key = dotenv_values(ENV_FILE).get("BLUECART_API_KEY")
+        client = PriceClient(BlueCartSource(api_key))
+
+    pricelist = read_dataset(PRICELIST_CSV, INGREDIENT_PRICELIST).with_row_index("row")
+    terms = search_terms(recipe_search_terms(RECIPES_CSV), pricelist)
+    results = client.fetch(terms["term"], args.allow_overage)
+    update_pricelist(PRICELIST_CSV, terms, results)
+    print(f"{client.requests_used()}/{client.quota} requests used this month.")
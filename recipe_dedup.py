@@ -0,0 +1,155 @@
+import os
+import time
+
+import numpy as np
+import polars as pl
+
+# Near-duplicate removal, recipes whose estimated Jaccard similarity of
+# ingredients and step shingles is at least the threshold are duplicates.
+# A threshold of 0 disables it. BANDS * ROWS MinHash permutations are used,
+# candidates are pairs sharing a band (likely above ~(1/BANDS)**(1/ROWS)).
+DEDUP_THRESHOLD = float(os.environ.get("RECIPE_DEDUP_THRESHOLD", 0.8))
+DEDUP_BANDS = int(os.environ.get("RECIPE_DEDUP_BANDS", 16))
+DEDUP_ROWS = int(os.environ.get("RECIPE_DEDUP_ROWS", 8))
+SHINGLE_SIZE = 3
+
+
+def recipe_tokens(df: pl.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Hash each recipe's ingredients and word shingles of its steps.
+
+    Returns the (row, token hash) pairs, sorted by row.
+    """
+    ingredients = (
+        df.select(
+            pl.col("ingredients").str.extract_all(r"'[^']*'|\"[^\"]*\"").alias("token")
+        )
+        .with_row_index("row")
+        .explode("token")
+        .drop_nulls("token")
+    )
+    words = (
+        df.select(
+            pl.col("steps")
+            .str.to_lowercase()
+            .str.extract_all(r"[a-z0-9]+")
+            .alias("word")
+        )
+        .with_row_index("row")
+        .explode("word")
+        .drop_nulls("word")
+    )
+
+    # Combine the hashes of SHINGLE_SIZE consecutive words of the same recipe
+    word_rows = words["row"].to_numpy()
+    word_hashes = words["word"].hash(seed=2).to_numpy()
+    n_shingles = max(len(word_hashes) - SHINGLE_SIZE + 1, 0)
+    shingles = word_hashes[:n_shingles].copy()
+    for i in range(1, SHINGLE_SIZE):
+        shingles = (
+            shingles * np.uint64(0x9E3779B97F4A7C15) + word_hashes[i : n_shingles + i]
+        )
+    same_recipe = word_rows[:n_shingles] == word_rows[SHINGLE_SIZE - 1 :]
+
+    rows = np.concatenate(
+        [ingredients["row"].to_numpy(), word_rows[:n_shingles][same_recipe]]
+    )
+    tokens = np.concatenate(
+        [ingredients["token"].hash(seed=1).to_numpy(), shingles[same_recipe]]
+    )
+    order = np.argsort(rows, kind="stable")
+    return rows[order], tokens[order]
+
+
+def minhash_signatures(
+    rows: np.ndarray, tokens: np.ndarray, num_perm: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the MinHash signature of every recipe with tokens.
+
+    Each permutation is a random affine map of the 64-bit token hashes, and
+    the minimum per recipe is taken with one reduceat over the sorted rows.
+    """
+    rng = np.random.default_rng(40404)
+    a = rng.integers(0, 2**64, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**64, num_perm, dtype=np.uint64)
+
+    recipe_rows, starts = np.unique(rows, return_index=True)
+    signatures = np.empty((len(recipe_rows), num_perm), np.uint64)
+    for i in range(num_perm):
+        signatures[:, i] = np.minimum.reduceat(tokens * a[i] + b[i], starts)
+    return recipe_rows, signatures
+
+
+def lsh_duplicate_pairs(
+    signatures: np.ndarray, bands: int, rows: int, threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find pairs of signatures with an estimated similarity above threshold.
+
+    Signatures sharing all values of a band fall in the same bucket. Each
+    bucket member is paired with the bucket's first member only, so the
+    number of candidates stays linear in the number of recipes.
+    """
+    left = []
+    right = []
+    for band in range(bands):
+        band_signatures = signatures[:, band * rows : (band + 1) * rows]
+        keys = band_signatures[:, 0].copy()
+        for i in range(1, rows):
+            keys = keys * np.uint64(0x9E3779B97F4A7C15) + band_signatures[:, i]
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        new_bucket = np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]])
+        bucket_first = order[np.flatnonzero(new_bucket)[np.cumsum(new_bucket) - 1]]
+        in_bucket = bucket_first != order
+        left.append(bucket_first[in_bucket])
+        right.append(order[in_bucket])
+
+    pairs = np.unique(np.stack([np.concatenate(left), np.concatenate(right)]), axis=1)
+
+    # Verify the candidates with the full signatures, in chunks
+    similar = np.zeros(pairs.shape[1], bool)
+    for i in range(0, pairs.shape[1], 100_000):
+        chunk = pairs[:, i : i + 100_000]
+        agreement = (signatures[chunk[0]] == signatures[chunk[1]]).mean(axis=1)
+        similar[i : i + 100_000] = agreement >= threshold
+    return pairs[0, similar], pairs[1, similar]
+
+
+def connected_components(n: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Label each node with the smallest node of its component."""
+    labels = np.arange(n)
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, left, labels[right])
+        np.minimum.at(new_labels, right, labels[left])
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def deduplicate_recipes(
+    df: pl.DataFrame,
+    threshold: float = DEDUP_THRESHOLD,
+    bands: int = DEDUP_BANDS,
+    rows: int = DEDUP_ROWS,
+):
+    """Keep the first recipe of each cluster of near-duplicate recipes."""
+    print("Removing near-duplicate recipes...")
+    start = time.perf_counter()
+
+    token_rows, tokens = recipe_tokens(df)
+    recipe_rows, signatures = minhash_signatures(token_rows, tokens, bands * rows)
+    left, right = lsh_duplicate_pairs(signatures, bands, rows, threshold)
+    labels = connected_components(len(recipe_rows), left, right)
+
+    # Recipes without any tokens are never duplicates
+    keep = np.ones(df.height, bool)
+    keep[recipe_rows] = labels == np.arange(len(recipe_rows))
+    df = df.filter(pl.Series(keep))
+
+    print(
+        f"{len(keep) - keep.sum()} near-duplicate recipes removed "
+        f"in {time.perf_counter() - start:.2f}s."
+    )
+    return df
@@ -0,0 +1,183 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from file_utils import file_version
+from schemas import RECIPES_1, read_dataset
+from tag_categories import category_enums, decode_categories, encode_categories
+
+RECIPE_FILE = Path("data/recipes-1.csv")
+
+# Tag category columns, stored as comma-joined values by 03-recipe_cleaning
+FACETS = [
+    "cuisine",
+    "course",
+    "cooking_method",
+    "dietary_restrictions",
+    "difficulty",
+    "dish",
+    "equipment",
+    "event",
+    "key_ingredient",
+    "season",
+]
+
+
+def store_source_version(store: Path) -> str | None:
+    """Get the version of the CSV a recipe store was built from, if it exists."""
+    if not store.exists():
+        return None
+    with pa.memory_map(str(store)) as source:
+        metadata = ipc.open_file(source).schema.metadata or {}
+    return metadata.get(b"source_version", b"").decode() or None
+
+
+def recipe_store(
+    recipe_file: Path = RECIPE_FILE, schema: pl.Schema = RECIPES_1
+) -> Path:
+    """Get the Arrow IPC copy of the recipe CSV, (re)creating it if stale.
+
+    The store is uncompressed and in one record batch so it can be memory
+    mapped as is. Its metadata records the mtime and size of the CSV it was
+    built from, so any other version of the CSV, even an older one, rebuilds
+    it. It is replaced atomically, processes that still map the old file keep
+    reading it.
+    """
+    store = recipe_file.with_suffix(".arrow")
+    source_version = "-".join(map(str, file_version(recipe_file)))
+    if store_source_version(store) != source_version:
+        # Each process writes its own partial file, concurrent cold starts
+        # then each replace the store with a complete copy
+        with tempfile.NamedTemporaryFile(
+            dir=store.parent, prefix=store.name, suffix=".partial", delete=False
+        ) as f:
+            partial = Path(f.name)
+        try:
+            table = (
+                read_dataset(recipe_file, schema)
+                .rechunk()
+                .to_arrow(compat_level=pl.CompatLevel.newest())
+                .replace_schema_metadata({"source_version": source_version})
+            )
+            with ipc.new_file(str(partial), table.schema) as writer:
+                writer.write_table(table)
+            partial.replace(store)
+        finally:
+            partial.unlink(missing_ok=True)
+    return store
+
+
+def open_recipe_store(store: Path) -> pa.Table:
+    """Memory-map a recipe store, its columns are views of the file's pages.
+
+    The pages are read on first access and shared in the page cache by every
+    process that opens the store, rather than copied into each one.
+    """
+    return ipc.open_file(pa.memory_map(str(store))).read_all()
+
+
+def load_recipes(
+    recipe_file: Path = RECIPE_FILE, schema: pl.Schema = RECIPES_1
+) -> pl.DataFrame:
+    """Load the recipes as zero-copy views of the memory-mapped recipe store."""
+    return pl.from_arrow(
+        open_recipe_store(recipe_store(recipe_file, schema)), rechunk=False
+    )
+
+
+def load_recipes_pandas(recipe_file: Path = RECIPE_FILE, schema: pl.Schema = RECIPES_1):
+    """Load the recipes as a pandas DataFrame of zero-copy Arrow-backed columns."""
+    import pandas as pd
+
+    return open_recipe_store(recipe_store(recipe_file, schema)).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
+
+
+def build_facet_index(
+    recipes: pl.DataFrame, facets: list[str] = FACETS
+) -> dict[str, int | dict[str, dict[str, np.ndarray]]]:
+    """Encode every facet value as a bit-packed bitmap over the recipe rows.
+
+    `index["facets"][facet]["bitmap"][i]` has bit `row` set (NumPy packbits
+    order) if recipe `row` has the facet value `index["facets"][facet]["values"][i]`.
+    """
+    n_recipes = recipes.height
+    index = {"n_recipes": n_recipes, "facets": {}}
+
+    for facet in facets:
+        if facet not in recipes.columns:
+            continue
+
+        exploded = (
+            recipes.select(pl.col(facet).str.split(","))
+            .with_row_index("row")
+            .explode(facet)
+            .drop_nulls(facet)
+        )
+        values = exploded.select(pl.col(facet).unique().sort()).to_series()
+        rows = exploded["row"].to_numpy().astype(np.int64)
+        value_ids = (
+            exploded.select(pl.col(facet).cast(pl.Enum(values)).to_physical())
+            .to_series()
+            .to_numpy()
+            .astype(np.int64)
+        )
+
+        bitmap = np.zeros((len(values), (n_recipes + 7) // 8), np.uint8)
+        np.bitwise_or.at(
+            bitmap, (value_ids, rows >> 3), (128 >> (rows & 7)).astype(np.uint8)
+        )
+        index["facets"][facet] = {
+            "values": values.to_numpy().astype(str),
+            "bitmap": bitmap,
+        }
+
+    return index
+
+
+def facet_mask(
+    index: dict, facet: str, values: set[str], match: str = "any"
+) -> np.ndarray:
+    """Get the packed mask of recipes with any (OR) or all (AND) of the values."""
+    facet_index = index["facets"][facet]
+    selected = np.isin(facet_index["values"], list(values))
+    bitmaps = facet_index["bitmap"][selected]
+
+    if match == "any":
+        return np.bitwise_or.reduce(bitmaps, axis=0, initial=0)
+    if match == "all":
+        if selected.sum() < len(values):
+            # A value no recipe has can never be matched
+            return np.zeros(bitmaps.shape[1], np.uint8)
+        return np.bitwise_and.reduce(bitmaps, axis=0, initial=255)
+    raise ValueError(f"Invalid match: {match}")
+
+
+def query_recipes(
+    index: dict, selections: dict[str, set[str]], match: str = "any"
+) -> np.ndarray:
+    """Get the rows of recipes matching every facet selection.
+
+    Facets are combined with AND, the values within a facet with `match`.
+    Facets with no selected values do not filter the recipes.
+    """
+    mask = np.full((index["n_recipes"] + 7) // 8, 255, np.uint8)
+    for facet, values in selections.items():
+        if values:
+            mask &= facet_mask(index, facet, values, match)
+    return np.flatnonzero(np.unpackbits(mask, count=index["n_recipes"]))
+
+
+def filter_recipes(
+    recipes: pl.DataFrame,
+    index: dict,
+    selections: dict[str, set[str]],
+    match: str = "any",
+) -> pl.DataFrame:
+    """Get the recipes matching every facet selection."""
+    return recipes[query_recipes(index, selections, match)]
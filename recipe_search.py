@@ -0,0 +1,123 @@
+import argparse
+import re
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+
+from schemas import INGREDIENT_RECIPE_2, RECIPES_2, read_dataset
+
+RECIPES_CSV = Path("data/recipes-2.csv")
+INGREDIENT_RECIPE_CSV = Path("data/ingredient-recipe-2.csv")
+
+SEARCH_TABLE = "recipe_search"
+# unicode61 folds case and accents ("crème" matches "creme") and porter
+# stems plurals and verb forms ("tomatoes", "chopped")
+SEARCH_TOKENIZER = "porter unicode61 remove_diacritics 2"
+# Indexed columns and their bm25 weights, a hit in the name counts most
+SEARCH_COLUMNS = {"name": 10.0, "ingredients": 5.0, "description": 2.0, "steps": 1.0}
+
+
+def search_table_ddl(table: str = SEARCH_TABLE) -> str:
+    """The FTS5 table of recipe text, keyed by rowid = recipe id.
+
+    The table is contentless, the text stays in the recipes table. Prefix
+    indexes make search-as-you-type queries on 2 and 3 letters fast.
+    """
+    return (
+        f"CREATE VIRTUAL TABLE {table} USING fts5("
+        f"{', '.join(SEARCH_COLUMNS)}, content='', "
+        f"tokenize='{SEARCH_TOKENIZER}', prefix='2 3');"
+    )
+
+
+def get_search_table(
+    recipes: pl.DataFrame, recipe_ingredients: pl.DataFrame
+) -> pl.DataFrame:
+    """Get the rows of the search table, with all ingredient labels of a recipe."""
+    labels = recipe_ingredients.group_by("recipe_id").agg(
+        pl.col("label").str.join(" ; ").alias("ingredients")
+    )
+    return (
+        recipes.select("id", "name", "description", "steps")
+        .join(
+            labels,
+            left_on="id",
+            right_on="recipe_id",
+            how="left",
+            maintain_order="left",
+        )
+        .select(pl.col("id").alias("rowid"), *SEARCH_COLUMNS)
+    )
+
+
+def match_query(text: str) -> str:
+    """Turn search box text into an FTS5 query matching all of its words.
+
+    The last word is matched as a prefix, as it may still be being typed.
+    """
+    words = [f'"{word}"' for word in re.findall(r"\w+", text.lower())]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def search_recipes(
+    connection: sqlite3.Connection,
+    text: str,
+    limit: int = 20,
+    table: str = SEARCH_TABLE,
+) -> list[tuple[int, float]]:
+    """Get the (recipe id, score) of the best matches, best first."""
+    query = match_query(text)
+    if not query:
+        return []
+    weights = ", ".join(str(weight) for weight in SEARCH_COLUMNS.values())
+    return connection.execute(
+        f"SELECT rowid, bm25({table}, {weights}) AS score FROM {table} "
+        f"WHERE {table} MATCH ? ORDER BY score LIMIT ?",
+        (query, limit),
+    ).fetchall()
+
+
+def build_search_index(
+    connection: sqlite3.Connection,
+    search_table: pl.DataFrame,
+    table: str = SEARCH_TABLE,
+):
+    """Create and fill the search table, then merge its index segments."""
+    connection.execute(search_table_ddl(table))
+    connection.executemany(
+        f"INSERT INTO {table} (rowid, {', '.join(SEARCH_COLUMNS)}) "
+        f"VALUES (?{', ?' * len(SEARCH_COLUMNS)})",
+        search_table.iter_rows(),
+    )
+    connection.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+    connection.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search the cleaned recipes.")
+    parser.add_argument("text")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    recipes = read_dataset(
+        RECIPES_CSV, RECIPES_2, ["id", "name", "description", "steps"]
+    )
+    connection = sqlite3.connect(":memory:")
+    recipe_ingredients = read_dataset(
+        INGREDIENT_RECIPE_CSV, INGREDIENT_RECIPE_2, ["recipe_id", "label"]
+    )
+    build_search_index(connection, get_search_table(recipes, recipe_ingredients))
+
+    matches = pl.DataFrame(
+        search_recipes(connection, args.text, args.limit),
+        schema={"id": pl.Int64, "score": pl.Float64},
+        orient="row",
+    )
+    print(
+        matches.join(recipes, on="id", maintain_order="left").select(
+            "id", "name", "score"
+        )
+    )
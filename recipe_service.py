@@ -0,0 +1,220 @@
+import argparse
+import functools
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import polars as pl
+
+from recipe_query import FACETS, build_facet_index, load_recipes, query_recipes
+from schemas import RECIPES_2
+
+RECIPES_CSV = Path("data/recipes-2.csv")
+PORT = 8502
+
+# Columns that can be filtered by range (min_<column>, max_<column>) and sorted by
+RANGE_COLUMNS = ["cost", "minutes", "calories", "n_ingredients"]
+SORT_COLUMNS = [*RANGE_COLUMNS, "name", "id"]
+RESULT_COLUMNS = ["id", "name", "minutes", "n_ingredients", "calories", "cost"]
+
+PER_PAGE = 20
+MAX_PER_PAGE = 100
+CACHE_SIZE = 4096
+
+
+class QueryError(ValueError):
+    """Raised for query parameters the service does not understand."""
+
+
+class RecipeService:
+    """Answers recipe queries over the cleaned recipes, caching the responses.
+
+    Responses are kept in an LRU cache keyed by the normalized query, so the
+    same query written differently (parameter order, case, repeated values)
+    is answered once.
+    """
+
+    def __init__(self, recipe_file: Path = RECIPES_CSV, cache_size: int = CACHE_SIZE):
+        self.recipes = load_recipes(recipe_file, RECIPES_2)
+        self.index = build_facet_index(self.recipes, FACETS)
+        self.respond = functools.lru_cache(maxsize=cache_size)(self._respond)
+
+    def normalize_query(self, params: dict[str, list[str]]) -> str:
+        """Get the canonical JSON of the query string parameters."""
+        query = {"facets": {}, "ranges": {}}
+        for name, values in params.items():
+            if name in self.index["facets"]:
+                selected = {
+                    value.strip().lower()
+                    for item in values
+                    for value in item.split(",")
+                    if value.strip()
+                }
+                if selected:
+                    query["facets"][name] = sorted(selected)
+            elif name[4:] in RANGE_COLUMNS and name[:4] in ["min_", "max_"]:
+                try:
+                    query["ranges"][name] = float(values[-1])
+                except ValueError:
+                    raise QueryError(f"{name} is not a number: {values[-1]}") from None
+            elif name not in ["match", "sort", "page", "per_page"]:
+                raise QueryError(f"Unknown parameter: {name}")
+
+        query["match"] = params.get("match", ["any"])[-1]
+        if query["match"] not in ["any", "all"]:
+            raise QueryError(f"match must be any or all, not {query['match']}")
+        query["sort"] = params.get("sort", ["id"])[-1]
+        if query["sort"].lstrip("-") not in SORT_COLUMNS:
+            raise QueryError(f"sort must be one of {SORT_COLUMNS}, optionally with -")
+        try:
+            query["page"] = max(int(params.get("page", [1])[-1]), 1)
+            query["per_page"] = min(
+                max(int(params.get("per_page", [PER_PAGE])[-1]), 1), MAX_PER_PAGE
+            )
+        except ValueError:
+            raise QueryError("page and per_page must be integers") from None
+        return json.dumps(query, sort_keys=True)
+
+    def _respond(self, key: str) -> tuple[bytes, str]:
+        """Run a normalized query, returning the JSON body and its ETag."""
+        query = json.loads(key)
+        rows = query_recipes(
+            self.index,
+            {facet: set(values) for facet, values in query["facets"].items()},
+            query["match"],
+        )
+        recipes = self.recipes[rows]
+        for name, bound in query["ranges"].items():
+            column = pl.col(name[4:])
+            recipes = recipes.filter(
+                column >= bound if name.startswith("min_") else column <= bound
+            )
+
+        column = query["sort"].lstrip("-")
+        descending = query["sort"].startswith("-")
+        page = (
+            recipes.sort(
+                [column, "id"], descending=[descending, False], nulls_last=True
+            )
+            .slice((query["page"] - 1) * query["per_page"], query["per_page"])
+            .select(*RESULT_COLUMNS, *self.index["facets"])
+        )
+
+        body = json.dumps(
+            {
+                "total": recipes.height,
+                "page": query["page"],
+                "per_page": query["per_page"],
+                "recipes": page.to_dicts(),
+            }
+        ).encode()
+        return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def query(self, params: dict[str, list[str]]) -> tuple[bytes, str]:
+        """Answer a query given as parsed query string parameters."""
+        return self.respond(self.normalize_query(params))
+
+    def facets(self) -> dict[str, list[str]]:
+        """Get the values of every facet that can be filtered on."""
+        return {
+            facet: facet_index["values"].tolist()
+            for facet, facet_index in self.index["facets"].items()
+        }
+
+    def warm_up(self):
+        """Answer the first page of every single facet value, and of no filter."""
+        start = time.perf_counter()
+        queries = [{}] + [
+            {facet: [value]}
+            for facet, values in self.facets().items()
+            for value in values
+        ]
+        for params in queries:
+            self.query(params)
+        print(
+            f"{len(queries)} queries warmed up in {time.perf_counter() - start:.2f}s."
+        )
+
+
+def serve_recipes(
+    service: RecipeService, host: str = "127.0.0.1", port: int = PORT
+) -> ThreadingHTTPServer:
+    """Serve the recipe queries as JSON over HTTP, in a thread.
+
+    GET /recipes?cuisine=italian&max_cost=20&sort=-calories&page=2 returns a
+    page of recipes, GET /facets the facet values and GET /health the cache
+    statistics. Responses carry an ETag and If-None-Match is answered with 304.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        # Keep connections open between requests
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                if url.path == "/recipes":
+                    body, etag = service.query(parse_qs(url.query))
+                elif url.path == "/facets":
+                    body, etag = json.dumps(service.facets()).encode(), None
+                elif url.path == "/health":
+                    body = json.dumps(service.respond.cache_info()._asdict()).encode()
+                    etag = None
+                else:
+                    return self.send_json(404, {"error": f"Not found: {url.path}"})
+            except QueryError as e:
+                return self.send_json(400, {"error": str(e)})
+
+            if etag is not None and etag in self.headers.get("If-None-Match", ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_json(200, body, etag)
+
+        def send_json(self, status: int, body: bytes | dict, etag: str | None = None):
+            if isinstance(body, dict):
+                body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag is not None:
+                self.send_header("ETag", etag)
+                # Clients may keep the response, but must revalidate it
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve recipe queries over the cleaned recipes as JSON."
+    )
+    parser.add_argument("--recipes", type=Path, default=RECIPES_CSV)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE)
+    parser.add_argument("--no-warm-up", action="store_true")
+    args = parser.parse_args()
+
+    service = RecipeService(args.recipes, args.cache_size)
+    if not args.no_warm_up:
+        service.warm_up()
+    server = serve_recipes(service, args.host, args.port)
+    print(f"Serving {service.recipes.height} recipes on http://{args.host}:{args.port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
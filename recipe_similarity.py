@@ -0,0 +1,229 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import scipy.sparse as sp
+
+from file_utils import file_hash
+from schemas import INGREDIENT_RECIPE_2, INGREDIENTS_2, read_dataset
+
+INGREDIENT_RECIPE_CSV = Path("data/ingredient-recipe-2.csv")
+INGREDIENTS_CSV = Path("data/ingredients-2.csv")
+SIMILARITY_INDEX_FILE = Path("data/recipe-similarity.npz")
+
+# Neighbours kept per recipe, recipes compared with all others at a time and
+# recipes sampled to bound the similarity of each recipe's kth neighbour
+N_NEIGHBORS = 20
+BLOCK_SIZE = 512
+SAMPLE_SIZE = 4096
+
+
+def recipe_ingredient_matrix(
+    ingredient_recipe_file: Path, ingredients_file: Path
+) -> tuple[sp.csr_array, np.ndarray, np.ndarray]:
+    """Get the recipe x ingredient matrix with a 1 where a recipe uses an ingredient.
+
+    Returns the matrix, the recipe id of each row and the ingredient name of
+    each column (ingredient ids are column numbers).
+    """
+    ingredients = read_dataset(ingredients_file, INGREDIENTS_2)
+    names = np.full(ingredients["id"].max() + 1, "", dtype=object)
+    names[ingredients["id"].to_numpy()] = ingredients["name"].to_numpy()
+
+    pairs = read_dataset(
+        ingredient_recipe_file, INGREDIENT_RECIPE_2, ["recipe_id", "ingredient_id"]
+    ).unique()
+    recipe_ids, rows = np.unique(pairs["recipe_id"].to_numpy(), return_inverse=True)
+    matrix = sp.csr_array(
+        (
+            np.ones(pairs.height, np.float32),
+            (rows.astype(np.int32), pairs["ingredient_id"].to_numpy().astype(np.int32)),
+        ),
+        shape=(len(recipe_ids), len(names)),
+    )
+    return matrix, recipe_ids, names.astype(str)
+
+
+def tfidf_weights(matrix: sp.csr_array) -> tuple[sp.csr_array, np.ndarray]:
+    """Weight each ingredient by its smoothed inverse document frequency.
+
+    Rows are scaled to unit length, so the dot product of two rows is their
+    cosine similarity. Rare ingredients count more than salt or water.
+    """
+    n_recipes = matrix.shape[0]
+    counts = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = (np.log((1 + n_recipes) / (1 + counts)) + 1).astype(np.float32)
+
+    weights = matrix @ sp.diags_array(idf)
+    norms = np.sqrt((weights**2).sum(axis=1))
+    norms[norms == 0] = 1
+    weights = sp.diags_array(1 / norms).astype(np.float32) @ weights
+    return sp.csr_array(weights, dtype=np.float32), idf
+
+
+def nearest_neighbors(
+    weights: sp.csr_array,
+    k: int = N_NEIGHBORS,
+    block_size: int = BLOCK_SIZE,
+    sample_size: int = SAMPLE_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the k most similar rows of every row, most similar first.
+
+    The similarities of a block of rows with every row are one sparse matrix
+    product. Each row's (k+1)th best similarity to a random sample of rows is
+    a lower bound of its kth best neighbour's, so only the similarities above
+    it are ranked. Returns the neighbouring rows and their cosine
+    similarities, padded with row -1 for recipes sharing ingredients with
+    fewer than k others.
+    """
+    n_recipes = weights.shape[0]
+    k = min(k, n_recipes - 1)
+    neighbors = np.full((n_recipes, max(k, 0)), -1, np.int32)
+    scores = np.zeros((n_recipes, max(k, 0)), np.float32)
+    if k <= 0:
+        return neighbors, scores
+
+    transposed = weights.T.tocsr()
+    rng = np.random.default_rng(40404)
+    sample_rows = rng.choice(n_recipes, min(sample_size, n_recipes), replace=False)
+    sample = weights[np.sort(sample_rows)].T.tocsr()
+
+    for start in range(0, n_recipes, block_size):
+        block = weights[start : min(start + block_size, n_recipes)]
+        bounds = np.partition((block @ sample).toarray(), -k - 1, axis=1)[:, -k - 1]
+
+        similarity = block @ transposed
+        rows = np.repeat(
+            np.arange(block.shape[0], dtype=np.int32), np.diff(similarity.indptr)
+        )
+        columns, values = similarity.indices, similarity.data
+        # A recipe is not its own neighbour
+        keep = (values >= bounds[rows]) & (columns != rows + start)
+        rows, columns, values = rows[keep], columns[keep], values[keep]
+
+        # Best first in each row
+        order = np.argsort(-values, kind="stable")
+        order = order[np.argsort(rows[order], kind="stable")]
+        rows, columns, values = rows[order], columns[order], values[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        top = rank < k
+        neighbors[rows[top] + start, rank[top]] = columns[top]
+        scores[rows[top] + start, rank[top]] = values[top]
+    return neighbors, scores
+
+
+def build_similarity_index(
+    ingredient_recipe_file: Path = INGREDIENT_RECIPE_CSV,
+    ingredients_file: Path = INGREDIENTS_CSV,
+    k: int = N_NEIGHBORS,
+) -> dict[str, np.ndarray | str]:
+    """Build the TF-IDF recipe vectors and the k nearest neighbours of each recipe.
+
+    `neighbors[i]` are the rows of the recipes most similar to recipe
+    `recipe_ids[i]` and `scores[i]` their cosine similarities. The vectors are
+    kept as the CSR arrays (`indptr`, `indices`, `data`) to score queries.
+    """
+    matrix, recipe_ids, ingredients = recipe_ingredient_matrix(
+        ingredient_recipe_file, ingredients_file
+    )
+    weights, idf = tfidf_weights(matrix)
+    neighbors, scores = nearest_neighbors(weights, k)
+    return {
+        "recipe_ids": recipe_ids,
+        "ingredients": ingredients,
+        "idf": idf,
+        "indptr": weights.indptr,
+        "indices": weights.indices,
+        "data": weights.data,
+        "neighbors": neighbors,
+        "scores": scores,
+        "source_hash": file_hash(ingredient_recipe_file),
+    }
+
+
+def save_similarity_index(index: dict[str, np.ndarray | str], file: Path):
+    """Save the similarity index as an uncompressed .npz file."""
+    np.savez(file, **index)
+
+
+def load_similarity_index(
+    ingredient_recipe_file: Path = INGREDIENT_RECIPE_CSV,
+    ingredients_file: Path = INGREDIENTS_CSV,
+    index_file: Path = SIMILARITY_INDEX_FILE,
+) -> dict[str, np.ndarray | str | sp.csr_array]:
+    """Load the similarity index, rebuilding it if the recipe ingredients changed."""
+    source_hash = file_hash(ingredient_recipe_file)
+    index = None
+    if index_file.exists():
+        with np.load(index_file) as saved:
+            index = {key: saved[key] for key in saved.files}
+        index["source_hash"] = str(index["source_hash"])
+
+    if index is None or index["source_hash"] != source_hash:
+        print(f"Building similarity index for {ingredient_recipe_file}...")
+        index = build_similarity_index(ingredient_recipe_file, ingredients_file)
+        save_similarity_index(index, index_file)
+
+    index["weights"] = sp.csr_array(
+        (index["data"], index["indices"], index["indptr"]),
+        shape=(len(index["recipe_ids"]), len(index["ingredients"])),
+    )
+    return index
+
+
+def similar_recipes(
+    index: dict[str, np.ndarray | sp.csr_array], recipe_id: int, k: int = 10
+) -> pl.DataFrame:
+    """Get the (recipe id, score) of the recipes most like a recipe, best first."""
+    row = np.searchsorted(index["recipe_ids"], recipe_id)
+    if row == len(index["recipe_ids"]) or index["recipe_ids"][row] != recipe_id:
+        raise KeyError(f"Recipe {recipe_id} is not in the similarity index")
+    neighbors = index["neighbors"][row, :k]
+    found = neighbors >= 0
+    return pl.DataFrame(
+        {
+            "id": index["recipe_ids"][neighbors[found]],
+            "score": index["scores"][row, :k][found],
+        }
+    )
+
+
+def score_ingredients(
+    index: dict[str, np.ndarray | sp.csr_array], ingredients: list[str], k: int = 10
+) -> pl.DataFrame:
+    """Get the (recipe id, score) of the recipes best matching a set of ingredients.
+
+    The ingredients are weighted like a recipe's and compared with every
+    recipe, e.g. to use up what is in the fridge. Unknown names are ignored.
+    """
+    wanted = {name.strip().lower() for name in ingredients}
+    columns = np.flatnonzero(np.isin(index["ingredients"], list(wanted)))
+    query = np.zeros(len(index["ingredients"]), np.float32)
+    query[columns] = index["idf"][columns]
+    norm = np.linalg.norm(query)
+    if norm == 0:
+        return pl.DataFrame(schema={"id": pl.Int64, "score": pl.Float32})
+
+    scores = index["weights"] @ (query / norm)
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return pl.DataFrame({"id": index["recipe_ids"][top], "score": scores[top]})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Find recipes similar to a recipe or to a set of ingredients."
+    )
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--recipe", type=int, help="Recipe id")
+    group.add_argument("--ingredients", nargs="+", help="e.g. garlic chicken lemon")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    index = load_similarity_index()
+    if args.recipe is not None:
+        print(similar_recipes(index, args.recipe, args.limit))
+    else:
+        print(score_ingredients(index, args.ingredients, args.limit))
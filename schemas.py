@@ -0,0 +1,135 @@
+import csv
+from pathlib import Path
+
+import polars as pl
+
+# Column types of every CSV the pipeline reads, in file column order
+RAW_RECIPES = pl.Schema(
+    {
+        "name": pl.String,
+        "id": pl.Int64,
+        "minutes": pl.Int64,
+        "contributor_id": pl.Int64,
+        "submitted": pl.String,
+        "tags": pl.String,
+        "nutrition": pl.String,
+        "n_steps": pl.Int64,
+        "steps": pl.String,
+        "description": pl.String,
+        "ingredients": pl.String,
+        "n_ingredients": pl.Int64,
+    }
+)
+
+# Written by 03-recipe_cleaning. The tag category columns are the categories of
+# data/tags.yaml, so files may have other ones, read as strings (see file_schema)
+RECIPES_1 = pl.Schema(
+    {
+        "name": pl.String,
+        "id": pl.Int64,
+        "minutes": pl.Int64,
+        "n_steps": pl.Int64,
+        "steps": pl.String,
+        "description": pl.String,
+        "ingredients": pl.String,
+        "n_ingredients": pl.Int64,
+        "cuisine": pl.String,
+        "course": pl.String,
+        "cooking_method": pl.String,
+        "dietary_restrictions": pl.String,
+        "difficulty": pl.String,
+        "dish": pl.String,
+        "equipment": pl.String,
+        "event": pl.String,
+        "key_ingredient": pl.String,
+        "season": pl.String,
+        "calories": pl.Float64,
+        "total_fat_pdv": pl.Float64,
+        "sugar_pdv": pl.Float64,
+        "sodium_pdv": pl.Float64,
+        "protein_pdv": pl.Float64,
+        "saturated_fat_pdv": pl.Float64,
+        "carbohydrate_pdv": pl.Float64,
+    }
+)
+
+# Written by 04-scrape_ingredients, the ingredients are a JSON label -> quantity
+INGREDIENTS_1 = pl.Schema(
+    {
+        "name": pl.String,
+        "id": pl.Int64,
+        "link": pl.String,
+        "ingredients": pl.String,
+    }
+)
+
+# Written by 05-match-ingredient-prices
+RECIPES_2 = pl.Schema({**RECIPES_1, "cost": pl.Float64})
+INGREDIENTS_2 = pl.Schema({"id": pl.Int64, "name": pl.String})
+INGREDIENT_RECIPE_2 = pl.Schema(
+    {
+        "recipe_id": pl.Int64,
+        "ingredient_id": pl.Int64,
+        "label": pl.String,
+        "quantity": pl.Float64,
+        "unit": pl.String,
+    }
+)
+
+# The ingredient is a "|"-separated list of aliases, quoted by quote_alias
+INGREDIENT_PRICELIST = pl.Schema(
+    {
+        "ingredient": pl.String,
+        "price": pl.Float64,
+        "quantity": pl.Float64,
+        "unit": pl.String,
+    }
+)
+# A pricelist per store, in any column order
+STORE_PRICELIST = pl.Schema({**INGREDIENT_PRICELIST, "store": pl.String})
+
+SCHEMAS = {
+    "RAW_recipes.csv": RAW_RECIPES,
+    "recipes-1.csv": RECIPES_1,
+    "recipes-2.csv": RECIPES_2,
+    "ingredients-1.csv": INGREDIENTS_1,
+    "ingredients-2.csv": INGREDIENTS_2,
+    "ingredient-recipe-2.csv": INGREDIENT_RECIPE_2,
+    "ingredient-pricelist.csv": INGREDIENT_PRICELIST,
+}
+
+
+def file_schema(file: Path, schema: pl.Schema) -> pl.Schema:
+    """Get the column types of a CSV file from its header and declared schema.
+
+    Columns the schema does not declare, such as a tag category added to
+    tags.yaml, are comma-joined strings. Declared columns the file lacks are
+    left out, so only the columns actually used must be present.
+    """
+    with file.open(newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    return pl.Schema({column: schema.get(column, pl.String) for column in header})
+
+
+def scan_dataset(
+    file: Path, schema: pl.Schema, columns: list[str] | None = None
+) -> pl.LazyFrame:
+    """Scan a CSV file with its declared schema, keeping only `columns`.
+
+    No types are inferred, and the columns that are not selected are skipped
+    by the CSV reader rather than parsed.
+    """
+    frame = pl.scan_csv(file, schema=file_schema(file, schema))
+    return frame if columns is None else frame.select(columns)
+
+
+def read_dataset(
+    file: Path, schema: pl.Schema, columns: list[str] | None = None
+) -> pl.DataFrame:
+    """Read a CSV file with its declared schema, keeping only `columns`."""
+    return scan_dataset(file, schema, columns).collect()
+
+
+def quote_alias(expr: pl.Expr) -> pl.Expr:
+    """Quote aliases with a comma, as the pricelist does, e.g. 'limes, juice of'."""
+    return pl.when(expr.str.contains(",")).then("'" + expr + "'").otherwise(expr)
@@ -0,0 +1,184 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from schemas import SCHEMAS, read_dataset
+
+REPO_DIR = Path(__file__).resolve().parent
+SHARDS_DIR = Path("data/shards")
+
+# Set to "i/N" to run a per-recipe stage on shard i of N, e.g. "0/4"
+SHARD_ENV = "PIPELINE_SHARD"
+
+# The per-recipe stages, 99-generate_sql_seed.py --shards N merges their outputs
+SHARD_STAGES = {
+    "03": "03-recipe_cleaning.py",
+    "04": "04-scrape_ingredients.py",
+    "05": "05-match-ingredient-prices.py",
+}
+
+
+def current_shard() -> tuple[int, int] | None:
+    """Get the (shard, number of shards) this process works on, if sharded."""
+    value = os.environ.get(SHARD_ENV)
+    if not value:
+        return None
+    shard, n_shards = (int(x) for x in value.split("/"))
+    if not 0 <= shard < n_shards:
+        raise ValueError(f"{SHARD_ENV}={value} is not one of {n_shards} shards")
+    return shard, n_shards
+
+
+def shard_dir(shard: int, n_shards: int) -> Path:
+    return SHARDS_DIR / f"{shard}-of-{n_shards}"
+
+
+def shard_path(file: Path) -> Path:
+    """Get the current shard's copy of a per-recipe file, or the file itself."""
+    shard = current_shard()
+    return file if shard is None else shard_dir(*shard) / file.name
+
+
+def shard_files(file: Path, n_shards: int) -> list[Path]:
+    """Get every shard's copy of a per-recipe file."""
+    return [shard_dir(shard, n_shards) / file.name for shard in range(n_shards)]
+
+
+def shard_of(ids: np.ndarray, n_shards: int) -> np.ndarray:
+    """Get the shard of each recipe id, its splitmix64 hash modulo n_shards.
+
+    Unlike Python's and Polars' hashes this is the same on every machine.
+    """
+    x = np.asarray(ids, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return (x % np.uint64(n_shards)).astype(np.int64)
+
+
+def filter_shard(df: pl.DataFrame, id_column: str = "id") -> pl.DataFrame:
+    """Keep the rows of the current shard's recipes, or every row if unsharded."""
+    shard = current_shard()
+    if shard is None:
+        return df
+    in_shard = shard_of(df[id_column].to_numpy(), shard[1]) == shard[0]
+    return df.filter(pl.Series(in_shard))
+
+
+def read_shards(
+    file: Path, schema: pl.Schema, n_shards: int, columns: list[str] | None = None
+) -> pl.DataFrame:
+    """Read and concatenate every shard's copy of a per-recipe file."""
+    return pl.concat(
+        [read_dataset(path, schema, columns) for path in shard_files(file, n_shards)]
+    )
+
+
+def split_file(file: Path, n_shards: int, id_column: str = "id"):
+    """Partition an unsharded per-recipe CSV into the shard directories.
+
+    Saves re-running a stage for every shard, e.g. re-scraping ingredients.
+    """
+    df = read_dataset(file, SCHEMAS[file.name])
+    shards = shard_of(df[id_column].to_numpy(), n_shards)
+    for shard, path in enumerate(shard_files(file, n_shards)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.filter(pl.Series(shards == shard)).write_csv(path)
+    print(f"{file} split into {n_shards} shards.")
+
+
+def run_shard(
+    shard: int, n_shards: int, stages: list[str], threads: int
+) -> dict[str, float | int]:
+    """Run the stages on one shard in order, in fresh processes."""
+    directory = shard_dir(shard, n_shards)
+    directory.mkdir(parents=True, exist_ok=True)
+    env = {
+        **os.environ,
+        SHARD_ENV: f"{shard}/{n_shards}",
+        # Share the cores between the local workers
+        "POLARS_MAX_THREADS": str(threads),
+    }
+
+    result = {"shard": shard}
+    for stage in stages:
+        start = time.perf_counter()
+        with (directory / f"{stage}.log").open("w") as log:
+            process = subprocess.run(
+                [sys.executable, str(REPO_DIR / SHARD_STAGES[stage])],
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        result[stage] = round(time.perf_counter() - start, 3)
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Stage {stage} failed on shard {shard}, see {directory / stage}.log"
+            )
+        print(f"Shard {shard}/{n_shards}: stage {stage} done in {result[stage]}s")
+    return result
+
+
+def run_shards(
+    n_shards: int,
+    stages: list[str],
+    workers: int,
+    shards: list[int] | None = None,
+) -> pl.DataFrame:
+    """Run the stages on every shard (or the given ones) with local workers.
+
+    Other machines sharing the filesystem can run the other shards.
+    """
+    shards = list(range(n_shards)) if shards is None else shards
+    workers = min(workers, len(shards))
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    with ThreadPoolExecutor(workers) as executor:
+        results = list(
+            executor.map(
+                lambda shard: run_shard(shard, n_shards, stages, threads), shards
+            )
+        )
+    return pl.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run stages 03-05 on hash partitions of the recipes."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the stages on shards")
+    run_parser.add_argument("--shards", type=int, required=True)
+    run_parser.add_argument(
+        "--stages", nargs="+", choices=SHARD_STAGES, default=list(SHARD_STAGES)
+    )
+    run_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    run_parser.add_argument(
+        "--only", type=int, nargs="+", help="Run only these shards, e.g. on one machine"
+    )
+
+    split_parser = subparsers.add_parser(
+        "split", help="Partition an existing per-recipe CSV into shards"
+    )
+    split_parser.add_argument("file", type=Path)
+    split_parser.add_argument("--shards", type=int, required=True)
+    split_parser.add_argument("--id-column", default="id")
+    args = parser.parse_args()
+
+    if args.command == "split":
+        split_file(args.file, args.shards, args.id_column)
+    else:
+        start = time.perf_counter()
+        results = run_shards(args.shards, args.stages, args.workers, args.only)
+        print(results)
+        print(
+            f"{results.height} shards done in {time.perf_counter() - start:.1f}s. "
+            f"Merge them with: python pipeline.py seed --shards {args.shards}"
+        )
@@ -0,0 +1,164 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pint
+import polars as pl
+import scipy.sparse as sp
+
+from schemas import STORE_PRICELIST
+from units import get_unit_registry, parse_quantity
+
+# Saved by 05-match-ingredient-prices.py
+COST_INDEX_FILE = Path("data/recipe-cost-index.npz")
+STORE_PRICES_CSV = Path("data/store-pricelist.csv")
+OUTPUT_STORE_COSTS_CSV = Path("data/recipe-store-costs.csv")
+
+
+def load_unit_matrix(
+    cost_index_file: Path = COST_INDEX_FILE,
+) -> tuple[sp.csr_array, np.ndarray, dict[str, np.ndarray]]:
+    """Load the recipe x product matrix of product units used by each recipe.
+
+    The units are relative to the package size of the product in the
+    pricelist stage 05 was run with, so `units @ prices` costs every recipe.
+    Returns the matrix, the recipe id of each row and the product name, base
+    package size and base price of each column.
+    """
+    with np.load(cost_index_file) as cost_index:
+        recipe_ids = cost_index["recipe_ids"]
+        products = {
+            "name": cost_index["products"],
+            "quantity": cost_index["product_quantities"],
+            "price": cost_index["product_prices"],
+        }
+        product_ids = (
+            pl.Series(cost_index["names"])
+            .cast(pl.Enum(products["name"]))
+            .to_physical()
+            .to_numpy()
+        )
+        # Repeated (recipe, product) entries are summed
+        units = sp.csr_array(
+            (cost_index["units"], (cost_index["rows"], product_ids)),
+            shape=(len(recipe_ids), len(products["name"])),
+        )
+    return units, recipe_ids, products
+
+
+def package_ratios(quantities: pl.DataFrame) -> pl.DataFrame:
+    """Add how many store packages make up each base package.
+
+    `quantities` has `base_quantity` and `store_quantity` strings. The ratio
+    is NaN where their units are not compatible, e.g. a store selling by
+    weight what the base pricelist sells by the piece.
+    """
+    ureg = get_unit_registry()
+    pairs = quantities.select("base_quantity", "store_quantity").unique()
+
+    ratios = []
+    for base, store in pairs.iter_rows():
+        try:
+            ratio = (
+                parse_quantity(base, ureg) / parse_quantity(store, ureg)
+            ).to_reduced_units()
+            ratios.append(ratio.magnitude if ratio.dimensionless else np.nan)
+        except pint.errors.PintError:
+            ratios.append(np.nan)
+
+    return quantities.join(
+        pairs.with_columns(pl.Series("ratio", ratios, pl.Float64)),
+        on=["base_quantity", "store_quantity"],
+        how="left",
+    )
+
+
+def price_matrix(
+    store_prices: pl.DataFrame, products: dict[str, np.ndarray], fill_missing=True
+) -> tuple[np.ndarray, np.ndarray]:
+    """Arrange a pricelist with a `store` column as a product x store matrix.
+
+    `store_prices` has the columns of ingredient-pricelist.csv plus `store`.
+    Prices are converted to the base package size of each product. Products
+    a store does not price get their base price, or NaN if not `fill_missing`.
+    Returns the matrix and the store of each column.
+    """
+    store_prices = (
+        store_prices.with_columns(pl.col("ingredient").str.split("|"))
+        .explode("ingredient")
+        .with_columns(pl.col("ingredient").str.strip_chars("'"))
+        # As in stage 05, the last row of a product wins
+        .unique(["store", "ingredient"], keep="last", maintain_order=True)
+        .join(
+            pl.DataFrame(
+                {
+                    "ingredient": products["name"],
+                    "base_quantity": products["quantity"],
+                    "product": np.arange(len(products["name"])),
+                }
+            ),
+            on="ingredient",
+        )
+    )
+    store_prices = package_ratios(
+        store_prices.with_columns(
+            pl.format("{} {}", "quantity", "unit").alias("store_quantity")
+        )
+    )
+    stores = store_prices["store"].unique().sort()
+    store_ids = store_prices["store"].cast(pl.Enum(stores)).to_physical()
+
+    prices = np.full((len(products["name"]), len(stores)), np.nan)
+    prices[store_prices["product"].to_numpy(), store_ids.to_numpy()] = (
+        store_prices["price"] * store_prices["ratio"]
+    ).to_numpy()
+    if fill_missing:
+        prices = np.where(np.isnan(prices), products["price"][:, None], prices)
+    return prices, stores.to_numpy()
+
+
+def store_costs(
+    units: sp.csr_array,
+    recipe_ids: np.ndarray,
+    products: dict[str, np.ndarray],
+    store_prices: pl.DataFrame,
+    fill_missing=True,
+) -> pl.DataFrame:
+    """Cost every recipe at every store, as (recipe_id, store, cost) rows.
+
+    All stores are costed with a single sparse x dense matrix product.
+    """
+    prices, stores = price_matrix(store_prices, products, fill_missing)
+    costs = units @ prices
+    return pl.DataFrame(
+        {
+            "recipe_id": np.repeat(recipe_ids, len(stores)),
+            "store": np.tile(stores, len(recipe_ids)),
+            "cost": costs.ravel().round(2),
+        }
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Cost every recipe with the prices of every store."
+    )
+    parser.add_argument("prices", type=Path, nargs="?", default=STORE_PRICES_CSV)
+    parser.add_argument("--output", type=Path, default=OUTPUT_STORE_COSTS_CSV)
+    parser.add_argument(
+        "--no-fill",
+        action="store_true",
+        help="Leave recipes with products a store does not price uncosted",
+    )
+    args = parser.parse_args()
+
+    units, recipe_ids, products = load_unit_matrix()
+    costs = store_costs(
+        units,
+        recipe_ids,
+        products,
+        pl.read_csv(args.prices, schema_overrides=STORE_PRICELIST),
+        not args.no_fill,
+    )
+    costs.write_csv(args.output)
+    print(f"{costs.height} recipe costs written to {args.output}.")
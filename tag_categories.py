@@ -0,0 +1,64 @@
+import functools
+from pathlib import Path
+
+import polars as pl
+import yaml
+
+TAGS_FILE = Path("data/tags.yaml")
+TAG_REPLACEMENTS_FILE = Path("data/replacements.yaml")
+
+
+def category_enums(
+    tags_file: Path = TAGS_FILE, replacements_file: Path = TAG_REPLACEMENTS_FILE
+) -> dict[str, pl.Enum]:
+    """Get the vocabulary of each tag category, after replacements, as an Enum.
+
+    Category columns cast to `List[Enum]` store each value as an integer
+    code into this shared vocabulary instead of repeating the strings.
+    """
+    # Cached by content, so editing the files mid-process is picked up
+    return _category_enums(tags_file.read_text(), replacements_file.read_text())
+
+
+@functools.cache
+def _category_enums(tags_yaml: str, replacements_yaml: str) -> dict[str, pl.Enum]:
+    tags = yaml.safe_load(tags_yaml)
+    replacements = yaml.safe_load(replacements_yaml)
+    replacement_map = {item: cat for cat, lst in replacements.items() for item in lst}
+    return {
+        category: pl.Enum(sorted({replacement_map.get(tag, tag) for tag in pattern}))
+        for category, pattern in tags.items()
+    }
+
+
+def encode_categories(df: pl.DataFrame, enums: dict[str, pl.Enum]) -> pl.DataFrame:
+    """Convert comma-joined category columns to `List[Enum]` columns.
+
+    Raises a ValueError naming the values missing from the vocabulary, e.g.
+    when the recipes were cleaned with an older tags.yaml.
+    """
+    for category, enum in enums.items():
+        if df.schema.get(category) != pl.String:
+            continue
+        values = df[category].str.split(",").explode().drop_nulls().unique()
+        unknown = values.filter(~values.is_in(enum.categories.implode()))
+        if not unknown.is_empty():
+            raise ValueError(
+                f"{category} values not in the tags file: {sorted(unknown)}. "
+                "Add them to it or clean the recipes again with the current tags."
+            )
+
+    return df.with_columns(
+        pl.col(category).str.split(",").cast(pl.List(enum))
+        for category, enum in enums.items()
+        if df.schema.get(category) == pl.String
+    )
+
+
+def decode_categories(df: pl.DataFrame, enums: dict[str, pl.Enum]) -> pl.DataFrame:
+    """Convert `List[Enum]` category columns back to comma-joined strings."""
+    return df.with_columns(
+        pl.col(category).cast(pl.List(pl.String)).list.join(",")
+        for category, enum in enums.items()
+        if df.schema.get(category) == pl.List(enum)
+    )
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from file_utils import file_hash
+from schemas import RAW_RECIPES, read_dataset, scan_dataset
+
+RECIPE_FILE = Path("food-com-recipes/RAW_recipes.csv")
+TAG_INDEX_FILE = Path("food-com-recipes/tag_index.npz")
+
+
+def parse_tags(recipe_file: Path) -> pl.DataFrame:
+    """Parse the stringified tag lists into one (row, id, tag) row per tag."""
+    return (
+        scan_dataset(recipe_file, RAW_RECIPES, ["id", "tags"])
+        .with_row_index("row")
+        .with_columns(
+            pl.col("tags")
+            .str.extract_all(r"'[^']*'")
+            .list.eval(pl.element().str.strip_chars("'"))
+        )
+        .explode("tags")
+        .rename({"tags": "tag"})
+        .filter(pl.col("tag").is_not_null() & (pl.col("tag") != ""))
+        .collect()
+    )
+
+
+def build_tag_index(recipe_file: Path) -> dict[str, np.ndarray | str]:
+    """Build the tag vocabulary, tag counts and a per-recipe tag bitmap.
+
+    Tag ids are assigned by descending count. Bit `tag_id` of row `i` in
+    `bitmap` is set if recipe `recipe_ids[i]` has that tag (NumPy packbits
+    order, i.e. the most significant bit of byte 0 is tag 0).
+    """
+    recipe_tags = parse_tags(recipe_file)
+
+    vocabulary = (
+        recipe_tags.group_by("tag")
+        .len("count")
+        .sort(["count", "tag"], descending=[True, False])
+        .with_row_index("tag_id")
+    )
+    recipe_ids = read_dataset(recipe_file, RAW_RECIPES, ["id"])["id"].to_numpy()
+
+    rows, tag_ids = (
+        recipe_tags.join(vocabulary.select(["tag", "tag_id"]), on="tag")
+        .select(["row", "tag_id"])
+        .to_numpy()
+        .T.astype(np.int64)
+    )
+
+    # Set the bits in place rather than packing a dense boolean matrix
+    bitmap = np.zeros((len(recipe_ids), (vocabulary.height + 7) // 8), np.uint8)
+    np.bitwise_or.at(
+        bitmap, (rows, tag_ids >> 3), (128 >> (tag_ids & 7)).astype(np.uint8)
+    )
+
+    return {
+        "tags": vocabulary["tag"].to_numpy().astype(str),
+        "counts": vocabulary["count"].to_numpy(),
+        "recipe_ids": recipe_ids,
+        "bitmap": bitmap,
+        "source_hash": file_hash(recipe_file),
+    }
+
+
+def save_tag_index(index: dict[str, np.ndarray | str], file: Path):
+    """Save the tag index as an uncompressed .npz file."""
+    np.savez(file, **index)
+
+
+def load_tag_index(
+    recipe_file: Path = RECIPE_FILE, index_file: Path = TAG_INDEX_FILE
+) -> dict[str, np.ndarray | str]:
+    """Load the tag index, rebuilding it if the recipe file has changed."""
+    source_hash = file_hash(recipe_file)
+    if index_file.exists():
+        with np.load(index_file) as saved:
+            index = {key: saved[key] for key in saved.files}
+        index["source_hash"] = str(index["source_hash"])
+        if index["source_hash"] == source_hash:
+            return index
+
+    print(f"Building tag index for {recipe_file}...")
+    index = build_tag_index(recipe_file)
+    save_tag_index(index, index_file)
+    return index
+
+
+def recipes_with_tag(index: dict[str, np.ndarray | str], tag: str) -> np.ndarray:
+    """Get the ids of all recipes with the given tag."""
+    tag_ids = np.flatnonzero(index["tags"] == tag)
+    if not len(tag_ids):
+        raise KeyError(f"Unknown tag {tag}")
+    tag_id = int(tag_ids[0])
+    mask = index["bitmap"][:, tag_id >> 3] & (128 >> (tag_id & 7))
+    return index["recipe_ids"][mask != 0]
+
+
+if __name__ == "__main__":
+    index = load_tag_index()
+    print(f"{len(index['tags'])} tags over {len(index['recipe_ids'])} recipes.")
@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import scipy.sparse as sp
+import yaml
+
+from file_utils import file_hash
+from tag_index import load_tag_index
+
+RECIPE_FILE = Path("food-com-recipes/RAW_recipes.csv")
+TAG_INDEX_FILE = Path("food-com-recipes/tag_index.npz")
+TAG_COOCCURRENCE_FILE = Path("food-com-recipes/tag_cooccurrence.npz")
+TAGS_FILE = Path("food-com-recipes/all_tags.yaml")
+
+# Categories suggested per uncategorized tag
+N_SUGGESTIONS = 3
+
+
+def tag_matrix(index: dict[str, np.ndarray | str]) -> sp.csr_array:
+    """Get the recipe x tag matrix with a 1 where a recipe has a tag.
+
+    Only the non-zero bytes of the tag bitmap are unpacked, so the dense
+    recipe x tag matrix is never built.
+    """
+    rows, byte_columns = np.nonzero(index["bitmap"])
+    bits = np.unpackbits(index["bitmap"][rows, byte_columns][:, None], axis=1)
+    byte_rows, bit_columns = np.nonzero(bits)
+    return sp.csr_array(
+        (
+            np.ones(len(byte_rows), np.int32),
+            (rows[byte_rows], byte_columns[byte_rows] * 8 + bit_columns),
+        ),
+        shape=(len(index["recipe_ids"]), len(index["tags"])),
+    )
+
+
+def tag_cooccurrence(matrix: sp.csr_array) -> sp.csr_array:
+    """Count the recipes having each pair of tags, with one sparse product.
+
+    The diagonal is the number of recipes with each tag.
+    """
+    return sp.csr_array(matrix.T @ matrix)
+
+
+def load_tag_cooccurrence(
+    recipe_file: Path = RECIPE_FILE,
+    index_file: Path = TAG_INDEX_FILE,
+    cooccurrence_file: Path = TAG_COOCCURRENCE_FILE,
+) -> dict[str, np.ndarray | str | sp.csr_array]:
+    """Load the tag co-occurrence matrix, rebuilding it if the recipe file changed."""
+    source_hash = file_hash(recipe_file)
+    saved = None
+    if cooccurrence_file.exists():
+        with np.load(cooccurrence_file) as npz:
+            saved = {key: npz[key] for key in npz.files}
+        saved["source_hash"] = str(saved["source_hash"])
+
+    if saved is None or saved["source_hash"] != source_hash:
+        print(f"Building tag co-occurrence for {recipe_file}...")
+        index = load_tag_index(recipe_file, index_file)
+        cooccurrence = tag_cooccurrence(tag_matrix(index))
+        saved = {
+            "tags": index["tags"],
+            "indptr": cooccurrence.indptr,
+            "indices": cooccurrence.indices,
+            "data": cooccurrence.data,
+            "source_hash": source_hash,
+        }
+        np.savez(cooccurrence_file, **saved)
+
+    return {
+        "tags": saved["tags"],
+        "cooccurrence": sp.csr_array(
+            (saved["data"], saved["indices"], saved["indptr"]),
+            shape=(len(saved["tags"]), len(saved["tags"])),
+        ),
+        "source_hash": saved["source_hash"],
+    }
+
+
+def suggest_categories(
+    tags: np.ndarray,
+    cooccurrence: sp.csr_array,
+    categories: dict[str, set[str]],
+    n: int = N_SUGGESTIONS,
+) -> pl.DataFrame:
+    """Suggest categories for the tags that are in none, best first.
+
+    A tag is related to each categorized tag by how often they are on the same
+    recipes, relative to how common both are (co-occurrence / sqrt(count x
+    count)), so tags on nearly every recipe don't outvote the rest. A
+    category's score is its share of the tag's relation to all categorized
+    tags. Returns (tag, category, score) rows, at most n per tag.
+    """
+    names = list(categories)
+    tag_ids = {tag: i for i, tag in enumerate(tags)}
+    members = [
+        (tag_ids[tag], c)
+        for c, name in enumerate(names)
+        for tag in categories[name]
+        if tag in tag_ids
+    ]
+    rows, columns = np.array(members, np.int64).reshape(-1, 2).T
+    membership = sp.csr_array(
+        (np.ones(len(rows), np.float32), (rows, columns)),
+        shape=(len(tags), len(names)),
+    )
+
+    counts = cooccurrence.diagonal().astype(np.float32)
+    scale = sp.diags_array(1 / np.sqrt(np.maximum(counts, 1)))
+    relation = sp.csr_array(scale @ cooccurrence.astype(np.float32) @ scale)
+    relation.setdiag(0)
+    scores = (relation @ membership).toarray()
+
+    uncategorized = np.flatnonzero(
+        (np.asarray(membership.sum(axis=1)).ravel() == 0) & (counts > 0)
+    )
+    scores = scores[uncategorized]
+    totals = scores.sum(axis=1, keepdims=True)
+    scores = np.divide(scores, totals, out=np.zeros_like(scores), where=totals > 0)
+
+    n = min(n, len(names))
+    best = np.argsort(-scores, axis=1, kind="stable")[:, :n]
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    return (
+        pl.DataFrame(
+            {
+                "tag": np.repeat(tags[uncategorized], n),
+                "category": np.array(names)[best.ravel()],
+                "score": best_scores.ravel(),
+            }
+        )
+        .filter(pl.col("score") > 0)
+        .sort(["tag", "score"], descending=[False, True], maintain_order=True)
+    )
+
+
+if __name__ == "__main__":
+    with TAGS_FILE.open("r") as f:
+        categories = {
+            name: set(tags or []) for name, tags in (yaml.safe_load(f) or {}).items()
+        }
+    index = load_tag_cooccurrence()
+    suggestions = suggest_categories(index["tags"], index["cooccurrence"], categories)
+    with pl.Config(tbl_rows=-1):
+        print(suggestions)